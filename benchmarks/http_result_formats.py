@@ -0,0 +1,112 @@
+"""Benchmark of formats of responses of /api/sql/query for a big table.
+
+Compares the default json response with ndjson and arrow streams (see mindsdb/api/http/result_stream.py):
+time to serialize the table, time to the first byte of the response, size of the response
+and (with --memory) peak memory of the serialization. By default the table is generated in the current process.
+With --url the query is sent to a running MindsDB instance and the client side time is measured too.
+
+Usage:
+    python benchmarks/http_result_formats.py --rows 1000000 --columns 20
+    python benchmarks/http_result_formats.py --url http://127.0.0.1:47334 --query "select * from files.big"
+"""
+
+import time
+import json
+import argparse
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import requests
+
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.http.result_stream import iter_arrow, iter_ndjson, JSON_MIME, NDJSON_MIME, ARROW_STREAM_MIME
+from mindsdb.utilities.json_encoder import CustomJSONEncoder
+
+
+def make_result_set(rows: int, columns: int) -> ResultSet:
+    rng = np.random.default_rng(0)
+    data = {}
+    for i in range(columns):
+        match i % 4:
+            case 0:
+                data[f"int_{i}"] = rng.integers(0, 1000000, rows)
+            case 1:
+                data[f"float_{i}"] = rng.random(rows)
+            case 2:
+                data[f"str_{i}"] = pd.Series(rng.integers(0, 1000, rows)).astype(str).radd("value_")
+            case 3:
+                data[f"date_{i}"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 10**6, rows), "s")
+    return ResultSet.from_df(pd.DataFrame(data))
+
+
+def dump_json(result_set: ResultSet):
+    # what the json response does: lists of json types, then one document
+    response = {
+        "type": "table",
+        "data": result_set.to_lists(json_types=True),
+        "column_names": [column.alias for column in result_set.columns],
+    }
+    yield json.dumps(response, cls=CustomJSONEncoder).encode()
+
+
+def measure(name: str, body_fn, trace_memory: bool):
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    first_byte = None
+    size = 0
+    for chunk in body_fn():
+        if first_byte is None and len(chunk) > 0:
+            first_byte = time.perf_counter() - start
+        size += len(chunk)
+    elapsed = time.perf_counter() - start
+    message = f"{name:>8}: total {elapsed:7.2f}s, first byte {first_byte:7.3f}s, size {size / 2**20:8.1f}MB"
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        message += f", peak memory {peak / 2**20:8.1f}MB"
+    print(message)
+
+
+def run_local(rows: int, columns: int, trace_memory: bool):
+    result_set = make_result_set(rows, columns)
+    context = {"db": "mindsdb"}
+    measure("json", lambda: dump_json(result_set), trace_memory)
+    measure("ndjson", lambda: iter_ndjson(result_set, context), trace_memory)
+    measure("arrow", lambda: iter_arrow(result_set, context), trace_memory)
+
+
+def run_http(url: str, query: str):
+    endpoint = url.rstrip("/") + "/api/sql/query"
+    for name, mime in (("json", JSON_MIME), ("ndjson", NDJSON_MIME), ("arrow", ARROW_STREAM_MIME)):
+        start = time.perf_counter()
+        response = requests.post(endpoint, json={"query": query}, headers={"Accept": mime}, stream=True)
+        response.raise_for_status()
+        first_byte = None
+        size = 0
+        for chunk in response.iter_content(chunk_size=2**16):
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            size += len(chunk)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>8}: total {elapsed:7.2f}s, first byte {first_byte:7.3f}s, size {size / 2**20:8.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--url", default=None, help="url of MindsDB http api")
+    parser.add_argument("--query", default=None, help="query to send with --url")
+    parser.add_argument("--memory", action="store_true", help="trace peak memory (makes serialization slower)")
+    args = parser.parse_args()
+
+    if args.url is not None:
+        run_http(args.url, args.query)
+    else:
+        run_local(args.rows, args.columns, args.memory)
+
+
+if __name__ == "__main__":
+    main()
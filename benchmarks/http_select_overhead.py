@@ -0,0 +1,109 @@
+"""Benchmark of per-request overhead of small queries over HTTP.
+
+Sends `SELECT 1` (or another query) to /api/sql/query of a running MindsDB instance and reports
+latency percentiles and throughput. With --setup the cost of the session setup is measured in the current
+process instead:
+ - `new session`: SessionController is created for each request (and all its controllers are used)
+ - `pooled session`: session is taken from the session pool and returned to it
+
+Usage:
+    python benchmarks/http_select_overhead.py --url http://127.0.0.1:47334 --requests 2000 --concurrency 8
+    python benchmarks/http_select_overhead.py --setup --requests 2000
+"""
+
+import time
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def report(name: str, latencies: list, elapsed: float):
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    mean = statistics.mean(latencies) * 1000
+    print(
+        f"{name:>15}: {len(latencies)} requests, {len(latencies) / elapsed:8.1f} req/s, "
+        f"mean {mean:.2f}ms, p50 {p50:.2f}ms, p99 {p99:.2f}ms"
+    )
+
+
+def run_http(url: str, query: str, count: int, concurrency: int):
+    endpoint = url.rstrip("/") + "/api/sql/query"
+    local = {}
+
+    def call(_):
+        session = local.setdefault("session", requests.Session())
+        start = time.perf_counter()
+        response = session.post(endpoint, json={"query": query, "context": {}})
+        response.raise_for_status()
+        if response.json().get("type") == "error":
+            raise RuntimeError(response.json().get("error_message"))
+        return time.perf_counter() - start
+
+    # warm up: connection, plan cache, lazy imports
+    for _ in range(10):
+        call(None)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(call, range(count)))
+    report("http", latencies, time.perf_counter() - start)
+
+
+def run_setup(query: str, count: int):
+    from mindsdb.interfaces.storage import db
+    from mindsdb.api.executor.controllers import SessionController, session_pool
+    from mindsdb.api.mysql.mysql_proxy.classes.fake_mysql_proxy import FakeMysqlProxy
+
+    db.init()
+
+    def new_session():
+        session = SessionController()
+        # the old session created all controllers in the constructor
+        for name in (
+            "model_controller",
+            "database_controller",
+            "skills_controller",
+            "function_controller",
+            "kb_controller",
+            "datahub",
+            "agents_controller",
+        ):
+            getattr(session, name)
+        FakeMysqlProxy(session=session).process_query(query)
+
+    def pooled_session():
+        with session_pool.session() as session:
+            FakeMysqlProxy(session=session).process_query(query)
+
+    for name, fn in (("new session", new_session), ("pooled session", pooled_session)):
+        fn()
+        latencies = []
+        start = time.perf_counter()
+        for _ in range(count):
+            call_start = time.perf_counter()
+            fn()
+            latencies.append(time.perf_counter() - call_start)
+        report(name, latencies, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:47334", help="url of MindsDB http api")
+    parser.add_argument("--query", default="SELECT 1")
+    parser.add_argument("--requests", type=int, default=1000, help="number of requests")
+    parser.add_argument("--concurrency", type=int, default=1, help="number of concurrent clients")
+    parser.add_argument("--setup", action="store_true", help="measure session setup in the current process")
+    args = parser.parse_args()
+
+    if args.setup:
+        run_setup(args.query, args.requests)
+    else:
+        run_http(args.url, args.query, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
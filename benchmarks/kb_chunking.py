@@ -0,0 +1,93 @@
+"""Benchmark of knowledge base document chunking.
+
+Compares chunking of a generated text corpus:
+ - `serial`: TextChunkingPreprocessor.process_documents + DocumentPreprocessor.to_dataframe (per-chunk pydantic objects)
+ - `columnar`: TextChunkingPreprocessor.chunk_documents + ChunkBatch.to_dataframe in the current process
+ - `parallel`: ParallelChunker with a pool of worker processes
+
+Usage:
+    python benchmarks/kb_chunking.py --size-mb 1024 --doc-size 20000 --workers 8
+"""
+
+import time
+import random
+import argparse
+
+from mindsdb.interfaces.knowledge_base.preprocessing.models import RawDocument, TextChunkingConfig
+from mindsdb.interfaces.knowledge_base.preprocessing.document_preprocessor import TextChunkingPreprocessor
+from mindsdb.interfaces.knowledge_base.preprocessing.parallel_chunker import ParallelChunker
+
+WORDS = [
+    "knowledge", "base", "vector", "query", "document", "chunk", "embedding", "model", "database", "table",
+    "select", "insert", "agent", "context", "retrieval", "search", "metadata", "content", "index", "storage",
+]
+
+
+def generate_corpus(size_mb: int, doc_size: int, seed: int = 42) -> list:
+    rnd = random.Random(seed)
+    total_size = size_mb * 1024 * 1024
+    documents = []
+    generated = 0
+    while generated < total_size:
+        sentences = []
+        length = 0
+        while length < doc_size:
+            sentence = " ".join(rnd.choices(WORDS, k=rnd.randint(5, 20))).capitalize() + "."
+            if rnd.random() < 0.1:
+                sentence += "\n\n"
+            sentences.append(sentence)
+            length += len(sentence) + 1
+        content = " ".join(sentences)
+        documents.append(
+            RawDocument(str(len(documents)), content, {"_content_column": "content", "_original_row_index": "0"})
+        )
+        generated += len(content)
+    return documents
+
+
+def run(name: str, fn) -> float:
+    start = time.perf_counter()
+    rows = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{name:>10}: {elapsed:8.2f}s, {rows} chunks")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=1024, help="size of generated corpus, Mb")
+    parser.add_argument("--doc-size", type=int, default=20000, help="size of one document, chars")
+    parser.add_argument("--workers", type=int, default=0, help="number of worker processes, 0 - number of CPUs")
+    parser.add_argument("--batch-size", type=int, default=500, help="documents per worker task")
+    parser.add_argument("--skip-serial", action="store_true", help="do not run the serial (pydantic) variant")
+    args = parser.parse_args()
+
+    documents = generate_corpus(args.size_mb, args.doc_size)
+    print(f"corpus: {len(documents)} documents, {args.size_mb} Mb")
+
+    preprocessor = TextChunkingPreprocessor(TextChunkingConfig())
+
+    if not args.skip_serial:
+        run(
+            "serial",
+            lambda: len(preprocessor.to_dataframe(
+                preprocessor.process_documents([doc.to_document() for doc in documents])
+            )),
+        )
+    run("columnar", lambda: len(preprocessor.chunk_documents(documents).to_dataframe()))
+
+    chunker = ParallelChunker(preprocessor)
+    if args.workers:
+        chunker.workers = args.workers
+    chunker.batch_size = args.batch_size
+    chunker.min_documents = 0
+    try:
+        # worker processes are spawned once and reused by all inserts, measure their start separately
+        run("pool start", lambda: len(chunker.chunk(documents[: chunker.batch_size * chunker.workers])))
+        run("parallel", lambda: len(chunker.chunk(documents).to_dataframe()))
+    finally:
+        ParallelChunker.shutdown()
+
+
+if __name__ == "__main__":
+    main()
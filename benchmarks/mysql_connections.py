@@ -0,0 +1,90 @@
+"""Benchmark of the mysql API with many connections.
+
+Opens --idle connections which don't send queries, then --active connections which send --queries queries each
+at the same time. Prints latency percentiles and throughput of the queries. Compare the thread per connection
+server with the asyncio server (config: {"api": {"mysql": {"server": "asyncio", "workers": 16}}}),
+the number of threads of the MindsDB process can be seen with `ps -o nlwp <pid>`.
+
+Usage:
+    python benchmarks/mysql_connections.py --idle 2000 --active 200 --queries 20
+    python benchmarks/mysql_connections.py --port 47335 --query "select * from files.big limit 10"
+"""
+
+import time
+import argparse
+import threading
+
+import numpy as np
+import mysql.connector
+
+
+def connect(args):
+    return mysql.connector.connect(
+        host=args.host, port=args.port, user=args.user, password=args.password, use_pure=True, ssl_disabled=True
+    )
+
+
+def run_client(args, barrier: threading.Barrier, latencies: list, errors: list):
+    try:
+        connection = connect(args)
+    except Exception as e:
+        errors.append(e)
+        barrier.abort()
+        return
+    try:
+        barrier.wait()
+        for _ in range(args.queries):
+            start = time.perf_counter()
+            cursor = connection.cursor()
+            cursor.execute(args.query)
+            cursor.fetchall()
+            cursor.close()
+            latencies.append(time.perf_counter() - start)
+    except Exception as e:
+        errors.append(e)
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=47335)
+    parser.add_argument("--user", default="mindsdb")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--idle", type=int, default=1000, help="connections without queries")
+    parser.add_argument("--active", type=int, default=100, help="connections which send queries")
+    parser.add_argument("--queries", type=int, default=10, help="queries of every active connection")
+    parser.add_argument("--query", default="select 1")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    idle = [connect(args) for _ in range(args.idle)]
+    print(f"{len(idle)} idle connections are opened in {time.perf_counter() - start:.2f}s")
+
+    latencies, errors = [], []
+    barrier = threading.Barrier(args.active + 1)
+    clients = [threading.Thread(target=run_client, args=(args, barrier, latencies, errors)) for _ in range(args.active)]
+    for client in clients:
+        client.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - start
+
+    if len(latencies) > 0:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+        print(
+            f"{len(latencies)} queries in {elapsed:.2f}s: {len(latencies) / elapsed:.1f} queries/s, "
+            f"latency p50 {p50:.1f}ms, p95 {p95:.1f}ms, p99 {p99:.1f}ms"
+        )
+    if len(errors) > 0:
+        print(f"{len(errors)} errors, first: {errors[0]}")
+
+    for connection in idle:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,620 @@
+"""Benchmark suite of the hot paths of the SQL engine.
+
+Runs offline in the current process with a temporary storage:
+ - data sources are local DuckDB files (duckdb handler) and a SQLite file (sqlite handler)
+ - predictions are made by tests/unit/dummy_ml_handler
+ - embeddings of the knowledge base are made by a fake embedding model (litellm call is replaced)
+ - servers of the wire protocols are started in the current process on random ports
+
+Scenarios:
+ - planner: planning of a query with joins, a subselect and a model
+ - result_set: ResultSet.from_df, to_lists and to_arrow of the `big` table
+ - select_mysql, select_postgres, select_http, select_flight: `select * from bench.big` over the protocol
+ - join: join of two tables from different databases, executed by DuckDB
+ - wide_result_set: conversions of ResultSet of the wide table (--wide-columns) made by join and union steps
+ - wide_union: union of two wide tables (--wide-columns) from different databases, executed by DuckDB
+ - nulls_union: union of two numeric tables with ~10% of NULLs from different databases, to_lists and mysql dump of
+   the result. Fails if the numeric columns are converted to 'object' dtype
+ - insert_select: INSERT ... SELECT from DuckDB to SQLite, split to partitions by `batch_size`
+ - predict, predict_cached: join of a table with dummy_ml model, without and with the predictions cache
+ - kb_insert, kb_select: ingest of documents to a knowledge base and vector search in it
+
+The result is printed and, with --json, saved to a machine-readable file: rounds, min/median/mean/max seconds,
+processed rows per second and the environment of the run. With --memory every scenario is run once more with
+tracemalloc to get the peak of allocated memory. With --compare the medians are compared with a previous
+result, the exit code is 1 if any scenario is slower than --max-regression.
+
+Usage:
+    python benchmarks/sql_engine.py --json results.json
+    python benchmarks/sql_engine.py --rows 100000 --docs 10000 --only select_mysql,join --rounds 5
+    python benchmarks/sql_engine.py --json new.json --compare results.json --max-regression 0.2
+    python benchmarks/sql_engine.py --only wide_union --wide-columns 1000 --memory
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+import platform
+import argparse
+import tempfile
+import threading
+import tracemalloc
+import statistics
+import subprocess
+from pathlib import Path
+from functools import partial
+from dataclasses import dataclass
+from typing import Callable, Optional
+from unittest.mock import patch, MagicMock
+
+import duckdb
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+EMBEDDING_SIZE = 64
+
+
+@dataclass
+class Scenario:
+    name: str
+    # runs the scenario once, returns number of processed rows
+    run: Callable[[], int]
+    # is called before every round, is not measured
+    setup: Optional[Callable[[], None]] = None
+
+
+def fake_embeddings(text: str) -> list:
+    # deterministic vector: the same text has the same embedding
+    digest = hashlib.sha256(text.encode()).digest()
+    return [(digest[i % len(digest)] - 128) / 128 for i in range(EMBEDDING_SIZE)]
+
+
+def fake_litellm_embedding(input, *args, **kwargs):
+    response = MagicMock()
+    response.data = [{"embedding": fake_embeddings(text)} for text in input]
+    return response
+
+
+class Environment:
+    """MindsDB with temporary storage, data sources and servers of the wire protocols in the current process"""
+
+    def __init__(self, storage_dir: Path, rows: int, docs: int, wide_columns: int):
+        self.storage_dir = storage_dir
+        self.rows = rows
+        self.docs = docs
+        self.wide_columns = wide_columns
+        self.servers = []
+
+        config_path = storage_dir / "config.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "storage_db": "sqlite:///" + str(storage_dir / "mindsdb.db"),
+                    "gui": {"open_on_start": False, "autoupdate": False},
+                    "logging": {"handlers": {"console": {"level": "WARNING"}}},
+                }
+            )
+        )
+        os.environ["MINDSDB_STORAGE_DIR"] = str(storage_dir)
+        os.environ["MINDSDB_CONFIG_PATH"] = str(config_path)
+
+        # mindsdb reads the config on import
+        from mindsdb.utilities.config import config
+        from mindsdb.interfaces.storage import db
+
+        self.config = config
+        db.init()
+        db.Base.metadata.create_all(db.engine)
+        from mindsdb.interfaces.database.integrations import integration_controller
+
+        integration_controller.create_permanent_integrations()
+        db.session.add(db.Project(name="mindsdb"))
+        db.session.commit()
+
+        self.import_dummy_ml(integration_controller)
+        self.create_data()
+
+        from mindsdb.api.executor.controllers.session_controller import SessionController
+        from mindsdb.api.executor.command_executor import ExecuteCommands
+        from mindsdb.utilities.context import context as ctx
+
+        ctx.set_default()
+        self.session = SessionController()
+        self.session.database = "mindsdb"
+        self.command_executor = ExecuteCommands(self.session)
+
+        self.run_sql(f"create database bench with engine='duckdb', parameters={{'database': '{self.bench_path}'}}")
+        self.run_sql(f"create database bench2 with engine='duckdb', parameters={{'database': '{self.bench2_path}'}}")
+        self.run_sql(f"create database bench_sqlite with engine='sqlite', parameters={{'db_file': '{self.sqlite_path}'}}")
+
+    def import_dummy_ml(self, integration_controller):
+        handler_dir = REPO_ROOT / "tests" / "unit" / "dummy_ml_handler"
+        sys.path.append(str(handler_dir.parent))
+        integration_controller.handlers_import_status["dummy_ml"] = {
+            "import": {"success": None, "error_message": None, "folder": handler_dir.name, "dependencies": []},
+            "path": handler_dir,
+            "name": "dummy_ml",
+            "permanent": False,
+        }
+        integration_controller.import_handler("dummy_ml", "")
+
+    def create_data(self):
+        self.bench_path = self.storage_dir / "bench.duckdb"
+        self.bench2_path = self.storage_dir / "bench2.duckdb"
+        self.sqlite_path = self.storage_dir / "bench.sqlite"
+
+        with duckdb.connect(str(self.bench_path)) as con:
+            con.execute(f"""
+                create table big as select
+                    i as id,
+                    i % 1000 as category,
+                    random() as value,
+                    timestamp '2024-01-01' + i * interval 1 second as created_at,
+                    'text_' || i as text
+                from range({self.rows}) t(i)
+            """)
+            con.execute(f"""
+                create table docs as select
+                    i as id,
+                    'document ' || i || ' about ' || (i % 97) || ' and ' || (i % 13) as content
+                from range({self.docs}) t(i)
+            """)
+        with duckdb.connect(str(self.bench2_path)) as con:
+            con.execute(f"create table dim as select i as id, 'name_' || i as name from range({self.rows}) t(i)")
+
+        # the same wide table in both databases, half of the columns are numbers, half are strings
+        wide_targets = ", ".join(
+            f"i + {k} as col_{k}" if k % 2 == 0 else f"'value_' || (i + {k}) as col_{k}" for k in range(self.wide_columns)
+        )
+        for path in (self.bench_path, self.bench2_path):
+            with duckdb.connect(str(path)) as con:
+                con.execute(f"create table wide as select {wide_targets} from range({max(self.rows // 100, 1)}) t(i)")
+                # numeric table, every column has ~10% of NULLs
+                con.execute(f"""
+                    create table sparse as select
+                        i as id,
+                        case when i % 10 = 1 then null else i % 1000 end as category,
+                        case when i % 10 = 2 then null else random() end as value,
+                        case when i % 10 = 3 then null else i * 2 end as amount,
+                        case when i % 10 = 4 then null else random() * 100 end as score
+                    from range({self.rows}) t(i)
+                """)
+        self.create_sqlite_table()
+
+    def create_sqlite_table(self):
+        # target of INSERT ... SELECT
+        with sqlite3.connect(self.sqlite_path) as con:
+            con.execute("drop table if exists big_copy")
+            con.execute("create table big_copy (id integer, category integer, value real, text text)")
+
+    def run_sql(self, sql: str):
+        from mindsdb_sql_parser import parse_sql
+
+        ret = self.command_executor.execute_command(parse_sql(sql))
+        if ret.data is not None:
+            return ret.data
+
+    def start_thread(self, target):
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+
+    def start_mysql(self) -> int:
+        from mindsdb.api.mysql.mysql_proxy.mysql_proxy import MysqlProxy
+        from mindsdb.api.mysql.mysql_proxy.async_server import AsyncMysqlServer
+        from mindsdb.api.mysql.mysql_proxy.classes.server_capabilities import server_capabilities
+        from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import CAPABILITIES
+        from mindsdb.api.common.middleware import check_auth
+
+        server_capabilities.set(CAPABILITIES.CLIENT_SSL, False)
+        server = AsyncMysqlServer("127.0.0.1", 0, MysqlProxy)
+        server.mindsdb_config = self.config
+        server.check_auth = partial(check_auth, config=self.config)
+        server.cert_path = None
+        server.hook_before_handle = lambda *args, **kwargs: None
+        server.bind()
+        self.start_thread(server.serve_forever)
+        self.servers.append(server)
+        return server.port
+
+    def start_postgres(self) -> int:
+        from mindsdb.api.postgres.postgres_proxy.postgres_proxy import PostgresProxyHandler
+        from mindsdb.api.postgres.postgres_proxy.async_server import AsyncPostgresServer
+        from mindsdb.api.common.middleware import check_auth
+
+        server = AsyncPostgresServer("127.0.0.1", 0, PostgresProxyHandler)
+        server.mindsdb_config = self.config
+        server.check_auth = partial(check_auth, config=self.config)
+        server.bind()
+        self.start_thread(server.serve_forever)
+        self.servers.append(server)
+        return server.port
+
+    def start_flight(self):
+        from mindsdb.api.flight.flight_server import FlightSqlServer
+
+        server = FlightSqlServer("grpc://127.0.0.1:0")
+        self.servers.append(server)
+        return server.port
+
+    def stop(self):
+        for server in self.servers:
+            server.shutdown()
+
+
+# region scenarios
+def planner_scenario(env: Environment, count: int = 100) -> Scenario:
+    from mindsdb_sql_parser import parse_sql
+    from mindsdb.api.executor.sql_query import SQLQuery
+
+    sql = """
+        select t.id, d.name, m.predicted
+        from bench.big t
+        join bench2.dim d on t.id = d.id
+        join mindsdb.bench_model m
+        where t.category in (select category from bench.big where id < 10)
+        limit 10
+    """
+
+    def run():
+        for _ in range(count):
+            query = SQLQuery(parse_sql(sql), session=env.session, execute=False)
+            list(query.planner.execute_steps())
+        return count
+
+    return Scenario("planner", run)
+
+
+def result_set_scenario(env: Environment) -> Scenario:
+    from mindsdb.api.executor.sql_query.result_set import ResultSet
+
+    with duckdb.connect(str(env.bench_path), read_only=True) as con:
+        df = con.execute("select * from big").fetchdf()
+
+    def run():
+        result_set = ResultSet.from_df(df.copy(deep=False))
+        result_set.to_lists()
+        result_set.to_arrow()
+        return len(result_set)
+
+    return Scenario("result_set", run)
+
+
+def select_mysql_scenario(env: Environment) -> Scenario:
+    import mysql.connector
+
+    port = env.start_mysql()
+
+    def run():
+        connection = mysql.connector.connect(
+            host="127.0.0.1", port=port, user="mindsdb", password="", use_pure=True, ssl_disabled=True
+        )
+        try:
+            cursor = connection.cursor()
+            cursor.execute("select * from bench.big")
+            return len(cursor.fetchall())
+        finally:
+            connection.close()
+
+    return Scenario("select_mysql", run)
+
+
+def select_postgres_scenario(env: Environment) -> Scenario:
+    import psycopg
+
+    port = env.start_postgres()
+
+    def run():
+        with psycopg.connect(
+            host="127.0.0.1", port=port, user="mindsdb", password="", sslmode="disable", autocommit=True
+        ) as connection:
+            return len(connection.execute("select * from bench.big", prepare=False).fetchall())
+
+    return Scenario("select_postgres", run)
+
+
+def select_http_scenario(env: Environment) -> Scenario:
+    from mindsdb.api.http.initialize import initialize_app
+
+    client = initialize_app().test_client()
+
+    def run():
+        response = client.post("/api/sql/query", json={"query": "select * from bench.big", "context": {}})
+        data = response.get_json()
+        if data["type"] == "error":
+            raise RuntimeError(data["error_message"])
+        return len(data["data"])
+
+    return Scenario("select_http", run)
+
+
+def select_flight_scenario(env: Environment) -> Scenario:
+    import pyarrow.flight as flight
+
+    port = env.start_flight()
+    client = flight.FlightClient(f"grpc://127.0.0.1:{port}")
+    options = flight.FlightCallOptions(headers=[client.authenticate_basic_token("mindsdb", "")])
+
+    def run():
+        info = client.get_flight_info(flight.FlightDescriptor.for_command(b"select * from bench.big"), options)
+        return sum(client.do_get(endpoint.ticket, options).read_all().num_rows for endpoint in info.endpoints)
+
+    return Scenario("select_flight", run)
+
+
+def join_scenario(env: Environment) -> Scenario:
+    def run():
+        return len(env.run_sql("select t.id, t.value, d.name from bench.big t join bench2.dim d on t.id = d.id"))
+
+    return Scenario("join", run)
+
+
+def wide_result_set_scenario(env: Environment, steps: int = 10) -> Scenario:
+    from mindsdb.api.executor.sql_query.result_set import ResultSet
+
+    with duckdb.connect(str(env.bench_path), read_only=True) as con:
+        df = con.execute("select * from wide").fetchdf()
+
+    def run():
+        # conversions which join, union and project steps make with their inputs and outputs
+        result_set = ResultSet.from_df(df.copy(deep=False), table_name="wide")
+        for _ in range(steps):
+            step_df, columns = result_set.to_df_cols(prefix="A")
+            result_set = ResultSet.from_df_cols(step_df, columns)[: len(step_df) // 2 + 1]
+            result_set.to_df()
+        return len(df) * steps
+
+    return Scenario("wide_result_set", run)
+
+
+def wide_union_scenario(env: Environment) -> Scenario:
+    def run():
+        return len(env.run_sql("select * from bench.wide union all select * from bench2.wide"))
+
+    return Scenario("wide_union", run)
+
+
+def nulls_union_scenario(env: Environment) -> Scenario:
+    from mindsdb.api.mysql.mysql_proxy.utilities.dump import dump_result_set_to_mysql
+
+    sql = "select * from bench.sparse union all select * from bench2.sparse"
+
+    # nulls must not turn numeric columns into 'object' on the way from the handler to the encoders
+    dtypes = env.run_sql(sql).get_raw_df().dtypes
+    object_columns = [i for i, dtype in enumerate(dtypes) if dtype == object]
+    if object_columns:
+        raise RuntimeError(f"numeric columns with nulls are converted to object: {object_columns}")
+
+    def run():
+        result_set = env.run_sql(sql)
+        result_set.to_lists()
+        dump_result_set_to_mysql(result_set)
+        return len(result_set)
+
+    return Scenario("nulls_union", run)
+
+
+def insert_select_scenario(env: Environment) -> Scenario:
+    batch_size = max(env.rows // 10, 1)
+
+    def run():
+        from mindsdb.utilities.context import context as ctx
+
+        # partitioned INSERT ... SELECT is added to background tasks, execute it in place as the task does
+        ctx.task_id = -1
+        try:
+            env.run_sql(f"""
+                insert into bench_sqlite.big_copy
+                select id, category, value, text from bench.big
+                using batch_size={batch_size}, track_column=id
+            """)
+        finally:
+            ctx.task_id = None
+        with sqlite3.connect(env.sqlite_path) as con:
+            return con.execute("select count(*) from big_copy").fetchone()[0]
+
+    return Scenario("insert_select", run, env.create_sqlite_table)
+
+
+def predict_scenarios(env: Environment, rows: int) -> list:
+    env.run_sql("create model mindsdb.bench_model predict predicted using engine='dummy_ml', join_learn_process=true")
+    sql = f"select t.id, m.predicted from (select * from bench.big limit {rows}) t join mindsdb.bench_model m"
+
+    def run(cache: bool):
+        env.run_sql(f"set predictor_cache = {str(cache).lower()}")
+        return len(env.run_sql(sql))
+
+    def warm_cache():
+        run(True)
+
+    return [
+        Scenario("predict", partial(run, False)),
+        Scenario("predict_cached", partial(run, True), warm_cache),
+    ]
+
+
+def kb_scenarios(env: Environment, queries: int = 100) -> list:
+    embedding_model = json.dumps({"provider": "bedrock", "model_name": "fake_embeddings", "api_key": "-"})
+
+    def create_kb():
+        env.run_sql("drop knowledge base if exists bench_kb")
+        env.run_sql(f"create knowledge base bench_kb using embedding_model={embedding_model}")
+
+    def insert():
+        env.run_sql("insert into bench_kb (select id, content from bench.docs)")
+        return env.docs
+
+    def select():
+        for i in range(queries):
+            env.run_sql(f"select id, chunk_content from bench_kb where content = 'document about {i}' limit 10")
+        return queries
+
+    def prepare_select():
+        # the KB is filled by kb_insert, it is created here if kb_select is run alone
+        kbs = env.run_sql("show knowledge bases").to_df()
+        if "bench_kb" not in kbs["NAME"].str.lower().tolist():
+            create_kb()
+            insert()
+
+    return [Scenario("kb_insert", insert, create_kb), Scenario("kb_select", select, prepare_select)]
+
+
+# endregion
+
+
+def measure(scenario: Scenario, rounds: int, warmup: bool, trace_memory: bool = False) -> dict:
+    if warmup:
+        if scenario.setup is not None:
+            scenario.setup()
+        scenario.run()
+
+    timings = []
+    rows = 0
+    for _ in range(rounds):
+        if scenario.setup is not None:
+            scenario.setup()
+        start = time.perf_counter()
+        rows = scenario.run()
+        timings.append(time.perf_counter() - start)
+
+    median = statistics.median(timings)
+    result = {
+        "name": scenario.name,
+        "rows": rows,
+        "stats": {
+            "rounds": rounds,
+            "min": min(timings),
+            "max": max(timings),
+            "mean": statistics.mean(timings),
+            "median": median,
+            "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "rows_per_second": rows / median if median > 0 else None,
+        },
+    }
+
+    if trace_memory:
+        # separate round: tracemalloc slows down the execution
+        if scenario.setup is not None:
+            scenario.setup()
+        tracemalloc.start()
+        try:
+            scenario.run()
+            result["stats"]["peak_allocated_mb"] = tracemalloc.get_traced_memory()[1] / (1 << 20)
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def get_environment_info(args) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        "machine_info": {
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+        },
+        "commit_info": {"id": commit},
+        "params": {
+            "rows": args.rows,
+            "docs": args.docs,
+            "predict_rows": args.predict_rows,
+            "wide_columns": args.wide_columns,
+            "rounds": args.rounds,
+        },
+        "datetime": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def compare(results: list, baseline_path: str, max_regression: float) -> bool:
+    baseline = {item["name"]: item for item in json.loads(Path(baseline_path).read_text())["benchmarks"]}
+    ok = True
+    print(f"\ncompared with {baseline_path}:")
+    for item in results:
+        old = baseline.get(item["name"])
+        if old is None:
+            continue
+        ratio = item["stats"]["median"] / old["stats"]["median"]
+        regression = ratio > 1 + max_regression
+        ok = ok and not regression
+        print(f"{item['name']:>16}: {ratio:6.2f}x{'  REGRESSION' if regression else ''}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000, help="rows of the tables")
+    parser.add_argument("--docs", type=int, default=100000, help="documents inserted to the knowledge base")
+    parser.add_argument("--predict-rows", type=int, default=100000, help="rows sent to the model")
+    parser.add_argument("--wide-columns", type=int, default=600, help="columns of the wide table, it has rows/100 rows")
+    parser.add_argument("--rounds", type=int, default=3, help="measured runs of every scenario")
+    parser.add_argument("--no-warmup", action="store_true", help="don't run every scenario once before measuring")
+    parser.add_argument("--memory", action="store_true", help="measure peak of allocated memory of every scenario")
+    parser.add_argument("--only", help="comma separated names of scenarios to run")
+    parser.add_argument("--json", help="save results to the file")
+    parser.add_argument("--compare", help="results of the previous run to compare with")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed slowdown of the median, 0.2 = 20%%")
+    args = parser.parse_args()
+
+    storage_dir = Path(tempfile.mkdtemp(prefix="mindsdb_bench_"))
+    env = None
+    try:
+        env = Environment(storage_dir, args.rows, args.docs, args.wide_columns)
+
+        # groups are named by the prefix of their scenarios. The model is created first: planner uses it
+        groups = {
+            "predict": lambda: predict_scenarios(env, args.predict_rows),
+            "planner": lambda: [planner_scenario(env)],
+            "result_set": lambda: [result_set_scenario(env)],
+            "select_mysql": lambda: [select_mysql_scenario(env)],
+            "select_postgres": lambda: [select_postgres_scenario(env)],
+            "select_http": lambda: [select_http_scenario(env)],
+            "select_flight": lambda: [select_flight_scenario(env)],
+            "join": lambda: [join_scenario(env)],
+            "wide": lambda: [wide_result_set_scenario(env), wide_union_scenario(env)],
+            "nulls": lambda: [nulls_union_scenario(env)],
+            "insert_select": lambda: [insert_select_scenario(env)],
+            "kb": lambda: kb_scenarios(env),
+        }
+        only = None if args.only is None else set(args.only.split(","))
+        scenarios = []
+        for prefix, group in groups.items():
+            if prefix == "predict" or only is None or any(name.startswith(prefix) for name in only):
+                scenarios += group()
+
+        results = []
+        with patch("mindsdb.integrations.handlers.litellm_handler.litellm_handler.embedding", fake_litellm_embedding):
+            for scenario in scenarios:
+                if only is not None and scenario.name not in only:
+                    continue
+                result = measure(scenario, args.rounds, not args.no_warmup, args.memory)
+                stats = result["stats"]
+                memory = f", peak {stats['peak_allocated_mb']:8.1f} MB" if args.memory else ""
+                print(
+                    f"{scenario.name:>16}: median {stats['median']:8.3f}s, min {stats['min']:8.3f}s, "
+                    f"max {stats['max']:8.3f}s, {result['rows']} rows, {stats['rows_per_second'] or 0:12.0f} rows/s"
+                    f"{memory}"
+                )
+                results.append(result)
+    finally:
+        if env is not None:
+            env.stop()
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({**get_environment_info(args), "benchmarks": results}, indent=2))
+
+    if args.compare and not compare(results, args.compare, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,18 +11,23 @@ import asyncio
 import traceback
 import threading
 import shutil
+import multiprocessing as mp
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import Callable, Optional, Tuple, List
 
-from sqlalchemy import func
-from sqlalchemy.orm.attributes import flag_modified
+from mindsdb.utilities import import_profiler
+
+# started before other imports of mindsdb to measure them
+import_profiler.start_from_env()
 
 from mindsdb.utilities import log
 
 logger = log.getLogger("mindsdb")
 logger.debug("Starting MindsDB...")
 
+# keep module level imports light (if started as a script, the module is imported again by spawned processes):
+# db, sqlalchemy, etc are imported in the functions which use them
 from mindsdb.__about__ import __version__ as mindsdb_version
 from mindsdb.utilities.config import config
 from mindsdb.utilities.starters import (
@@ -33,23 +38,18 @@ from mindsdb.utilities.starters import (
     start_scheduler,
     start_tasks,
     start_litellm,
+    start_flight,
 )
 from mindsdb.utilities.ps import is_pid_listen_port, get_child_pids
-import mindsdb.interfaces.storage.db as db
 from mindsdb.utilities.fs import clean_process_marks, clean_unlinked_process_marks, create_pid_file, delete_pid_file
 from mindsdb.utilities.context import context as ctx
-from mindsdb.utilities.auth import register_oauth_client, get_aws_meta_data
 from mindsdb.utilities.sentry import sentry_sdk  # noqa: F401
 from mindsdb.utilities.api_status import set_api_status
 
-try:
-    import torch.multiprocessing as mp
-except Exception:
-    import multiprocessing as mp
 try:
     mp.set_start_method("spawn")
 except RuntimeError:
-    logger.info("Torch multiprocessing context already set, ignoring...")
+    logger.info("Multiprocessing context already set, ignoring...")
 
 gc.enable()
 
@@ -64,6 +64,7 @@ class TrunkProcessEnum(Enum):
     TASKS = "tasks"
     ML_TASK_QUEUE = "ml_task_queue"
     LITELLM = "litellm"
+    FLIGHT = "flight"
 
     @classmethod
     def _missing_(cls, value):
@@ -172,6 +173,9 @@ def set_error_model_status_by_pids(unexisting_pids: List[int]):
     Args:
         unexisting_pids (List[int]): list of 'pids' that do not exist.
     """
+    from sqlalchemy.orm.attributes import flag_modified
+    import mindsdb.interfaces.storage.db as db
+
     predictor_records = (
         db.session.query(db.Predictor)
         .filter(
@@ -196,6 +200,9 @@ def set_error_model_status_for_unfinished():
     """Set error status to any model if status not in 'complete' or 'error'
     Note: only for local usage.
     """
+    from sqlalchemy.orm.attributes import flag_modified
+    import mindsdb.interfaces.storage.db as db
+
     predictor_records = (
         db.session.query(db.Predictor)
         .filter(
@@ -227,6 +234,8 @@ def create_permanent_integrations():
     Create permanent integrations, for now only the 'files' integration.
     NOTE: this is intentional to avoid importing integration_controller
     """
+    import mindsdb.interfaces.storage.db as db
+
     integration_name = "files"
     existing = db.session.query(db.Integration).filter_by(name=integration_name, company_id=None).first()
     if existing is None:
@@ -250,6 +259,10 @@ def validate_default_project() -> None:
     'is_default' metadata. If it is not possible, then terminate the process with error.
     Note: this can be done using 'project_controller', but we want to save init time and used RAM.
     """
+    from sqlalchemy import func
+    from sqlalchemy.orm.attributes import flag_modified
+    import mindsdb.interfaces.storage.db as db
+
     new_default_project_name = config.get("default_project")
     logger.debug(f"Checking if default project {new_default_project_name} exists")
     filter_company_id = ctx.company_id if ctx.company_id is not None else 0
@@ -369,15 +382,21 @@ if __name__ == "__main__":
         except Exception:
             pass
 
+    import mindsdb.interfaces.storage.db as db
+
     db.init()
 
     environment = config["environment"]
     if environment == "aws_marketplace":
+        from mindsdb.utilities.auth import register_oauth_client
+
         try:
             register_oauth_client()
         except Exception as e:
             logger.error(f"Something went wrong during client register: {e}")
     elif environment != "local":
+        from mindsdb.utilities.auth import get_aws_meta_data
+
         try:
             aws_meta_data = get_aws_meta_data()
             config.update({"aws_meta_data": aws_meta_data})
@@ -453,6 +472,12 @@ if __name__ == "__main__":
             port=config["api"]["postgres"]["port"],
             args=(config.cmd_args.verbose,),
         ),
+        TrunkProcessEnum.FLIGHT: TrunkProcessData(
+            name=TrunkProcessEnum.FLIGHT.value,
+            entrypoint=start_flight,
+            port=config["api"]["flight"]["port"],
+            args=(config.cmd_args.verbose,),
+        ),
         TrunkProcessEnum.JOBS: TrunkProcessData(
             name=TrunkProcessEnum.JOBS.value, entrypoint=start_scheduler, args=(config.cmd_args.verbose,)
         ),
@@ -500,6 +525,8 @@ if __name__ == "__main__":
         if trunc_process_data.port is None:
             set_api_status(trunc_process_data.name, True)
 
+    import_profiler.write_startup_report("main")
+
     atexit.register(close_api_gracefully, trunc_processes_struct=trunc_processes_struct)
     atexit.register(clean_mindsdb_tmp_dir)
 
@@ -1 +1,3 @@
-from .session_controller import SessionController
+from .session_controller import SessionController, SessionPool, session_pool
+
+__all__ = ["SessionController", "SessionPool", "session_pool"]
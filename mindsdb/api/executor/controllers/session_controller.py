@@ -8,6 +8,10 @@
  * permission of MindsDB Inc
  *******************************************************
 """
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
 from mindsdb.api.executor.datahub.datanodes import InformationSchemaDataNode
 from mindsdb.utilities.config import Config
 from mindsdb.interfaces.agents.agents_controller import AgentsController
@@ -16,6 +20,7 @@ from mindsdb.interfaces.database.database import DatabaseController
 from mindsdb.interfaces.skills.skills_controller import SkillsController
 from mindsdb.interfaces.functions.controller import FunctionController
 
+from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities import log
 
 logger = log.getLogger(__name__)
@@ -31,36 +36,117 @@ class SessionController:
         Initialize the session
         """
         self.api_type = api_type
-        self.username = None
-        self.auth = False
         self.logging = logger
-        self.database = None
 
         self.config = Config()
 
-        self.model_controller = ModelController()
-
         # to prevent circular imports
         from mindsdb.interfaces.database.integrations import integration_controller
         self.integration_controller = integration_controller
 
-        self.database_controller = DatabaseController()
-        self.skills_controller = SkillsController()
-        self.function_controller = FunctionController(self)
+        # controllers are created on the first use: most of the requests need only few of them
+        self._model_controller = None
+        self._database_controller = None
+        self._skills_controller = None
+        self._function_controller = None
+        self._kb_controller = None
+        self._datahub = None
+        self._agents_controller = None
 
-        # to prevent circular imports
-        from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseController
-        self.kb_controller = KnowledgeBaseController(self)
+        self._default_predictor_cache = False if self.config.get('cache')['type'] == 'none' else True
+        self.reset()
 
-        self.datahub = InformationSchemaDataNode(self)
-        self.agents_controller = AgentsController()
+    def reset(self):
+        """
+        Reset the state of the request, controllers are kept
+        """
+        self.username = None
+        self.auth = False
+        self.database = None
 
         self.prepared_stmts = {}
         self.packet_sequence_number = 0
         self.profiling = False
-        self.predictor_cache = False if self.config.get('cache')['type'] == 'none' else True
+        self.predictor_cache = self._default_predictor_cache
         self.show_secrets = False
 
+        # function controller keeps functions of the request
+        self._function_controller = None
+
+    # region controllers
+    @property
+    def model_controller(self) -> ModelController:
+        if self._model_controller is None:
+            self._model_controller = ModelController()
+        return self._model_controller
+
+    @model_controller.setter
+    def model_controller(self, value: ModelController):
+        self._model_controller = value
+
+    @property
+    def database_controller(self) -> DatabaseController:
+        if self._database_controller is None:
+            self._database_controller = DatabaseController()
+        return self._database_controller
+
+    @database_controller.setter
+    def database_controller(self, value: DatabaseController):
+        self._database_controller = value
+
+    @property
+    def skills_controller(self) -> SkillsController:
+        if self._skills_controller is None:
+            self._skills_controller = SkillsController()
+        return self._skills_controller
+
+    @skills_controller.setter
+    def skills_controller(self, value: SkillsController):
+        self._skills_controller = value
+
+    @property
+    def function_controller(self) -> FunctionController:
+        if self._function_controller is None:
+            self._function_controller = FunctionController(self)
+        return self._function_controller
+
+    @function_controller.setter
+    def function_controller(self, value: FunctionController):
+        self._function_controller = value
+
+    @property
+    def kb_controller(self):
+        if self._kb_controller is None:
+            # to prevent circular imports
+            from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseController
+            self._kb_controller = KnowledgeBaseController(self)
+        return self._kb_controller
+
+    @kb_controller.setter
+    def kb_controller(self, value):
+        self._kb_controller = value
+
+    @property
+    def datahub(self) -> InformationSchemaDataNode:
+        if self._datahub is None:
+            self._datahub = InformationSchemaDataNode(self)
+        return self._datahub
+
+    @datahub.setter
+    def datahub(self, value: InformationSchemaDataNode):
+        self._datahub = value
+
+    @property
+    def agents_controller(self) -> AgentsController:
+        if self._agents_controller is None:
+            self._agents_controller = AgentsController()
+        return self._agents_controller
+
+    @agents_controller.setter
+    def agents_controller(self, value: AgentsController):
+        self._agents_controller = value
+    # endregion
+
     def inc_packet_sequence_number(self):
         self.packet_sequence_number = (self.packet_sequence_number + 1) % 256
 
@@ -89,3 +175,71 @@ class SessionController:
     def from_json(self, updated):
         for key in updated:
             setattr(self, key, updated[key])
+
+
+class SessionPool:
+    """
+    Pool of idle sessions. Sessions are separated by company and api type,
+    a session is used by only one request at a time and its state is reset when it is returned to the pool
+    """
+
+    def __init__(self, max_idle: int = 16):
+        """
+        Args:
+            max_idle (int): max number of idle sessions of a company
+        """
+        self.max_idle = max_idle
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, api_type: str = 'http') -> SessionController:
+        """
+        Get idle session or create a new one
+
+        Args:
+            api_type (str): type of the api
+
+        Returns:
+            SessionController: session, it must be returned with `release`
+        """
+        key = (ctx.company_id, api_type)
+        session = None
+        with self._lock:
+            sessions = self._idle.get(key)
+            if sessions:
+                session = sessions.pop()
+        if session is None:
+            session = SessionController(api_type=api_type)
+        session._pool_key = key
+        return session
+
+    def release(self, session: SessionController) -> None:
+        """
+        Return session to the pool
+
+        Args:
+            session (SessionController): session which was taken by `acquire`
+        """
+        key = getattr(session, '_pool_key', None)
+        if key is None:
+            return
+        session.reset()
+        with self._lock:
+            sessions = self._idle.setdefault(key, [])
+            if len(sessions) < self.max_idle:
+                sessions.append(session)
+
+    @contextmanager
+    def session(self, api_type: str = 'http') -> Iterator[SessionController]:
+        session = self.acquire(api_type)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle = {}
+
+
+session_pool = SessionPool()
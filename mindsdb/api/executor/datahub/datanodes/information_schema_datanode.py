@@ -40,6 +40,7 @@ from .mindsdb_tables import (
     HandlersTable,
     JobsTable,
     QueriesTable,
+    QueryStatsTable,
     ChatbotsTable,
     KBTable,
     SkillsTable,
@@ -86,6 +87,7 @@ class InformationSchemaDataNode(DataNode):
         ViewsTable,
         TriggersTable,
         QueriesTable,
+        QueryStatsTable,
         MetaHandlerInfoTable,
     ]
 
@@ -3,7 +3,6 @@ import inspect
 from dataclasses import astuple
 from typing import Iterable, List
 
-import numpy as np
 import pandas as pd
 from sqlalchemy.types import Integer, Float
 
@@ -15,8 +14,11 @@ from mindsdb.api.executor.datahub.datanodes.datanode import DataNode
 from mindsdb.api.executor.datahub.classes.tables_row import TablesRow
 from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
 from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.utilities.sql import normalize_nulls
 from mindsdb.integrations.libs.response import HandlerResponse, INF_SCHEMA_COLUMNS_NAMES
 from mindsdb.integrations.utilities.utils import get_class_name
+from mindsdb.interfaces.skills.schema_cache import get_schema_cache
+from mindsdb.interfaces.database.metadata_cache import invalidate_metadata_cache
 from mindsdb.metrics import metrics
 from mindsdb.utilities import log
 from mindsdb.utilities.profiler import profiler
@@ -119,6 +121,8 @@ class IntegrationDataNode(DataNode):
     def drop_table(self, name: Identifier, if_exists=False):
         drop_ast = DropTables(tables=[name], if_exists=if_exists)
         self.query(drop_ast)
+        get_schema_cache().invalidate(self.integration_name, name.parts[-1])
+        invalidate_metadata_cache(self.integration_name)
 
     def create_table(
         self,
@@ -154,6 +158,8 @@ class IntegrationDataNode(DataNode):
             except Exception as e:
                 if raise_if_exists:
                     raise e
+            get_schema_cache().invalidate(self.integration_name, table_name.parts[-1])
+            invalidate_metadata_cache(self.integration_name)
 
         if result_set is None:
             # it is just a 'create table'
@@ -237,6 +243,7 @@ class IntegrationDataNode(DataNode):
                 get_class_name(self.integration_handler), result.type
             )
             response_size_with_labels.observe(num_rows)
+            profiler.set_attributes(integration=self.integration_name, engine=self.ds_type, rows=num_rows)
         except Exception as e:
             msg = str(e).strip()
             if msg == "":
@@ -268,9 +275,8 @@ class IntegrationDataNode(DataNode):
             df = df.to_frame()
 
         try:
-            # replace python's Nan, np.NaN, np.nan and pd.NA to None
-            # TODO keep all NAN to the end of processing, bacause replacing also changes dtypes
-            df.replace([np.NaN, pd.NA, pd.NaT], None, inplace=True)
+            # nulls of typed columns are kept, they are replaced with None by the encoders of the output
+            normalize_nulls(df)
         except Exception as e:
             logger.error(f"Issue with clearing DF from NaN values: {e}")
         # endregion
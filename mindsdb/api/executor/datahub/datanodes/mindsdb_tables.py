@@ -1,15 +1,17 @@
 import json
+import datetime
 
 import pandas as pd
 from mindsdb_sql_parser.ast import BinaryOperation, Constant, Select
 from mindsdb_sql_parser.ast.base import ASTNode
 
-from mindsdb.interfaces.agents.agents_controller import AgentsController
 from mindsdb.interfaces.jobs.jobs_controller import JobsController
 from mindsdb.interfaces.skills.skills_controller import SkillsController
 from mindsdb.interfaces.database.views import ViewController
 from mindsdb.interfaces.database.projects import ProjectController
 from mindsdb.interfaces.query_context.context_controller import query_context_controller
+from mindsdb.utilities.query_stats import query_stats, STEP_STATS_COLUMNS
+from mindsdb.utilities.context import context as ctx
 
 from mindsdb.api.executor.datahub.datanodes.system_tables import Table
 
@@ -406,6 +408,8 @@ class AgentsTable(MdbTable):
 
     @classmethod
     def get_data(cls, query: ASTNode = None, inf_schema=None, **kwargs):
+        from mindsdb.interfaces.agents.agents_controller import AgentsController
+
         agents_controller = AgentsController()
 
         project_name = get_project_name(query)
@@ -476,3 +480,20 @@ class QueriesTable(MdbTable):
         data = [[row[k] for k in columns_lower] for row in data]
 
         return pd.DataFrame(data, columns=cls.columns)
+
+
+class QueryStatsTable(MdbTable):
+    name = "QUERY_STATS"
+    columns = ["FINISHED_AT", "SQL", "DATABASE", "PLAN_CACHE_HIT"] + [col.upper() for col in STEP_STATS_COLUMNS]
+
+    @classmethod
+    def get_data(cls, **kwargs):
+        """
+        Returns statistics of the steps of recently executed queries, one row per step.
+        Time columns are in seconds
+        """
+        data = [
+            [datetime.datetime.fromtimestamp(record[0])] + list(record[1:])
+            for record in query_stats.get_records(ctx.company_id)
+        ]
+        return pd.DataFrame(data, columns=cls.columns)
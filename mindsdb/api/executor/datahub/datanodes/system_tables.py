@@ -1,5 +1,6 @@
-from typing import Optional, List, Literal
-from dataclasses import dataclass, fields
+from typing import Dict, Optional, List, Literal
+from functools import partial
+from dataclasses import astuple, dataclass, fields
 
 import pandas as pd
 from mindsdb_sql_parser.ast.base import ASTNode
@@ -9,6 +10,9 @@ from mindsdb.utilities.config import config
 from mindsdb.integrations.utilities.sql_utils import extract_comparison_conditions
 from mindsdb.integrations.libs.response import INF_SCHEMA_COLUMNS_NAMES
 from mindsdb.interfaces.data_catalog.data_catalog_reader import DataCatalogReader
+from mindsdb.interfaces.data_catalog.data_catalog_loader import DataCatalogLoader
+from mindsdb.interfaces.database.metadata_cache import get_metadata_cache, make_metadata_key
+from mindsdb.interfaces.storage import db
 from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import MYSQL_DATA_TYPE, MYSQL_DATA_TYPE_COLUMNS_DEFAULT
 from mindsdb.api.executor.datahub.classes.tables_row import TABLES_ROW_TYPE, TablesRow
 
@@ -39,6 +43,115 @@ def _get_scope(query):
     return databases, tables
 
 
+# region metadata of integrations
+# Loaders are executed in the threads of the metadata cache, each load uses its own session:
+# session of the query is not thread-safe.
+def _load_integration_tables(integration_name: str) -> List[TablesRow]:
+    from mindsdb.api.executor.controllers import session_pool
+
+    with session_pool.session() as session:
+        return session.datahub.get(integration_name).get_tables()
+
+
+def _get_metadata(items: list, description: str) -> list:
+    """Get metadata from the cache, sources which didn't respond in time are logged: the result is partial"""
+    cache = get_metadata_cache()
+    results, skipped = cache.get_many(items)
+    if len(skipped) > 0:
+        names = ", ".join(".".join(part for part in key[1:] if part is not None) for key in skipped)
+        logger.warning(
+            f"{description} is partial: metadata of {names} was not loaded in {cache.timeout} seconds, "
+            "it is still loading in the background"
+        )
+    return results
+
+
+def _get_integrations_tables(integrations_names: List[str]) -> Dict[str, Optional[List[TablesRow]]]:
+    """Get lists of tables of integrations. Integrations are requested concurrently, results are cached.
+
+    Args:
+        integrations_names (List[str]): names of integrations
+
+    Returns:
+        Dict[str, Optional[List[TablesRow]]]: tables of each integration, None if integration did not respond in time
+    """
+    items = [(make_metadata_key(name), partial(_load_integration_tables, name)) for name in integrations_names]
+    return dict(zip(integrations_names, _get_metadata(items, "List of tables")))
+
+
+def _get_catalog_columns_df(session, integration_name: str, table_name: str) -> Optional[pd.DataFrame]:
+    """Get columns of the table from the data catalog
+
+    Returns:
+        Optional[pd.DataFrame]: columns in the format of integrations.libs.response.INF_SCHEMA_COLUMNS_NAMES
+            or None if the table is not in the catalog
+    """
+    integration_id = session.integration_controller.get(integration_name)["id"]
+    meta_table = db.MetaTables.query.filter_by(integration_id=integration_id, name=table_name).first()
+    if meta_table is None or len(meta_table.meta_columns) == 0:
+        return None
+
+    columns = sorted(meta_table.meta_columns, key=lambda column: column.id)
+    df = pd.DataFrame(
+        {
+            INF_SCHEMA_COLUMNS_NAMES.COLUMN_NAME: [column.name for column in columns],
+            INF_SCHEMA_COLUMNS_NAMES.DATA_TYPE: [column.data_type for column in columns],
+            INF_SCHEMA_COLUMNS_NAMES.ORDINAL_POSITION: list(range(1, len(columns) + 1)),
+            INF_SCHEMA_COLUMNS_NAMES.COLUMN_DEFAULT: [column.default_value for column in columns],
+            INF_SCHEMA_COLUMNS_NAMES.IS_NULLABLE: [
+                None if column.is_nullable is None else ("YES" if column.is_nullable else "NO") for column in columns
+            ],
+        }
+    )
+    for column_name in astuple(INF_SCHEMA_COLUMNS_NAMES):
+        if column_name not in df.columns:
+            df[column_name] = None
+    return df
+
+
+def _load_table_columns(integration_name: str, table_name: str) -> pd.DataFrame:
+    from mindsdb.api.executor.controllers import session_pool
+
+    persist = get_metadata_cache().persist and config["data_catalog"]["enabled"]
+    with session_pool.session() as session:
+        if persist:
+            df = _get_catalog_columns_df(session, integration_name, table_name)
+            if df is not None:
+                return df
+
+        df = session.datahub.get(integration_name).get_table_columns_df(table_name)
+
+    if persist:
+        try:
+            DataCatalogLoader(database_name=integration_name, table_names=[table_name]).load_metadata()
+        except Exception as e:
+            logger.warning(f"Can't save metadata of '{integration_name}.{table_name}' to the data catalog: {e}")
+    return df
+
+
+def _get_integration_columns(integration_name: str, tables_names: List[str]) -> Dict[str, Optional[pd.DataFrame]]:
+    """Get columns of tables of the integration. Tables are requested concurrently, results are cached.
+
+    Args:
+        integration_name (str): name of the integration
+        tables_names (List[str]): names of the tables
+
+    Returns:
+        Dict[str, Optional[pd.DataFrame]]: columns of each table, None if table is not described in time
+    """
+    items = [
+        (
+            make_metadata_key(integration_name, table_name),
+            partial(_load_table_columns, integration_name, table_name),
+        )
+        for table_name in tables_names
+    ]
+    return dict(zip(tables_names, _get_metadata(items, "List of columns")))
+
+
+# endregion
+
+
 class Table:
     deletable: bool = False
     visible: bool = False
@@ -120,18 +233,15 @@ class TablesTable(Table):
                 row.TABLE_SCHEMA = ds_name
                 data.append(row.to_list())
 
-        for ds_name in inf_schema.get_integrations_names():
-            if databases is not None and ds_name not in databases:
+        integrations_names = [
+            ds_name for ds_name in inf_schema.get_integrations_names() if databases is None or ds_name in databases
+        ]
+        for ds_name, ds_tables in _get_integrations_tables(integrations_names).items():
+            if ds_tables is None:
                 continue
-
-            try:
-                ds = inf_schema.get(ds_name)
-                ds_tables = ds.get_tables()
-                for row in ds_tables:
-                    row.TABLE_SCHEMA = ds_name
-                    data.append(row.to_list())
-            except Exception:
-                logger.error(f"Can't get tables from '{ds_name}'")
+            for row in ds_tables:
+                row.TABLE_SCHEMA = ds_name
+                data.append(row.to_list())
 
         for project_name in inf_schema.get_projects_names():
             if databases is not None and project_name not in databases:
@@ -205,13 +315,13 @@ class ColumnsTableRow:
     ORIGINAL_TYPE: Optional[str] = None
 
     @classmethod
-    def from_is_columns_row(cls, table_schema: str, table_name: str, row: pd.Series) -> "ColumnsTableRow":
+    def from_is_columns_row(cls, table_schema: str, table_name: str, row: dict | pd.Series) -> "ColumnsTableRow":
         """Transform row from response of `handler.get_columns(...)` to internal information_schema.columns row.
 
         Args:
             table_schema (str): The name of the schema of the table which columns are described.
             table_name (str): The name of the table which columns are described.
-            row (pd.Series): A row from the response of `handler.get_columns(...)`.
+            row (dict | pd.Series): A row from the response of `handler.get_columns(...)`, it may be changed.
 
         Returns:
             ColumnsTableRow: A row in the MindsDB's internal INFORMATION_SCHEMA.COLUMNS table.
@@ -287,23 +397,33 @@ class ColumnsTable(Table):
         if databases is None:
             databases = ["information_schema", config.get("default_project"), "files"]
 
+        integrations_names = set(inf_schema.get_integrations_names())
+
         result = []
         for db_name in databases:
-            tables = {}
-
-            dn = inf_schema.get(db_name)
-            if dn is None:
-                continue
-
-            if tables_names is None:
-                list_tables = [t.TABLE_NAME for t in dn.get_tables()]
+            if db_name.lower() in integrations_names:
+                # remote database: tables are requested concurrently and cached
+                if tables_names is None:
+                    ds_tables = _get_integrations_tables([db_name])[db_name] or []
+                    list_tables = [t.TABLE_NAME for t in ds_tables]
+                else:
+                    list_tables = tables_names
+                tables = _get_integration_columns(db_name, list_tables)
             else:
-                list_tables = tables_names
-            for table_name in list_tables:
-                tables[table_name] = dn.get_table_columns_df(table_name)
+                dn = inf_schema.get(db_name)
+                if dn is None:
+                    continue
+
+                if tables_names is None:
+                    list_tables = [t.TABLE_NAME for t in dn.get_tables()]
+                else:
+                    list_tables = tables_names
+                tables = {table_name: dn.get_table_columns_df(table_name) for table_name in list_tables}
 
             for table_name, table_columns_df in tables.items():
-                for _, row in table_columns_df.iterrows():
+                if table_columns_df is None:
+                    continue
+                for row in table_columns_df.to_dict(orient="records"):
                     result.append(
                         ColumnsTableRow.from_is_columns_row(table_schema=db_name, table_name=table_name, row=row)
                     )
@@ -37,3 +37,11 @@ class WrongArgumentError(ExecutorException):
 
 class LogicError(ExecutorException):
     pass
+
+
+class MemoryLimitError(ExecutorException):
+    pass
+
+
+class AdmissionTimeoutError(ExecutorException):
+    pass
@@ -0,0 +1,387 @@
+import copy
+import time
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from mindsdb_sql_parser.ast import ASTNode, Constant, Parameter
+from sqlalchemy import func as sa_func
+from sqlalchemy.exc import IntegrityError
+
+from mindsdb.api.executor.planner.query_plan import QueryPlan
+from mindsdb.api.executor.planner.steps import PlanStep
+from mindsdb.integrations.utilities.query_traversal import query_traversal
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities.config import config
+from mindsdb.utilities.context import context as ctx
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+class LiftedConstant(Constant):
+    """Constant of the query which is a parameter of the cached plan"""
+
+    def __init__(self, value, param_index: int, *args, **kwargs):
+        super().__init__(value, *args, **kwargs)
+        self.param_index = param_index
+
+
+def lift_constants(query: ASTNode) -> Tuple[str, list, ASTNode]:
+    """Make normalized text of the query, in which constants are replaced by placeholders.
+    The query itself is not changed: constants are replaced by LiftedConstant in a copy of the query,
+    the copy is used to make the plan which is stored in the cache
+
+    Args:
+        query (ASTNode): the query
+
+    Returns:
+        Tuple[str, list, ASTNode]: normalized text of the query, values of constants and
+            the copy of the query with lifted constants
+    """
+    values = []
+
+    def _lift(node, **kwargs):
+        # subclasses of Constant (like Last) have special meaning for the planner, they are kept as is
+        if type(node) is Constant:
+            lifted = LiftedConstant(
+                node.value,
+                len(values),
+                with_quotes=node.with_quotes,
+                alias=node.alias,
+                parentheses=node.parentheses,
+            )
+            values.append(node.value)
+            return lifted
+
+    lifted_query = copy.deepcopy(query)
+    query_traversal(lifted_query, _lift)
+
+    def _placeholder(node, **kwargs):
+        if isinstance(node, LiftedConstant):
+            # type of the value is a part of the query shape
+            return Parameter(f"{type(node.value).__name__}", alias=node.alias)
+
+    normalized = copy.deepcopy(lifted_query)
+    query_traversal(normalized, _placeholder)
+    return normalized.to_string(), values, lifted_query
+
+
+def _bind(obj, values: list, visited: set) -> None:
+    # set values of parameters in all ast nodes and steps of the plan
+    if id(obj) in visited:
+        return
+    visited.add(id(obj))
+
+    if isinstance(obj, LiftedConstant):
+        obj.value = values[obj.param_index]
+    elif isinstance(obj, (list, tuple, set)):
+        for item in obj:
+            _bind(item, values, visited)
+    elif isinstance(obj, dict):
+        for item in obj.values():
+            _bind(item, values, visited)
+    elif isinstance(obj, (ASTNode, PlanStep, QueryPlan)):
+        for item in vars(obj).values():
+            _bind(item, values, visited)
+
+
+def _find_plain_values(obj, values: set, visited: set, in_ast: bool = False) -> bool:
+    # search for values of lifted constants copied by the planner out of ast nodes
+    if id(obj) in visited:
+        return False
+    visited.add(id(obj))
+
+    if isinstance(obj, LiftedConstant):
+        return False
+    if isinstance(obj, Constant):
+        return _is_value(obj.value, values)
+    if isinstance(obj, (list, tuple, set)):
+        return any(_find_plain_values(item, values, visited, in_ast) for item in obj)
+    elif isinstance(obj, dict):
+        return any(_find_plain_values(item, values, visited, in_ast) for item in obj.values())
+    elif isinstance(obj, ASTNode):
+        # only constants are values in ast, other attributes are names and options
+        return any(_find_plain_values(item, values, visited, True) for item in vars(obj).values())
+    elif isinstance(obj, QueryPlan):
+        return _find_plain_values(obj.steps, values, visited)
+    elif isinstance(obj, PlanStep):
+        return any(
+            _find_plain_values(item, values, visited, in_ast) for name, item in vars(obj).items() if name != "step_num"
+        )
+    elif in_ast or isinstance(obj, bool):
+        # flags of steps are not values
+        return False
+    return _is_value(obj, values)
+
+
+def _is_value(obj, values: set) -> bool:
+    try:
+        return (type(obj), obj) in values
+    except TypeError:
+        return False
+
+
+def has_plain_values(plan: QueryPlan, values: list) -> bool:
+    """Check if the plan contains values of lifted constants which are not LiftedConstant:
+    for example, a value from 'where' stored in a dict of the step or wrapped in a new Constant.
+    Such values are not changed by bind_plan
+
+    Args:
+        plan (QueryPlan): plan of the query with lifted constants
+        values (list): values of the query constants
+
+    Returns:
+        bool: True if the plan contains values of constants out of LiftedConstant
+    """
+    hashable = set()
+    for value in values:
+        try:
+            hashable.add((type(value), value))
+        except TypeError:
+            pass
+    if len(hashable) == 0:
+        return False
+    return _find_plain_values(plan, hashable, set())
+
+
+def bind_plan(plan: QueryPlan, values: list) -> QueryPlan:
+    """Make a copy of the cached plan with new values of parameters
+
+    Args:
+        plan (QueryPlan): cached plan
+        values (list): values of the query constants
+
+    Returns:
+        QueryPlan: plan for the query
+    """
+    plan = copy.deepcopy(plan)
+    _bind(plan, values, set())
+    return plan
+
+
+class _PlanRecord:
+    __slots__ = ("plan", "values", "integrations", "verified", "cacheable", "plain_values", "version", "expires_at")
+
+    def __init__(self, plan: QueryPlan, values: list, integrations: Optional[list], version: int, expires_at: float):
+        self.plan = plan
+        self.values = values
+        self.integrations = integrations
+        self.verified = False
+        self.cacheable = True
+        self.plain_values = has_plain_values(plan, values)
+        self.version = version
+        self.expires_at = expires_at
+
+
+class PlanCache:
+    """Cache of query plans, shared by all sessions of the process.
+
+    Constants of the query are lifted out as parameters (see lift_constants) and the plan is stored by
+    the normalized text of the query. On hit the plan is copied and the new values of constants are bound to it.
+
+    Planner may use values of constants not only as ast nodes (for example, values from 'where' for
+    predictor row step). That is why the plan is reused for other values only after it is verified:
+    when the same query with other constants is planned for the second time, the cached plan with bound
+    values must be equal to the new plan. Otherwise, the query is marked as not cacheable.
+    The plan is reused without verification for exactly the same query.
+
+    One verification is enough only if every value of the constants is kept in the plan as LiftedConstant.
+    Branches of the planner which look at values (predictor 'where' to row_dict, limits of timeseries
+    predictors) are used only for queries with models, such queries are not cached. Other branches check
+    only types of nodes and the type of every constant is a part of the key. If the planner copied a value
+    out of the ast node anyway (see has_plain_values), the plan is never verified and is reused only for
+    the same values.
+
+    Plan depends on the list of projects, integrations, models, agents and views, records of the company
+    are dropped on any change of them. Other processes are notified by the version of the plans stored in
+    the database (see get_version and invalidate_plan_cache): the version is read once per query and
+    records made with another version are not used.
+
+    Settings are taken from config['plan_cache']:
+        enabled: use the cache or not
+        ttl: lifetime of a record, seconds
+        max_size: max number of records
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_size: Optional[int] = None):
+        cache_config = config["plan_cache"]
+        self.enabled = cache_config["enabled"]
+        self.ttl = ttl if ttl is not None else cache_config["ttl"]
+        self.max_size = max_size if max_size is not None else cache_config["max_size"]
+
+        self._records: OrderedDict[Hashable, _PlanRecord] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(normalized_query: str, database: Optional[str]) -> Hashable:
+        return ctx.company_id, database, normalized_query
+
+    @staticmethod
+    def get_version(company_id: Optional[int] = None) -> Optional[int]:
+        """Get the version of plans of the company, it is changed by invalidate_plan_cache in any process
+
+        Args:
+            company_id (Optional[int]): id of the company, current company by default
+
+        Returns:
+            Optional[int]: version of plans, None if it can't be read and the cache must not be used
+        """
+        if db.session is None:
+            # storage is not initialized, there are no other processes to be notified
+            return 0
+        if company_id is None:
+            company_id = ctx.company_id
+        try:
+            version = (
+                db.session.query(sa_func.max(db.PlanCacheVersion.version))
+                .filter(db.PlanCacheVersion.company_id == company_id)
+                .scalar()
+            )
+        except Exception as e:
+            logger.warning(f"Unable to read version of the plan cache: {e}")
+            db.session.rollback()
+            return None
+        return version or 0
+
+    def get(self, key: Hashable, values: list, version: int = 0) -> Optional[Tuple[QueryPlan, Optional[list]]]:
+        """Get plan for the query
+
+        Args:
+            key (Hashable): key of the query, see make_key
+            values (list): values of the query constants
+            version (int): version of plans read before the query was planned, see get_version
+
+        Returns:
+            Optional[Tuple[QueryPlan, Optional[list]]]: plan with bound values and integrations
+                the planner was created with, or None
+        """
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None and (record.expires_at < time.monotonic() or record.version != version):
+                del self._records[key]
+                record = None
+
+            if record is None or not record.cacheable or not (record.verified or record.values == values):
+                self.misses += 1
+                return None
+
+            self._records.move_to_end(key)
+            self.hits += 1
+            plan = record.plan
+            integrations = record.integrations
+        return bind_plan(plan, values), integrations
+
+    def contains(self, key: Hashable, version: int = 0) -> bool:
+        """Check if there is a record for the query, it is not checked if the record is expired
+
+        Args:
+            key (Hashable): key of the query, see make_key
+            version (int): version of plans, see get_version
+
+        Returns:
+            bool: True if the record of the version exists
+        """
+        with self._lock:
+            record = self._records.get(key)
+            return record is not None and record.version == version
+
+    def set(
+        self, key: Hashable, values: list, plan: QueryPlan, integrations: Optional[list] = None, version: int = 0
+    ) -> None:
+        """Put plan to the cache or verify the cached one
+
+        Args:
+            key (Hashable): key of the query, see make_key
+            values (list): values of the query constants
+            plan (QueryPlan): plan of the query. If there is no record for the query yet, it must be the plan
+                of the query with lifted constants (see lift_constants), otherwise the plan is used only to
+                verify the cached one
+            integrations (Optional[list]): databases the planner was created with
+            version (int): version of plans read before the query was planned, see get_version
+        """
+        with self._lock:
+            record = self._records.get(key)
+        if record is not None and record.version != version:
+            # the record is made with other state of objects, it is replaced
+            record = None
+        if record is not None and record.cacheable and not record.verified and record.values != values:
+            # the same query with other values: check that the plan is the same
+            bound_plan = bind_plan(record.plan, values)
+            if repr(bound_plan.steps) == repr(plan.steps):
+                # the plan with plain values may be equal only by chance, it is checked every time
+                record.verified = not record.plain_values
+            else:
+                logger.debug("Plan of the query depends on values of constants, it will not be cached")
+                record.cacheable = False
+            return
+        if record is not None:
+            return
+
+        record = _PlanRecord(copy.deepcopy(plan), values, integrations, version, time.monotonic() + self.ttl)
+        with self._lock:
+            self._records[key] = record
+            while len(self._records) > self.max_size:
+                self._records.popitem(last=False)
+
+    def invalidate(self, company_id: Optional[int] = None) -> None:
+        """Remove all plans of the company
+
+        Args:
+            company_id (Optional[int]): id of the company, current company by default
+        """
+        if company_id is None:
+            company_id = ctx.company_id
+        with self._lock:
+            keys = [key for key in self._records if key[0] == company_id]
+            for key in keys:
+                del self._records[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+_plan_cache = None
+_plan_cache_lock = threading.Lock()
+
+
+def get_plan_cache() -> PlanCache:
+    """Returns process-wide instance of the cache"""
+    global _plan_cache
+    if _plan_cache is None:
+        with _plan_cache_lock:
+            if _plan_cache is None:
+                _plan_cache = PlanCache()
+    return _plan_cache
+
+
+def _increment_version(company_id: Optional[int]) -> None:
+    # notify other processes: plans made with the previous version are not used
+    column = db.PlanCacheVersion.version
+    for _ in range(2):
+        updated = (
+            db.session.query(db.PlanCacheVersion)
+            .filter(db.PlanCacheVersion.company_id == company_id)
+            .update({column: column + 1}, synchronize_session=False)
+        )
+        if updated == 0:
+            db.session.add(db.PlanCacheVersion(company_id=company_id, version=1))
+        try:
+            db.session.commit()
+            return
+        except IntegrityError:
+            # the record is created by another process at the same time
+            db.session.rollback()
+
+
+def invalidate_plan_cache() -> None:
+    """Drop cached plans of the current company in all processes, must be called when objects used by planner
+    are changed. Changes of the objects must be committed before the call
+    """
+    if _plan_cache is not None:
+        _plan_cache.invalidate()
+    if config["plan_cache"]["enabled"] and db.session is not None:
+        _increment_version(ctx.company_id)
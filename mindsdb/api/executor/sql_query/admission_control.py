@@ -0,0 +1,235 @@
+import time
+import functools
+import threading
+import contextvars
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from mindsdb.api.executor.exceptions import AdmissionTimeoutError
+from mindsdb.api.executor.planner.steps import PlanStep, FetchDataframeStep, MultipleSteps
+from mindsdb.utilities.config import config
+from mindsdb.utilities import log
+
+from .step_scheduler import is_parallel_step
+
+logger = log.getLogger(__name__)
+
+LIGHT_POOL = "light"
+HEAVY_POOL = "heavy"
+
+# queries which read only these databases are executed in the light pool
+LIGHT_DATABASES = ("information_schema", "log")
+
+
+class AdmissionMetrics:
+    """Prometheus metrics of the admission control"""
+
+    def __init__(self):
+        self.queue_depth = Gauge(
+            "mindsdb_admission_queue_depth",
+            "How many queries wait for a free execution slot",
+            ("pool",),
+            multiprocess_mode="livesum",
+        )
+        self.active = Gauge(
+            "mindsdb_admission_active_queries",
+            "How many queries are executed",
+            ("pool",),
+            multiprocess_mode="livesum",
+        )
+        self.wait_time = Histogram(
+            "mindsdb_admission_wait_seconds",
+            "How long queries wait for a free execution slot",
+            ("pool",),
+        )
+        self.timeouts = Counter(
+            "mindsdb_admission_timeouts",
+            "How many queries were rejected because they waited for a slot longer than the queue timeout",
+            ("pool",),
+        )
+
+
+@functools.cache
+def get_metrics() -> AdmissionMetrics:
+    # metrics are registered on the first use, not on import
+    return AdmissionMetrics()
+
+
+# the current context already holds a slot: nested queries (views, knowledge bases, ...) don't take another one
+_admitted = contextvars.ContextVar("mindsdb_admitted", default=False)
+
+
+def get_query_pool(steps: List[PlanStep]) -> str:
+    """Get the pool of the query: light for in-memory steps over metadata tables, heavy for everything else
+
+    Args:
+        steps (List[PlanStep]): steps of the plan
+
+    Returns:
+        str: name of the pool
+    """
+    for step in steps:
+        if isinstance(step, MultipleSteps):
+            if get_query_pool(step.steps) == HEAVY_POOL:
+                return HEAVY_POOL
+            continue
+        if not is_parallel_step(step):
+            return HEAVY_POOL
+        if isinstance(step, FetchDataframeStep):
+            if not isinstance(step.integration, str) or step.integration.lower() not in LIGHT_DATABASES:
+                return HEAVY_POOL
+    return LIGHT_POOL
+
+
+@dataclass(eq=False)
+class _Waiter:
+    company_id: object
+    event: threading.Event = field(default_factory=threading.Event)
+    admitted: bool = False
+
+
+@dataclass
+class Ticket:
+    pool: str
+    company_id: object
+    token: contextvars.Token
+
+
+class _Pool:
+    def __init__(self, name: str):
+        self.name = name
+        self.active = 0
+        self.queued = 0
+        self.active_per_company: Dict[object, int] = defaultdict(int)
+        self.waiting: Dict[object, Deque[_Waiter]] = defaultdict(deque)
+        # virtual time of the companies: number of admitted queries divided by the weight of the company
+        self.vtime: Dict[object, float] = {}
+        self.clock = 0.0
+
+    def forget_idle(self, company_id):
+        if self.active_per_company.get(company_id) == 0:
+            del self.active_per_company[company_id]
+        if company_id in self.waiting and len(self.waiting[company_id]) == 0:
+            del self.waiting[company_id]
+        if company_id not in self.active_per_company and company_id not in self.waiting:
+            self.vtime.pop(company_id, None)
+
+
+class AdmissionController:
+    """Limits the number of queries which are executed at the same time.
+
+    Queries are split into two pools (see get_query_pool), every pool has its own global limit
+    (`admission_control.<pool>.max_concurrent`) and the limit for one company (`max_per_company`). When there is
+    no free slot, the query waits in the queue of its company. A free slot is given to the company with the least
+    virtual time: the number of its admitted queries divided by its weight (`admission_control.company_weights`),
+    so a company with many queries doesn't starve others. The query fails with AdmissionTimeoutError if it waits
+    longer than `admission_control.queue_timeout` seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools = {name: _Pool(name) for name in (LIGHT_POOL, HEAVY_POOL)}
+
+    @staticmethod
+    def _get_weight(company_id) -> float:
+        weights = config["admission_control"]["company_weights"] or {}
+        return float(weights.get(str(company_id), 1))
+
+    def acquire(self, company_id, pool_name: str) -> Optional[Ticket]:
+        """Wait for a free execution slot
+
+        Args:
+            company_id: owner of the query
+            pool_name (str): light or heavy
+
+        Returns:
+            Optional[Ticket]: ticket to release the slot, None if admission control is not applied
+
+        Raises:
+            AdmissionTimeoutError: there was no free slot during the queue timeout
+        """
+        admission_config = config["admission_control"]
+        if not admission_config["enabled"] or _admitted.get():
+            return None
+
+        pool = self._pools[pool_name]
+        waiter = _Waiter(company_id)
+        start_time = time.perf_counter()
+        with self._lock:
+            if company_id not in pool.vtime:
+                # idle company doesn't keep the credit: it starts from the current virtual time
+                pool.vtime[company_id] = pool.clock
+            pool.waiting[company_id].append(waiter)
+            pool.queued += 1
+            self._dispatch(pool)
+
+        if not waiter.event.wait(timeout=admission_config["queue_timeout"]):
+            with self._lock:
+                if not waiter.admitted:
+                    pool.waiting[company_id].remove(waiter)
+                    pool.queued -= 1
+                    pool.forget_idle(company_id)
+                    get_metrics().queue_depth.labels(pool_name).set(pool.queued)
+                    get_metrics().timeouts.labels(pool_name).inc()
+                    raise AdmissionTimeoutError(
+                        f"The query waited for execution longer than {admission_config['queue_timeout']} seconds,"
+                        " the server is busy"
+                    )
+
+        wait_time = time.perf_counter() - start_time
+        get_metrics().wait_time.labels(pool_name).observe(wait_time)
+        if wait_time > 1:
+            logger.info(f"Query waited for a free slot in {pool_name} pool for {wait_time:.1f}s")
+        return Ticket(pool=pool_name, company_id=company_id, token=_admitted.set(True))
+
+    def release(self, ticket: Optional[Ticket]):
+        """Free the slot taken by acquire"""
+        if ticket is None:
+            return
+        _admitted.reset(ticket.token)
+        pool = self._pools[ticket.pool]
+        with self._lock:
+            pool.active -= 1
+            pool.active_per_company[ticket.company_id] -= 1
+            pool.forget_idle(ticket.company_id)
+            self._dispatch(pool)
+
+    def _dispatch(self, pool: _Pool):
+        """Give free slots of the pool to waiting queries, must be called under the lock"""
+        pool_config = config["admission_control"][pool.name]
+        max_per_company = pool_config["max_per_company"]
+        while pool.active < pool_config["max_concurrent"]:
+            candidates = [
+                company_id
+                for company_id, waiters in pool.waiting.items()
+                if len(waiters) > 0
+                and (max_per_company is None or pool.active_per_company.get(company_id, 0) < max_per_company)
+            ]
+            if len(candidates) == 0:
+                break
+            company_id = min(candidates, key=pool.vtime.__getitem__)
+            waiter = pool.waiting[company_id].popleft()
+            pool.clock = pool.vtime[company_id]
+            pool.vtime[company_id] += 1 / self._get_weight(company_id)
+            pool.queued -= 1
+            pool.active += 1
+            pool.active_per_company[company_id] += 1
+            waiter.admitted = True
+            waiter.event.set()
+        get_metrics().queue_depth.labels(pool.name).set(pool.queued)
+        get_metrics().active.labels(pool.name).set(pool.active)
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Get the current state of the pools
+
+        Returns:
+            Dict[str, dict]: pool name -> number of active and queued queries
+        """
+        with self._lock:
+            return {name: {"active": pool.active, "queued": pool.queued} for name, pool in self._pools.items()}
+
+
+admission_controller = AdmissionController()
@@ -0,0 +1,172 @@
+import threading
+from collections import defaultdict
+from typing import Collection, Dict, Optional
+
+from mindsdb.api.executor.exceptions import MemoryLimitError
+from mindsdb.utilities.config import config
+from mindsdb.utilities import log
+
+from .result_set import ResultSet
+
+logger = log.getLogger(__name__)
+
+MB = 1 << 20
+
+
+class MemoryTracker:
+    """Memory held by the results of the steps of all running queries, per company"""
+
+    def __init__(self):
+        self._usage: Dict[object, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def change(self, company_id, size: int) -> int:
+        """Add (or subtract) memory of the company
+
+        Returns:
+            int: memory of the company after the change, bytes
+        """
+        with self._lock:
+            usage = self._usage[company_id] + size
+            if usage == 0:
+                del self._usage[company_id]
+            else:
+                self._usage[company_id] = usage
+            return usage
+
+    def get_usage(self, company_id) -> int:
+        with self._lock:
+            return self._usage.get(company_id, 0)
+
+
+memory_tracker = MemoryTracker()
+
+
+def is_accounting_enabled() -> bool:
+    memory_config = config["query_memory"]
+    return memory_config["max_query_mb"] is not None or memory_config["max_company_mb"] is not None
+
+
+class QueryMemory:
+    """Accounting of memory held by the results of the steps of one query.
+
+    Results are added when a step is finished and removed when they are released (no next step uses them) or when
+    the query is finished. Deferred and spilled results are accounted again when their data is loaded to memory.
+    If the query or its company exceeds the budget (`query_memory.max_query_mb`, `query_memory.max_company_mb`),
+    the query is aborted or, with `query_memory.on_exceed = 'spill'`, the largest results of the query are moved
+    to files until the memory is within the budget. Results which are used by the next step are not spilled:
+    they would be read back at once.
+
+    Args:
+        company_id: owner of the query
+    """
+
+    def __init__(self, company_id):
+        self.company_id = company_id
+        self.total = 0
+        self._results: Dict[int, ResultSet] = {}
+        self._sizes: Dict[int, int] = {}
+        # results used by the next step, see add
+        self._keep: Collection[int] = ()
+        self._lock = threading.Lock()
+
+    def add(self, step_num: int, result: Optional[ResultSet], keep: Collection[int] = ()):
+        """Account the result of the step and check the budgets
+
+        Args:
+            step_num (int): number of the step
+            result (ResultSet): result of the step
+            keep (Collection[int]): steps which results must not be spilled (they are used by the next step)
+
+        Raises:
+            MemoryLimitError: the budget is exceeded and can't be satisfied by spilling
+        """
+        if result is None or not is_accounting_enabled():
+            return
+
+        size = result.memory_size()
+        with self._lock:
+            # the step can return the result of the previous step, it is counted once
+            for num, held in list(self._results.items()):
+                if held is result:
+                    self._forget(num)
+            self._results[step_num] = result
+            self._sizes[step_num] = size
+            self.total += size
+            result.set_load_listener(self._on_load)
+            self._keep = keep
+            company_usage = memory_tracker.change(self.company_id, size)
+            self._check_budget(company_usage, keep)
+
+    def _on_load(self, result: ResultSet):
+        """Account the data of deferred or spilled result which is loaded to memory
+
+        Raises:
+            MemoryLimitError: the budget is exceeded and can't be satisfied by spilling
+        """
+        with self._lock:
+            step_num = next((num for num, held in self._results.items() if held is result), None)
+            if step_num is None:
+                return
+            size = result.memory_size()
+            change = size - self._sizes[step_num]
+            if change == 0:
+                return
+            self._sizes[step_num] = size
+            self.total += change
+            company_usage = memory_tracker.change(self.company_id, change)
+            # the loaded result is being used
+            self._check_budget(company_usage, keep={step_num, *self._keep})
+
+    def release(self, step_num: int):
+        with self._lock:
+            self._forget(step_num)
+
+    def close(self):
+        with self._lock:
+            for step_num in list(self._results):
+                self._forget(step_num)
+
+    def _forget(self, step_num: int):
+        result = self._results.pop(step_num, None)
+        if result is not None:
+            result.set_load_listener(None)
+        size = self._sizes.pop(step_num, 0)
+        if size != 0:
+            self.total -= size
+            memory_tracker.change(self.company_id, -size)
+
+    def _get_excess(self, company_usage: int) -> int:
+        memory_config = config["query_memory"]
+        excess = 0
+        if memory_config["max_query_mb"] is not None:
+            excess = max(excess, self.total - memory_config["max_query_mb"] * MB)
+        if memory_config["max_company_mb"] is not None:
+            excess = max(excess, company_usage - memory_config["max_company_mb"] * MB)
+        return excess
+
+    def _check_budget(self, company_usage: int, keep: Collection[int] = ()):
+        if self._get_excess(company_usage) <= 0:
+            return
+
+        memory_config = config["query_memory"]
+        if memory_config["on_exceed"] == "spill":
+            spill_dir = config["paths"]["tmp"]
+            for step_num in sorted(self._sizes, key=self._sizes.get, reverse=True):
+                if self._sizes[step_num] == 0:
+                    break
+                if step_num in keep:
+                    continue
+                self._results[step_num].spill(spill_dir)
+                logger.info(f"Result of step {step_num} ({self._sizes[step_num] / MB:.1f} MB) is spilled to disk")
+                company_usage = memory_tracker.change(self.company_id, -self._sizes[step_num])
+                self.total -= self._sizes[step_num]
+                self._sizes[step_num] = 0
+                if self._get_excess(company_usage) <= 0:
+                    return
+
+        raise MemoryLimitError(
+            f"Query exceeded the memory budget: the query uses {self.total / MB:.1f} MB"
+            f" (limit {memory_config['max_query_mb']} MB), all queries of the company use"
+            f" {company_usage / MB:.1f} MB (limit {memory_config['max_company_mb']} MB)"
+        )
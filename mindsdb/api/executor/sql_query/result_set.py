@@ -1,10 +1,14 @@
+import os
 import copy
+import uuid
+import weakref
 from array import array
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
 from dataclasses import dataclass, field, MISSING
 
-import numpy as np
 import pandas as pd
+import pyarrow as pa
 from pandas.api import types as pd_types
 import sqlalchemy.types as sqlalchemy_types
 
@@ -13,6 +17,7 @@ from mindsdb_sql_parser.ast import TableColumn
 from mindsdb.utilities import log
 from mindsdb.api.executor.exceptions import WrongArgumentError
 from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import MYSQL_DATA_TYPE
+from mindsdb.api.executor.utilities.sql import DeferredQuery, nulls_to_none
 
 
 logger = log.getLogger(__name__)
@@ -87,12 +92,38 @@ def rename_df_columns(df: pd.DataFrame, names: list | None = None) -> None:
 
     Args:
         df (pd.DataFrame): dataframe
-        names (Optional[List]): columns names to set
+        names (Optional[List]): columns names to set, columns are enumerated if not set
     """
     if names is not None:
         df.columns = names
-    else:
-        df.columns = list(range(len(df.columns)))
+    elif not _is_positional(df.columns):
+        # range index doesn't hold the list of numbers
+        df.columns = pd.RangeIndex(len(df.columns))
+
+
+def _is_positional(index: pd.Index) -> bool:
+    return isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1
+
+
+def with_column_names(df: pd.DataFrame, names: list) -> pd.DataFrame:
+    """Get the dataframe with other names of columns. The data is not copied and the input dataframe is not changed,
+    so it can be shared between the steps of the query
+
+    Args:
+        df (pd.DataFrame): dataframe
+        names (list): columns names
+
+    Returns:
+        pd.DataFrame: dataframe which shares data with the input one
+    """
+    return df.set_axis(names, axis=1, copy=False)
+
+
+def _remove_file(path: Path) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
 
 
 class ResultSet:
@@ -116,6 +147,14 @@ class ResultSet:
             columns = []
         self._columns = columns
 
+        # query which result is not fetched yet and names of its columns, see from_deferred
+        self._deferred = None
+        self._deferred_names = None
+        # file with the dataframe moved out of memory, see spill
+        self._spill_path = None
+        # called when the data is loaded to memory (deferred query is executed or spilled data is read back)
+        self._on_load = None
+
         if df is None:
             if values is None:
                 df = None
@@ -131,18 +170,112 @@ class ResultSet:
 
     def __repr__(self):
         col_names = ", ".join([col.name for col in self._columns])
+        if self._deferred is not None:
+            return f"{self.__class__.__name__}(deferred, cols: {col_names})"
 
         return f"{self.__class__.__name__}({self.length()} rows, cols: {col_names})"
 
+    @property
+    def _df(self) -> pd.DataFrame | None:
+        if self._deferred is not None:
+            self._materialize()
+        data = self._data
+        if data is None:
+            path = self._spill_path
+            # the path is cleared after the data is loaded
+            data = self._data if path is None else self._load_spilled(path)
+        return data
+
+    @_df.setter
+    def _df(self, df: pd.DataFrame | None):
+        self._deferred = None
+        self._spill_path = None
+        self._data = df
+
+    def _materialize(self):
+        # the query can return more columns than the result has (row ids of the join), only its columns are selected
+        df = self._deferred.rename(self._deferred_names, self._deferred_names).execute()
+        rename_df_columns(df)
+        self._deferred = None
+        self._deferred_names = None
+        self._data = df
+        self._notify_loaded()
+
+    def set_load_listener(self, listener: Callable[["ResultSet"], None] | None) -> None:
+        """Set function which is called when the data of deferred or spilled result is loaded to memory
+
+        Args:
+            listener (Callable[[ResultSet], None] | None): function, it gets the result set
+        """
+        self._on_load = listener
+
+    def _notify_loaded(self):
+        listener = self._on_load
+        if listener is not None:
+            listener(self)
+
+    @property
+    def is_deferred(self) -> bool:
+        return self._deferred is not None
+
+    @property
+    def is_spilled(self) -> bool:
+        return self._spill_path is not None and self._data is None
+
+    def memory_size(self) -> int:
+        """Get size of the dataframe in memory, including the content of object columns.
+        Deferred and spilled results don't take memory
+
+        Returns:
+            int: size in bytes
+        """
+        data = self._data
+        if self._deferred is not None or data is None:
+            return 0
+        return int(data.memory_usage(index=True, deep=True).sum())
+
+    def spill(self, directory: Path) -> None:
+        """Move the dataframe to a file, it is read back on the next access to the data
+
+        Args:
+            directory (Path): folder for the file, the file is deleted with the ResultSet
+        """
+        data = self._data
+        if self._deferred is not None or data is None:
+            return
+        path = Path(directory) / f"result_{uuid.uuid4().hex}.pickle"
+        data.to_pickle(path, protocol=5)
+        weakref.finalize(self, _remove_file, path)
+        # the path is set first: readers check _data and then the path
+        self._spill_path = path
+        self._data = None
+
+    def _load_spilled(self, path: Path) -> pd.DataFrame:
+        data = pd.read_pickle(path)
+        self._data = data
+        self._spill_path = None
+        self._notify_loaded()
+        return data
+
+    def __getstate__(self):
+        # the file of the spilled data is not copied
+        state = self.__dict__.copy()
+        # the copy is not accounted by the memory accounting of the query
+        state["_on_load"] = None
+        if self.is_spilled:
+            state["_data"] = pd.read_pickle(self._spill_path)
+            state["_spill_path"] = None
+        return state
+
     def __len__(self) -> int:
         if self._df is None:
             return 0
         return len(self._df)
 
     def __getitem__(self, slice_val):
-        # return resultSet with sliced dataframe
+        # return resultSet with sliced dataframe: the slice is a view, column objects are shared
         df = self._df[slice_val]
-        return ResultSet(columns=self.columns, df=df)
+        return ResultSet(columns=list(self._columns), df=df)
 
     # --- converters ---
 
@@ -170,6 +303,24 @@ class ResultSet:
         rename_df_columns(df)
         return cls(df=df, columns=columns, is_prediction=is_prediction, mysql_types=mysql_types)
 
+    @classmethod
+    def from_deferred(cls, query: DeferredQuery, columns: list[Column], names: list[str]) -> "ResultSet":
+        """Create ResultSet from query which is executed on the first access to the data.
+        The query can be used by the next step as a part of its own query, see DeferredQuery
+
+        Args:
+            query (DeferredQuery): query
+            columns (list[Column]): columns of the result
+            names (list[str]): names of the columns in the result of the query, in the same order
+
+        Returns:
+            ResultSet: result set
+        """
+        result = cls(columns=columns)
+        result._deferred = query
+        result._deferred_names = names
+        return result
+
     @classmethod
     def from_df_cols(cls, df: pd.DataFrame, columns_dict: dict[str, Column], strict: bool = True) -> "ResultSet":
         """Create ResultSet from dataframe and dictionary of columns
@@ -198,15 +349,19 @@ class ResultSet:
 
         return cls(columns=columns, df=df)
 
-    def to_df(self):
+    def to_df(self, allow_deferred: bool = False):
+        # allow_deferred: return DeferredQuery instead of dataframe if the data is not fetched yet
         columns_names = self.get_column_names()
-        df = self.get_raw_df()
-        rename_df_columns(df, columns_names)
-        return df
+        if allow_deferred and self._deferred is not None and len(set(columns_names)) == len(columns_names):
+            return self._deferred.rename(self._deferred_names, columns_names)
+        return with_column_names(self.get_raw_df(), columns_names)
 
-    def to_df_cols(self, prefix: str = "") -> tuple[pd.DataFrame, dict[str, Column]]:
+    def to_df_cols(
+        self, prefix: str = "", allow_deferred: bool = False
+    ) -> tuple[pd.DataFrame | DeferredQuery, dict[str, Column]]:
         # returns dataframe and dict of columns
         #   can be restored to ResultSet by from_df_cols method
+        # allow_deferred: return DeferredQuery instead of dataframe if the data is not fetched yet
 
         columns = []
         col_names = {}
@@ -215,9 +370,11 @@ class ResultSet:
             columns.append(name)
             col_names[name] = col
 
-        df = self.get_raw_df()
-        rename_df_columns(df, columns)
-        return df, col_names
+        if allow_deferred and self._deferred is not None and len(col_names) == len(columns):
+            # keep it deferred: the caller puts it into its query
+            return self._deferred.rename(self._deferred_names, columns), col_names
+
+        return with_column_names(self.get_raw_df(), columns), col_names
 
     # --- tables ---
 
@@ -262,8 +419,10 @@ class ResultSet:
         idx = self.get_col_index(col)
         self._columns.pop(idx)
 
-        self._df.drop(idx, axis=1, inplace=True)
-        rename_df_columns(self._df)
+        # not inplace: the dataframe can be a view of the sliced result set
+        df = self._df.drop(idx, axis=1)
+        rename_df_columns(df)
+        self._df = df
 
     @property
     def columns(self):
@@ -394,12 +553,28 @@ class ResultSet:
             for i, column in enumerate(self.columns):
                 if column.type == MYSQL_DATA_TYPE.VECTOR:
                     df[i] = df[i].apply(_dump_vector)
-            df.replace({np.nan: None}, inplace=True)
-            return df.to_records(index=False).tolist()
+            return nulls_to_none(df).to_records(index=False).tolist()
 
         # slower but keep timestamp type
-        df = self._df.replace({np.nan: None})  # TODO rework
-        return df.to_dict("split")["data"]
+        return nulls_to_none(self._df).to_dict("split")["data"]
+
+    def to_arrow(self) -> pa.Table:
+        """Convert to arrow table. Numeric columns are not copied. Names of columns can be duplicated
+
+        Returns:
+            pa.Table: arrow table
+        """
+        df = self.get_raw_df()
+        arrays = []
+        for i in range(len(df.columns)):
+            values = df.iloc[:, i]
+            try:
+                arrays.append(pa.array(values, from_pandas=True))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                # mixed types in object column
+                arrays.append(pa.array([None if v is None else str(v) for v in values], type=pa.string()))
+        names = [str(name) for name in self.get_column_names()]
+        return pa.Table.from_arrays(arrays, names=names)
 
     def get_column_values(self, col_idx):
         # get by column index
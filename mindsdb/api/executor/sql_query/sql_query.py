@@ -8,26 +8,32 @@
  * permission of MindsDB Inc
  *******************************************************
 """
+import time
 import inspect
+import threading
 from textwrap import dedent
-from typing import Union, Dict
+from typing import Union, Dict, Optional, Set
 
 import pandas as pd
 from mindsdb_sql_parser import parse_sql, ASTNode
+from mindsdb_sql_parser.ast import Select, Union as UnionQuery, Intersect, Except
 
 from mindsdb.api.executor.planner.steps import (
     ApplyTimeseriesPredictorStep,
     ApplyPredictorRowStep,
     ApplyPredictorStep,
+    PlanStep,
 )
 
 from mindsdb.api.executor.planner.exceptions import PlanningException
 from mindsdb.utilities.render.sqlalchemy_render import SqlalchemyRender
 from mindsdb.api.executor.planner import query_planner
+from mindsdb.api.executor.planner.plan_cache import get_plan_cache, lift_constants
 
 from mindsdb.api.executor.utilities.sql import get_query_models
 from mindsdb.interfaces.model.functions import get_model_record
 from mindsdb.api.executor.exceptions import (
+    AdmissionTimeoutError,
     BadTableError,
     UnknownError,
     LogicError,
@@ -37,11 +43,33 @@ from mindsdb.utilities.fs import create_process_mark, delete_process_mark
 from mindsdb.utilities.exception import EntityNotExistsError
 from mindsdb.interfaces.query_context.context_controller import query_context_controller
 from mindsdb.utilities.context import context as ctx
+from mindsdb.utilities.config import config
+from mindsdb.utilities.query_stats import query_stats, StepStats, StepTimer, get_result_size
+from mindsdb.utilities import log
 
 
 from . import steps
 from .result_set import ResultSet, Column
 from . steps.base import BaseStepCall
+from .admission_control import admission_controller, get_query_pool
+from .query_memory import QueryMemory, is_accounting_enabled
+from .step_scheduler import (
+    execute_steps_parallel,
+    get_result_consumers,
+    get_step_references,
+    get_steps_dependencies,
+    has_independent_steps,
+    get_deferred_steps,
+)
+
+logger = log.getLogger(__name__)
+
+
+def get_step_integration(step: PlanStep) -> Optional[str]:
+    integration = getattr(step, 'integration', None) or getattr(step, 'namespace', None)
+    if isinstance(integration, str):
+        return integration.lower()
+    return None
 
 
 class SQLQuery:
@@ -71,6 +99,8 @@ class SQLQuery:
 
         self.columns_list = None
         self.steps_data: Dict[int, ResultSet] = {}
+        # steps which results are not fetched, but are used in the query of the next step
+        self.deferred_steps: Dict[int, PlanStep] = {}
 
         self.planner: query_planner.QueryPlanner = None
         self.parameters = []
@@ -80,6 +110,25 @@ class SQLQuery:
         self.run_query = None
         self.stop_event = stop_event
 
+        self.plan_cache_key = None
+        self.plan_cache_values = None
+        self.plan_cache_query = None
+        self.plan_cache_version = None
+        self.plan_cache_hit = False
+        self.planner_integrations = None
+
+        # statistics of the executed steps, see query_stats
+        self.stats_query_id = query_stats.new_query_id()
+        self.steps_stats = []
+
+        # memory held by the results of the steps, see query_memory
+        self.memory = QueryMemory(ctx.company_id)
+        # number of not executed steps which use the result of the step, results are released when it is 0
+        self.result_consumers: Optional[Dict[int, int]] = None
+        # results used by the step which follows the step in the plan, they are not spilled
+        self.next_step_references: Dict[int, Set[int]] = {}
+        self._consumers_lock = threading.Lock()
+
         if isinstance(sql, str):
             self.query = parse_sql(sql)
             self.context['query_str'] = sql
@@ -91,6 +140,9 @@ class SQLQuery:
             except Exception:
                 self.context['query_str'] = str(self.query)
 
+        if execute and self.query_id is None:
+            self.prepare_plan_cache()
+
         self.create_planner()
 
         if execute:
@@ -106,8 +158,50 @@ class SQLQuery:
                     step_name = cl.bind.__name__
                     cls.step_handlers[step_name] = cl
 
+    def prepare_plan_cache(self):
+        """Lift constants of the query to be able to reuse cached plan of the same query with other values.
+        The query is not changed: the constants are lifted in a copy of it
+        """
+        plan_cache = get_plan_cache()
+        if not plan_cache.enabled or not isinstance(self.query, (Select, UnionQuery, Intersect, Except)):
+            return
+        try:
+            normalized_query, self.plan_cache_values, self.plan_cache_query = lift_constants(self.query)
+        except Exception as e:
+            logger.debug(f'Unable to normalize query for plan cache: {e}')
+            return
+        # objects used by planner may be changed by another process, plans are valid only for this version
+        self.plan_cache_version = plan_cache.get_version()
+        if self.plan_cache_version is None:
+            return
+        database = None if self.database == '' else self.database.lower()
+        self.plan_cache_key = plan_cache.make_key(normalized_query, database)
+
     @profiler.profile()
     def create_planner(self):
+        database = None if self.database == '' else self.database.lower()
+
+        if self.plan_cache_key is not None:
+            with profiler.Context('plan cache: get'):
+                cached = get_plan_cache().get(
+                    self.plan_cache_key, self.plan_cache_values, self.plan_cache_version
+                )
+            if cached is not None:
+                profiler.set_meta(plan_cache='hit')
+                plan, databases = cached
+                self.plan_cache_hit = True
+                # only plans without models are cached
+                self.context['predictor_metadata'] = []
+                self.planner = query_planner.QueryPlanner(
+                    self.query,
+                    integrations=databases,
+                    predictor_metadata=[],
+                    default_namespace=database,
+                )
+                self.planner.plan = plan
+                return
+            profiler.set_meta(plan_cache='miss')
+
         databases = self.session.database_controller.get_list()
 
         predictor_metadata = []
@@ -184,9 +278,14 @@ class SQLQuery:
 
             predictor_metadata.append(predictor)
 
-        database = None if self.database == '' else self.database.lower()
+        if len(predictor_metadata) > 0:
+            # plans with models depend on models' state, they are not cached
+            self.plan_cache_key = None
+            self.plan_cache_values = None
+            self.plan_cache_query = None
 
         self.context['predictor_metadata'] = predictor_metadata
+        self.planner_integrations = databases
         self.planner = query_planner.QueryPlanner(
             self.query,
             integrations=databases,
@@ -194,16 +293,49 @@ class SQLQuery:
             default_namespace=database,
         )
 
+    def save_plan_to_cache(self):
+        """Put the plan of the query to the cache. The query is planned with its original constants,
+        the cached plan is made from the copy of the query with lifted constants, to be able to bind other values
+        to it. If the cache already has the record for the query, the plan is used only to verify the cached one
+        """
+        plan_cache = get_plan_cache()
+        plan = self.planner.plan
+        if not plan_cache.contains(self.plan_cache_key, self.plan_cache_version):
+            database = None if self.database == '' else self.database.lower()
+            try:
+                planner = query_planner.QueryPlanner(
+                    self.plan_cache_query,
+                    integrations=self.planner_integrations,
+                    predictor_metadata=[],
+                    default_namespace=database,
+                )
+                list(planner.execute_steps())
+            except Exception as e:
+                logger.debug(f'Unable to plan query with lifted constants: {e}')
+                return
+            plan = planner.plan
+        plan_cache.set(
+            self.plan_cache_key, self.plan_cache_values, plan, self.planner_integrations, self.plan_cache_version
+        )
+
     def prepare_query(self):
         """it is prepared statement call
         """
         try:
             for step in self.planner.prepare_steps(self.query):
                 data = self.execute_step(step)
-                step.set_result(data)
+                # planner of the prepared statement expects columns of the table as dict
+                table_info = (step.namespace, data.columns[0].table_name, data.columns[0].table_name) \
+                    if len(data.columns) > 0 else None
+                step.set_result({
+                    'tables': [] if table_info is None else [table_info],
+                    'columns': {table_info: [{'name': col.name, 'type': col.type} for col in data.columns]}
+                })
                 self.steps_data[step.step_num] = data
         except PlanningException as e:
             raise LogicError(e)
+        finally:
+            self.memory.close()
 
         statement_info = self.planner.get_statement_info()
 
@@ -234,10 +366,16 @@ class SQLQuery:
             # no need to execute
             return
 
-        try:
-            steps = list(self.planner.execute_steps())
-        except PlanningException as e:
-            raise LogicError(e)
+        if self.plan_cache_hit:
+            steps = list(self.planner.plan.steps)
+        else:
+            try:
+                steps = list(self.planner.execute_steps())
+            except PlanningException as e:
+                raise LogicError(e)
+
+            if self.plan_cache_key is not None and not self.planner.plan.is_resumable:
+                self.save_plan_to_cache()
 
         if self.planner.plan.is_resumable:
             # create query
@@ -259,17 +397,51 @@ class SQLQuery:
 
             ctx.run_query_id = self.run_query.record.id
 
+        if config['query_memory']['release_results']:
+            self.result_consumers = {
+                step_num: len(consumers) for step_num, consumers in get_result_consumers(steps).items()
+            }
+        if is_accounting_enabled():
+            self.next_step_references = {
+                step.step_num: get_step_references(next_step) for step, next_step in zip(steps, steps[1:])
+            }
+
+        try:
+            admission_ticket = admission_controller.acquire(ctx.company_id, get_query_pool(steps))
+        except AdmissionTimeoutError as e:
+            if self.run_query is not None:
+                # the query can be resumed later
+                self.run_query.on_error(e, steps[0].step_num, self.steps_data)
+            raise
+
         step_result = None
         process_mark = None
+        start_time = time.perf_counter()
         try:
             steps_classes = (x.__class__ for x in steps)
             predict_steps = (ApplyPredictorRowStep, ApplyPredictorStep, ApplyTimeseriesPredictorStep)
             if any(s in predict_steps for s in steps_classes):
                 process_mark = create_process_mark('predict')
-            for step in steps:
-                with profiler.Context(f'step: {step.__class__.__name__}'):
+            if config['query_execution']['fuse_steps'] and self.run_query is None:
+                self.deferred_steps = get_deferred_steps(steps)
+
+            dependencies = self.get_parallel_dependencies(steps)
+            if dependencies is not None:
+                exec_config = config['query_execution']
+                with profiler.Context('steps: parallel'):
+                    execute_steps_parallel(
+                        steps,
+                        self.execute_step,
+                        self.steps_data,
+                        dependencies,
+                        workers=exec_config['workers'],
+                        max_per_integration=exec_config['max_per_integration'],
+                    )
+                step_result = self.steps_data[steps[-1].step_num]
+            else:
+                for step in steps:
                     step_result = self.execute_step(step)
-                self.steps_data[step.step_num] = step_result
+                    self.steps_data[step.step_num] = step_result
         except Exception as e:
             if self.run_query is not None:
                 # set error and place where it stopped
@@ -281,8 +453,20 @@ class SQLQuery:
                 self.run_query.finish()
                 ctx.run_query_id = None
         finally:
+            admission_controller.release(admission_ticket)
+            self.memory.close()
+            self.result_consumers = None
+            self.next_step_references = {}
             if process_mark is not None:
                 delete_process_mark('predict', process_mark)
+            query_stats.add_query(
+                self.context['query_str'],
+                self.context['database'],
+                ctx.company_id,
+                self.steps_stats,
+                self.plan_cache_hit,
+                time.perf_counter() - start_time,
+            )
 
         # save updated query
         self.query = self.planner.query
@@ -307,13 +491,103 @@ class SQLQuery:
         except Exception as e:
             raise UnknownError("error in column list step") from e
 
+    def get_parallel_dependencies(self, steps: list) -> Optional[Dict[int, Set[int]]]:
+        """Get DAG of the steps if they can be executed in parallel
+
+        Resumable queries and queries with enabled profiling are executed step by step:
+        both track the current step of the query.
+
+        Args:
+            steps (list): steps of the plan
+
+        Returns:
+            Optional[Dict[int, Set[int]]]: dependencies of the steps or None if steps have to be executed in order
+        """
+        if (
+            len(steps) < 2
+            or not config['query_execution']['parallel_steps']
+            or self.run_query is not None
+            or profiler.profiling_enabled()
+        ):
+            return None
+        dependencies = get_steps_dependencies(steps)
+        if not has_independent_steps(steps, dependencies):
+            return None
+        return dependencies
+
+    def release_results(self, step: PlanStep):
+        """Drop results which are used by the finished step if they are not used by other steps
+
+        Args:
+            step (PlanStep): finished step
+        """
+        if self.result_consumers is None:
+            return
+        released = []
+        with self._consumers_lock:
+            for step_num in get_step_references(step):
+                count = self.result_consumers.get(step_num)
+                if count is None:
+                    continue
+                self.result_consumers[step_num] = count - 1
+                if count == 1:
+                    released.append(step_num)
+        for step_num in released:
+            self.steps_data.pop(step_num, None)
+            self.memory.release(step_num)
+
     def execute_step(self, step, steps_data=None):
         cls_name = step.__class__.__name__
         handler = self.step_handlers.get(cls_name)
         if handler is None:
             raise UnknownError(f"Unknown step: {cls_name}")
 
-        return handler(self, steps_data=steps_data).call(step)
+        step_call = handler(self, steps_data=steps_data)
+        integration = get_step_integration(step)
+        with profiler.Context(f'step: {cls_name}', integration=integration):
+            if config['query_stats']['enabled']:
+                result = self.call_step_with_stats(step, step_call, integration)
+            else:
+                result = step_call.call(step)
+
+        if steps_data is None:
+            # step of the plan, not a substep of a partitioned step
+            # inputs of the step are released first: they are not spilled if they are not used anymore
+            self.release_results(step)
+            self.memory.add(step.step_num, result, keep=self.next_step_references.get(step.step_num, ()))
+        return result
+
+    def call_step_with_stats(self, step: PlanStep, step_call: BaseStepCall, integration: Optional[str]) -> ResultSet:
+        stats = StepStats(
+            query_id=self.stats_query_id,
+            step_num=step.step_num,
+            step=step.__class__.__name__,
+            integration=integration,
+        )
+        rows_in = [get_result_size(step_call.steps_data.get(num))[0] for num in get_step_references(step)]
+        rows_in = [rows for rows in rows_in if rows is not None]
+        if len(rows_in) > 0:
+            stats.rows_in = sum(rows_in)
+
+        timer = StepTimer()
+        try:
+            result = step_call.call(step)
+        except Exception as e:
+            stats.error = str(e)[:1000]
+            raise
+        finally:
+            timer.stop(stats)
+            stats.cache_hit = step_call.cache_hit
+            self.steps_stats.append(stats)
+
+        stats.rows_out, stats.bytes_out = get_result_size(result)
+        profiler.set_attributes(
+            rows_in=stats.rows_in,
+            rows_out=stats.rows_out,
+            bytes=stats.bytes_out,
+            cache_hit=stats.cache_hit,
+        )
+        return result
 
 
 SQLQuery.register_steps()
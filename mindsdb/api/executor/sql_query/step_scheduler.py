@@ -0,0 +1,313 @@
+import threading
+import contextvars
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Set
+
+import pandas as pd
+
+from mindsdb.api.executor.planner.step_result import Result
+from mindsdb.api.executor.planner.steps import (
+    PlanStep,
+    FetchDataframeStep,
+    JoinStep,
+    UnionStep,
+    ProjectStep,
+    FilterStep,
+    GroupByStep,
+    OrderByStep,
+    LimitOffsetStep,
+    SubSelectStep,
+    QueryStep,
+    DataStep,
+    MultipleSteps,
+    GetTableColumns,
+    GetPredictorColumns,
+)
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.exceptions import UnknownError
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities.config import config
+from mindsdb.utilities.loading_cache import SharedInstance
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+# steps which only read data and don't change the state of the query, they can be executed in parallel.
+# Other steps (predictions, inserts, partitioned fetches, ...) are executed alone, after all previous steps
+PARALLEL_STEPS = (
+    FetchDataframeStep,
+    JoinStep,
+    UnionStep,
+    ProjectStep,
+    FilterStep,
+    GroupByStep,
+    OrderByStep,
+    LimitOffsetStep,
+    SubSelectStep,
+    QueryStep,
+    DataStep,
+    MultipleSteps,
+    GetTableColumns,
+    GetPredictorColumns,
+)
+
+# steps which are executed by DuckDB and can return not fetched (deferred) result
+DEFERRABLE_STEPS = (JoinStep, UnionStep)
+# steps which can include deferred result in their DuckDB query
+DEFERRED_CONSUMER_STEPS = (JoinStep, UnionStep, QueryStep, ProjectStep, SubSelectStep)
+
+_SCALAR_TYPES = (str, bytes, int, float, bool, type(None), pd.DataFrame, ResultSet)
+
+
+def is_parallel_step(step: PlanStep) -> bool:
+    # exact type: FetchDataframeStepPartition is a subclass of FetchDataframeStep, but has to be executed alone
+    return type(step) in PARALLEL_STEPS
+
+
+def get_step_references(step: PlanStep) -> Set[int]:
+    """Find numbers of steps which results are used by the step
+
+    Args:
+        step (PlanStep): step of the plan
+
+    Returns:
+        Set[int]: numbers of the steps
+    """
+    found = set()
+    visited = set()
+
+    def walk(obj):
+        if isinstance(obj, Result):
+            found.add(obj.step_num)
+            return
+        if isinstance(obj, _SCALAR_TYPES) or isinstance(obj, type) or id(obj) in visited:
+            return
+        visited.add(id(obj))
+        if isinstance(obj, dict):
+            for value in obj.values():
+                walk(value)
+        elif isinstance(obj, (list, tuple, set)):
+            for value in obj:
+                walk(value)
+        elif hasattr(obj, "__dict__"):
+            for value in vars(obj).values():
+                walk(value)
+
+    walk(step)
+    found.discard(step.step_num)
+    return found
+
+
+def get_steps_dependencies(steps: List[PlanStep]) -> Dict[int, Set[int]]:
+    """Build DAG of the steps: for each step get numbers of the steps which must be completed before it
+
+    Args:
+        steps (List[PlanStep]): steps of the plan in order of execution
+
+    Returns:
+        Dict[int, Set[int]]: step number -> numbers of the steps it depends on
+    """
+    dependencies = {}
+    previous = set()
+    barrier = None
+    for step in steps:
+        if is_parallel_step(step):
+            deps = get_step_references(step) & previous
+            if barrier is not None:
+                deps.add(barrier)
+        else:
+            # is executed after all previous steps and before all next ones
+            deps = set(previous)
+            barrier = step.step_num
+        dependencies[step.step_num] = deps
+        previous.add(step.step_num)
+    return dependencies
+
+
+def has_independent_steps(steps: List[PlanStep], dependencies: Dict[int, Set[int]]) -> bool:
+    """Check if the plan has at least two steps which can be executed at the same time"""
+    ancestors = {}
+    for step in steps:
+        step_ancestors = set()
+        for dep in dependencies[step.step_num]:
+            step_ancestors.add(dep)
+            step_ancestors |= ancestors[dep]
+        ancestors[step.step_num] = step_ancestors
+
+    parallel_nums = [step.step_num for step in steps if is_parallel_step(step)]
+    for i, num in enumerate(parallel_nums):
+        for num2 in parallel_nums[i + 1 :]:
+            if num not in ancestors[num2]:
+                return True
+    return False
+
+
+def get_result_consumers(steps: List[PlanStep]) -> Dict[int, List[PlanStep]]:
+    """Find steps which use the result of every step
+
+    Args:
+        steps (List[PlanStep]): steps of the plan
+
+    Returns:
+        Dict[int, List[PlanStep]]: step number -> steps which use its result, steps without consumers are missing
+    """
+    consumers = defaultdict(list)
+    for step in steps:
+        for step_num in get_step_references(step):
+            consumers[step_num].append(step)
+    return dict(consumers)
+
+
+def get_deferred_steps(steps: List[PlanStep]) -> Dict[int, PlanStep]:
+    """Find steps which result can be left deferred: it is used only by one next step, and this step is executed
+    by DuckDB too. The chain of such steps is executed as one DuckDB query, see DeferredQuery
+
+    Args:
+        steps (List[PlanStep]): steps of the plan
+
+    Returns:
+        Dict[int, PlanStep]: step number -> step
+    """
+    consumers = get_result_consumers(steps)
+
+    deferred = {}
+    # result of the last step is returned to the client
+    for step in steps[:-1]:
+        if type(step) not in DEFERRABLE_STEPS:
+            continue
+        step_consumers = consumers.get(step.step_num, [])
+        if len(step_consumers) == 1 and type(step_consumers[0]) in DEFERRED_CONSUMER_STEPS:
+            deferred[step.step_num] = step
+    return deferred
+
+
+def _get_integration(step: PlanStep) -> Optional[str]:
+    if isinstance(step, FetchDataframeStep) and isinstance(step.integration, str):
+        return step.integration.lower()
+    return None
+
+
+def _create_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=max(config["query_execution"]["pool_size"], 1), thread_name_prefix="query_steps"
+    )
+
+
+# threads live as long as the process: handlers which are not thread-safe are cached per thread (see HandlersCache),
+# a new thread for every step would open a new connection to the integration
+_pool: SharedInstance[ThreadPoolExecutor] = SharedInstance(_create_pool)
+_worker_state = threading.local()
+
+
+def _run_step(run_context: contextvars.Context, execute_step: Callable[[PlanStep], ResultSet], step: PlanStep):
+    # executed in the thread of the pool, in the context (company, user) of the query
+    _worker_state.active = True
+    try:
+        return run_context.run(execute_step, step)
+    finally:
+        _worker_state.active = False
+        # the thread is reused by other queries: close its db session
+        if db.session is not None:
+            db.session.remove()
+
+
+def execute_steps_parallel(
+    steps: List[PlanStep],
+    execute_step: Callable[[PlanStep], ResultSet],
+    steps_data: Dict[int, ResultSet],
+    dependencies: Dict[int, Set[int]],
+    workers: int,
+    max_per_integration: int,
+) -> None:
+    """Execute steps of the plan in order of their dependencies, independent steps are executed concurrently.
+
+    Steps which are not in PARALLEL_STEPS are executed in the current thread when all previous steps are done.
+    Results can be removed from steps_data by `execute_step` when they are not used anymore, so finished steps
+    are tracked separately.
+
+    Steps are executed by the pool of threads shared by all queries. A query which is executed by a step (for
+    example, a query of a view) executes its steps one by one: waiting for the pool from its thread could
+    block the pool.
+
+    Args:
+        steps (List[PlanStep]): steps of the plan
+        execute_step (Callable): function which executes one step
+        steps_data (Dict[int, ResultSet]): results of the steps are stored here
+        dependencies (Dict[int, Set[int]]): DAG of the steps, see get_steps_dependencies
+        workers (int): max number of steps executed at the same time
+        max_per_integration (int): max number of fetches from one integration executed at the same time
+    """
+    if getattr(_worker_state, "active", False):
+        for step in steps:
+            steps_data[step.step_num] = execute_step(step)
+        return
+
+    # at least one step has to be executed at a time, otherwise the query never ends
+    workers = max(workers, 1)
+    max_per_integration = max(max_per_integration, 1)
+
+    executor = _pool.get()
+    pending = list(steps)
+    running: Dict[Future, PlanStep] = {}
+    per_integration = defaultdict(int)
+    completed = set(steps_data.keys())
+    error = None
+
+    try:
+        while len(pending) > 0 or len(running) > 0:
+            started = False
+            if error is None:
+                for step in list(pending):
+                    if not dependencies[step.step_num].issubset(completed):
+                        continue
+                    if not is_parallel_step(step):
+                        if len(running) == 0:
+                            pending.remove(step)
+                            steps_data[step.step_num] = execute_step(step)
+                            completed.add(step.step_num)
+                            started = True
+                        # the rest of the steps depend on it
+                        break
+                    if len(running) >= workers:
+                        break
+                    integration = _get_integration(step)
+                    if integration is not None:
+                        if per_integration[integration] >= max_per_integration:
+                            continue
+                        per_integration[integration] += 1
+                    pending.remove(step)
+                    running[executor.submit(_run_step, contextvars.copy_context(), execute_step, step)] = step
+                    started = True
+
+            if len(running) == 0:
+                if error is not None:
+                    break
+                if not started and len(pending) > 0:
+                    raise UnknownError(
+                        f"Steps can't be executed, their dependencies are not met: {[s.step_num for s in pending]}"
+                    )
+                continue
+
+            done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                integration = _get_integration(step)
+                if integration is not None:
+                    per_integration[integration] -= 1
+                try:
+                    steps_data[step.step_num] = future.result()
+                    completed.add(step.step_num)
+                except Exception as e:
+                    # wait for steps which are already running and raise the first error
+                    if error is None:
+                        error = e
+                    pending.clear()
+    finally:
+        if len(running) > 0:
+            # the caller can be interrupted while steps are running, they must not use the query after it
+            wait(running.keys())
+
+    if error is not None:
+        raise error
@@ -32,13 +32,13 @@ def get_preditor_alias(step, mindsdb_database):
 
 
 class ApplyPredictorBaseCall(BaseStepCall):
-    def apply_predictor(self, project_name, predictor_name, df, version, params):
+    def apply_predictor(self, project_name, predictor_name, df, version, params, batch=False):
         # is it an agent?
         agent = self.session.agents_controller.get_agent(predictor_name, project_name)
         if agent is not None:
             messages = df.to_dict("records")
             predictions = self.session.agents_controller.get_completion(
-                agent, messages=messages, project_name=project_name, params=params
+                agent, messages=messages, project_name=project_name, params=params, batch=batch
             )
 
         else:
@@ -173,6 +173,7 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
 
                 predictor_cache = get_cache("predict")
                 predictions = predictor_cache.get(key)
+                self.cache_hit = predictions is not None
             else:
                 predictions = None
 
@@ -201,7 +202,8 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
                 version = None
                 if len(step.predictor.parts) > 1 and step.predictor.parts[-1].isdigit():
                     version = int(step.predictor.parts[-1])
-                predictions = self.apply_predictor(project_name, predictor_name, table_df, version, params)
+                # rows of joined table are independent questions to an agent
+                predictions = self.apply_predictor(project_name, predictor_name, table_df, version, params, batch=True)
 
                 if self.session.predictor_cache is not False:
                     if predictions is not None and isinstance(predictions, pd.DataFrame):
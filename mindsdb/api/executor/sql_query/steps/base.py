@@ -1,6 +1,8 @@
 
 class BaseStepCall:
     bind = None
+    # result was taken from the cache, it is shown in query statistics
+    cache_hit = False
 
     def __init__(self, sql_query, steps_data=None):
         if steps_data is None:
@@ -17,5 +19,9 @@ class BaseStepCall:
     def get_columns_list(self):
         return self.sql_query.columns_list
 
+    def is_deferred(self, step):
+        # result of the step can be returned without fetching, see DeferredQuery
+        return self.sql_query.deferred_steps.get(step.step_num) is step
+
     def call(self, step):
         raise NotImplementedError
@@ -1,7 +1,5 @@
 import copy
 
-import numpy as np
-
 from mindsdb_sql_parser.ast import (
     Identifier, BinaryOperation, Constant
 )
@@ -12,7 +10,7 @@ from mindsdb.integrations.utilities.query_traversal import query_traversal
 from mindsdb.utilities.render.sqlalchemy_render import SqlalchemyRender
 
 from mindsdb.api.executor.sql_query.result_set import ResultSet
-from mindsdb.api.executor.utilities.sql import query_df_with_type_infer_fallback
+from mindsdb.api.executor.utilities.sql import query_df_with_type_infer_fallback, normalize_nulls, DeferredQuery
 from mindsdb.api.executor.exceptions import NotSupportedYet
 
 from .base import BaseStepCall
@@ -86,19 +84,27 @@ class JoinStepCall(BaseStepCall):
             join_condition = SqlalchemyRender('postgres').get_string(condition)
             join_type = step.query.join_type
 
-        table_a, names_a = left_data.to_df_cols(prefix='A')
-        table_b, names_b = right_data.to_df_cols(prefix='B')
+        table_a, names_a = left_data.to_df_cols(prefix='A', allow_deferred=True)
+        table_b, names_b = right_data.to_df_cols(prefix='B', allow_deferred=True)
 
         query = f"""
             SELECT * FROM table_a {join_type} table_b
             ON {join_condition}
         """
-        resp_df, _description = query_df_with_type_infer_fallback(query, {
+        dataframes = {
             'table_a': table_a,
             'table_b': table_b
-        })
+        }
+
+        if self.is_deferred(step) and len(names_a) + len(names_b) == len(left_data.columns) + len(right_data.columns):
+            names_a.update(names_b)
+            names = [name for name, col in names_a.items() if col.alias.lower() != '__mindsdb_row_id']
+            columns = [names_a[name] for name in names]
+            return ResultSet.from_deferred(DeferredQuery(query, dataframes), columns, names)
+
+        resp_df, _description = query_df_with_type_infer_fallback(query, dataframes)
 
-        resp_df.replace({np.nan: None}, inplace=True)
+        normalize_nulls(resp_df)
 
         names_a.update(names_b)
         data = ResultSet.from_df_cols(df=resp_df, columns_dict=names_a)
@@ -25,7 +25,7 @@ class ProjectStepCall(BaseStepCall):
     def call(self, step):
         result_set = self.steps_data[step.dataframe.step_num]
 
-        df, col_names = result_set.to_df_cols()
+        df, col_names = result_set.to_df_cols(allow_deferred=True)
         col_idx = {}
         tbl_idx = defaultdict(list)
         for name, col in col_names.items():
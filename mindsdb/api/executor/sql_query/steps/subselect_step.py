@@ -15,7 +15,7 @@ from mindsdb_sql_parser.ast import (
 from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import SERVER_VARIABLES
 from mindsdb.api.executor.planner.step_result import Result
 from mindsdb.api.executor.planner.steps import SubSelectStep, QueryStep
-from mindsdb.api.executor.sql_query.result_set import ResultSet, Column
+from mindsdb.api.executor.sql_query.result_set import ResultSet
 from mindsdb.api.executor.utilities.sql import query_df
 from mindsdb.api.executor.exceptions import KeyColumnDoesNotExist
 from mindsdb.integrations.utilities.query_traversal import query_traversal
@@ -40,6 +40,7 @@ class SubSelectStepCall(BaseStepCall):
         query = step.query
         query.from_table = Identifier("df_table")
 
+        absent_cols = []
         if step.add_absent_cols and isinstance(query, Select):
             query_cols = set()
 
@@ -54,16 +55,18 @@ class SubSelectStepCall(BaseStepCall):
 
             result_cols = [col.name for col in result.columns]
 
-            for col_name in query_cols:
-                if col_name not in result_cols:
-                    result.add_column(Column(name=col_name))
+            absent_cols = [col_name for col_name in query_cols if col_name not in result_cols]
 
         # inject previous step values
         if isinstance(query, Select):
             fill_params = get_fill_param_fnc(self.steps_data)
             query_traversal(query, fill_params)
 
-        df = result.to_df()
+        if len(absent_cols) > 0:
+            # columns are added to a copy: the result can be read by other steps at the same time
+            df = result.to_df().assign(**{col_name: None for col_name in absent_cols})
+        else:
+            df = result.to_df(allow_deferred=True)
         res = query_df(df, query, session=self.session)
 
         # get database from first column
@@ -88,7 +91,7 @@ class QueryStepCall(BaseStepCall):
             prev_step_num = query.from_table.value.step_num
             result_set = self.steps_data[prev_step_num]
 
-        df, col_names = result_set.to_df_cols()
+        df, col_names = result_set.to_df_cols(allow_deferred=True)
         col_idx = {}
         tbl_idx = defaultdict(list)
         for name, col in col_names.items():
@@ -2,8 +2,7 @@ from mindsdb.api.executor.planner.steps import UnionStep
 
 from mindsdb.api.executor.sql_query.result_set import ResultSet
 from mindsdb.api.executor.exceptions import WrongArgumentError
-from mindsdb.api.executor.utilities.sql import query_df_with_type_infer_fallback
-import numpy as np
+from mindsdb.api.executor.utilities.sql import query_df_with_type_infer_fallback, normalize_nulls, DeferredQuery
 
 from .base import BaseStepCall
 
@@ -30,8 +29,8 @@ class UnionStepCall(BaseStepCall):
         #         if type1 != type2:
         #             raise ErSqlWrongArguments(f'UNION types mismatch: {type1} != {type2}')
 
-        table_a, names = left_result.to_df_cols()
-        table_b, _ = right_result.to_df_cols()
+        table_a, names = left_result.to_df_cols(allow_deferred=True)
+        table_b, _ = right_result.to_df_cols(allow_deferred=True)
 
         if step.operation.lower() == "intersect":
             op = "INTERSECT"
@@ -47,7 +46,11 @@ class UnionStepCall(BaseStepCall):
             SELECT * FROM table_b
         """
 
-        resp_df, _description = query_df_with_type_infer_fallback(query, {"table_a": table_a, "table_b": table_b})
-        resp_df.replace({np.nan: None}, inplace=True)
+        dataframes = {"table_a": table_a, "table_b": table_b}
+        if self.is_deferred(step) and len(names) == len(left_result.columns):
+            return ResultSet.from_deferred(DeferredQuery(query, dataframes), list(names.values()), list(names.keys()))
+
+        resp_df, _description = query_df_with_type_infer_fallback(query, dataframes)
+        normalize_nulls(resp_df)
 
         return ResultSet.from_df_cols(df=resp_df, columns_dict=names)
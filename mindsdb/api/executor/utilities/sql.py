@@ -1,9 +1,12 @@
 import copy
+import itertools
+import threading
 from typing import List
 
 import duckdb
 from duckdb import InvalidInputException
 import numpy as np
+import pandas as pd
 
 from mindsdb_sql_parser import parse_sql
 from mindsdb_sql_parser.ast import ASTNode, Select, Identifier, Function, Constant
@@ -51,6 +54,136 @@ def get_query_models(query: ASTNode, default_database: str = None) -> List[tuple
     return _get_query_tables(query, resolve_model_identifier, default_database)
 
 
+_duckdb_database = None
+_duckdb_database_lock = threading.Lock()
+
+
+def _get_duckdb_connection(user_functions=None) -> duckdb.DuckDBPyConnection:
+    """Creating of a new in-memory database takes more time than execution of a small query.
+    Queries are executed in connections (cursors) to the shared in-memory database: registered dataframes and
+    settings are local for a connection. But functions are shared by all connections of the database,
+    a query with user functions is executed in a separate database.
+
+    Args:
+        user_functions: functions controller which register new functions in connection
+
+    Returns:
+        duckdb.DuckDBPyConnection: connection, must be closed after use
+    """
+    if user_functions is not None and len(getattr(user_functions, "functions", [None])) > 0:
+        return duckdb.connect(database=":memory:")
+
+    global _duckdb_database
+    with _duckdb_database_lock:
+        if _duckdb_database is None:
+            _duckdb_database = duckdb.connect(database=":memory:")
+        return _duckdb_database.cursor()
+
+
+def normalize_nulls(df: pd.DataFrame) -> pd.DataFrame:
+    """Inplace replace of nulls (NaN, pd.NA, NaT) with None in the columns of 'object' dtype.
+    Typed columns (numbers, datetimes, nullable extension and arrow dtypes) keep their nulls and dtype:
+    replacing them with None would turn the column into 'object' and make the next steps slower.
+    Typed nulls are converted to None by the encoders of the output, see nulls_to_none
+
+    Args:
+        df (pd.DataFrame): dataframe
+
+    Returns:
+        pd.DataFrame: the same dataframe
+    """
+    for i, dtype in enumerate(df.dtypes):
+        if dtype != object:
+            continue
+        series = df.iloc[:, i]
+        mask = series.isna()
+        if mask.any():
+            df.isetitem(i, series.where(~mask, None))
+    return df
+
+
+def nulls_to_none(df: pd.DataFrame) -> pd.DataFrame:
+    """Get dataframe where nulls of all columns are replaced with None, for the encoders of the output.
+    Only columns which have nulls are converted to 'object' dtype, the input dataframe is not changed
+
+    Args:
+        df (pd.DataFrame): dataframe
+
+    Returns:
+        pd.DataFrame: shallow copy of the dataframe
+    """
+    result = None
+    for i, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, np.dtype) and dtype.kind in "iub":
+            # numpy ints and bools can't hold nulls
+            continue
+        series = df.iloc[:, i]
+        mask = series.isna()
+        if not mask.any():
+            continue
+        if result is None:
+            result = df.copy(deep=False)
+        result.isetitem(i, series.astype(object).where(~mask, None))
+    return df if result is None else result
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class DeferredQuery:
+    """Query to in-memory tables which is not executed yet.
+
+    Steps of the plan which are executed by DuckDB (join, union) can return it instead of a dataframe. The next
+    DuckDB step includes it into its own query as a CTE, so the chain of steps is executed as one query and the
+    intermediate results are not converted to dataframes.
+
+    Args:
+        query_str (str): query, the tables of the query are keys of dataframes
+        dataframes (dict): tables of the query: dataframes or other DeferredQuery
+    """
+
+    _frame_counter = itertools.count()
+
+    def __init__(self, query_str: str, dataframes: dict):
+        self.query_str, self.dataframes = self._compose(query_str, dataframes)
+
+    @classmethod
+    def _compose(cls, query_str: str, dataframes: dict) -> tuple[str, dict]:
+        # every dataframe gets unique name: queries of the chain are executed in one connection
+        ctes = []
+        frames = {}
+        for name, value in dataframes.items():
+            if isinstance(value, DeferredQuery):
+                ctes.append(f"{name} AS ({value.query_str})")
+                frames.update(value.dataframes)
+            else:
+                frame_name = f"frame_{next(cls._frame_counter)}"
+                # columns of the source dataframe can be renamed in place before the query is executed
+                frames[frame_name] = value.copy(deep=False)
+                ctes.append(f"{name} AS (SELECT * FROM {frame_name})")
+        if len(ctes) > 0:
+            query_str = f"WITH {', '.join(ctes)} {query_str}"
+        return query_str, frames
+
+    def rename(self, columns: list[str], names: list[str]) -> "DeferredQuery":
+        """Get query with renamed columns
+
+        Args:
+            columns (list[str]): names of the columns of the query
+            names (list[str]): new names
+
+        Returns:
+            DeferredQuery: new query
+        """
+        targets = ", ".join(f"{_quote(column)} AS {_quote(name)}" for column, name in zip(columns, names))
+        return DeferredQuery(f"SELECT {targets} FROM deferred_table", {"deferred_table": self})
+
+    def execute(self) -> pd.DataFrame:
+        result_df, _description = query_df_with_type_infer_fallback(self.query_str, self.dataframes)
+        return normalize_nulls(result_df)
+
+
 def query_df_with_type_infer_fallback(query_str: str, dataframes: dict, user_functions=None):
     """Duckdb need to infer column types if column.dtype == object. By default it take 1000 rows,
     but that may be not sufficient for some cases. This func try to run query multiple times
@@ -58,16 +191,19 @@ def query_df_with_type_infer_fallback(query_str: str, dataframes: dict, user_fun
 
     Args:
         query_str (str): query to execute
-        dataframes (dict): dataframes
+        dataframes (dict): dataframes or DeferredQuery
         user_functions: functions controller which register new functions in connection
 
     Returns:
         pandas.DataFrame
         pandas.columns
     """
+    if any(isinstance(value, DeferredQuery) for value in dataframes.values()):
+        deferred = DeferredQuery(query_str, dataframes)
+        query_str, dataframes = deferred.query_str, deferred.dataframes
 
     try:
-        with duckdb.connect(database=":memory:") as con:
+        with _get_duckdb_connection(user_functions) as con:
             if user_functions:
                 user_functions.register(con)
 
@@ -77,7 +213,7 @@ def query_df_with_type_infer_fallback(query_str: str, dataframes: dict, user_fun
             exception = None
             for sample_size in [1000, 10000, 1000000]:
                 try:
-                    con.execute(f"set global pandas_analyze_sample={sample_size};")
+                    con.execute(f"set pandas_analyze_sample={sample_size};")
                     result_df = con.execute(query_str).fetchdf()
                 except InvalidInputException as e:
                     exception = e
@@ -149,7 +285,7 @@ def query_df(df, query, session=None):
     """Perform simple query ('select' from one table, without subqueries and joins) on DataFrame.
 
     Args:
-        df (pandas.DataFrame): data
+        df (pandas.DataFrame | DeferredQuery): data
         query (mindsdb_sql_parser.ast.Select | str): select query
 
     Returns:
@@ -228,6 +364,10 @@ def query_df(df, query, session=None):
 
     query_traversal(query_ast, adapt_query)
 
+    if isinstance(df, DeferredQuery) and (len(json_columns) > 0 or query_ast.cte is not None):
+        # the query can't be combined with the previous one
+        df = df.execute()
+
     # convert json columns
     encoder = CustomJSONEncoder()
 
@@ -250,7 +390,7 @@ def query_df(df, query, session=None):
         query_str = render.get_string(query_ast, with_failback=True)
 
     # workaround to prevent duckdb.TypeMismatchException
-    if len(df) > 0:
+    if isinstance(df, pd.DataFrame) and len(df) > 0:
         if table_name.lower() in ("models", "predictors"):
             if "TRAINING_OPTIONS" in df.columns:
                 df = df.astype({"TRAINING_OPTIONS": "string"})
@@ -259,6 +399,6 @@ def query_df(df, query, session=None):
                 df = df.astype({"CONNECTION_DATA": "string"})
 
     result_df, description = query_df_with_type_infer_fallback(query_str, {"df": df}, user_functions=user_functions)
-    result_df.replace({np.nan: None}, inplace=True)
+    normalize_nulls(result_df)
     result_df.columns = [x[0] for x in description]
     return result_df
@@ -0,0 +1,310 @@
+import os
+import time
+import base64
+import secrets
+import threading
+from functools import partial
+from typing import Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.flight as flight
+
+from mindsdb.api.common.middleware import check_auth
+from mindsdb.api.executor.controllers import session_pool
+from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
+from mindsdb.api.mysql.mysql_proxy.classes.fake_mysql_proxy import FakeMysqlProxy
+from mindsdb.api.mysql.mysql_proxy.external_libs.mysql_scramble import scramble as scramble_func
+from mindsdb.utilities.config import config
+from mindsdb.utilities.context import context as ctx
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+# Flight SQL messages are protobuf messages packed into google.protobuf.Any
+FLIGHT_SQL_TYPE_PREFIX = "type.googleapis.com/arrow.flight.protocol.sql."
+COMMAND_STATEMENT_QUERY = FLIGHT_SQL_TYPE_PREFIX + "CommandStatementQuery"
+TICKET_STATEMENT_QUERY = FLIGHT_SQL_TYPE_PREFIX + "TicketStatementQuery"
+
+
+# region minimal protobuf encoding: only length-delimited fields are used by the supported messages
+def _encode_varint(value: int) -> bytes:
+    result = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            result.append(byte | 0x80)
+        else:
+            result.append(byte)
+            return bytes(result)
+
+
+def _decode_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_message(fields: dict) -> bytes:
+    """Encode protobuf message which has only string/bytes fields
+
+    Args:
+        fields (dict): number of the field -> value
+
+    Returns:
+        bytes: serialized message
+    """
+    result = bytearray()
+    for number, value in fields.items():
+        if isinstance(value, str):
+            value = value.encode()
+        result += _encode_varint(number << 3 | 2)
+        result += _encode_varint(len(value))
+        result += value
+    return bytes(result)
+
+
+def decode_message(data: bytes) -> dict:
+    """Decode protobuf message. Values of varint fields are int, values of length-delimited fields are bytes
+
+    Args:
+        data (bytes): serialized message
+
+    Returns:
+        dict: number of the field -> value
+    """
+    fields = {}
+    pos = 0
+    while pos < len(data):
+        key, pos = _decode_varint(data, pos)
+        number, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            fields[number], pos = _decode_varint(data, pos)
+        elif wire_type == 2:
+            length, pos = _decode_varint(data, pos)
+            fields[number] = data[pos : pos + length]
+            pos += length
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type: {wire_type}")
+    return fields
+
+
+def pack_any(type_url: str, value: bytes) -> bytes:
+    return encode_message({1: type_url, 2: value})
+
+
+def unpack_any(data: bytes) -> Tuple[Optional[str], bytes]:
+    """Get type and value of google.protobuf.Any, type is None if data is not Any"""
+    try:
+        fields = decode_message(data)
+        type_url = fields.get(1)
+        if isinstance(type_url, bytes) and type_url.startswith(b"type.googleapis.com/"):
+            return type_url.decode(), fields.get(2, b"")
+    except (ValueError, IndexError, UnicodeDecodeError):
+        pass
+    return None, data
+
+
+# endregion
+
+
+class _BearerTokenMiddleware(flight.ServerMiddleware):
+    def __init__(self, token: str, username: str):
+        self.token = token
+        self.username = username
+
+    def sending_headers(self):
+        return {"authorization": f"Bearer {self.token}"}
+
+
+class AuthMiddlewareFactory(flight.ServerMiddlewareFactory):
+    """Checks credentials of the call with the same function as mysql and postgres APIs.
+    Client sends basic auth once (handshake) and gets bearer token for the next calls
+
+    Args:
+        token_ttl (int): seconds, lifetime of the token
+    """
+
+    def __init__(self, token_ttl: int = 24 * 60 * 60):
+        self.token_ttl = token_ttl
+        self.check_auth = partial(check_auth, config=config)
+        self.salt = base64.b64encode(os.urandom(15)).decode()
+        self._tokens = {}
+        self._lock = threading.Lock()
+
+    def start_call(self, info, headers):
+        values = headers.get("authorization") or headers.get("Authorization") or []
+        if len(values) == 0:
+            raise flight.FlightUnauthenticatedError("No credentials supplied")
+        auth_type, _, value = values[0].partition(" ")
+
+        if auth_type.lower() == "basic":
+            ctx.set_default()
+            username, _, password = base64.b64decode(value).decode().partition(":")
+            auth_data = self.check_auth(username, password, scramble_func, self.salt, ctx.company_id)
+            if not auth_data or not auth_data["success"]:
+                raise flight.FlightUnauthenticatedError("Authentication failed")
+            token = secrets.token_urlsafe(32)
+            now = time.monotonic()
+            with self._lock:
+                self._tokens = {k: v for k, v in self._tokens.items() if now - v[1] < self.token_ttl}
+                self._tokens[token] = (auth_data["username"], now)
+            return _BearerTokenMiddleware(token, auth_data["username"])
+
+        if auth_type.lower() == "bearer":
+            with self._lock:
+                record = self._tokens.get(value)
+            if record is None or time.monotonic() - record[1] >= self.token_ttl:
+                raise flight.FlightUnauthenticatedError("Invalid token")
+            return _BearerTokenMiddleware(value, record[0])
+
+        raise flight.FlightUnauthenticatedError(f"Unsupported authorization: {auth_type}")
+
+
+class _NoOpAuthHandler(flight.ServerAuthHandler):
+    # authentication is done by middleware, the handshake only has to succeed
+    def authenticate(self, outgoing, incoming):
+        pass
+
+    def is_valid(self, token):
+        return ""
+
+
+class _StoredResult:
+    __slots__ = ("table", "parts", "owner", "fetched", "created_at")
+
+    def __init__(self, table: pa.Table, parts: list, owner: Optional[str]):
+        self.table = table
+        self.parts = parts
+        self.owner = owner
+        self.fetched = set()
+        self.created_at = time.monotonic()
+
+
+class FlightSqlServer(flight.FlightServerBase):
+    """Arrow Flight (SQL) API.
+
+    - GetFlightInfo executes the query. The query is Flight SQL CommandStatementQuery or utf-8 text of the query.
+      The result is split into partitions of `partition_rows` rows, every partition is an endpoint of FlightInfo,
+      the client can fetch them in parallel.
+    - DoGet returns a partition as a stream of record batches. The result is kept until all partitions are fetched
+      or `result_ttl` seconds are passed. Only the user who executed the query can fetch the result.
+
+    Args:
+        location (str): uri to listen, like grpc://0.0.0.0:47336
+        partition_rows (int): rows in one endpoint
+        result_ttl (int): seconds to keep not fetched results
+    """
+
+    def __init__(self, location: str, partition_rows: int = 1000000, result_ttl: int = 600, **kwargs):
+        super().__init__(
+            location,
+            auth_handler=_NoOpAuthHandler(),
+            middleware={"auth": AuthMiddlewareFactory()},
+            **kwargs,
+        )
+        self.partition_rows = partition_rows
+        self.result_ttl = result_ttl
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def _get_username(self, context) -> Optional[str]:
+        middleware = context.get_middleware("auth")
+        return None if middleware is None else middleware.username
+
+    def _execute(self, query: str, username: Optional[str]) -> pa.Table:
+        ctx.set_default()
+        with session_pool.session() as session:
+            session.username = username
+            session.auth = True
+            mysql_proxy = FakeMysqlProxy(session=session)
+            try:
+                result = mysql_proxy.process_query(query)
+            except Exception as e:
+                logger.warning(f"Error in flight query: {e}")
+                raise flight.FlightServerError(str(e)) from e
+
+        if result.type == RESPONSE_TYPE.ERROR:
+            raise flight.FlightServerError(result.error_message or "Error during query execution")
+        if result.type in (RESPONSE_TYPE.TABLE, RESPONSE_TYPE.COLUMNS_TABLE):
+            return result.result_set.to_arrow()
+        return pa.table({"affected_rows": pa.array([result.affected_rows], type=pa.int64())})
+
+    def _store(self, table: pa.Table, owner: Optional[str]) -> Tuple[str, list]:
+        handle = secrets.token_hex(16)
+        parts = [(offset, self.partition_rows) for offset in range(0, table.num_rows, self.partition_rows)]
+        if len(parts) == 0:
+            parts = [(0, 0)]
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, value in self._results.items() if now - value.created_at > self.result_ttl]
+            for key in expired:
+                del self._results[key]
+            self._results[handle] = _StoredResult(table, parts, owner)
+        return handle, parts
+
+    def get_flight_info(self, context, descriptor):
+        if descriptor.descriptor_type != flight.DescriptorType.CMD:
+            raise flight.FlightServerError("Only command descriptors are supported")
+
+        type_url, value = unpack_any(descriptor.command)
+        if type_url is None:
+            query = value.decode()
+        elif type_url == COMMAND_STATEMENT_QUERY:
+            query = decode_message(value).get(1, b"").decode()
+        else:
+            raise flight.FlightServerError(f"Unsupported command: {type_url}")
+        is_flight_sql = type_url is not None
+
+        logger.debug(f"Flight query: {query}")
+        username = self._get_username(context)
+        table = self._execute(query, username)
+        handle, parts = self._store(table, username)
+
+        endpoints = []
+        for i in range(len(parts)):
+            ticket = f"{handle}:{i}".encode()
+            if is_flight_sql:
+                ticket = pack_any(TICKET_STATEMENT_QUERY, encode_message({1: ticket}))
+            endpoints.append(flight.FlightEndpoint(ticket, []))
+        return flight.FlightInfo(table.schema, descriptor, endpoints, table.num_rows, table.nbytes)
+
+    @staticmethod
+    def _parse_ticket(ticket: bytes) -> Tuple[str, int]:
+        """Get handle of the result and number of the partition from the ticket"""
+        type_url, value = unpack_any(ticket)
+        try:
+            if type_url == TICKET_STATEMENT_QUERY:
+                value = decode_message(value).get(1, b"")
+            handle, _, part = value.decode().partition(":")
+            return handle, int(part)
+        except (ValueError, IndexError, AttributeError) as e:
+            raise flight.FlightServerError("Invalid ticket") from e
+
+    def do_get(self, context, ticket):
+        handle, part = self._parse_ticket(ticket.ticket)
+        username = self._get_username(context)
+
+        with self._lock:
+            stored = self._results.get(handle)
+            # results of other users are not distinguished from missing ones
+            if stored is None or stored.owner != username:
+                raise flight.FlightServerError("Result is not found or expired")
+            if not 0 <= part < len(stored.parts):
+                raise flight.FlightServerError("Invalid ticket: partition is out of range")
+            offset, length = stored.parts[part]
+            stored.fetched.add(part)
+            if len(stored.fetched) == len(stored.parts):
+                del self._results[handle]
+
+        return flight.RecordBatchStream(stored.table.slice(offset, length))
@@ -0,0 +1,20 @@
+import mindsdb.interfaces.storage.db as db
+from mindsdb.api.flight.flight_server import FlightSqlServer
+from mindsdb.utilities.config import config
+from mindsdb.utilities import log
+
+
+def start(verbose=False):
+    logger = log.getLogger(__name__)
+    logger.info("Flight API is starting..")
+    db.init()
+
+    flight_config = config["api"]["flight"]
+    location = f"grpc://{flight_config['host']}:{flight_config['port']}"
+    server = FlightSqlServer(
+        location,
+        partition_rows=int(flight_config["partition_rows"]),
+        result_ttl=int(flight_config["result_ttl"]),
+    )
+    logger.info(f"Flight API is listening on {location}")
+    server.serve()
@@ -12,7 +12,6 @@ from mindsdb_sql_parser.ast import Identifier
 from mindsdb_sql_parser.ast.mindsdb import CreateMLEngine
 
 from mindsdb.metrics.metrics import api_endpoint_metrics
-from mindsdb.integrations.libs.ml_exec_base import process_cache
 from mindsdb.integrations.utilities.install import install_dependencies
 from mindsdb.interfaces.storage.model_fs import HandlerStorage
 from mindsdb.api.http.utils import http_error
@@ -101,6 +100,8 @@ class InstallDependencies(Resource):
         if result.get("success") is True:
             # If warm processes are available in the cache, remove them.
             # This will force a new process to be created with the installed dependencies.
+            from mindsdb.integrations.libs.ml_exec_base import process_cache
+
             process_cache.remove_processes_for_handler(handler_name)
             return "", 200
         return http_error(
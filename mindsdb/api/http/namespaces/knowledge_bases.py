@@ -1,8 +1,8 @@
 from http import HTTPStatus
+from typing import TYPE_CHECKING
 
 from flask import request
 from flask_restx import Resource
-from langchain_text_splitters import MarkdownHeaderTextSplitter
 
 from mindsdb.api.http.namespaces.configs.projects import ns_conf
 from mindsdb.api.executor.controllers.session_controller import SessionController
@@ -10,7 +10,6 @@ from mindsdb.api.executor.exceptions import ExecutorException
 from mindsdb.api.http.utils import http_error
 
 from mindsdb.api.mysql.mysql_proxy.classes.fake_mysql_proxy import FakeMysqlProxy
-from mindsdb.integrations.utilities.rag.splitters.file_splitter import FileSplitter, FileSplitterConfig
 from mindsdb.interfaces.file.file_controller import FileController
 from mindsdb.interfaces.knowledge_base.preprocessing.constants import (
     DEFAULT_CONTEXT_DOCUMENT_LIMIT,
@@ -19,17 +18,17 @@ from mindsdb.interfaces.knowledge_base.preprocessing.constants import (
     DEFAULT_MARKDOWN_HEADERS,
     DEFAULT_WEB_CRAWL_LIMIT,
 )
-from mindsdb.interfaces.knowledge_base.preprocessing.document_loader import DocumentLoader
 from mindsdb.metrics.metrics import api_endpoint_metrics
 from mindsdb.interfaces.database.projects import ProjectController
-from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseTable
 from mindsdb.utilities import log
 from mindsdb.utilities.exception import EntityNotExistsError
-from mindsdb.integrations.utilities.rag.settings import DEFAULT_LLM_MODEL, DEFAULT_RAG_PROMPT_TEMPLATE
 
 
 from mindsdb_sql_parser.ast import Identifier
 
+if TYPE_CHECKING:
+    from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseTable
+
 logger = log.getLogger(__name__)
 
 
@@ -198,6 +197,10 @@ class KnowledgeBaseResource(Resource):
                 )
 
             # Set up dependencies for DocumentLoader
+            from langchain_text_splitters import MarkdownHeaderTextSplitter
+            from mindsdb.integrations.utilities.rag.splitters.file_splitter import FileSplitter, FileSplitterConfig
+            from mindsdb.interfaces.knowledge_base.preprocessing.document_loader import DocumentLoader
+
             file_controller = FileController()
             file_splitter_config = FileSplitterConfig()
             file_splitter = FileSplitter(file_splitter_config)
@@ -283,7 +286,9 @@ class KnowledgeBaseResource(Resource):
         return "", HTTPStatus.NO_CONTENT
 
 
-def _handle_chat_completion(knowledge_base_table: KnowledgeBaseTable, request):
+def _handle_chat_completion(knowledge_base_table: "KnowledgeBaseTable", request):
+    from mindsdb.integrations.utilities.rag.settings import DEFAULT_LLM_MODEL, DEFAULT_RAG_PROMPT_TEMPLATE
+
     # Check for required parameters
     query = request.json.get("query")
 
@@ -327,7 +332,7 @@ def _handle_chat_completion(knowledge_base_table: KnowledgeBaseTable, request):
     return response
 
 
-def _handle_context_completion(knowledge_base_table: KnowledgeBaseTable, request):
+def _handle_context_completion(knowledge_base_table: "KnowledgeBaseTable", request):
     # Used for semantic search.
     query = request.json.get("query")
     # Keyword search.
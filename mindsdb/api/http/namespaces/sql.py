@@ -1,15 +1,23 @@
 from http import HTTPStatus
 import traceback
 
-from flask import request
+from flask import request, Response
 from flask_restx import Resource
 
 import mindsdb.utilities.hooks as hooks
 import mindsdb.utilities.profiler as profiler
 from mindsdb.api.http.utils import http_error
+from mindsdb.api.http.result_stream import (
+    get_response_format,
+    iter_arrow,
+    iter_ndjson,
+    JSON_MIME,
+    NDJSON_MIME,
+)
 from mindsdb.api.http.namespaces.configs.sql import ns_conf
 from mindsdb.api.mysql.mysql_proxy.mysql_proxy import SQLAnswer
 from mindsdb.api.mysql.mysql_proxy.classes.fake_mysql_proxy import FakeMysqlProxy
+from mindsdb.api.executor.controllers import session_pool
 from mindsdb.api.executor.data_types.response_type import (
     RESPONSE_TYPE as SQL_RESPONSE_TYPE,
 )
@@ -50,15 +58,26 @@ class Query(Resource):
         error_text = None
         error_traceback = None
 
+        # tables can be returned as a stream of ndjson or arrow, the rest of responses is json
+        response_format = get_response_format(request.accept_mimetypes)
+        stream_result = None
+
         profiler.set_meta(
             query=query, api="http", environment=Config().get("environment")
         )
-        with profiler.Context("http_query_processing"):
-            mysql_proxy = FakeMysqlProxy()
+        with profiler.Context("http_query_processing"), session_pool.session() as session:
+            mysql_proxy = FakeMysqlProxy(session=session)
             mysql_proxy.set_context(context)
             try:
                 result: SQLAnswer = mysql_proxy.process_query(query)
-                query_response: dict = result.dump_http_response()
+                if response_format != JSON_MIME and result.type in (
+                    SQL_RESPONSE_TYPE.TABLE,
+                    SQL_RESPONSE_TYPE.COLUMNS_TABLE,
+                ):
+                    stream_result = result
+                    query_response = {"type": SQL_RESPONSE_TYPE.TABLE}
+                else:
+                    query_response: dict = result.dump_http_response()
             except ExecutorException as e:
                 # classified error
                 error_type = "expected"
@@ -108,6 +127,13 @@ class Query(Resource):
             traceback=error_traceback,
         )
 
+        if stream_result is not None:
+            if response_format == NDJSON_MIME:
+                body = iter_ndjson(stream_result.result_set, context)
+            else:
+                body = iter_arrow(stream_result.result_set, context)
+            return Response(body, mimetype=response_format)
+
         return query_response, 200
 
 
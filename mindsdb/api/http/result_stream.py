@@ -0,0 +1,128 @@
+import io
+import json
+from typing import Iterator
+
+import pyarrow as pa
+from werkzeug.datastructures import MIMEAccept
+
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.utilities.json_encoder import CustomJSONEncoder
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+JSON_MIME = "application/json"
+NDJSON_MIME = "application/x-ndjson"
+ARROW_STREAM_MIME = "application/vnd.apache.arrow.stream"
+
+# rows in one line batch of ndjson or in one record batch of arrow stream
+CHUNK_SIZE = 10000
+
+
+def get_response_format(accept: MIMEAccept) -> str:
+    """Choose format of the response of the query using 'Accept' header of the request.
+    JSON is used if the header is absent or doesn't prefer other formats.
+
+    Args:
+        accept (MIMEAccept): accepted mimetypes of the request
+
+    Returns:
+        str: mimetype of the response
+    """
+    if not accept:
+        return JSON_MIME
+    return accept.best_match([JSON_MIME, NDJSON_MIME, ARROW_STREAM_MIME], default=JSON_MIME)
+
+
+def iter_ndjson(result_set: ResultSet, context: dict, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Serialize table to newline delimited json.
+    First line is a header: {"type": "table", "column_names": [...], "context": {...}}, next lines are rows as lists.
+    Rows are converted to json types by chunks, the whole table is never converted to python lists
+
+    Args:
+        result_set (ResultSet): table
+        context (dict): context of the query
+        chunk_size (int): rows in one chunk
+
+    Yields:
+        bytes: lines of the response
+    """
+    encoder = CustomJSONEncoder()
+    header = {
+        "type": "table",
+        "column_names": [column.alias or column.name for column in result_set.columns],
+        "context": context,
+    }
+    yield (encoder.encode(header) + "\n").encode()
+
+    for start in range(0, len(result_set), chunk_size):
+        rows = result_set[start : start + chunk_size].to_lists(json_types=True)
+        yield "".join(encoder.encode(row) + "\n" for row in rows).encode()
+
+
+def _null_column_type(series) -> pa.DataType:
+    # type of the column which has only nulls in the first chunk
+    values = series.dropna()
+    if len(values) == 0:
+        return pa.null()
+    try:
+        return pa.infer_type(list(values), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # mixed types in object column, see ResultSet.to_arrow
+        return pa.string()
+
+
+def _cast_chunk(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    # types of the columns of a chunk can differ from the types inferred from the first chunk
+    arrays = []
+    for column, field in zip(table.columns, schema):
+        if column.type != field.type:
+            try:
+                column = column.cast(field.type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                if field.type != pa.string():
+                    raise
+                column = pa.array([None if v is None else str(v) for v in column.to_pylist()], type=pa.string())
+        arrays.append(column)
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def iter_arrow(result_set: ResultSet, context: dict, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Serialize table to arrow IPC stream. Context of the query is stored in metadata of the schema.
+    Rows are converted to arrow by chunks, like in iter_ndjson, the schema is taken from the first chunk
+
+    Args:
+        result_set (ResultSet): table
+        context (dict): context of the query
+        chunk_size (int): rows in one record batch
+
+    Yields:
+        bytes: parts of the stream
+    """
+    first_chunk = result_set[:chunk_size].to_arrow()
+    fields = []
+    df = result_set.get_raw_df()
+    for i, field in enumerate(first_chunk.schema):
+        if field.type == pa.null() and len(result_set) > chunk_size:
+            field = field.with_type(_null_column_type(df.iloc[chunk_size:, i]))
+        fields.append(field)
+    schema = pa.schema(fields, metadata={"context": json.dumps(context, cls=CustomJSONEncoder)})
+
+    sink = io.BytesIO()
+
+    def flush() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield flush()
+        for start in range(0, len(result_set), chunk_size):
+            if start == 0:
+                chunk = first_chunk
+            else:
+                chunk = result_set[start : start + chunk_size].to_arrow()
+            writer.write_table(_cast_chunk(chunk, schema), max_chunksize=chunk_size)
+            yield flush()
+    yield flush()
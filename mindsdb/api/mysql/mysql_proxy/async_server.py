@@ -0,0 +1,216 @@
+import ssl
+import socket
+import asyncio
+import contextvars
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import MAX_PACKET_SIZE
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+class _PrefetchedSocket:
+    """Socket which returns the data read in advance before reading from the socket itself"""
+
+    def __init__(self, sock: socket.socket, data: bytes):
+        self._sock = sock
+        self._data = data
+
+    def recv(self, bufsize: int, flags: int = 0) -> bytes:
+        if len(self._data) == 0:
+            return self._sock.recv(bufsize, flags)
+        chunk = self._data[:bufsize]
+        if not flags & socket.MSG_PEEK:
+            self._data = self._data[bufsize:]
+        return chunk
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+
+class AsyncMysqlServer:
+    """MySQL server which keeps connections on an event loop instead of a thread per connection.
+
+    Waiting for the next command of the client costs nothing: the socket is only watched by the event loop.
+    The command packet is read on the event loop too, then the command is executed and answered by
+    MysqlProxy.handle_command in a pool of `workers` threads. If all workers are busy, the command waits
+    in the admission queue on the event loop. Every connection keeps its own copy of context variables
+    between the commands.
+
+    The handshake (authentication) has several round trips and is done by MysqlProxy.start_session in a separate
+    pool of threads, so slow clients can't take workers of the commands. Every read of the handshake is limited
+    by `handshake_timeout` seconds, the connection is closed if the client doesn't answer in time.
+
+    It provides the same attributes to MysqlProxy as socketserver.TCPServer (check_auth, cert_path, etc.),
+    they are set by MysqlProxy.startProxy.
+
+    Args:
+        host (str): host to listen
+        port (int): port to listen
+        handler_class (type): MysqlProxy
+        workers (int): max number of commands executed at the same time
+        handshake_timeout (float): seconds to wait for every answer of the client during the handshake
+    """
+
+    def __init__(self, host: str, port: int, handler_class, workers: int = 16, handshake_timeout: float = 10):
+        self.host = host
+        self.port = port
+        self.handler_class = handler_class
+        self.workers = workers
+        self.handshake_timeout = handshake_timeout
+        self.connection_id = 0
+
+        self.connections = 0
+        self.active = 0
+        self.queued = 0
+
+        self._loop = None
+        self._slots = None
+        self._executor = None
+        self._handshake_executor = None
+        self._socket = None
+        self._serve_task = None
+        self._tasks = set()
+
+    def bind(self):
+        """Create listening socket, it can be used before `serve_forever`"""
+        self._socket = socket.create_server((self.host, self.port), reuse_port=False, backlog=1024)
+        self._socket.setblocking(False)
+        self.port = self._socket.getsockname()[1]
+
+    def serve_forever(self):
+        try:
+            asyncio.run(self.serve())
+        except asyncio.CancelledError:
+            pass
+
+    def shutdown(self):
+        """Stop `serve_forever`, can be called from another thread"""
+        if self._serve_task is not None:
+            self._loop.call_soon_threadsafe(self._serve_task.cancel)
+
+    def server_close(self):
+        if self._socket is not None:
+            self._socket.close()
+
+    async def serve(self):
+        if self._socket is None:
+            self.bind()
+        self._loop = asyncio.get_running_loop()
+        self._serve_task = asyncio.current_task()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="mysql_worker")
+        self._handshake_executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="mysql_handshake")
+        try:
+            while True:
+                client, address = await self._loop.sock_accept(self._socket)
+                task = asyncio.create_task(self.serve_connection(client, address))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            self._executor.shutdown(wait=False)
+            self._handshake_executor.shutdown(wait=False)
+
+    async def serve_connection(self, client: socket.socket, address):
+        client.settimeout(self.handshake_timeout)
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        proxy = self.handler_class(client, address, self, handle=False)
+        # context variables of the connection, they are set during the session start
+        context = contextvars.Context()
+        self.connections += 1
+        try:
+            started = await self._loop.run_in_executor(self._handshake_executor, context.run, proxy.start_session)
+            if started is False:
+                return
+            # the socket is replaced by ssl socket if the client asked for it
+            sock = proxy.socket
+            while True:
+                sock.setblocking(False)
+                data = await self._read_packet(sock)
+                sock.setblocking(True)
+                if await self._execute(context, partial(self._handle_command, proxy, sock, data)) is False:
+                    return
+        except TimeoutError:
+            logger.warning(f"Connection {address} is closed: no answer from the client during the handshake")
+        except Exception:
+            logger.exception(f"Error in connection {address}")
+        finally:
+            self.connections -= 1
+            getattr(proxy, "socket", client).close()
+
+    async def _execute(self, context: contextvars.Context, fnc):
+        self.queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+        self.active += 1
+        try:
+            return await self._loop.run_in_executor(self._executor, context.run, fnc)
+        finally:
+            self.active -= 1
+            self._slots.release()
+
+    @staticmethod
+    def _handle_command(proxy, sock: socket.socket, data: bytes) -> bool:
+        proxy.socket = _PrefetchedSocket(sock, data)
+        try:
+            return proxy.handle_command()
+        finally:
+            proxy.socket = sock
+
+    async def _read_packet(self, sock: socket.socket) -> bytes:
+        """Read all parts of the next packet of the client, the socket must be non-blocking.
+        The result is shorter than the packet if the connection is closed by the client.
+
+        Returns:
+            bytes: headers and bodies of the parts of the packet
+        """
+        data = b""
+        while True:
+            header = await self._recv(sock, 4)
+            data += header
+            if len(header) < 4:
+                return data
+            length = int.from_bytes(header[:3], "little")
+            body = await self._recv(sock, length)
+            data += body
+            if length != MAX_PACKET_SIZE or len(body) < length:
+                return data
+
+    async def _recv(self, sock: socket.socket, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            try:
+                chunk = sock.recv(size - len(data))
+            except (BlockingIOError, ssl.SSLWantReadError):
+                await self._wait_readable(sock)
+                continue
+            except ConnectionError:
+                break
+            if len(chunk) == 0:
+                break
+            data += chunk
+        return data
+
+    async def _wait_readable(self, sock: socket.socket):
+        if isinstance(sock, ssl.SSLSocket) and sock.pending() > 0:
+            # data is already decrypted and buffered
+            return
+
+        fd = sock.fileno()
+        future = self._loop.create_future()
+
+        def on_readable():
+            if not future.done():
+                future.set_result(None)
+
+        self._loop.add_reader(fd, on_readable)
+        try:
+            await future
+        finally:
+            self._loop.remove_reader(fd)
@@ -13,7 +13,7 @@ class Dummy:
 
 
 class FakeMysqlProxy(MysqlProxy):
-    def __init__(self):
+    def __init__(self, session: SessionController = None):
         request = Dummy()
         client_address = ['', '']
         server = Dummy()
@@ -29,7 +29,9 @@ class FakeMysqlProxy(MysqlProxy):
         self.server = server
         self.connection_id = None
 
-        self.session = SessionController()
+        if session is None:
+            session = SessionController()
+        self.session = session
         self.session.database = config.get('default_project')
 
     def is_cloud_connection(self):
@@ -52,6 +52,7 @@ from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets import (
     SwitchOutResponse,
 )
 from mindsdb.api.mysql.mysql_proxy.executor import Executor
+from mindsdb.api.mysql.mysql_proxy.async_server import AsyncMysqlServer
 from mindsdb.api.mysql.mysql_proxy.external_libs.mysql_scramble import (
     scramble as scramble_func,
 )
@@ -137,13 +138,19 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
     def server_close(srv):
         srv.server_close()
 
-    def __init__(self, request, client_address, server):
+    def __init__(self, request, client_address, server, handle: bool = True):
         self.charset = "utf8"
         self.charset_text_type = CHARSET_NUMBERS["utf8_general_ci"]
         self.session = None
         self.client_capabilities = None
         self.connection_id = None
-        super().__init__(request, client_address, server)
+        if handle:
+            super().__init__(request, client_address, server)
+        else:
+            # the connection is served step by step: start_session, then handle_command for each command
+            self.request = request
+            self.client_address = client_address
+            self.server = server
 
     def init_session(self):
         logger.debug("New connection [{ip}:{port}]".format(ip=self.client_address[0], port=self.client_address[1]))
@@ -619,6 +626,18 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         Handle new incoming connections
         :return:
         """
+        if self.start_session() is False:
+            return
+
+        while self.handle_command():
+            pass
+
+    def start_session(self) -> bool:
+        """Initialize the context and the session of the connection and authenticate the client
+
+        Returns:
+            bool: False if the connection has to be closed
+        """
         ctx.set_default()
 
         self.server.hook_before_handle()
@@ -631,7 +650,7 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         self.init_session()
         if cloud_connection["is_cloud"] is False:
             if self.handshake() is False:
-                return
+                return False
         else:
             ctx.user_class = cloud_connection["user_class"]
             ctx.email_confirmed = cloud_connection["email_confirmed"]
@@ -639,157 +658,164 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             self.session.database = cloud_connection["database"]
             self.session.username = "cloud"
             self.session.auth = True
+        return True
 
-        while True:
-            logger.debug("Got a new packet")
-            p = self.packet(CommandPacket)
+    def handle_command(self) -> bool:
+        """Read one command from the client and send the answer
 
-            try:
-                success = p.get()
-            except Exception:
-                logger.error("Session closed, on packet read error")
-                logger.error(traceback.format_exc())
-                return
-
-            if success is False:
-                logger.debug("Session closed by client")
-                return
-
-            logger.debug("Command TYPE: {type}".format(type=getConstName(COMMANDS, p.type.value)))
-
-            command_names = {
-                COMMANDS.COM_QUERY: "COM_QUERY",
-                COMMANDS.COM_STMT_PREPARE: "COM_STMT_PREPARE",
-                COMMANDS.COM_STMT_EXECUTE: "COM_STMT_EXECUTE",
-                COMMANDS.COM_STMT_FETCH: "COM_STMT_FETCH",
-                COMMANDS.COM_STMT_CLOSE: "COM_STMT_CLOSE",
-                COMMANDS.COM_QUIT: "COM_QUIT",
-                COMMANDS.COM_INIT_DB: "COM_INIT_DB",
-                COMMANDS.COM_FIELD_LIST: "COM_FIELD_LIST",
-            }
+        Returns:
+            bool: False if the connection has to be closed
+        """
+        logger.debug("Got a new packet")
+        p = self.packet(CommandPacket)
 
-            command_name = command_names.get(p.type.value, f"UNKNOWN {p.type.value}")
-            sql = None
-            response = None
-            error_type = None
-            error_code = None
-            error_text = None
-            error_traceback = None
+        try:
+            success = p.get()
+        except Exception:
+            logger.error("Session closed, on packet read error")
+            logger.error(traceback.format_exc())
+            return False
 
-            try:
-                if p.type.value == COMMANDS.COM_QUERY:
-                    sql = self.decode_utf(p.sql.value)
-                    sql = clear_sql(sql)
-                    logger.debug(f"Incoming query: {sql}")
-                    profiler.set_meta(query=sql, api="mysql", environment=config.get("environment"))
-                    with profiler.Context("mysql_query_processing"):
-                        response = self.process_query(sql)
-                elif p.type.value == COMMANDS.COM_STMT_PREPARE:
-                    sql = self.decode_utf(p.sql.value)
-                    self.answer_stmt_prepare(sql)
-                elif p.type.value == COMMANDS.COM_STMT_EXECUTE:
-                    self.answer_stmt_execute(p.stmt_id.value, p.parameters)
-                elif p.type.value == COMMANDS.COM_STMT_FETCH:
-                    self.answer_stmt_fetch(p.stmt_id.value, p.limit.value)
-                elif p.type.value == COMMANDS.COM_STMT_CLOSE:
-                    self.answer_stmt_close(p.stmt_id.value)
-                elif p.type.value == COMMANDS.COM_QUIT:
-                    logger.debug("Session closed, on client disconnect")
-                    self.session = None
-                    break
-                elif p.type.value == COMMANDS.COM_INIT_DB:
-                    new_database = p.database.value.decode()
-
-                    executor = Executor(session=self.session, sqlserver=self)
-                    executor.change_default_db(new_database)
-
-                    response = SQLAnswer(RESPONSE_TYPE.OK)
-                elif p.type.value == COMMANDS.COM_FIELD_LIST:
-                    # this command is deprecated, but console client still use it.
-                    response = SQLAnswer(RESPONSE_TYPE.OK)
-                elif p.type.value == COMMANDS.COM_STMT_RESET:
-                    response = SQLAnswer(RESPONSE_TYPE.OK)
-                else:
-                    logger.warning("Command has no specific handler, return OK msg")
-                    logger.debug(str(p))
-                    # p.pprintPacket() TODO: Make a version of print packet
-                    # that sends it to debug instead
-                    response = SQLAnswer(RESPONSE_TYPE.OK)
-
-            except SqlApiException as e:
-                # classified error
-                error_type = "expected"
-
-                response = SQLAnswer(
-                    resp_type=RESPONSE_TYPE.ERROR,
-                    error_code=e.err_code,
-                    error_message=str(e),
-                )
+        if success is False:
+            logger.debug("Session closed by client")
+            return False
 
-            except exec_exc.ExecutorException as e:
-                # unclassified
-                error_type = "expected"
-
-                if isinstance(e, exec_exc.NotSupportedYet):
-                    error_code = ERR.ER_NOT_SUPPORTED_YET
-                elif isinstance(e, exec_exc.KeyColumnDoesNotExist):
-                    error_code = ERR.ER_KEY_COLUMN_DOES_NOT_EXIST
-                elif isinstance(e, exec_exc.TableNotExistError):
-                    error_code = ERR.ER_TABLE_EXISTS_ERROR
-                elif isinstance(e, exec_exc.WrongArgumentError):
-                    error_code = ERR.ER_WRONG_ARGUMENTS
-                elif isinstance(e, exec_exc.LogicError):
-                    error_code = ERR.ER_WRONG_USAGE
-                elif isinstance(e, (exec_exc.BadDbError, exec_exc.BadTableError)):
-                    error_code = ERR.ER_BAD_DB_ERROR
-                else:
-                    error_code = ERR.ER_SYNTAX_ERROR
-
-                response = SQLAnswer(
-                    resp_type=RESPONSE_TYPE.ERROR,
-                    error_code=error_code,
-                    error_message=str(e),
-                )
-            except exec_exc.UnknownError as e:
-                # unclassified
-                error_type = "unexpected"
-
-                response = SQLAnswer(
-                    resp_type=RESPONSE_TYPE.ERROR,
-                    error_code=ERR.ER_UNKNOWN_ERROR,
-                    error_message=str(e),
-                )
+        logger.debug("Command TYPE: {type}".format(type=getConstName(COMMANDS, p.type.value)))
+
+        command_names = {
+            COMMANDS.COM_QUERY: "COM_QUERY",
+            COMMANDS.COM_STMT_PREPARE: "COM_STMT_PREPARE",
+            COMMANDS.COM_STMT_EXECUTE: "COM_STMT_EXECUTE",
+            COMMANDS.COM_STMT_FETCH: "COM_STMT_FETCH",
+            COMMANDS.COM_STMT_CLOSE: "COM_STMT_CLOSE",
+            COMMANDS.COM_QUIT: "COM_QUIT",
+            COMMANDS.COM_INIT_DB: "COM_INIT_DB",
+            COMMANDS.COM_FIELD_LIST: "COM_FIELD_LIST",
+        }
+
+        command_name = command_names.get(p.type.value, f"UNKNOWN {p.type.value}")
+        sql = None
+        response = None
+        error_type = None
+        error_code = None
+        error_text = None
+        error_traceback = None
+
+        try:
+            if p.type.value == COMMANDS.COM_QUERY:
+                sql = self.decode_utf(p.sql.value)
+                sql = clear_sql(sql)
+                logger.debug(f"Incoming query: {sql}")
+                profiler.set_meta(query=sql, api="mysql", environment=config.get("environment"))
+                with profiler.Context("mysql_query_processing"):
+                    response = self.process_query(sql)
+            elif p.type.value == COMMANDS.COM_STMT_PREPARE:
+                sql = self.decode_utf(p.sql.value)
+                self.answer_stmt_prepare(sql)
+            elif p.type.value == COMMANDS.COM_STMT_EXECUTE:
+                self.answer_stmt_execute(p.stmt_id.value, p.parameters)
+            elif p.type.value == COMMANDS.COM_STMT_FETCH:
+                self.answer_stmt_fetch(p.stmt_id.value, p.limit.value)
+            elif p.type.value == COMMANDS.COM_STMT_CLOSE:
+                self.answer_stmt_close(p.stmt_id.value)
+            elif p.type.value == COMMANDS.COM_QUIT:
+                logger.debug("Session closed, on client disconnect")
+                self.session = None
+                return False
+            elif p.type.value == COMMANDS.COM_INIT_DB:
+                new_database = p.database.value.decode()
+
+                executor = Executor(session=self.session, sqlserver=self)
+                executor.change_default_db(new_database)
+
+                response = SQLAnswer(RESPONSE_TYPE.OK)
+            elif p.type.value == COMMANDS.COM_FIELD_LIST:
+                # this command is deprecated, but console client still use it.
+                response = SQLAnswer(RESPONSE_TYPE.OK)
+            elif p.type.value == COMMANDS.COM_STMT_RESET:
+                response = SQLAnswer(RESPONSE_TYPE.OK)
+            else:
+                logger.warning("Command has no specific handler, return OK msg")
+                logger.debug(str(p))
+                # p.pprintPacket() TODO: Make a version of print packet
+                # that sends it to debug instead
+                response = SQLAnswer(RESPONSE_TYPE.OK)
+
+        except SqlApiException as e:
+            # classified error
+            error_type = "expected"
+
+            response = SQLAnswer(
+                resp_type=RESPONSE_TYPE.ERROR,
+                error_code=e.err_code,
+                error_message=str(e),
+            )
 
-            except Exception as e:
-                # any other exception
-                error_type = "unexpected"
-                error_traceback = traceback.format_exc()
-                logger.error(f"ERROR while executing query\n{error_traceback}\n{e}")
+        except exec_exc.ExecutorException as e:
+            # unclassified
+            error_type = "expected"
+
+            if isinstance(e, exec_exc.NotSupportedYet):
+                error_code = ERR.ER_NOT_SUPPORTED_YET
+            elif isinstance(e, exec_exc.KeyColumnDoesNotExist):
+                error_code = ERR.ER_KEY_COLUMN_DOES_NOT_EXIST
+            elif isinstance(e, exec_exc.TableNotExistError):
+                error_code = ERR.ER_TABLE_EXISTS_ERROR
+            elif isinstance(e, exec_exc.WrongArgumentError):
+                error_code = ERR.ER_WRONG_ARGUMENTS
+            elif isinstance(e, exec_exc.LogicError):
+                error_code = ERR.ER_WRONG_USAGE
+            elif isinstance(e, (exec_exc.BadDbError, exec_exc.BadTableError)):
+                error_code = ERR.ER_BAD_DB_ERROR
+            else:
                 error_code = ERR.ER_SYNTAX_ERROR
-                response = SQLAnswer(
-                    resp_type=RESPONSE_TYPE.ERROR,
-                    error_code=error_code,
-                    error_message=str(e),
-                )
 
-            if response is not None:
-                self.send_query_answer(response)
-                if response.type == RESPONSE_TYPE.ERROR:
-                    error_text = response.error_message
-                    error_code = response.error_code
-                    error_type = error_type or "expected"
-
-            hooks.after_api_query(
-                company_id=ctx.company_id,
-                api="mysql",
-                command=command_name,
-                payload=sql,
-                error_type=error_type,
+            response = SQLAnswer(
+                resp_type=RESPONSE_TYPE.ERROR,
                 error_code=error_code,
-                error_text=error_text,
-                traceback=error_traceback,
+                error_message=str(e),
+            )
+        except exec_exc.UnknownError as e:
+            # unclassified
+            error_type = "unexpected"
+
+            response = SQLAnswer(
+                resp_type=RESPONSE_TYPE.ERROR,
+                error_code=ERR.ER_UNKNOWN_ERROR,
+                error_message=str(e),
             )
 
+        except Exception as e:
+            # any other exception
+            error_type = "unexpected"
+            error_traceback = traceback.format_exc()
+            logger.error(f"ERROR while executing query\n{error_traceback}\n{e}")
+            error_code = ERR.ER_SYNTAX_ERROR
+            response = SQLAnswer(
+                resp_type=RESPONSE_TYPE.ERROR,
+                error_code=error_code,
+                error_message=str(e),
+            )
+
+        if response is not None:
+            self.send_query_answer(response)
+            if response.type == RESPONSE_TYPE.ERROR:
+                error_text = response.error_message
+                error_code = response.error_code
+                error_type = error_type or "expected"
+
+        hooks.after_api_query(
+            company_id=ctx.company_id,
+            api="mysql",
+            command=command_name,
+            payload=sql,
+            error_type=error_type,
+            error_code=error_code,
+            error_text=error_text,
+            traceback=error_traceback,
+        )
+        return True
+
     def packet(self, packetClass=Packet, **kwargs):
         """
         Factory method for packets
@@ -855,8 +881,18 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
 
         logger.info(f"Starting MindsDB Mysql proxy server on tcp://{host}:{port}")
 
-        SocketServer.TCPServer.allow_reuse_address = True
-        server = SocketServer.ThreadingTCPServer((host, port), MysqlProxy)
+        if config["api"]["mysql"].get("server") == "asyncio":
+            server = AsyncMysqlServer(
+                host,
+                port,
+                MysqlProxy,
+                workers=int(config["api"]["mysql"].get("workers", 16)),
+                handshake_timeout=float(config["api"]["mysql"].get("handshake_timeout", 10)),
+            )
+            server.bind()
+        else:
+            SocketServer.TCPServer.allow_reuse_address = True
+            server = SocketServer.ThreadingTCPServer((host, port), MysqlProxy)
         server.mindsdb_config = config
         server.check_auth = partial(check_auth, config=config)
         server.cert_path = cert_path
@@ -312,8 +312,8 @@ def _handle_series_as_int(series: pd.Series) -> pd.Series:
         pd.Series: The series with the int values as strings
     """
     if pd_types.is_integer_dtype(series.dtype):
-        if series.dtype == "Int64":
-            # NOTE: 'apply' converts values to python floats
+        if pd_types.is_extension_array_dtype(series.dtype):
+            # NOTE: 'apply' converts values of nullable int dtypes (Int64, Int32, ...) to python floats
             return series.astype(object).apply(_dump_str)
         return series.apply(_dump_str)
     return series.apply(_dump_int_or_str)
@@ -381,9 +381,11 @@ def dump_result_set_to_mysql(
             case _:
                 series = series.apply(_dump_str)
 
-        # inplace modification of dt types raise SettingWithCopyWarning, so do regular replace
-        # we may split this operation for dt and other types for optimisation
-        df[i] = series.replace([np.NaN, pd.NA, pd.NaT], None)
+        # dumped values are str or None, only nulls left by vectorized dt formatting have to be replaced
+        mask = series.isna()
+        if mask.any():
+            series = series.astype(object).where(~mask, None)
+        df[i] = series
 
     columns_dicts = [column_to_mysql_column_dict(column) for column in result_set.columns]
 
@@ -0,0 +1,218 @@
+import io
+import struct
+import socket
+import asyncio
+import threading
+import contextvars
+from functools import partial
+from typing import List, Optional
+
+from mindsdb.api.mysql.mysql_proxy.async_server import AsyncMysqlServer
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_formats import (
+    AuthenticationClearTextPassword,
+    ConnectionFailure,
+)
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_packets import (
+    PostgresPacketReader,
+    PostgresPacketBuilder,
+    UnsupportedPostgresMessageType,
+)
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+SSL_REQUEST_CODE = 80877103
+# if the output of a worker becomes bigger, it is sent to the client before the end of the command
+OUTPUT_FLUSH_SIZE = 2**16
+RECV_SIZE = 2**16
+
+
+class _Input:
+    """Buffer of the data received from the client, it is filled on the event loop"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, sock: socket.socket):
+        self.loop = loop
+        self.sock = sock
+        self.buffer = bytearray()
+
+    async def _fill(self) -> bool:
+        data = await self.loop.sock_recv(self.sock, RECV_SIZE)
+        if not data:
+            return False
+        self.buffer += data
+        return True
+
+    async def read_startup_packet(self) -> Optional[bytes]:
+        """Read packet without type identifier (SSLRequest, StartupMessage), None if the client closed connection"""
+        while len(self.buffer) < 4:
+            if not await self._fill():
+                return None
+        length = struct.unpack("!i", self.buffer[:4])[0]
+        while len(self.buffer) < length:
+            if not await self._fill():
+                return None
+        data = bytes(self.buffer[:length])
+        del self.buffer[:length]
+        return data
+
+    def _split_messages(self, limit: Optional[int] = None) -> List[bytes]:
+        messages = []
+        pos = 0
+        while len(self.buffer) - pos >= 5 and (limit is None or len(messages) < limit):
+            length = struct.unpack("!i", self.buffer[pos + 1 : pos + 5])[0]
+            end = pos + 1 + length
+            if end > len(self.buffer):
+                break
+            messages.append(bytes(self.buffer[pos:end]))
+            pos = end
+        del self.buffer[:pos]
+        return messages
+
+    async def read_messages(self, limit: Optional[int] = None) -> List[bytes]:
+        """Wait for at least one message and return all the messages which are received completely.
+        A client which pipelines queries gets them handled as one batch.
+
+        Args:
+            limit (int): max number of messages to return
+
+        Returns:
+            List[bytes]: raw messages, empty list if the client closed connection
+        """
+        while True:
+            messages = self._split_messages(limit)
+            if len(messages) > 0:
+                return messages
+            if not await self._fill():
+                return []
+
+
+class _Output:
+    """File-like buffer for the messages of the handler.
+
+    When it is written by a worker thread and becomes bigger than OUTPUT_FLUSH_SIZE, the worker sends the data through
+    the event loop and waits until it is sent. So rows of a big result are streamed, and a slow client slows down
+    the conversion of rows instead of growing the buffer.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, sock: socket.socket):
+        self.loop = loop
+        self.sock = sock
+        self.buffer = bytearray()
+        self._loop_thread_id = threading.get_ident()
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        if len(self.buffer) >= OUTPUT_FLUSH_SIZE and threading.get_ident() != self._loop_thread_id:
+            future = asyncio.run_coroutine_threadsafe(self.loop.sock_sendall(self.sock, self._take()), self.loop)
+            future.result()
+        return len(data)
+
+    def _take(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+    async def flush(self):
+        if len(self.buffer) > 0:
+            await self.loop.sock_sendall(self.sock, self._take())
+
+
+class AsyncPostgresServer(AsyncMysqlServer):
+    """Postgres server which keeps connections on an event loop and executes messages in a pool of `workers` threads.
+
+    Messages are read on the event loop. All the messages which are received at once (e.g. pipelined
+    Parse/Bind/Execute/Sync sequences) are handled by one task of the pool with
+    PostgresProxyHandler.handle_messages, their responses are sent together.
+
+    The startup messages and the password are read on the event loop too, every read is limited by
+    `handshake_timeout` seconds. Detection of the cloud connection reads the socket in the separate pool
+    of the handshakes with the same timeout, so slow clients can't take workers of the queries.
+
+    Args:
+        host (str): host to listen
+        port (int): port to listen
+        handler_class (type): PostgresProxyHandler
+        workers (int): max number of batches of messages executed at the same time
+        handshake_timeout (float): seconds to wait for every answer of the client during the handshake
+    """
+
+    async def serve_connection(self, client: socket.socket, address):
+        handler = self.handler_class(client, address, self, handle=False)
+        context = contextvars.Context()
+        self.connections += 1
+        try:
+            # detection of cloud connection reads blocking socket
+            client.settimeout(self.handshake_timeout)
+            await self._loop.run_in_executor(self._handshake_executor, context.run, handler.start_session)
+            client.setblocking(False)
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            reader = _Input(self._loop, client)
+            output = _Output(self._loop, client)
+            handler.wfile = output
+            if not await self._start_connection(context, handler, reader, output):
+                return
+
+            while True:
+                raw_messages = await reader.read_messages()
+                if len(raw_messages) == 0:
+                    return
+                messages = self._parse_messages(raw_messages)
+                keep = await self._execute(context, partial(handler.handle_messages, messages))
+                await output.flush()
+                if keep is False:
+                    return
+        except (TimeoutError, asyncio.TimeoutError):
+            logger.warning(f"Connection {address} is closed: no answer from the client during the handshake")
+        except Exception:
+            logger.exception(f"Error in connection {address}")
+        finally:
+            self.connections -= 1
+            client.close()
+
+    async def _start_connection(self, context, handler, reader: _Input, output: _Output) -> bool:
+        data = await asyncio.wait_for(reader.read_startup_packet(), self.handshake_timeout)
+        if data is None:
+            return False
+        if len(data) == 8 and struct.unpack("!i", data[4:8])[0] == SSL_REQUEST_CODE:
+            PostgresPacketBuilder().write_char(b"N", output)
+            await output.flush()
+            data = await asyncio.wait_for(reader.read_startup_packet(), self.handshake_timeout)
+            if data is None:
+                return False
+        handler.user_parameters = PostgresPacketReader(io.BytesIO(data)).read_startup_message()
+
+        if not handler.is_cloud:
+            authenticated = await self._execute(context, partial(handler.login, ""))
+            if not authenticated:
+                handler.send(AuthenticationClearTextPassword())
+                await output.flush()
+                raw_messages = await asyncio.wait_for(reader.read_messages(limit=1), self.handshake_timeout)
+                if len(raw_messages) == 0:
+                    return False
+                password = PostgresPacketReader(io.BytesIO(raw_messages[0])).read_authentication(
+                    encoding=handler.charset
+                )
+                authenticated = await self._execute(context, partial(handler.login, password))
+            if not authenticated:
+                handler.send(ConnectionFailure(message="Authentication failed."))
+                await output.flush()
+                return False
+
+        handler.send_initial_data()
+        handler.send_ready()
+        await output.flush()
+        return True
+
+    @staticmethod
+    def _parse_messages(raw_messages: List[bytes]) -> list:
+        messages = []
+        for raw_message in raw_messages:
+            try:
+                message = PostgresPacketReader(io.BytesIO(raw_message)).read_message()
+            except UnsupportedPostgresMessageType as e:
+                logger.warning(f"Ignoring unsupported message: {e}")
+                continue
+            if message is not None:
+                messages.append(message)
+        return messages
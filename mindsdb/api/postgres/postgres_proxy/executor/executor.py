@@ -1,7 +1,9 @@
+import re
 from typing import Union
 
-from mindsdb_sql_parser import parse_sql
+from mindsdb_sql_parser import parse_sql, ast
 from mindsdb.api.executor.planner import utils as planner_utils
+from mindsdb.integrations.utilities.query_traversal import query_traversal
 
 from numpy import dtype as np_dtype
 from pandas.api import types as pd_types
@@ -54,11 +56,21 @@ class Executor:
                 f"The SQL statement cannot be parsed - {sql}: {mdb_error}"
             ) from mdb_error
 
+        # postgres parameters ($1, $2, ...) are parsed as identifiers
+        def find_params(node, **kwargs):
+            if isinstance(node, ast.Identifier) and len(node.parts) == 1 and re.fullmatch(r"\$\d+", node.parts[0]):
+                return ast.Parameter(node.parts[0])
+
+        query_traversal(self.query, find_params)
+
     def stmt_execute(self, param_values):
         if self.is_executed:
             return
 
-        # fill params
+        # fill params: $N parameter can be used in any order and many times
+        params = planner_utils.get_query_params(self.query)
+        if len(params) > 0 and all(p.value.startswith("$") for p in params):
+            param_values = [param_values[int(p.value[1:]) - 1] for p in params]
         self.query = planner_utils.fill_query_params(self.query, param_values)
 
         # execute query
@@ -89,7 +101,7 @@ class Executor:
         self.is_executed = True
 
         if ret.data is not None:
-            self.data = ret.data.to_lists()
+            self.data = ret.data
             self.columns = ret.data.columns
 
         self.state_track = ret.state_track
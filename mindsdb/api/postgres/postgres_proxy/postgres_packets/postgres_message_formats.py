@@ -702,6 +702,20 @@ class Sync(BaseFrontendMessage):
         super().__init__()
 
 
+class Flush(BaseFrontendMessage):
+    """
+    Flush (F)
+    Byte1('H')
+    Identifies the message as a Flush command.
+
+    Int32(4)
+    Length of message contents in bytes, including self. """
+
+    def __init__(self):
+        self.identifier = PostgresFrontendMessageIdentifier.FLUSH
+        super().__init__()
+
+
 class Describe(BaseFrontendMessage):
     """
     Describe (F)
@@ -746,7 +760,8 @@ FE_MESSAGE_MAP: Dict[PostgresFrontendMessageIdentifier, Type[PostgresMessage]] =
     PostgresFrontendMessageIdentifier.BIND: Bind,
     PostgresFrontendMessageIdentifier.EXECUTE: Execute,
     PostgresFrontendMessageIdentifier.SYNC: Sync,
-    PostgresFrontendMessageIdentifier.DESCRIBE: Describe
+    PostgresFrontendMessageIdentifier.DESCRIBE: Describe,
+    PostgresFrontendMessageIdentifier.FLUSH: Flush
 }
 SUPPORTED_AUTH_TYPES = [PostgresAuthType.PASSWORD]
 
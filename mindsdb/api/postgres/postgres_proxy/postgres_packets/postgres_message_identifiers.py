@@ -25,6 +25,7 @@ class PostgresFrontendMessageIdentifier(Enum):
     BIND = b'B'
     SYNC = b'S'
     DESCRIBE = b'D'
+    FLUSH = b'H'
 
 
 class PostgresAuthType(Enum):
@@ -8,12 +8,13 @@ import struct
 import sys
 from functools import partial
 import socket
-from typing import Callable, Dict, Type, Any, Iterable, Sequence
+from typing import Callable, Dict, Type, Any, Iterable, List, Sequence
 
 from mindsdb.api.executor.controllers import SessionController
 from mindsdb.api.postgres.postgres_proxy.executor import Executor
 from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import CHARSET_NUMBERS
 from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
+from mindsdb.api.executor.sql_query.result_set import Column
 from mindsdb.api.common.middleware import check_auth
 from mindsdb.api.mysql.mysql_proxy.mysql_proxy import SQLAnswer
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.errors import POSTGRES_SYNTAX_ERROR_CODE
@@ -34,6 +35,7 @@ from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_forma
     Bind,
     Parse,
     Sync,
+    Flush,
     ParseComplete,
     InvalidSQLStatementName,
     BindComplete,
@@ -47,17 +49,21 @@ from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_packets impor
     PostgresPacketBuilder,
 )
 from mindsdb.api.postgres.postgres_proxy.utilities import strip_null_byte
+from mindsdb.api.postgres.postgres_proxy.async_server import AsyncPostgresServer
 from mindsdb.utilities.config import config
 from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities import log
 from mindsdb.api.mysql.mysql_proxy.external_libs.mysql_scramble import scramble as scramble_func
 
+# rows in one batch of DataRow messages
+DATA_ROW_CHUNK_SIZE = 1000
+
 
 class PostgresProxyHandler(socketserver.StreamRequestHandler):
     client_buffer: PostgresPacketReader
     user_parameters: Dict[bytes, bytes]
 
-    def __init__(self, request, client_address, server):
+    def __init__(self, request, client_address, server, handle: bool = True):
         self.logger = log.getLogger(__name__)
         self.charset = "utf8"
         self.charset_text_type = CHARSET_NUMBERS["utf8_general_ci"]
@@ -70,9 +76,32 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         self.named_portals = {}
         self.unnamed_portal = None
         self.transaction_status = b"I"  # I: Idle, T: Transaction Block, E: Failed Transaction Block
-        super().__init__(request, client_address, server)
+        # a message of the extended query protocol failed, next messages are skipped until Sync
+        self._skip_until_sync = False
+        if handle:
+            super().__init__(request, client_address, server)
+        else:
+            # connection is served by AsyncPostgresServer, it reads messages and provides wfile
+            self.request = request
+            self.client_address = client_address
+            self.server = server
 
     def handle(self) -> None:
+        self.start_session()
+        self.client_buffer = PostgresPacketReader(self.rfile)
+        if self.is_cloud:
+            # We already have a connection started through the gateway.
+            started = True
+            self.handshake()
+        else:
+            started = self.start_connection()
+        if started:
+            self.logger.debug("connection started")
+            self.send_initial_data()
+            self.main_loop()
+
+    def start_session(self) -> None:
+        """Set context of the connection and create the session. Must be called before the handshake"""
         ctx.set_default()
         self.init_session()
         self.logger.debug("handle new incoming connection")
@@ -89,18 +118,8 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             Execute: self.execute,
             Describe: self.describe,
             Sync: self.sync,
+            Flush: self.flush,
         }
-        self.client_buffer = PostgresPacketReader(self.rfile)
-        if self.is_cloud:
-            # We already have a connection started through the gateway.
-            started = True
-            self.handshake()
-        else:
-            started = self.start_connection()
-        if started:
-            self.logger.debug("connection started")
-            self.send_initial_data()
-            self.main_loop()
 
     def is_cloud_connection(self):
         """Determine source of connection. Must be call before handshake.
@@ -178,8 +197,15 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             return True
 
         # TODO Should check validity of statement here and not at parse stage
-        portal = statement.copy()
-        portal["bind"] = message
+        if statement.get("bound"):
+            # every portal has own executor: executor keeps the parameters and the result of the execution
+            executor = Executor(session=self.session, proxy_server=self, charset=self.charset)
+            executor.stmt_prepare(sql=statement["parse"].query)
+        else:
+            # first portal uses the executor of Parse: a query without parameters is already executed by it
+            executor = statement["executor"]
+            statement["bound"] = True
+        portal = {"executor": executor, "parse": statement["parse"], "bind": message}
         if message.name:
             self.named_portals[message.name] = portal
         else:
@@ -192,11 +218,14 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         if message.describe_type == b"P":
             if message.name:
                 describing = self.named_portals[message.name]
-            elif self.unnamed_statement:
+            elif self.unnamed_portal:
                 describing = self.unnamed_portal
             else:
                 self.send(InvalidSQLStatementName("Portal Does not Exist"))
                 return True
+            if not describing["executor"].is_executed:
+                # columns of the result are known after the execution, Execute of the portal will return the result
+                describing["executor"].stmt_execute(param_values=self.decode_parameters(describing["bind"]))
         elif message.describe_type == b"S":
             if message.name:
                 describing = self.named_statements[message.name]
@@ -205,7 +234,7 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             else:
                 self.send(InvalidSQLStatementName())
                 return True
-            self.send(ParameterDescription(parameters=describing["parse"]["parameters"]))
+            self.send(ParameterDescription(parameters=describing["parse"].parameters))
         else:
             self.send(DataException(message="Describe did not have correct type. Can be 'P' or 'S'"))
             return True
@@ -222,20 +251,41 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             portal = self.unnamed_portal
         else:
             self.send(InvalidSQLStatementName("Portal does not exist"))
+            return True
 
         executor = portal["executor"]
-        params = portal["bind"].parameters
+        params = self.decode_parameters(portal["bind"])
         executor.stmt_execute(param_values=params)
         sql_answer = self.return_executor_data(executor)
         self.respond_from_sql_answer(sql=executor.sql, sql_answer=sql_answer, row_descs=False)
         return True
 
+    def decode_parameters(self, message: Bind) -> list:
+        """Parameters in text format are decoded to str, parameters in binary format are returned as is"""
+        params = []
+        for i, value in enumerate(message.parameters):
+            if len(message.format_codes) == 0:
+                format_code = 0
+            elif len(message.format_codes) == 1:
+                format_code = message.format_codes[0]
+            else:
+                format_code = message.format_codes[i]
+            if value is not None and format_code == 0:
+                value = value.decode(self.get_encoding())
+            params.append(value)
+        return params
+
     def sync(self, message: Sync):
         self.logger.info("Postgres_Proxy: Syncing")
         # TODO: Close/commit transaction if outside of a block. Maybe no collaries since Proxy
         self.send_ready()
         return True
 
+    def flush(self, message: Flush):
+        # responses are not buffered by the handler: wfile of the threading server is unbuffered,
+        # the asyncio server sends the output after every batch of messages
+        return True
+
     def init_session(self):
         self.logger.info("New connection [{ip}:{port}]".format(ip=self.client_address[0], port=self.client_address[1]))
         self.logger.debug(self.__dict__)
@@ -309,6 +359,22 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             password = self.client_buffer.read_authentication(encoding=self.charset)
         else:
             password = ""
+        if self.login(password):
+            return True
+        if not ask_for_password:  # try asking for password
+            return self.authenticate(ask_for_password=True)
+        self.send(ConnectionFailure(message="Authentication failed."))
+        return False
+
+    def login(self, password: str) -> bool:
+        """Check credentials of the user from the startup message, send AuthenticationOk if they are valid
+
+        Args:
+            password (str): password of the user
+
+        Returns:
+            bool: True if authentication succeeded
+        """
         username = self.user_parameters[b"user"].decode(encoding=self.charset)
         auth_data = self.server.check_auth(username, password, scramble_func, self.salt, ctx.company_id)
         if auth_data["success"]:
@@ -317,12 +383,8 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             self.session.auth = True
             self.send(AuthenticationOk())
             return True
-        else:
-            if not ask_for_password:  # try asking for password
-                return self.authenticate(ask_for_password=True)
-            self.logger.debug("Authentication failed")
-            self.send(ConnectionFailure(message="Authentication failed."))
-            return False
+        self.logger.debug("Authentication failed")
+        return False
 
     def terminate(self, message: Terminate) -> bool:
         self.logger.info("Postgres_Proxy: Terminating")
@@ -355,13 +417,16 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         return strip_null_byte(sql).strip(";")
 
     def return_table(self, sql_answer: SQLAnswer, row_descs=True):
-        fields = self.to_postgres_fields(sql_answer.result_set.columns)
-        rows = self.to_postgres_rows(sql_answer.result_set)
+        result_set = sql_answer.result_set
         if row_descs:
+            fields = self.to_postgres_fields(result_set.columns)
             self.send(RowDescriptions(fields=fields))
-        self.send(DataRow(rows=rows))
+        # rows are converted and sent by chunks, the output can be flushed to the client between them
+        for start in range(0, len(result_set), DATA_ROW_CHUNK_SIZE):
+            rows = self.to_postgres_rows(result_set[start:start + DATA_ROW_CHUNK_SIZE].to_lists())
+            self.send(DataRow(rows=rows))
         encoding = self.get_encoding()
-        tag = ("SELECT %s" % str(len(rows))).encode(encoding)
+        tag = ("SELECT %s" % str(len(result_set))).encode(encoding)
         self.send(CommandComplete(tag=tag))
         return True
 
@@ -389,12 +454,12 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         elif RESPONSE_TYPE.ERROR == sql_answer.type:
             return self.return_error(sql_answer)
 
-    @staticmethod
-    def to_postgres_fields(columns: Iterable[Dict[str, Any]]) -> Sequence[PostgresField]:
+    def to_postgres_fields(self, columns: Iterable[Column]) -> Sequence[PostgresField]:
+        executor = Executor(session=self.session, proxy_server=self, charset=self.charset)
         fields = []
         i = 0
-        for column in columns:
-            fields.append(GenericField(name=column["name"], object_id=column["type"].value, column_id=i))
+        for column in executor.to_postgres_columns(columns):
+            fields.append(GenericField(name=column["alias"], object_id=column["type"].value, column_id=i))
             i += 1
         return fields
 
@@ -458,11 +523,55 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             else:
                 self.logger.warning("Ignoring unsupported message type %s" % tof)
 
+    def handle_messages(self, messages: List[PostgresMessage]) -> bool:
+        """Handle a batch of pipelined messages. Responses are written to wfile in the order of the messages.
+        If a message of the extended query protocol fails, the error is sent and the next messages
+        are skipped until Sync, as postgres does. The rest of the pipeline can arrive in the next batches.
+
+        Args:
+            messages (List[PostgresMessage]): messages in the order they were received
+
+        Returns:
+            bool: False if the connection has to be closed
+        """
+        for message in messages:
+            tof = type(message)
+            if self._skip_until_sync:
+                if tof is not Sync:
+                    continue
+                self._skip_until_sync = False
+            if tof not in self.message_map:
+                self.logger.warning("Ignoring unsupported message type %s" % tof)
+                continue
+            try:
+                if not self.message_map[tof](message):
+                    return False
+            except Exception as e:
+                self.logger.warning(f"Error during handling of {tof.__name__}: {e}")
+                self.send(Error.from_answer(
+                    error_code=POSTGRES_SYNTAX_ERROR_CODE.encode(self.charset),
+                    error_message=str(e).encode(self.charset),
+                ))
+                if tof is Query:
+                    self.send_ready()
+                else:
+                    self._skip_until_sync = True
+        return True
+
     @staticmethod
     def startProxy():
         host = config["api"]["postgres"]["host"]
         port = int(config["api"]["postgres"]["port"])
-        server = TcpServer((host, port), PostgresProxyHandler)
+        if config["api"]["postgres"].get("server") == "asyncio":
+            server = AsyncPostgresServer(
+                host,
+                port,
+                PostgresProxyHandler,
+                workers=int(config["api"]["postgres"].get("workers", 16)),
+                handshake_timeout=float(config["api"]["postgres"].get("handshake_timeout", 10)),
+            )
+        else:
+            server = TcpServer((host, port), PostgresProxyHandler)
         server.connection_id = 0
         server.mindsdb_config = config
         server.check_auth = partial(check_auth, config=config)
@@ -1,5 +1,5 @@
 import inspect
-from typing import List
+from typing import Iterator, List
 from dataclasses import dataclass
 
 import pandas as pd
@@ -7,6 +7,7 @@ import github
 
 from mindsdb.integrations.utilities.sql_utils import (FilterCondition, FilterOperator, SortColumn)
 from mindsdb.integrations.libs.api_handler import APIResource
+from mindsdb.integrations.handlers.github_handler.github_tables import get_pages, DEFAULT_LIMIT
 
 
 @dataclass
@@ -158,24 +159,21 @@ class GHTable(APIResource):
     def get_columns(self) -> List[str]:
         return list(self.output_columns.keys())
 
-    def list(
+    def list_pages(
         self,
         conditions: List[FilterCondition] = None,
         limit: int = None,
         sort: List[SortColumn] = None,
         targets: List[str] = None,
         **kwargs
-    ) -> pd.DataFrame:
-
-        if limit is None:
-            limit = 20
+    ) -> Iterator[pd.DataFrame]:
 
         method_kwargs = {}
         if sort is not None and self._allow_sort:
             for col in sort:
                 method_kwargs['sort'] = col.column
                 method_kwargs['direction'] = 'asc' if col.ascending else 'desc'
-                sort.applied = True
+                col.applied = True
                 # supported only 1 column
                 break
 
@@ -197,32 +195,27 @@ class GHTable(APIResource):
         connection = self.handler.connect()
         method = getattr(connection.get_repo(self.handler.repository), self.method.name)
 
-        data = []
-        count = 0
-        for record in method(**method_kwargs):
-            item = {}
-            for name, output_type in self.output_columns.items():
-
-                # workaround to prevent making addition request per property.
-                if name in targets:
-                    # request only if is required
-                    value = getattr(record, name)
+        for page in get_pages(method(**method_kwargs), limit=DEFAULT_LIMIT if limit is None else None):
+            data = [self._get_item(record, targets) for record in page]
+            yield pd.DataFrame(data, columns=self.get_columns())
+
+    def _get_item(self, record, targets: List[str]) -> dict:
+        item = {}
+        for name, output_type in self.output_columns.items():
+
+            # workaround to prevent making addition request per property.
+            if name in targets:
+                # request only if is required
+                value = getattr(record, name)
+            else:
+                value = getattr(record, '_' + name).value
+            if value is not None:
+                if output_type.name == 'list':
+                    value = ",".join([
+                            str(self.repr_value(i, output_type.sub_type))
+                            for i in value
+                    ])
                 else:
-                    value = getattr(record, '_' + name).value
-                if value is not None:
-                    if output_type.name == 'list':
-                        value = ",".join([
-                                str(self.repr_value(i, output_type.sub_type))
-                                for i in value
-                        ])
-                    else:
-                        value = self.repr_value(value, output_type.name)
-                item[name] = value
-
-            data.append(item)
-
-            count += 1
-            if limit <= count:
-                break
-
-        return pd.DataFrame(data, columns=self.get_columns())
+                    value = self.repr_value(value, output_type.name)
+            item[name] = value
+        return item
@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import Iterator, List
 import pandas as pd
 
 from mindsdb.integrations.libs.api_handler import APIResource
@@ -10,18 +10,48 @@ from mindsdb.utilities import log
 
 logger = log.getLogger(__name__)
 
+# rows returned by paginated tables if the query doesn't have a limit
+DEFAULT_LIMIT = 20
+
+
+def get_pages(paginated_list, limit: int = None) -> Iterator[list]:
+    """Iterate over PaginatedList of PyGithub by pages, one request per page.
+    At least one (possibly empty) page is returned
+
+    Args:
+        paginated_list (PaginatedList): result of github api call
+        limit (int): stop after this number of items, the last page is truncated
+
+    Yields:
+        list: items of the page
+    """
+    page_num = 0
+    count = 0
+    while True:
+        items = paginated_list.get_page(page_num)
+        if limit is not None and count + len(items) >= limit:
+            yield items[: limit - count]
+            return
+        if len(items) > 0 or page_num == 0:
+            yield items
+        if len(items) == 0:
+            return
+        count += len(items)
+        page_num += 1
+
 
 class GithubIssuesTable(APIResource):
     """The GitHub Issue Table implementation"""
 
-    def list(self,
-             conditions: List[FilterCondition] = None,
-             limit: int = None,
-             sort: List[SortColumn] = None,
-             targets: List[str] = None) -> pd.DataFrame:
-        """Pulls data from the GitHub "List repository issues" API
+    def list_pages(self,
+                   conditions: List[FilterCondition] = None,
+                   limit: int = None,
+                   sort: List[SortColumn] = None,
+                   targets: List[str] = None,
+                   **kwargs) -> Iterator[pd.DataFrame]:
+        """Pulls data from the GitHub "List repository issues" API, page by page
 
-        Returns
+        Yields
         -------
         pd.DataFrame
             GitHub issues matching the query
@@ -32,9 +62,6 @@ class GithubIssuesTable(APIResource):
             If the query contains an unsupported condition
         """
 
-        if limit is None:
-            limit = 20
-
         issues_kwargs = {'state': 'all'}
 
         if sort is not None:
@@ -42,7 +69,7 @@ class GithubIssuesTable(APIResource):
                 if col.column in ('created', 'updated', 'comments'):
                     issues_kwargs['sort'] = col.column
                     issues_kwargs['direction'] = 'asc' if col.ascending else 'desc'
-                    sort.applied = True
+                    col.applied = True
 
                     # supported only 1 column
                     break
@@ -67,42 +94,37 @@ class GithubIssuesTable(APIResource):
 
         self.handler.connect()
 
-        data = []
-        count = 0
-        for an_issue in self.handler.connection\
-                .get_repo(self.handler.repository) \
-                .get_issues(**issues_kwargs):
-            item = {
-                "number": an_issue.number,
-                "title": an_issue.title,
-                "state": an_issue.state,
-                "creator": an_issue.user.login,
-                "labels": ",".join(
-                    [label.name for label in an_issue.labels]
-                ),
-                "assignees": ",".join(
-                    [
-                        assignee.login
-                        for assignee in an_issue.assignees
-                    ]
-                ),
-                "comments": an_issue.comments,
-                "body": an_issue.body,
-                "created": an_issue.created_at,
-                "updated": an_issue.updated_at,
-                "closed": an_issue.closed_at,
-            }
-
-            if 'closed_by' in targets:
-                item['closed_by'] = an_issue.closed_by.login if an_issue.closed_by else None
-
-            data.append(item)
-
-            count += 1
-            if limit <= count:
-                break
-
-        return pd.DataFrame(data, columns=self.get_columns())
+        issues = self.handler.connection.get_repo(self.handler.repository).get_issues(**issues_kwargs)
+        for page in get_pages(issues, limit=DEFAULT_LIMIT if limit is None else None):
+            data = [self._get_item(an_issue, targets) for an_issue in page]
+            yield pd.DataFrame(data, columns=self.get_columns())
+
+    def _get_item(self, an_issue, targets: List[str]) -> dict:
+        item = {
+            "number": an_issue.number,
+            "title": an_issue.title,
+            "state": an_issue.state,
+            "creator": an_issue.user.login,
+            "labels": ",".join(
+                [label.name for label in an_issue.labels]
+            ),
+            "assignees": ",".join(
+                [
+                    assignee.login
+                    for assignee in an_issue.assignees
+                ]
+            ),
+            "comments": an_issue.comments,
+            "body": an_issue.body,
+            "created": an_issue.created_at,
+            "updated": an_issue.updated_at,
+            "closed": an_issue.closed_at,
+        }
+
+        if 'closed_by' in targets:
+            item['closed_by'] = an_issue.closed_by.login if an_issue.closed_by else None
+
+        return item
 
     def add(self, issues: List[dict]):
         """Inserts data into the GitHub "Create an issue" API
@@ -232,12 +254,13 @@ class GithubIssuesTable(APIResource):
 class GithubPullRequestsTable(APIResource):
     """The GitHub Issue Table implementation"""
 
-    def list(self,
-             conditions: List[FilterCondition] = None,
-             limit: int = None,
-             sort: List[SortColumn] = None,
-             targets: List[str] = None) -> pd.DataFrame:
-        """Pulls data from the GitHub "List repository pull requests" API
+    def list_pages(self,
+                   conditions: List[FilterCondition] = None,
+                   limit: int = None,
+                   sort: List[SortColumn] = None,
+                   targets: List[str] = None,
+                   **kwargs) -> Iterator[pd.DataFrame]:
+        """Pulls data from the GitHub "List repository pull requests" API, page by page
 
         Native filters:
         - state: open, closed, or all (default)
@@ -248,7 +271,7 @@ class GithubPullRequestsTable(APIResource):
         Native sorts:
         - created, updated, popularity
 
-        Returns
+        Yields
         -------
         pd.DataFrame
             GitHub pull requests matching the query
@@ -259,9 +282,6 @@ class GithubPullRequestsTable(APIResource):
             If the query contains an unsupported condition
         """
 
-        if limit is None:
-            limit = 20
-
         issues_kwargs = {'state': 'all'}
 
         if sort is not None:
@@ -269,7 +289,7 @@ class GithubPullRequestsTable(APIResource):
                 if col.column in ('created', 'updated', 'popularity'):
                     issues_kwargs['sort'] = col.column
                     issues_kwargs['direction'] = 'asc' if col.ascending else 'desc'
-                    sort.applied = True
+                    col.applied = True
 
                     # supported only 1 column
                     break
@@ -283,65 +303,60 @@ class GithubPullRequestsTable(APIResource):
 
         self.handler.connect()
 
-        data = []
-        count = 0
-        for a_pull in self.handler.connection\
-                .get_repo(self.handler.repository) \
-                .get_pulls(**issues_kwargs):
-
-            item = {
-                "number": a_pull.number,
-                "title": a_pull.title,
-                "state": a_pull.state,
-                "creator": a_pull.user.login,
-                "labels": ",".join(
-                    [label.name for label in a_pull.labels]
-                ),
-                "milestone": a_pull.milestone.title if a_pull.milestone else None,
-                "assignees": ",".join(
-                    [
-                        assignee.login
-                        for assignee in a_pull.assignees
-                    ]
-                ),
-                "reviewers": ",".join(
-                    [
-                        reviewer.login
-                        for reviewer in a_pull.requested_reviewers
-                    ]
-                ),
-                "teams": ",".join(
-                    [
-                        team.name
-                        for team in a_pull.requested_teams
-                    ]
-                ),
-                "draft": a_pull.draft,
-                "body": a_pull.body,
-                "base": a_pull.base.ref if a_pull.base else None,
-                "head": a_pull.head.ref if a_pull.head else None,
-                "created": a_pull.created_at,
-                "updated": a_pull.updated_at,
-                "merged": a_pull.merged_at,
-                "closed": a_pull.closed_at,
-            }
-
-            # downloaded columns, use them only if explicitly requested
-            for field in ('comments', 'review_comments', 'mergeable', 'mergeable_state', 'rebaseable',
-                          'commits', 'additions', 'deletions', 'changed_files'):
-                if field in targets:
-                    item[field] = getattr(a_pull, field)
-            if 'is_merged' in targets:
-                item['is_merged'] = a_pull.merged
-            if 'merged_by' in targets:
-                item['is_merged'] = a_pull.merged_by.login if a_pull.merged_by else None
-
-            data.append(item)
-            count += 1
-            if limit <= count:
-                break
-
-        return pd.DataFrame(data, columns=self.get_columns())
+        pulls = self.handler.connection.get_repo(self.handler.repository).get_pulls(**issues_kwargs)
+        for page in get_pages(pulls, limit=DEFAULT_LIMIT if limit is None else None):
+            data = [self._get_item(a_pull, targets) for a_pull in page]
+            yield pd.DataFrame(data, columns=self.get_columns())
+
+    def _get_item(self, a_pull, targets: List[str]) -> dict:
+        item = {
+            "number": a_pull.number,
+            "title": a_pull.title,
+            "state": a_pull.state,
+            "creator": a_pull.user.login,
+            "labels": ",".join(
+                [label.name for label in a_pull.labels]
+            ),
+            "milestone": a_pull.milestone.title if a_pull.milestone else None,
+            "assignees": ",".join(
+                [
+                    assignee.login
+                    for assignee in a_pull.assignees
+                ]
+            ),
+            "reviewers": ",".join(
+                [
+                    reviewer.login
+                    for reviewer in a_pull.requested_reviewers
+                ]
+            ),
+            "teams": ",".join(
+                [
+                    team.name
+                    for team in a_pull.requested_teams
+                ]
+            ),
+            "draft": a_pull.draft,
+            "body": a_pull.body,
+            "base": a_pull.base.ref if a_pull.base else None,
+            "head": a_pull.head.ref if a_pull.head else None,
+            "created": a_pull.created_at,
+            "updated": a_pull.updated_at,
+            "merged": a_pull.merged_at,
+            "closed": a_pull.closed_at,
+        }
+
+        # downloaded columns, use them only if explicitly requested
+        for field in ('comments', 'review_comments', 'mergeable', 'mergeable_state', 'rebaseable',
+                      'commits', 'additions', 'deletions', 'changed_files'):
+            if field in targets:
+                item[field] = getattr(a_pull, field)
+        if 'is_merged' in targets:
+            item['is_merged'] = a_pull.merged
+        if 'merged_by' in targets:
+            item['merged_by'] = a_pull.merged_by.login if a_pull.merged_by else None
+
+        return item
 
     def get_columns(self) -> List[str]:
         """Gets all columns to be returned in pandas DataFrame responses
@@ -1,4 +1,4 @@
-from typing import List, Dict, Text, Any
+from typing import List, Dict, Text, Any, Iterator
 
 import pandas as pd
 from hubspot.crm.objects import (
@@ -14,61 +14,76 @@ from mindsdb_sql_parser import ast
 
 from mindsdb.integrations.utilities.handlers.query_utilities import (
     INSERTQueryParser,
-    SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
-    SELECTQueryExecutor,
     UPDATEQueryExecutor,
     DELETEQueryExecutor,
 )
 
-from mindsdb.integrations.libs.api_handler import APITable
+from mindsdb.integrations.libs.api_handler import APIResource
+from mindsdb.integrations.utilities.sql_utils import FilterCondition
 from mindsdb.utilities import log
 
 logger = log.getLogger(__name__)
 
-
-class CompaniesTable(APITable):
+# maximum number of objects in one page of the list API
+PAGE_SIZE = 100
+
+
+def get_pages(basic_api, limit: int = None, conditions: List[FilterCondition] = None) -> Iterator[List]:
+    """
+    Requests objects from the list API of a HubSpot CRM object page by page
+
+    Parameters
+    ----------
+    basic_api : BasicApi
+        `basic_api` of the CRM object, e.g. hubspot.crm.companies.basic_api
+    limit : int
+        Number of rows requested by the query
+    conditions : List[FilterCondition]
+        Conditions of the query, they are applied to the pages by the caller
+
+    Yields
+    ------
+    List
+        Objects of the page
+    """
+    # the page can be as small as the limit only if no rows are removed by filtering
+    page_size = min(limit, PAGE_SIZE) if limit and not conditions else PAGE_SIZE
+    after = None
+    while True:
+        page = basic_api.get_page(limit=page_size, after=after)
+        yield page.results
+
+        if page.paging is None or page.paging.next is None:
+            break
+        after = page.paging.next.after
+
+
+class CompaniesTable(APIResource):
     """Hubspot Companies table."""
 
-    def select(self, query: ast.Select) -> pd.DataFrame:
+    def list_pages(
+        self, conditions: List[FilterCondition] = None, limit: int = None, **kwargs
+    ) -> Iterator[pd.DataFrame]:
         """
-        Pulls Hubspot Companies data
+        Pulls Hubspot Companies data page by page
 
         Parameters
         ----------
-        query : ast.Select
-            Given SQL SELECT query
-
-        Returns
-        -------
-        pd.DataFrame
-            Hubspot Companies matching the query
+        conditions : List[FilterCondition]
+            Conditions of the query, all of them are applied by the caller
+        limit : int
+            Number of rows requested by the query
 
-        Raises
+        Yields
         ------
-        ValueError
-            If the query contains an unsupported condition
-
+        pd.DataFrame
+            Pages of Hubspot Companies
         """
-
-        select_statement_parser = SELECTQueryParser(
-            query,
-            "companies",
-            self.get_columns()
-        )
-        selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
-
-        companies_df = pd.json_normalize(self.get_companies(limit=result_limit))
-        select_statement_executor = SELECTQueryExecutor(
-            companies_df,
-            selected_columns,
-            where_conditions,
-            order_by_conditions
-        )
-        companies_df = select_statement_executor.execute_query()
-
-        return companies_df
+        hubspot = self.handler.connect()
+        for page in get_pages(hubspot.crm.companies.basic_api, limit, conditions):
+            yield pd.DataFrame([self._to_dict(company) for company in page], columns=self.get_columns())
 
     def insert(self, query: ast.Insert) -> None:
         """
@@ -160,26 +175,36 @@ class CompaniesTable(APITable):
         self.delete_companies(company_ids)
 
     def get_columns(self) -> List[Text]:
-        return pd.json_normalize(self.get_companies(limit=1)).columns.tolist()
+        return [
+            "id",
+            "name",
+            "city",
+            "phone",
+            "state",
+            "domain",
+            "industry",
+            "createdate",
+            "lastmodifieddate",
+        ]
 
     def get_companies(self, **kwargs) -> List[Dict]:
         hubspot = self.handler.connect()
         companies = hubspot.crm.companies.get_all(**kwargs)
-        companies_dict = [
-            {
-                "id": company.id,
-                "name": company.properties.get("name", None),
-                "city": company.properties.get("city", None),
-                "phone": company.properties.get("phone", None),
-                "state": company.properties.get("state", None),
-                "domain": company.properties.get("company", None),
-                "industry": company.properties.get("industry", None),
-                "createdate": company.properties["createdate"],
-                "lastmodifieddate": company.properties["hs_lastmodifieddate"],
-            }
-            for company in companies
-        ]
-        return companies_dict
+        return [self._to_dict(company) for company in companies]
+
+    @staticmethod
+    def _to_dict(company) -> Dict:
+        return {
+            "id": company.id,
+            "name": company.properties.get("name", None),
+            "city": company.properties.get("city", None),
+            "phone": company.properties.get("phone", None),
+            "state": company.properties.get("state", None),
+            "domain": company.properties.get("company", None),
+            "industry": company.properties.get("industry", None),
+            "createdate": company.properties["createdate"],
+            "lastmodifieddate": company.properties["hs_lastmodifieddate"],
+        }
 
     def create_companies(self, companies_data: List[Dict[Text, Any]]) -> None:
         hubspot = self.handler.connect()
@@ -215,47 +240,30 @@ class CompaniesTable(APITable):
             raise Exception(f"Companies deletion failed {e}")
 
 
-class ContactsTable(APITable):
+class ContactsTable(APIResource):
     """Hubspot Contacts table."""
 
-    def select(self, query: ast.Select) -> pd.DataFrame:
+    def list_pages(
+        self, conditions: List[FilterCondition] = None, limit: int = None, **kwargs
+    ) -> Iterator[pd.DataFrame]:
         """
-        Pulls Hubspot Contacts data
+        Pulls Hubspot Contacts data page by page
 
         Parameters
         ----------
-        query : ast.Select
-            Given SQL SELECT query
-
-        Returns
-        -------
-        pd.DataFrame
-            Hubspot Contacts matching the query
+        conditions : List[FilterCondition]
+            Conditions of the query, all of them are applied by the caller
+        limit : int
+            Number of rows requested by the query
 
-        Raises
+        Yields
         ------
-        ValueError
-            If the query contains an unsupported condition
-
+        pd.DataFrame
+            Pages of Hubspot Contacts
         """
-
-        select_statement_parser = SELECTQueryParser(
-            query,
-            "contacts",
-            self.get_columns()
-        )
-        selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
-
-        contacts_df = pd.json_normalize(self.get_contacts(limit=result_limit))
-        select_statement_executor = SELECTQueryExecutor(
-            contacts_df,
-            selected_columns,
-            where_conditions,
-            order_by_conditions
-        )
-        contacts_df = select_statement_executor.execute_query()
-
-        return contacts_df
+        hubspot = self.handler.connect()
+        for page in get_pages(hubspot.crm.contacts.basic_api, limit, conditions):
+            yield pd.DataFrame([self._to_dict(contact) for contact in page], columns=self.get_columns())
 
     def insert(self, query: ast.Insert) -> None:
         """
@@ -347,26 +355,36 @@ class ContactsTable(APITable):
         self.delete_contacts(contact_ids)
 
     def get_columns(self) -> List[Text]:
-        return pd.json_normalize(self.get_contacts(limit=1)).columns.tolist()
+        return [
+            "id",
+            "email",
+            "firstname",
+            "lastname",
+            "phone",
+            "company",
+            "website",
+            "createdate",
+            "lastmodifieddate",
+        ]
 
     def get_contacts(self, **kwargs) -> List[Dict]:
         hubspot = self.handler.connect()
         contacts = hubspot.crm.contacts.get_all(**kwargs)
-        contacts_dict = [
-            {
-                "id": contact.id,
-                "email": contact.properties["email"],
-                "firstname": contact.properties.get("firstname", None),
-                "lastname": contact.properties.get("lastname", None),
-                "phone": contact.properties.get("phone", None),
-                "company": contact.properties.get("company", None),
-                "website": contact.properties.get("website", None),
-                "createdate": contact.properties["createdate"],
-                "lastmodifieddate": contact.properties["lastmodifieddate"],
-            }
-            for contact in contacts
-        ]
-        return contacts_dict
+        return [self._to_dict(contact) for contact in contacts]
+
+    @staticmethod
+    def _to_dict(contact) -> Dict:
+        return {
+            "id": contact.id,
+            "email": contact.properties["email"],
+            "firstname": contact.properties.get("firstname", None),
+            "lastname": contact.properties.get("lastname", None),
+            "phone": contact.properties.get("phone", None),
+            "company": contact.properties.get("company", None),
+            "website": contact.properties.get("website", None),
+            "createdate": contact.properties["createdate"],
+            "lastmodifieddate": contact.properties["lastmodifieddate"],
+        }
 
     def create_contacts(self, contacts_data: List[Dict[Text, Any]]) -> None:
         hubspot = self.handler.connect()
@@ -402,47 +420,30 @@ class ContactsTable(APITable):
             raise Exception(f"Contacts deletion failed {e}")
 
 
-class DealsTable(APITable):
+class DealsTable(APIResource):
     """Hubspot Deals table."""
 
-    def select(self, query: ast.Select) -> pd.DataFrame:
+    def list_pages(
+        self, conditions: List[FilterCondition] = None, limit: int = None, **kwargs
+    ) -> Iterator[pd.DataFrame]:
         """
-        Pulls Hubspot Deals data
+        Pulls Hubspot Deals data page by page
 
         Parameters
         ----------
-        query : ast.Select
-            Given SQL SELECT query
+        conditions : List[FilterCondition]
+            Conditions of the query, all of them are applied by the caller
+        limit : int
+            Number of rows requested by the query
 
-        Returns
-        -------
-        pd.DataFrame
-            Hubspot Deals matching the query
-
-        Raises
+        Yields
         ------
-        ValueError
-            If the query contains an unsupported condition
-
+        pd.DataFrame
+            Pages of Hubspot Deals
         """
-
-        select_statement_parser = SELECTQueryParser(
-            query,
-            "deals",
-            self.get_columns()
-        )
-        selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
-
-        deals_df = pd.json_normalize(self.get_deals(limit=result_limit))
-        select_statement_executor = SELECTQueryExecutor(
-            deals_df,
-            selected_columns,
-            where_conditions,
-            order_by_conditions
-        )
-        deals_df = select_statement_executor.execute_query()
-
-        return deals_df
+        hubspot = self.handler.connect()
+        for page in get_pages(hubspot.crm.deals.basic_api, limit, conditions):
+            yield pd.DataFrame([self._to_dict(deal) for deal in page], columns=self.get_columns())
 
     def insert(self, query: ast.Insert) -> None:
         """
@@ -534,26 +535,36 @@ class DealsTable(APITable):
         self.delete_deals(deal_ids)
 
     def get_columns(self) -> List[Text]:
-        return pd.json_normalize(self.get_deals(limit=1)).columns.tolist()
+        return [
+            "id",
+            "dealname",
+            "amount",
+            "pipeline",
+            "closedate",
+            "dealstage",
+            "hubspot_owner_id",
+            "createdate",
+            "hs_lastmodifieddate",
+        ]
 
     def get_deals(self, **kwargs) -> List[Dict]:
         hubspot = self.handler.connect()
         deals = hubspot.crm.deals.get_all(**kwargs)
-        deals_dict = [
-            {
-                "id": deal.id,
-                "dealname": deal.properties["dealname"],
-                "amount": deal.properties.get("amount", None),
-                "pipeline": deal.properties.get("pipeline", None),
-                "closedate": deal.properties.get("closedate", None),
-                "dealstage": deal.properties.get("dealstage", None),
-                "hubspot_owner_id": deal.properties.get("hubspot_owner_id", None),
-                "createdate": deal.properties["createdate"],
-                "hs_lastmodifieddate": deal.properties["hs_lastmodifieddate"],
-            }
-            for deal in deals
-        ]
-        return deals_dict
+        return [self._to_dict(deal) for deal in deals]
+
+    @staticmethod
+    def _to_dict(deal) -> Dict:
+        return {
+            "id": deal.id,
+            "dealname": deal.properties["dealname"],
+            "amount": deal.properties.get("amount", None),
+            "pipeline": deal.properties.get("pipeline", None),
+            "closedate": deal.properties.get("closedate", None),
+            "dealstage": deal.properties.get("dealstage", None),
+            "hubspot_owner_id": deal.properties.get("hubspot_owner_id", None),
+            "createdate": deal.properties["createdate"],
+            "hs_lastmodifieddate": deal.properties["hs_lastmodifieddate"],
+        }
 
     def create_deals(self, deals_data: List[Dict[Text, Any]]) -> None:
         hubspot = self.handler.connect()
@@ -1,5 +1,5 @@
 import datetime as dt
-from typing import Any, Dict, List, Text
+from typing import Any, Dict, Iterator, List, Text, Tuple
 
 from mindsdb_sql_parser.ast import Delete, Insert, Update
 import pandas as pd
@@ -75,6 +75,51 @@ class SlackConversationsTable(APIResource):
         if not channels:
             channels = self._get_all_channels(limit)
 
+        return self._to_dataframe(channels)
+
+    def list_pages(
+        self, conditions: List[FilterCondition] = None, limit: int = None, **kwargs: Any
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Retrieves Slack conversations page by page.
+        If channel ID(s) are provided, the channels are returned as one page, see `list`.
+        Otherwise, the channels are requested by pages of up to 1000 items. If there is no limit, only the first page is
+        retrieved to prevent rate limiting by the Slack API.
+
+        Args:
+            conditions (List[FilterCondition]): The conditions to filter the conversations.
+            limit (int): The number of the conversations requested by the query.
+            kwargs(Any): Arbitrary keyword arguments.
+
+        Raises:
+            SlackApiError: If an error occurs when getting the channels from the Slack API.
+
+        Yields:
+            pd.DataFrame: The pages of conversations.
+        """
+        if any(condition.column == "id" for condition in conditions):
+            yield self.list(conditions=conditions, limit=limit)
+            return
+
+        client = self.handler.connect()
+
+        # the page can be as small as the limit only if no rows are removed by filtering
+        params = {"limit": min(limit, 1000) if limit and not conditions else 1000}
+        while True:
+            try:
+                response = client.conversations_list(**params)
+            except SlackApiError as slack_error:
+                logger.error(f"Error getting channels: {slack_error.response['error']}")
+                raise
+
+            yield self._to_dataframe(response["channels"])
+
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not cursor or limit is None:
+                break
+            params["cursor"] = cursor
+
+    def _to_dataframe(self, channels: List[Dict]) -> pd.DataFrame:
         for channel in channels:
             channel["created_at"] = dt.datetime.fromtimestamp(channel["created"])
             channel["updated_at"] = dt.datetime.fromtimestamp(channel["updated"] / 1000)
@@ -231,41 +276,7 @@ class SlackMessagesTable(APIResource):
             pd.DataFrame: The list of messages.
         """
         client = self.handler.connect()
-
-        # Build the parameters for the call to the Slack API.
-        params = {}
-        for condition in conditions:
-            value = condition.value
-            op = condition.op
-
-            # Handle the column 'channel_id'.
-            if condition.column == "channel_id":
-                if op != FilterOperator.EQUAL:
-                    raise ValueError(f"Unsupported operator '{op}' for column 'channel_id'")
-
-                # Check if the provided channel exists.
-                try:
-                    channel = SlackConversationsTable(self.handler).get_channel(value)
-                    params["channel"] = value
-                    condition.applied = True
-                except SlackApiError:
-                    raise ValueError(f"Channel '{value}' not found")
-
-            # Handle the column 'created_at'.
-            elif condition.column == "created_at" and value is not None:
-                date = dt.datetime.fromisoformat(value).replace(tzinfo=dt.timezone.utc)
-                if op == FilterOperator.GREATER_THAN:
-                    params["oldest"] = date.timestamp() + 1
-                elif op == FilterOperator.GREATER_THAN_OR_EQUAL:
-                    params["oldest"] = date.timestamp()
-                elif op == FilterOperator.LESS_THAN_OR_EQUAL:
-                    params["latest"] = date.timestamp()
-                else:
-                    continue
-                condition.applied = True
-
-        if "channel" not in params:
-            raise ValueError("To retrieve data from Slack, you need to provide the 'channel_id' parameter.")
+        params, channel = self._get_history_params(conditions)
 
         # Retrieve the messages from the Slack API.
         try:
@@ -294,23 +305,129 @@ class SlackMessagesTable(APIResource):
             logger.error(f"Error getting messages: {slack_error.response['error']}")
             raise
 
+        result = self._to_dataframe(messages, params["channel"], channel)
+
+        # Sort the messages by the specified columns.
+        if sort:
+            result.sort_values(by=[col.column for col in sort], ascending=[col.ascending for col in sort], inplace=True)
+
+        return result
+
+    def list_pages(
+        self, conditions: List[FilterCondition] = None, limit: int = None, sort: List[SortColumn] = None, **kwargs: Any
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Retrieves messages from a Slack conversation page by page, from the newest to the oldest.
+
+        `channel_id` is a required parameter to retrieve messages from a conversation.
+
+        Messages are requested by pages of up to 999 items. If there is no limit, only the first page is retrieved
+        to prevent rate limiting by the Slack API.
+
+        Args:
+            conditions (List[FilterCondition]): The conditions to filter the messages.
+            limit (int): The number of the messages requested by the query.
+            sort (List[SortColumn]): The columns to sort the messages by.
+            kwargs (Any): Arbitrary keyword arguments.
+
+        Raises:
+            ValueError: If the 'channel_id' parameter is not provided or not found.
+            SlackApiError: If an error occurs when getting the messages from the Slack API.
+
+        Yields:
+            pd.DataFrame: The pages of messages.
+        """
+        client = self.handler.connect()
+        params, channel = self._get_history_params(conditions)
+
+        # the API returns messages from the newest to the oldest
+        if sort and len(sort) == 1 and sort[0].column in ("ts", "created_at") and not sort[0].ascending:
+            sort[0].applied = True
+
+        # the page can be as small as the limit only if no rows are removed by filtering
+        all_applied = all(condition.applied for condition in conditions)
+        params["limit"] = min(limit, 999) if limit and all_applied else 999
+        while True:
+            try:
+                response = client.conversations_history(**params)
+            except SlackApiError as slack_error:
+                logger.error(f"Error getting messages: {slack_error.response['error']}")
+                raise
+
+            yield self._to_dataframe(response["messages"], params["channel"], channel)
+
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not cursor or limit is None:
+                break
+            params["cursor"] = cursor
+
+    def _to_dataframe(self, messages: List[Dict], channel_id: Text, channel: Dict) -> pd.DataFrame:
         result = pd.DataFrame(messages, columns=self.get_columns())
 
         result = result[result["text"].notnull()]
 
         # Add the channel ID and name to the result.
-        result["channel_id"] = params["channel"]
+        result["channel_id"] = channel_id
         result["channel_name"] = channel["name"] if "name" in channel else None
 
         # Translate the time stamp into a 'created_at' field.
         result["created_at"] = pd.to_datetime(result["ts"].astype(float), unit="s").dt.strftime("%Y-%m-%d %H:%M:%S")
 
-        # Sort the messages by the specified columns.
-        if sort:
-            result.sort_values(by=[col.column for col in sort], ascending=[col.ascending for col in sort], inplace=True)
-
         return result
 
+    def _get_history_params(self, conditions: List[FilterCondition]) -> Tuple[Dict, Dict]:
+        """
+        Builds the parameters for the call to the `conversations_history` method from the conditions.
+
+        Args:
+            conditions (List[FilterCondition]): The conditions to filter the messages.
+
+        Raises:
+            ValueError:
+                - If the 'channel_id' parameter is not provided.
+                - If an unsupported operator is used for the column 'channel_id'.
+                - If the channel ID provided is not found.
+
+        Returns:
+            Tuple[Dict, Dict]: The parameters and the channel data.
+        """
+        # Build the parameters for the call to the Slack API.
+        params = {}
+        for condition in conditions:
+            value = condition.value
+            op = condition.op
+
+            # Handle the column 'channel_id'.
+            if condition.column == "channel_id":
+                if op != FilterOperator.EQUAL:
+                    raise ValueError(f"Unsupported operator '{op}' for column 'channel_id'")
+
+                # Check if the provided channel exists.
+                try:
+                    channel = SlackConversationsTable(self.handler).get_channel(value)
+                    params["channel"] = value
+                    condition.applied = True
+                except SlackApiError:
+                    raise ValueError(f"Channel '{value}' not found")
+
+            # Handle the column 'created_at'.
+            elif condition.column == "created_at" and value is not None:
+                date = dt.datetime.fromisoformat(value).replace(tzinfo=dt.timezone.utc)
+                if op == FilterOperator.GREATER_THAN:
+                    params["oldest"] = date.timestamp() + 1
+                elif op == FilterOperator.GREATER_THAN_OR_EQUAL:
+                    params["oldest"] = date.timestamp()
+                elif op == FilterOperator.LESS_THAN_OR_EQUAL:
+                    params["latest"] = date.timestamp()
+                else:
+                    continue
+                condition.applied = True
+
+        if "channel" not in params:
+            raise ValueError("To retrieve data from Slack, you need to provide the 'channel_id' parameter.")
+
+        return params, channel
+
     def insert(self, query: Insert):
         """
         Executes an INSERT SQL query represented by an ASTNode object and posts a message to a Slack channel.
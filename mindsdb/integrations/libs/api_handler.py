@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 import ast as py_ast
 
 import pandas as pd
@@ -17,6 +17,7 @@ from mindsdb.integrations.libs.base import BaseHandler
 from mindsdb.integrations.libs.api_handler_exceptions import TableAlreadyExists, TableNotFound
 
 from mindsdb.integrations.libs.response import HandlerResponse as Response, RESPONSE_TYPE
+from mindsdb.utilities.context_executor import ContextThreadPoolExecutor
 from mindsdb.utilities import log
 
 
@@ -153,7 +154,82 @@ class APITable:
         raise NotImplementedError()
 
 
+def _close_pages(pages: Iterator[pd.DataFrame]) -> None:
+    close = getattr(pages, "close", None)
+    if close is not None:
+        close()
+
+
+def process_pages(
+    pages: Iterator[pd.DataFrame], process: Callable[[pd.DataFrame], Tuple[Optional[pd.DataFrame], bool]]
+) -> Iterator[Optional[pd.DataFrame]]:
+    """Apply `process` to the pages, stop requesting pages when it reports that no more pages are needed.
+    The source iterator is closed at the end.
+
+    Args:
+        pages (Iterator[pd.DataFrame]): source of pages
+        process (Callable): returns the processed page and True if it is the last needed page
+
+    Yields:
+        Optional[pd.DataFrame]: processed pages
+    """
+    try:
+        for page in pages:
+            page, is_last = process(page)
+            yield page
+            if is_last:
+                break
+    finally:
+        _close_pages(pages)
+
+
+def prefetch_pages(
+    pages: Iterator[pd.DataFrame],
+    process: Optional[Callable[[pd.DataFrame], Tuple[Optional[pd.DataFrame], bool]]] = None,
+) -> Iterator[Optional[pd.DataFrame]]:
+    """Fetch the next page in a background thread while the current page is processed by the consumer.
+    Pages are requested one by one, the source iterator is never used from two threads at the same time.
+    The next page is not requested if `process` reports that the current page is the last needed one.
+    If the consumer stops iteration, the consumer doesn't wait for the running request:
+    the source iterator is closed when the request is finished.
+
+    Args:
+        pages (Iterator[pd.DataFrame]): source of pages
+        process (Callable): optional, returns the processed page and True if it is the last needed page
+
+    Yields:
+        Optional[pd.DataFrame]: processed pages in the same order
+    """
+    end = object()
+    executor = ContextThreadPoolExecutor(max_workers=1)
+    future = None
+    try:
+        future = executor.submit(next, pages, end)
+        while True:
+            page = future.result()
+            future = None
+            if page is end:
+                break
+            is_last = False
+            if process is not None:
+                page, is_last = process(page)
+            if not is_last:
+                future = executor.submit(next, pages, end)
+            yield page
+            if is_last:
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if future is None or future.cancelled():
+            _close_pages(pages)
+        else:
+            future.add_done_callback(lambda _: _close_pages(pages))
+
+
 class APIResource(APITable):
+    # request the next page of list_pages while the current one is filtered
+    prefetch_pages = True
+
     def __init__(self, *args, table_name=None, **kwargs):
         self.table_name = table_name
         super().__init__(*args, **kwargs)
@@ -167,12 +243,32 @@ class APIResource(APITable):
         Returns:
             pd.DataFrame
         """
+        frames = list(self.select_stream(query))
+        if len(frames) == 0:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def select_stream(self, query: Select) -> Iterator[pd.DataFrame]:
+        """Execute select and return result by parts.
 
+        If the resource implements `list_pages`, pages are filtered as they arrive and fetching stops
+        when `limit` rows are found. It is not possible if the result has to be sorted after fetching:
+        in this case all pages are fetched and the result is returned as one part.
+        Otherwise `list` is used and the result is returned as one part.
+
+        Args:
+            query (Select): sql query
+
+        Yields:
+            pd.DataFrame: parts of the result
+        """
         conditions = self._extract_conditions(query.where)
 
         limit = None
         if query.limit:
-            limit = query.limit.value
+            limit = int(query.limit.value)
 
         sort = None
         if query.order_by and len(query.order_by) > 0:
@@ -189,15 +285,59 @@ class APIResource(APITable):
         if self.table_name is not None:
             kwargs["table_name"] = self.table_name
 
-        result = self.list(**kwargs)
+        if not self.has_list_pages():
+            result = self.list(**kwargs)
+            result = filter_dataframe(result, self._get_filters(conditions))
+            yield self._sort_and_limit(result, query, sort, limit)
+            return
+
+        pages = self.list_pages(**kwargs)
+
+        # conditions and sort are marked as applied by list_pages when the first page is requested
+        filters, need_sort = None, False
+        to_sort = []
+        count = 0
 
+        def process(page: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], bool]:
+            nonlocal filters, need_sort, count
+            if filters is None:
+                filters = self._get_filters(conditions)
+                need_sort = sort is not None and not all(col.applied for col in sort)
+
+            if len(filters) > 0:
+                page = filter_dataframe(page, filters)
+
+            if need_sort:
+                to_sort.append(page)
+                return None, False
+
+            if limit is not None and count + len(page) >= limit:
+                return page[: limit - count], True
+            count += len(page)
+            return page, False
+
+        if self.prefetch_pages:
+            parts = prefetch_pages(pages, process)
+        else:
+            parts = process_pages(pages, process)
+        try:
+            for part in parts:
+                if part is not None:
+                    yield part
+        finally:
+            parts.close()
+
+        if len(to_sort) > 0:
+            yield self._sort_and_limit(pd.concat(to_sort, ignore_index=True), query, sort, limit)
+
+    def _get_filters(self, conditions: List[FilterCondition]) -> list:
         filters = []
         for cond in conditions:
             if not cond.applied:
                 filters.append([cond.op.value, cond.column, cond.value])
+        return filters
 
-        result = filter_dataframe(result, filters)
-
+    def _sort_and_limit(self, result: pd.DataFrame, query: Select, sort: List[SortColumn], limit: int) -> pd.DataFrame:
         if sort:
             sort_columns = []
             for idx, a_sort in enumerate(sort):
@@ -207,10 +347,14 @@ class APIResource(APITable):
             result = sort_dataframe(result, sort_columns)
 
         if limit is not None and len(result) > limit:
-            result = result[: int(limit)]
+            result = result[:limit]
 
         return result
 
+    def has_list_pages(self) -> bool:
+        """Checks if the resource implements paginated listing"""
+        return type(self).list_pages is not APIResource.list_pages
+
     def list(
         self,
         conditions: List[FilterCondition] = None,
@@ -221,6 +365,7 @@ class APIResource(APITable):
     ):
         """
         List items based on specified conditions, limits, sorting, and targets.
+        If the resource implements `list_pages`, all pages are fetched and concatenated.
 
         Args:
             conditions (List[FilterCondition]): Optional. A list of conditions to filter the items. Each condition
@@ -232,6 +377,41 @@ class APIResource(APITable):
         Raises:
             NotImplementedError: This is an abstract method and should be implemented in a subclass.
         """
+        if not self.has_list_pages():
+            raise NotImplementedError()
+
+        frames = list(self.list_pages(conditions=conditions, limit=limit, sort=sort, targets=targets, **kwargs))
+        if len(frames) == 0:
+            return pd.DataFrame(columns=self.get_columns())
+        return pd.concat(frames, ignore_index=True)
+
+    def list_pages(
+        self,
+        conditions: List[FilterCondition] = None,
+        limit: int = None,
+        sort: List[SortColumn] = None,
+        targets: List[str] = None,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Paginated version of `list`: yields items page by page, as they are received from the API.
+
+        Conditions and sort columns which are used in requests to the API have to be marked as applied
+        before the first page is yielded. The rest of the conditions are applied to every page by the caller.
+        The caller stops the iteration (and closes the generator) when it has enough rows, so `limit` is only
+        a hint for the page size: the generator should not truncate the result to it, because
+        some of the rows can be removed by conditions which are not applied.
+        Every page must contain all columns of the resource, even if it is empty.
+
+        Args:
+            conditions (List[FilterCondition]): Optional. A list of conditions to filter the items.
+            limit (int): Optional. The number of items requested by the query.
+            sort (List[SortColumn]): Optional. A list of sorting criteria
+            targets (List[str]): Optional. A list of strings representing specific fields
+
+        Yields:
+            pd.DataFrame: pages of items
+        """
         raise NotImplementedError()
 
     def insert(self, query: Insert) -> None:
@@ -458,12 +638,8 @@ class APIHandler(BaseHandler):
         if isinstance(query, Select):
             # If the list method exists, it should be overridden in the child class.
             # The APIResource class could be used as a base class by overriding the select method, but not the list method.
-            table = self._get_table(query.from_table)
-            list_method = getattr(table, "list", None)
-            if not list_method or (list_method and list_method.__func__ is APIResource.list):
-                # for back compatibility, targets wasn't passed in previous version
-                query.targets = [Star()]
-            result = self._get_table(query.from_table).select(query)
+            table = self._get_select_table(query)
+            result = table.select(query)
         elif isinstance(query, Update):
             result = self._get_table(query.table).update(query)
         elif isinstance(query, Insert):
@@ -480,6 +656,45 @@ class APIHandler(BaseHandler):
         else:
             raise NotImplementedError
 
+    def _get_select_table(self, query: Select) -> APITable:
+        table = self._get_table(query.from_table)
+        list_method = getattr(table, "list", None)
+        if not list_method or (
+            list_method.__func__ is APIResource.list and not (isinstance(table, APIResource) and table.has_list_pages())
+        ):
+            # for back compatibility, targets wasn't passed in previous version
+            query.targets = [Star()]
+        return table
+
+    def query_stream(self, query: ASTNode, fetch_size: int = None) -> Iterator[pd.DataFrame]:
+        """Executes select query and returns the result by parts.
+        Resources with `list_pages` return filtered pages as they are received from the API,
+        other tables return the result as one part.
+
+        Args:
+            query (ASTNode): select query
+            fetch_size (int): not used, the size of the part is defined by the API
+
+        Yields:
+            pd.DataFrame: parts of the result
+        """
+        if not isinstance(query, Select):
+            raise NotImplementedError(f"Streaming is not supported for query: {type(query).__name__}")
+
+        if type(self).query is not APIHandler.query:
+            # the handler has its own implementation of the query
+            response = self.query(query)
+            if response.type == RESPONSE_TYPE.ERROR:
+                raise RuntimeError(response.error_message)
+            yield response.data_frame
+            return
+
+        table = self._get_select_table(query)
+        if isinstance(table, APIResource):
+            yield from table.select_stream(query)
+        else:
+            yield table.select(query)
+
     def get_columns(self, table_name: str) -> Response:
         """
         Returns a list of entity columns
@@ -43,10 +43,8 @@ from mindsdb.utilities.ml_task_queue.producer import MLTaskProducer
 from mindsdb.utilities.ml_task_queue.const import ML_TASK_TYPE
 from mindsdb.integrations.libs.process_cache import process_cache, empty_callback, MLProcessException
 
-try:
-    import torch.multiprocessing as mp
-except Exception:
-    import multiprocessing as mp
+# torch.multiprocessing is not needed here: torch registers its reductions itself when an engine imports it
+import multiprocessing as mp
 mp_ctx = mp.get_context('spawn')
 
 
@@ -6,6 +6,8 @@ from concurrent.futures import ProcessPoolExecutor, Future
 from pandas import DataFrame
 
 import mindsdb.interfaces.storage.db as db
+import mindsdb.utilities.profiler as profiler
+from mindsdb.utilities import otel
 from mindsdb.utilities.config import Config
 from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities.ml_task_queue.const import ML_TASK_TYPE
@@ -162,10 +164,11 @@ class WarmProcess:
         return self.task
 
 
-def warm_function(func, context: str, *args, **kwargs):
+def warm_function(func, context: str, trace_context: dict, *args, **kwargs):
     ctx.load(context)
     try:
-        return func(*args, **kwargs)
+        with otel.attach_trace_context(trace_context), otel.start_span(f'ml process: {func.__name__}'):
+            return func(*args, **kwargs)
     except Exception as e:
         if type(e) in (ImportError, ModuleNotFoundError):
             raise
@@ -251,7 +254,8 @@ class ProcessCache:
             Args:
                 task_type (ML_TASK_TYPE): type of the task (learn, predict, etc)
                 model_id (int): id of the model
-                payload (dict): any 'lightweight' data that needs to be send in the process
+                payload (dict): any 'lightweight' data that needs to be send in the process. If the task
+                    came from the task queue, payload['trace_context'] is the trace context of the sender
                 dataframe (DataFrame): DataFrame to be send in the process
 
             Returns:
@@ -334,6 +338,18 @@ class ProcessCache:
 
         ml_engine_name = payload['handler_meta']['engine']
         model_marker = (model_id, payload['context']['company_id'])
+        with otel.attach_trace_context(payload.get('trace_context')), profiler.Context(
+            f'ml: {task_type.value.decode()}',
+            engine=ml_engine_name,
+            model_id=model_id,
+            rows=None if dataframe is None else len(dataframe)
+        ):
+            return self._dispatch(ml_engine_name, handler_module_path, model_marker, func, payload['context'], kwargs)
+
+    def _dispatch(self, ml_engine_name: str, handler_module_path: str, model_marker: tuple,
+                  func: Callable, context: dict, kwargs: dict) -> Future:
+        """ send the task to a warm process of the ML engine, start new process if there is no free one
+        """
         with self._lock:
             if ml_engine_name not in self.cache:
                 warm_process = WarmProcess(init_ml_handler, (handler_module_path,))
@@ -364,7 +380,7 @@ class ProcessCache:
                     warm_process = WarmProcess(init_ml_handler, (handler_module_path,))
                     self.cache[ml_engine_name]['processes'].append(warm_process)
 
-            task = warm_process.apply_async(warm_function, func, payload['context'], **kwargs)
+            task = warm_process.apply_async(warm_function, func, context, otel.inject_trace_context(), **kwargs)
             self.cache[ml_engine_name]['last_usage_at'] = time.time()
             warm_process.add_marker(model_marker)
         return task
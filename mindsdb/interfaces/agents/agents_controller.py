@@ -1,8 +1,7 @@
 import datetime
-from typing import Dict, Iterator, List, Union, Tuple, Optional, Any
+from typing import TYPE_CHECKING, Dict, Iterator, List, Union, Tuple, Optional, Any
 import copy
 
-from langchain_core.tools import BaseTool
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy import null
 import pandas as pd
@@ -15,13 +14,16 @@ from mindsdb.interfaces.database.projects import ProjectController
 from mindsdb.interfaces.model.functions import PredictorRecordNotFound
 from mindsdb.interfaces.model.model_controller import ModelController
 from mindsdb.interfaces.skills.skills_controller import SkillsController
+from mindsdb.api.executor.planner.plan_cache import invalidate_plan_cache
 from mindsdb.utilities.config import config
 from mindsdb.utilities import log
 
 from mindsdb.utilities.exception import EntityExistsError, EntityNotExistsError
 
 from .constants import ASSISTANT_COLUMN, SUPPORTED_PROVIDERS, PROVIDER_TO_MODELS
-from .langchain_agent import get_llm_provider
+
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
 
 logger = log.getLogger(__name__)
 
@@ -76,6 +78,8 @@ class AgentsController:
         except PredictorRecordNotFound:
             if not provider:
                 # If provider is not given, get it from the model name
+                from .langchain_agent import get_llm_provider
+
                 provider = get_llm_provider({"model_name": model_name})
 
             elif provider not in SUPPORTED_PROVIDERS and model_name not in PROVIDER_TO_MODELS.get(provider, []):
@@ -359,6 +363,7 @@ class AgentsController:
 
         db.session.add(agent)
         db.session.commit()
+        invalidate_plan_cache()
 
         return agent
 
@@ -655,6 +660,7 @@ class AgentsController:
             raise ValueError("Unable to delete demo object")
         agent.deleted_at = datetime.datetime.now()
         db.session.commit()
+        invalidate_plan_cache()
 
     def get_agent_llm_params(self, agent_params: dict):
         """
@@ -679,9 +685,10 @@ class AgentsController:
         agent: db.Agents,
         messages: list[Dict[str, str]],
         project_name: str = default_project,
-        tools: list[BaseTool] = None,
+        tools: list["BaseTool"] = None,
         stream: bool = False,
         params: dict | None = None,
+        batch: bool = False,
     ) -> Union[Iterator[object], pd.DataFrame]:
         """
         Queries an agent to get a completion.
@@ -693,6 +700,7 @@ class AgentsController:
             tools (list[BaseTool]): Tools to use while getting the completion
             stream (bool): Whether to stream the response
             params (dict | None): params to redefine agent params
+            batch (bool): Messages are independent questions, answer all of them concurrently
 
         Returns:
             response (Union[Iterator[object], pd.DataFrame]): Completion as a DataFrame or iterator of completion chunks
@@ -701,7 +709,9 @@ class AgentsController:
             ValueError: Agent's model does not exist.
         """
         if stream:
-            return self._get_completion_stream(agent, messages, project_name=project_name, tools=tools, params=params)
+            return self._get_completion_stream(
+                agent, messages, project_name=project_name, tools=tools, params=params, batch=batch
+            )
         from .langchain_agent import LangchainAgent
 
         model, provider = self.check_model_provider(agent.model_name, agent.provider)
@@ -714,15 +724,16 @@ class AgentsController:
         llm_params = self.get_agent_llm_params(agent.params)
 
         lang_agent = LangchainAgent(agent, model, llm_params=llm_params)
-        return lang_agent.get_completion(messages, params=params)
+        return lang_agent.get_completion(messages, params=params, batch=batch)
 
     def _get_completion_stream(
         self,
         agent: db.Agents,
         messages: list[Dict[str, str]],
         project_name: str = default_project,
-        tools: list[BaseTool] = None,
+        tools: list["BaseTool"] = None,
         params: dict | None = None,
+        batch: bool = False,
     ) -> Iterator[object]:
         """
         Queries an agent to get a stream of completion chunks.
@@ -735,6 +746,7 @@ class AgentsController:
             project_name (str): Project the agent belongs to (default mindsdb)
             tools (list[BaseTool]): Tools to use while getting the completion
             params (dict | None): params to redefine agent params
+            batch (bool): Messages are independent questions, answers are streamed as they are completed
 
         Returns:
             chunks (Iterator[object]): Completion chunks as an iterator
@@ -756,4 +768,4 @@ class AgentsController:
         llm_params = self.get_agent_llm_params(agent.params)
 
         lang_agent = LangchainAgent(agent, model=model, llm_params=llm_params)
-        return lang_agent.get_completion(messages, stream=True, params=params)
+        return lang_agent.get_completion(messages, stream=True, params=params, batch=batch)
@@ -1,8 +1,5 @@
 import os
 
-from langchain.agents import AgentType
-from langchain_openai import OpenAIEmbeddings
-
 from types import MappingProxyType
 
 # the same as
@@ -198,16 +195,16 @@ ASSISTANT_COLUMN = "answer"
 CONTEXT_COLUMN = "context"
 TRACE_ID_COLUMN = "trace_id"
 DEFAULT_AGENT_TIMEOUT_SECONDS = 300
+# Max number of rows answered at the same time in batch mode.
+DEFAULT_AGENT_BATCH_MAX_WORKERS = 8
 # These should require no additional arguments.
 DEFAULT_AGENT_TOOLS = []
-DEFAULT_AGENT_TYPE = AgentType.CONVERSATIONAL_REACT_DESCRIPTION
 DEFAULT_MAX_ITERATIONS = 10
 DEFAULT_MAX_TOKENS = 8096
 DEFAULT_MODEL_NAME = "gpt-4o"
 DEFAULT_TEMPERATURE = 0.0
 USER_COLUMN = "question"
 DEFAULT_EMBEDDINGS_MODEL_PROVIDER = "openai"
-DEFAULT_EMBEDDINGS_MODEL_CLASS = OpenAIEmbeddings
 MAX_INSERT_BATCH_SIZE = 50_000
 DEFAULT_TIKTOKEN_MODEL_NAME = os.getenv("DEFAULT_TIKTOKEN_MODEL_NAME", "gpt-4")
 AGENT_CHUNK_POLLING_INTERVAL_SECONDS = os.getenv("AGENT_CHUNK_POLLING_INTERVAL_SECONDS", 1.0)
@@ -286,3 +283,16 @@ Thought: Do I need to use a tool? No
 {ai_prefix}: [your response here]
 ```
 """
+
+
+def __getattr__(name: str):
+    # langchain is slow to import: constants based on its classes are created on the first access
+    if name == "DEFAULT_AGENT_TYPE":
+        from langchain.agents import AgentType
+
+        return AgentType.CONVERSATIONAL_REACT_DESCRIPTION
+    if name == "DEFAULT_EMBEDDINGS_MODEL_CLASS":
+        from langchain_openai import OpenAIEmbeddings
+
+        return OpenAIEmbeddings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
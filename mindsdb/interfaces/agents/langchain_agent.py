@@ -1,6 +1,7 @@
 import json
-from concurrent.futures import as_completed, TimeoutError
-from typing import Dict, Iterable, List, Optional
+import time
+from concurrent.futures import as_completed, wait, TimeoutError, FIRST_COMPLETED
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 import queue
 import re
@@ -45,6 +46,7 @@ from .providers import get_bedrock_chat_model
 from mindsdb.interfaces.agents.constants import (
     OPEN_AI_CHAT_MODELS,
     DEFAULT_AGENT_TIMEOUT_SECONDS,
+    DEFAULT_AGENT_BATCH_MAX_WORKERS,
     DEFAULT_AGENT_TYPE,
     DEFAULT_EMBEDDINGS_MODEL_PROVIDER,
     DEFAULT_MAX_ITERATIONS,
@@ -185,24 +187,37 @@ def create_chat_model(args: Dict):
     raise ValueError(f"Unknown provider: {args['provider']}")
 
 
-def prepare_prompts(df, base_template, input_variables, user_column=USER_COLUMN):
-    empty_prompt_ids = np.where(df[input_variables].isna().all(axis=1).values)[0]
+def prepare_row_prompts(df, base_template, input_variables, user_column=USER_COLUMN) -> List[Optional[str]]:
+    """Make prompt for every row of the dataframe
+
+    Returns:
+        List[Optional[str]]: prompt for every row, None if row doesn't have input
+    """
+    empty_prompt_ids = set(np.where(df[input_variables].isna().all(axis=1).values)[0])
 
     # Combine system prompt with user-provided template
     base_template = f"{DEFAULT_AGENT_SYSTEM_PROMPT}\n\n{base_template}"
 
     base_template = base_template.replace("{{", "{").replace("}}", "}")
+    prompt = PromptTemplate(input_variables=input_variables, template=base_template)
     prompts = []
 
-    for i, row in df.iterrows():
+    for i, row in enumerate(df.to_dict("records")):
         if i not in empty_prompt_ids:
-            prompt = PromptTemplate(input_variables=input_variables, template=base_template)
             kwargs = {col: row[col] if row[col] is not None else "" for col in input_variables}
             prompts.append(prompt.format(**kwargs))
         elif row.get(user_column):
             prompts.append(row[user_column])
+        else:
+            prompts.append(None)
 
-    return prompts, empty_prompt_ids
+    return prompts
+
+
+def prepare_prompts(df, base_template, input_variables, user_column=USER_COLUMN):
+    empty_prompt_ids = np.where(df[input_variables].isna().all(axis=1).values)[0]
+    prompts = prepare_row_prompts(df, base_template, input_variables, user_column)
+    return [prompt for prompt in prompts if prompt is not None], empty_prompt_ids
 
 
 def prepare_callbacks(self, args):
@@ -219,6 +234,15 @@ def handle_agent_error(e, error_message=None):
     return error_message
 
 
+def get_timeout_message(timeout_seconds) -> str:
+    return (
+        f"I'm sorry! I couldn't generate a response within the allotted time ({timeout_seconds} seconds). "
+        "If you need more time for processing, you can adjust the timeout settings. "
+        "Please refer to the documentation for instructions on how to change the timeout value. "
+        "Feel free to try your request again."
+    )
+
+
 def process_chunk(chunk):
     if isinstance(chunk, dict):
         return {k: process_chunk(v) for k, v in chunk.items()}
@@ -329,7 +353,19 @@ class LangchainAgent:
             self.provider,
         ]
 
-    def get_completion(self, messages, stream: bool = False, params: dict | None = None):
+    def get_completion(self, messages, stream: bool = False, params: dict | None = None, batch: bool = False):
+        """Get completion for messages
+
+        Args:
+            messages: chat history, the last message is the current question.
+                In batch mode every message is an independent question.
+            stream (bool): return iterator of chunks
+            params (dict | None): params to redefine agent params
+            batch (bool): answer every message, rows are processed concurrently
+
+        Returns:
+            Union[pd.DataFrame, Iterable[Dict]]: completion
+        """
         # Get metadata and tags to be used in the trace
         metadata = self.get_metadata()
         tags = self.get_tags()
@@ -348,12 +384,19 @@ class LangchainAgent:
         self.run_completion_span = self.langfuse_client_wrapper.start_span(name="run-completion", input=messages)
 
         if stream:
-            return self._get_completion_stream(messages)
+            return self._get_completion_stream(messages, batch=batch)
 
         args = {}
         args.update(self.args)
         args.update(params or {})
 
+        if batch:
+            df = pd.DataFrame(messages).reset_index(drop=True)
+            logger.info(f"LangchainAgent.get_completion: Received {len(messages)} messages in batch mode")
+            response = self.run_agent_batch(df, args)
+            self.langfuse_client_wrapper.end_span(span=self.run_completion_span, output=response)
+            return response
+
         df = pd.DataFrame(messages)
         logger.info(f"LangchainAgent.get_completion: Received {len(messages)} messages")
         if logger.isEnabledFor(logging.DEBUG):
@@ -376,11 +419,12 @@ class LangchainAgent:
 
         return response
 
-    def _get_completion_stream(self, messages: List[dict]) -> Iterable[Dict]:
+    def _get_completion_stream(self, messages: List[dict], batch: bool = False) -> Iterable[Dict]:
         """Gets a completion as a stream of chunks from given messages.
 
         Args:
             messages (List[dict]): Messages to get completion chunks for
+            batch (bool): answer every message, answers are streamed as rows are completed
 
         Returns:
             chunks (Iterable[object]): Completion chunks
@@ -389,6 +433,8 @@ class LangchainAgent:
         args = self.args
 
         df = pd.DataFrame(messages)
+        if batch:
+            return self.stream_agent_batch(df.reset_index(drop=True), args)
         logger.info(f"LangchainAgent._get_completion_stream: Received {len(messages)} messages")
         # Check if we have the expected columns for conversation history
         if "question" in df.columns and "answer" in df.columns:
@@ -420,21 +466,7 @@ class LangchainAgent:
 
         tools = self._langchain_tools_from_skills(llm)
 
-        # Prefer prediction prompt template over original if provided.
-        prompt_template = args["prompt_template"]
-
-        # Modern LangChain approach: Use memory but populate it correctly
-        # Create memory and populate with conversation history
-        memory = ConversationSummaryBufferMemory(
-            llm=llm,
-            input_key="input",
-            output_key="output",
-            max_token_limit=args.get("max_tokens", DEFAULT_MAX_TOKENS),
-            memory_key="chat_history",
-        )
-
-        # Add system message first
-        memory.chat_memory.messages.insert(0, SystemMessage(content=prompt_template))
+        memory = self._create_memory(llm, args)
 
         user_column = args.get("user_column", USER_COLUMN)
         assistant_column = args.get("assistant_column", ASSISTANT_COLUMN)
@@ -469,6 +501,25 @@ class LangchainAgent:
         # Store memory for agent use
         self._conversation_memory = memory
 
+        return self._create_agent_executor(llm, tools, memory, args)
+
+    @staticmethod
+    def _create_memory(llm, args: Dict) -> ConversationSummaryBufferMemory:
+        # Modern LangChain approach: Use memory but populate it correctly
+        # Create memory and populate with conversation history
+        memory = ConversationSummaryBufferMemory(
+            llm=llm,
+            input_key="input",
+            output_key="output",
+            max_token_limit=args.get("max_tokens", DEFAULT_MAX_TOKENS),
+            memory_key="chat_history",
+        )
+
+        # Add system message first
+        memory.chat_memory.messages.insert(0, SystemMessage(content=args["prompt_template"]))
+        return memory
+
+    def _create_agent_executor(self, llm, tools: List, memory, args: Dict) -> AgentExecutor:
         agent_type = args.get("agent_type", DEFAULT_AGENT_TYPE)
         agent_executor = initialize_agent(
             tools,
@@ -593,6 +644,45 @@ AI: {response}"""
                 return langchain_react_formatted_response
         return f"Agent failed with error:\n{str(error)}..."
 
+    def _invoke_agent_executor(
+        self, agent_executor: AgentExecutor, prompt: str, args: Dict, log_missing_history: bool = True
+    ) -> Dict:
+        if not prompt:
+            return {CONTEXT_COLUMN: [], ASSISTANT_COLUMN: ""}
+        try:
+            callbacks, context_callback = prepare_callbacks(self, args)
+
+            # Modern LangChain approach: Include conversation history + current message
+            if hasattr(self, "_conversation_messages") and self._conversation_messages:
+                # Add current user message to conversation history
+                full_messages = self._conversation_messages + [HumanMessage(content=prompt)]
+                logger.critical(f"🔍 INVOKING AGENT with {len(full_messages)} messages (including history)")
+                logger.debug(
+                    f"Full conversation messages: {[type(msg).__name__ + ': ' + msg.content[:100] + '...' for msg in full_messages]}"
+                )
+
+                # For agents, we need to pass the input in the expected format
+                # The agent expects 'input' key with the current question, but conversation history should be in memory
+                result = agent_executor.invoke({"input": prompt}, config={"callbacks": callbacks})
+            else:
+                if log_missing_history:
+                    logger.warning("No conversation messages found - using simple prompt")
+                result = agent_executor.invoke({"input": prompt}, config={"callbacks": callbacks})
+            captured_context = context_callback.get_contexts()
+            output = result["output"] if isinstance(result, dict) and "output" in result else str(result)
+            return {CONTEXT_COLUMN: captured_context, ASSISTANT_COLUMN: output}
+        except Exception as e:
+            error_message = str(e)
+            # Special handling for API key errors
+            if "API key" in error_message and ("not found" in error_message or "missing" in error_message):
+                # Format API key error more clearly
+                logger.error(f"API Key Error: {error_message}")
+                error_message = f"API Key Error: {error_message}"
+            return {
+                CONTEXT_COLUMN: [],
+                ASSISTANT_COLUMN: handle_agent_error(e, error_message),
+            }
+
     def run_agent(self, df: pd.DataFrame, agent: AgentExecutor, args: Dict) -> pd.DataFrame:
         base_template = args.get("prompt_template", args["prompt_template"])
         return_context = args.get("return_context", True)
@@ -602,42 +692,6 @@ AI: {response}"""
             df, base_template, input_variables, args.get("user_column", USER_COLUMN)
         )
 
-        def _invoke_agent_executor_with_prompt(agent_executor, prompt):
-            if not prompt:
-                return {CONTEXT_COLUMN: [], ASSISTANT_COLUMN: ""}
-            try:
-                callbacks, context_callback = prepare_callbacks(self, args)
-
-                # Modern LangChain approach: Include conversation history + current message
-                if hasattr(self, "_conversation_messages") and self._conversation_messages:
-                    # Add current user message to conversation history
-                    full_messages = self._conversation_messages + [HumanMessage(content=prompt)]
-                    logger.critical(f"🔍 INVOKING AGENT with {len(full_messages)} messages (including history)")
-                    logger.debug(
-                        f"Full conversation messages: {[type(msg).__name__ + ': ' + msg.content[:100] + '...' for msg in full_messages]}"
-                    )
-
-                    # For agents, we need to pass the input in the expected format
-                    # The agent expects 'input' key with the current question, but conversation history should be in memory
-                    result = agent_executor.invoke({"input": prompt}, config={"callbacks": callbacks})
-                else:
-                    logger.warning("No conversation messages found - using simple prompt")
-                    result = agent_executor.invoke({"input": prompt}, config={"callbacks": callbacks})
-                captured_context = context_callback.get_contexts()
-                output = result["output"] if isinstance(result, dict) and "output" in result else str(result)
-                return {CONTEXT_COLUMN: captured_context, ASSISTANT_COLUMN: output}
-            except Exception as e:
-                error_message = str(e)
-                # Special handling for API key errors
-                if "API key" in error_message and ("not found" in error_message or "missing" in error_message):
-                    # Format API key error more clearly
-                    logger.error(f"API Key Error: {error_message}")
-                    error_message = f"API Key Error: {error_message}"
-                return {
-                    CONTEXT_COLUMN: [],
-                    ASSISTANT_COLUMN: handle_agent_error(e, error_message),
-                }
-
         completions = []
         contexts = []
 
@@ -649,7 +703,7 @@ AI: {response}"""
             # The previous prompts are conversation history and should only be used for context
             if prompts:
                 current_prompt = prompts[-1]  # Last prompt is the current question
-                futures = [executor.submit(_invoke_agent_executor_with_prompt, agent, current_prompt)]
+                futures = [executor.submit(self._invoke_agent_executor, agent, current_prompt, args)]
             else:
                 logger.error("No prompts found to process")
                 futures = []
@@ -665,12 +719,7 @@ AI: {response}"""
                     completions.append(result[ASSISTANT_COLUMN])
                     contexts.append(result[CONTEXT_COLUMN])
             except TimeoutError:
-                timeout_message = (
-                    f"I'm sorry! I couldn't generate a response within the allotted time ({agent_timeout_seconds} seconds). "
-                    "If you need more time for processing, you can adjust the timeout settings. "
-                    "Please refer to the documentation for instructions on how to change the timeout value. "
-                    "Feel free to try your request again."
-                )
+                timeout_message = get_timeout_message(agent_timeout_seconds)
                 logger.warning(f"Agent execution timed out after {agent_timeout_seconds} seconds")
                 for _ in range(len(futures) - len(completions)):
                     completions.append(timeout_message)
@@ -695,6 +744,132 @@ AI: {response}"""
 
         return pred_df
 
+    def iter_agent_batch(self, prompts: List[Optional[str]], args: Dict) -> Iterable[Tuple[int, Optional[Dict]]]:
+        """Answer independent prompts concurrently.
+        LLM client and tools are created once and shared between rows, every row gets its own agent executor
+        with empty conversation memory.
+
+        Params from args:
+            max_workers: max number of rows processed at the same time
+            timeout: max time of processing of one row, seconds
+
+        Args:
+            prompts (List[Optional[str]]): prompt for every row, None for rows without input
+            args (Dict): agent params
+
+        Returns:
+            Iterable[Tuple[int, Optional[Dict]]]: (row index, result) in order of completion of rows.
+                Result is None for rows without input.
+        """
+        max_workers = args.get("max_workers") or DEFAULT_AGENT_BATCH_MAX_WORKERS
+        row_timeout = args.get("timeout", DEFAULT_AGENT_TIMEOUT_SECONDS)
+
+        for i, prompt in enumerate(prompts):
+            if not prompt:
+                yield i, None
+
+        indexes = [i for i, prompt in enumerate(prompts) if prompt]
+        if len(indexes) == 0:
+            return
+
+        llm = create_chat_model(args)
+        self.llm = llm
+        tools = self._langchain_tools_from_skills(llm)
+        # shared callback handlers have to be created before threads are started
+        self._get_agent_callbacks(args)
+
+        if not getattr(self, "_conversation_messages", None):
+            # rows don't have conversation history, it is logged once per batch
+            logger.warning("No conversation messages found - using simple prompt")
+
+        started_at = {}
+
+        def _run_row(i):
+            started_at[i] = time.monotonic()
+            agent_executor = self._create_agent_executor(llm, tools, self._create_memory(llm, args), args)
+            return self._invoke_agent_executor(agent_executor, prompts[i], args, log_missing_history=False)
+
+        executor = ContextThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {executor.submit(_run_row, i): i for i in indexes}
+            pending = set(futures)
+            while pending:
+                # wake up when the oldest running row reaches the timeout
+                running = [started_at[futures[future]] for future in pending if futures[future] in started_at]
+                wait_timeout = row_timeout
+                if running:
+                    wait_timeout = max(min(running) + row_timeout - time.monotonic(), 0)
+                done, pending = wait(pending, timeout=min(wait_timeout, row_timeout), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    yield futures[future], future.result()
+
+                now = time.monotonic()
+                for future in list(pending):
+                    i = futures[future]
+                    if i in started_at and now - started_at[i] >= row_timeout:
+                        # the thread can't be stopped, its result will be ignored
+                        logger.warning(f"Agent execution for row {i} timed out after {row_timeout} seconds")
+                        pending.discard(future)
+                        yield i, {CONTEXT_COLUMN: [], ASSISTANT_COLUMN: get_timeout_message(row_timeout)}
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run_agent_batch(self, df: pd.DataFrame, args: Dict) -> pd.DataFrame:
+        """Answer every row of the dataframe, rows are processed concurrently
+
+        Args:
+            df (pd.DataFrame): input rows
+            args (Dict): agent params
+
+        Returns:
+            pd.DataFrame: input rows with answer, context and trace_id columns
+        """
+        base_template = args["prompt_template"]
+        input_variables = re.findall(r"{{(.*?)}}", base_template)
+        prompts = prepare_row_prompts(df, base_template, input_variables, args.get("user_column", USER_COLUMN))
+
+        completions = [None] * len(prompts)
+        contexts = [[]] * len(prompts)
+        for i, result in self.iter_agent_batch(prompts, args):
+            if result is not None:
+                completions[i] = result[ASSISTANT_COLUMN]
+                contexts[i] = result[CONTEXT_COLUMN]
+
+        pred_df = df.copy()
+        pred_df[ASSISTANT_COLUMN] = completions
+        pred_df[CONTEXT_COLUMN] = [json.dumps(context) for context in contexts]
+        pred_df[TRACE_ID_COLUMN] = self.langfuse_client_wrapper.get_trace_id()
+
+        if not args.get("return_context", True):
+            pred_df = pred_df.drop(columns=[CONTEXT_COLUMN])
+        return pred_df
+
+    def stream_agent_batch(self, df: pd.DataFrame, args: Dict) -> Iterable[Dict]:
+        """Answer every row of the dataframe, answers are yielded as soon as rows are completed
+
+        Args:
+            df (pd.DataFrame): input rows
+            args (Dict): agent params
+
+        Returns:
+            Iterable[Dict]: chunks with type 'row', every chunk contains index of the row in the input
+        """
+        base_template = args["prompt_template"]
+        input_variables = re.findall(r"{{(.*?)}}", base_template)
+        prompts = prepare_row_prompts(df, base_template, input_variables, args.get("user_column", USER_COLUMN))
+
+        yield self.add_chunk_metadata({"type": "start", "rows": len(prompts)})
+        for i, result in self.iter_agent_batch(prompts, args):
+            chunk = {"type": "row", "index": i, "output": None}
+            if result is not None:
+                chunk["output"] = result[ASSISTANT_COLUMN]
+                if args.get("return_context", True):
+                    chunk["context"] = result[CONTEXT_COLUMN]
+            yield self.add_chunk_metadata(chunk)
+
+        self.langfuse_client_wrapper.end_span_stream(span=self.run_completion_span)
+
     def add_chunk_metadata(self, chunk: Dict) -> Dict:
         logger.debug(f"Adding metadata to chunk: {chunk}")
         logger.debug(f"Trace ID: {self.langfuse_client_wrapper.get_trace_id()}")
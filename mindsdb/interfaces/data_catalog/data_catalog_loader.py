@@ -4,6 +4,7 @@ import json
 import datetime
 from mindsdb.integrations.libs.response import RESPONSE_TYPE
 from mindsdb.interfaces.data_catalog.base_data_catalog import BaseDataCatalog
+from mindsdb.interfaces.skills.schema_cache import get_schema_cache
 from mindsdb.interfaces.storage import db
 
 
@@ -32,6 +33,8 @@ class DataCatalogLoader(BaseDataCatalog):
 
             self._load_foreign_keys(tables, columns)
 
+            get_schema_cache().invalidate(self.database_name)
+
         self.logger.info(f"Metadata loading completed for {self.database_name}.")
 
     def _get_loaded_table_names(self) -> List[str]:
@@ -374,6 +377,7 @@ class DataCatalogLoader(BaseDataCatalog):
 
             db.session.delete(table)
         db.session.commit()
+        get_schema_cache().invalidate(self.database_name)
         self.logger.info(f"Metadata for {self.database_name} removed successfully.")
 
     def to_str(self, val) -> str:
@@ -33,6 +33,9 @@ from mindsdb.integrations.libs.ml_exec_base import BaseMLEngineExec
 from mindsdb.integrations.libs.base import BaseHandler
 import mindsdb.utilities.profiler as profiler
 from mindsdb.interfaces.data_catalog.data_catalog_loader import DataCatalogLoader
+from mindsdb.interfaces.skills.schema_cache import get_schema_cache
+from mindsdb.api.executor.planner.plan_cache import invalidate_plan_cache
+from mindsdb.interfaces.database.metadata_cache import invalidate_metadata_cache
 
 logger = log.getLogger(__name__)
 
@@ -188,6 +191,7 @@ class IntegrationController:
                     connection_args[arg_name] = Path(arg_value).name
 
         integration_id = self._add_integration_record(name, engine, connection_args)
+        invalidate_plan_cache()
 
         if files_dir is not None:
             store = FileStorage(resource_group=RESOURCE_GROUP.INTEGRATION, resource_id=integration_id, sync=False)
@@ -202,6 +206,8 @@ class IntegrationController:
 
     def modify(self, name, data):
         self.handlers_cache.delete(name)
+        get_schema_cache().invalidate(name)
+        invalidate_metadata_cache(name)
         integration_record = self._get_integration_record(name)
         if isinstance(integration_record.data, dict) and integration_record.data.get("is_demo") is True:
             raise ValueError("It is forbidden to change properties of the demo object")
@@ -212,6 +218,7 @@ class IntegrationController:
 
         integration_record.data = data
         db.session.commit()
+        invalidate_plan_cache()
 
     def delete(self, name: str, strict_case: bool = False) -> None:
         """Delete an integration by name.
@@ -279,6 +286,9 @@ class IntegrationController:
 
         db.session.delete(integration_record)
         db.session.commit()
+        get_schema_cache().invalidate(name)
+        invalidate_metadata_cache(name)
+        invalidate_plan_cache()
 
     def _get_integration_record_data(self, integration_record, show_secrets=True):
         if (
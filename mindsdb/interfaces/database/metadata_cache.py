@@ -0,0 +1,137 @@
+import time
+from concurrent.futures import Future, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mindsdb.utilities.config import config
+from mindsdb.utilities.loading_cache import LoadingCache, SharedInstance
+from mindsdb.utilities.context import context as ctx
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+# (company_id, integration, table). Table is None for the list of tables of the integration
+MetadataKey = Tuple[Optional[int], str, Optional[str]]
+
+
+def make_metadata_key(integration: str, table: Optional[str] = None) -> MetadataKey:
+    """Make key of the list of tables of the integration (if table is not set) or of columns of the table
+
+    Args:
+        integration (str): name of the integration
+        table (Optional[str]): name of the table
+
+    Returns:
+        MetadataKey: key of the record in the cache
+    """
+    return ctx.company_id, integration.lower(), table
+
+
+class MetadataCache(LoadingCache):
+    """Process-wide cache of metadata of integrations (lists of tables and columns of tables), which is used
+    to answer queries to information_schema.tables and information_schema.columns.
+
+    - Metadata of different sources is loaded concurrently. A caller waits for a source no longer than `timeout`,
+      a slow source is skipped in the response, but its loading is continued and the result is cached.
+    - An expired record is returned as is and refreshed in the background.
+    - Records of an integration are dropped when it is altered or dropped, or a table is created or dropped in it.
+
+    Settings are taken from config['information_schema']['metadata_cache']:
+        enabled: cache the metadata or not. If disabled, sources are still requested concurrently
+        ttl: seconds after which a record is refreshed
+        max_records: max number of records, older are evicted
+        workers: number of threads which load metadata
+        timeout: seconds to wait for one source
+        persist: read columns from the data catalog (if it is enabled) and save loaded tables to it
+    """
+
+    thread_name_prefix = "metadata_cache"
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_records: Optional[int] = None,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        cache_config = config["information_schema"]["metadata_cache"]
+        super().__init__(
+            enabled=cache_config["enabled"],
+            ttl=ttl if ttl is not None else cache_config["ttl"],
+            max_size=max_records if max_records is not None else cache_config["max_records"],
+            workers=workers if workers is not None else cache_config["workers"],
+        )
+        self.persist = cache_config["persist"]
+        self.timeout = timeout if timeout is not None else cache_config["timeout"]
+
+    def get_many(
+        self, items: List[Tuple[MetadataKey, Callable[[], Any]]], timeout: Optional[float] = None
+    ) -> Tuple[List[Optional[Any]], List[MetadataKey]]:
+        """Get metadata of several sources at once
+
+        Args:
+            items: pairs of (key, loader)
+            timeout (Optional[float]): seconds to wait for sources which are not in the cache
+
+        Returns:
+            Tuple[List[Optional[Any]], List[MetadataKey]]: values in the order of items (None for sources which
+                failed or didn't respond in time) and keys of the sources which didn't respond in time
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        results: List[Optional[Any]] = [None] * len(items)
+        futures: Dict[int, Future] = {}
+        now = time.monotonic()
+        with self._lock:
+            for i, (key, loader) in enumerate(items):
+                record, future = self._get_or_submit(key, loader, now)
+                if record is not None:
+                    results[i] = record.value
+                else:
+                    futures[i] = future
+
+        skipped = []
+        if len(futures) > 0:
+            wait(futures.values(), timeout=timeout)
+            for i, future in futures.items():
+                key = items[i][0]
+                if not future.done():
+                    skipped.append(key)
+                    continue
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.error(f"Can't get metadata of '{key[1]}': {e}")
+        return results, skipped
+
+    def get(self, key: MetadataKey, loader: Callable[[], Any], timeout: Optional[float] = None) -> Optional[Any]:
+        results, _ = self.get_many([(key, loader)], timeout=timeout)
+        return results[0]
+
+    def invalidate(self, integration: str, company_id: Optional[int] = None) -> None:
+        """Remove records of the integration of the company
+
+        Args:
+            integration (str): name of the integration
+            company_id (Optional[int]): id of the company, current company by default
+        """
+        if company_id is None:
+            company_id = ctx.company_id
+        integration = integration.lower()
+        self._invalidate(lambda key: key[0] == company_id and key[1] == integration)
+
+
+_metadata_cache = SharedInstance(MetadataCache)
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Returns process-wide instance of the cache"""
+    return _metadata_cache.get()
+
+
+def invalidate_metadata_cache(integration: str) -> None:
+    """Drop cached metadata of the integration, must be called when the integration or its tables are changed"""
+    cache = _metadata_cache.get_if_created()
+    if cache is not None:
+        cache.invalidate(integration)
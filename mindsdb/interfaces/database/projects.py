@@ -20,6 +20,7 @@ from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities.exception import EntityExistsError, EntityNotExistsError
 import mindsdb.utilities.profiler as profiler
 from mindsdb.api.executor.sql_query import SQLQuery
+from mindsdb.api.executor.planner.plan_cache import invalidate_plan_cache
 from mindsdb.api.executor.utilities.sql import query_df
 from mindsdb.interfaces.query_context.context_controller import query_context_controller
 
@@ -64,6 +65,7 @@ class Project:
 
         db.session.add(record)
         db.session.commit()
+        invalidate_plan_cache()
 
         self.id = record.id
 
@@ -91,6 +93,7 @@ class Project:
             self.company_id = None
             self.id = None
         db.session.commit()
+        invalidate_plan_cache()
 
     def drop_model(self, name: str):
         ModelController().delete_model(name, project_name=self.name)
@@ -582,4 +585,5 @@ class ProjectController:
             project.record.name = new_name
 
         db.session.commit()
+        invalidate_plan_cache()
         return project
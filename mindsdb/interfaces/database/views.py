@@ -4,6 +4,7 @@ from mindsdb.interfaces.query_context.context_controller import query_context_co
 from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities.exception import EntityExistsError, EntityNotExistsError
 from mindsdb.interfaces.model.functions import get_project_record, get_project_records
+from mindsdb.api.executor.planner.plan_cache import invalidate_plan_cache
 
 
 class ViewController:
@@ -31,6 +32,7 @@ class ViewController:
         view_record = db.View(name=name, company_id=ctx.company_id, query=query, project_id=project_id)
         db.session.add(view_record)
         db.session.commit()
+        invalidate_plan_cache()
 
     def update(self, name: str, query: str, project_name: str, strict_case: bool = False):
         """Update the SQL query of an existing view in the specified project.
@@ -62,6 +64,7 @@ class ViewController:
             raise EntityNotExistsError("View not found", name)
         rec.query = query
         db.session.commit()
+        invalidate_plan_cache()
 
     def delete(self, name: str, project_name: str, strict_case: bool = False) -> None:
         """Remove a view with the specified name from the given project.
@@ -92,6 +95,7 @@ class ViewController:
             raise EntityNotExistsError("View not found", name)
         db.session.delete(record)
         db.session.commit()
+        invalidate_plan_cache()
 
         query_context_controller.drop_query_context("view", record.id)
 
@@ -6,6 +6,7 @@ import decimal
 
 import pandas as pd
 import numpy as np
+import sqlalchemy as sa
 from pydantic import BaseModel, ValidationError
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -33,17 +34,26 @@ from mindsdb.interfaces.agents.constants import DEFAULT_EMBEDDINGS_MODEL_CLASS,
 from mindsdb.interfaces.agents.langchain_agent import create_chat_model, get_llm_provider
 from mindsdb.interfaces.database.projects import ProjectController
 from mindsdb.interfaces.variables.variables_controller import variables_controller
-from mindsdb.interfaces.knowledge_base.preprocessing.models import PreprocessingConfig, Document
+from mindsdb.interfaces.knowledge_base.preprocessing.models import (
+    PreprocessingConfig,
+    Document,
+    RawDocument,
+    ChunkBatch,
+)
 from mindsdb.interfaces.knowledge_base.preprocessing.document_preprocessor import PreprocessorFactory
+from mindsdb.interfaces.knowledge_base.preprocessing.parallel_chunker import ParallelChunker
 from mindsdb.interfaces.knowledge_base.evaluate import EvaluateBase
 from mindsdb.interfaces.knowledge_base.executor import KnowledgeBaseQueryExecutor
+from mindsdb.interfaces.knowledge_base.query_cache import get_query_cache
 from mindsdb.interfaces.model.functions import PredictorRecordNotFound
 from mindsdb.utilities.exception import EntityExistsError, EntityNotExistsError
 from mindsdb.integrations.utilities.sql_utils import FilterCondition, FilterOperator, KeywordSearchArgs
 from mindsdb.utilities.config import config
 from mindsdb.utilities.context import context as ctx
+import mindsdb.utilities.profiler as profiler
 
 from mindsdb.api.executor.command_executor import ExecuteCommands
+from mindsdb.api.executor.planner.plan_cache import invalidate_plan_cache
 from mindsdb.api.executor.utilities.sql import query_df
 from mindsdb.utilities import log
 from mindsdb.integrations.utilities.rag.rerankers.base_reranker import BaseLLMReranker
@@ -218,7 +228,45 @@ class KnowledgeBaseTable:
 
         return df
 
+    @property
+    def data_version(self) -> int:
+        return self._kb.data_version or 0
+
+    def _data_changed(self):
+        """Increment version of KB data. It makes cached results of previous queries unreachable"""
+        db.session.query(db.KnowledgeBase).filter(db.KnowledgeBase.id == self._kb.id).update(
+            {db.KnowledgeBase.data_version: sa.func.coalesce(db.KnowledgeBase.data_version, 0) + 1},
+            synchronize_session=False,
+        )
+        db.session.commit()
+        get_query_cache().invalidate(self._kb.id)
+
+    def _get_query_cache_key(self, query, disable_reranking: bool) -> tuple:
+        # params contain embedding and reranking models, results depend on them
+        params = json.dumps(self._kb.params, sort_keys=True, default=str)
+        model_params = json.dumps(self.model_params, sort_keys=True, default=str)
+        return self._kb.id, self.data_version, str(query), disable_reranking, params, model_params
+
     def select(self, query, disable_reranking=False):
+        """Select from vector db with caching of the result
+
+        Result is cached per KB data version, so any insert/update/delete in the KB invalidates it
+        """
+        query_cache = get_query_cache()
+        if not query_cache.enabled:
+            return self._select(query, disable_reranking)
+
+        cache_key = self._get_query_cache_key(query, disable_reranking)
+        df = query_cache.get(cache_key)
+        if df is not None:
+            logger.debug(f"Result of query is taken from cache: {query}")
+            return df
+
+        df = self._select(query, disable_reranking)
+        query_cache.set(cache_key, self._kb.id, df)
+        return df
+
+    def _select(self, query, disable_reranking=False):
         logger.debug(f"Processing select query: {query}")
 
         # Extract the content query text for potential reranking
@@ -561,6 +609,7 @@ class KnowledgeBaseTable:
         # send to vectordb
         self.addapt_conditions_columns(conditions)
         db_handler.dispatch_update(query, conditions)
+        self._data_changed()
 
     def delete_query(self, query: Delete):
         """
@@ -578,6 +627,7 @@ class KnowledgeBaseTable:
         conditions = db_handler.extract_conditions(query.where)
         self.addapt_conditions_columns(conditions)
         db_handler.dispatch_delete(query, conditions)
+        self._data_changed()
 
     def hybrid_search(
         self,
@@ -610,6 +660,7 @@ class KnowledgeBaseTable:
         """
         db_handler = self.get_vector_db()
         db_handler.delete(self._kb.vector_database_table)
+        self._data_changed()
 
     def insert(self, df: pd.DataFrame, params: dict = None):
         """Insert dataframe to KB table.
@@ -655,25 +706,23 @@ class KnowledgeBaseTable:
                         "_content_column": col,
                     }
 
-                    raw_documents.append(Document(content=content_str, id=doc_id, metadata=metadata))
+                    raw_documents.append(RawDocument(doc_id, content_str, metadata))
 
-        # Apply preprocessing to all documents if preprocessor exists
-        if self.document_preprocessor:
-            processed_chunks = self.document_preprocessor.process_documents(raw_documents)
-        else:
-            processed_chunks = raw_documents  # Use raw documents if no preprocessing
-
-        # Convert processed chunks back to DataFrame with standard structure
-        df = pd.DataFrame(
-            [
-                {
-                    TableField.CONTENT.value: chunk.content,
-                    TableField.ID.value: chunk.id,
-                    TableField.METADATA.value: chunk.metadata,
-                }
-                for chunk in processed_chunks
-            ]
-        )
+        with profiler.Context("kb: chunk", knowledge_base=self._kb.name, documents=len(raw_documents)):
+            # Apply preprocessing to all documents if preprocessor exists
+            if self.document_preprocessor:
+                chunk_batch = ParallelChunker(self.document_preprocessor).chunk(raw_documents)
+            else:
+                # Use raw documents if no preprocessing
+                chunk_batch = ChunkBatch.from_lists(
+                    [doc.id for doc in raw_documents],
+                    [doc.content for doc in raw_documents],
+                    [doc.metadata for doc in raw_documents],
+                )
+
+            # Convert processed chunks back to DataFrame with standard structure
+            df = chunk_batch.to_dataframe()
+            profiler.set_attributes(rows=len(df))
 
         if df.empty:
             logger.warning("No valid content found in any content columns")
@@ -699,15 +748,30 @@ class KnowledgeBaseTable:
                         return
 
         # add embeddings and send to vector db
-        df_emb = self._df_to_embeddings(df)
+        with profiler.Context(
+            "kb: embed",
+            knowledge_base=self._kb.name,
+            model_id=self._kb.embedding_model_id,
+            model=(self._kb.params.get("embedding_model") or {}).get("model_name"),
+            rows=len(df),
+        ):
+            df_emb = self._df_to_embeddings(df)
         df = pd.concat([df, df_emb], axis=1)
         db_handler = self.get_vector_db()
 
-        if params is not None and params.get("kb_no_upsert", False):
-            # speed up inserting by disable checking existing records
-            db_handler.insert(self._kb.vector_database_table, df)
-        else:
-            db_handler.do_upsert(self._kb.vector_database_table, df)
+        with profiler.Context(
+            "kb: upsert",
+            knowledge_base=self._kb.name,
+            table=self._kb.vector_database_table,
+            rows=len(df),
+            bytes=int(df.memory_usage(index=False, deep=False).sum()),
+        ):
+            if params is not None and params.get("kb_no_upsert", False):
+                # speed up inserting by disable checking existing records
+                db_handler.insert(self._kb.vector_database_table, df)
+            else:
+                db_handler.do_upsert(self._kb.vector_database_table, df)
+        self._data_changed()
 
     def _adapt_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -1207,6 +1271,7 @@ class KnowledgeBaseController:
         )
         db.session.add(kb)
         db.session.commit()
+        invalidate_plan_cache()
         return kb
 
     def _create_persistent_pgvector(self, params=None):
@@ -1331,6 +1396,7 @@ class KnowledgeBaseController:
         # kb exists
         db.session.delete(kb)
         db.session.commit()
+        invalidate_plan_cache()
 
         # drop objects if they were created automatically
         if "default_vector_storage" in kb.params:
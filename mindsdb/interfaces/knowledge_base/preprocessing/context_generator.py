@@ -0,0 +1,201 @@
+import re
+import html
+import json
+import asyncio
+import hashlib
+from typing import List, Dict, Optional
+
+from mindsdb.utilities.cache import get_cache, str_checksum
+from mindsdb.utilities.config import config
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+_TAG_PATTERN = re.compile(r"</?document>|</?chunk>", flags=re.IGNORECASE)
+
+MULTI_CHUNK_CONTEXT_TEMPLATE = """
+<document>
+{WHOLE_DOCUMENT}
+</document>
+Here are {CHUNKS_COUNT} chunks of this document we want to situate within the whole document
+{CHUNKS}
+For every chunk give a short succinct context to situate this chunk within the overall document for the purposes of improving search retrieval of the chunk. Answer only with a JSON array of {CHUNKS_COUNT} strings: contexts of the chunks in the same order, and nothing else."""
+
+
+def escape_tags(text: str) -> str:
+    """Escape tags used in the prompt markup, to not break the prompt structure"""
+    return _TAG_PATTERN.sub(lambda match: html.escape(match.group(0)), text)
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ContextGenerator:
+    """Generate contexts for chunks of documents using LLM.
+
+    - Generated contexts are cached. One cache record holds contexts of all chunks of a document and
+      it is identified by (document hash, prompt template, llm model), inside the record contexts are
+      identified by chunk hash. Re-ingesting the same content doesn't call LLM again.
+    - Chunks of the same document can be sent to LLM in one prompt (`chunks_per_prompt` > 1), in this case
+      the document is sent once per group of chunks. If response can't be parsed, chunks of the group are
+      processed one by one. It is off by default: the multi-chunk prompt differs from the regular template.
+    - Number of concurrent requests to LLM is limited by `max_concurrency`.
+    """
+
+    def __init__(
+        self,
+        llm,
+        template: str,
+        model_key: str,
+        max_concurrency: int = 8,
+        chunks_per_prompt: int = 1,
+        use_cache: bool = True,
+    ):
+        self.llm = llm
+        self.template = template
+        self.max_concurrency = max(max_concurrency, 1)
+        self.chunks_per_prompt = max(chunks_per_prompt, 1)
+
+        self._cache = None
+        if use_cache:
+            cache_max_size = config["knowledge_bases"]["contextual"]["cache_max_size"]
+            self._cache = get_cache("kb_context", max_size=cache_max_size)
+        # different template or model produce different contexts
+        self._cache_key_suffix = str_checksum(f"{model_key}\n{template}\n{MULTI_CHUNK_CONTEXT_TEMPLATE}")
+
+    def _cache_key(self, doc_hash: str) -> str:
+        return f"{doc_hash}_{self._cache_key_suffix}"
+
+    def _prepare_prompt(self, chunk_content: str, full_document: str) -> str:
+        return self.template.format(WHOLE_DOCUMENT=escape_tags(full_document), CHUNK_CONTENT=escape_tags(chunk_content))
+
+    def _prepare_multi_chunk_prompt(self, chunk_contents: List[str], full_document: str) -> str:
+        chunks = "\n".join(
+            f'<chunk number="{i + 1}">\n{escape_tags(chunk_content)}\n</chunk>'
+            for i, chunk_content in enumerate(chunk_contents)
+        )
+        return MULTI_CHUNK_CONTEXT_TEMPLATE.format(
+            WHOLE_DOCUMENT=escape_tags(full_document), CHUNKS=chunks, CHUNKS_COUNT=len(chunk_contents)
+        )
+
+    @staticmethod
+    def _parse_multi_chunk_response(response: str, count: int) -> Optional[List[str]]:
+        text = response.strip()
+        # remove markdown code fence
+        if text.startswith("```"):
+            text = text.strip("`")
+            if text.lower().startswith("json"):
+                text = text[4:]
+        try:
+            contexts = json.loads(text)
+        except (json.JSONDecodeError, TypeError):
+            return None
+        if not isinstance(contexts, list) or len(contexts) != count:
+            return None
+        return [str(context) for context in contexts]
+
+    def _call_llm(self, prompts: List[str]) -> List[str]:
+        if len(prompts) == 0:
+            return []
+        run_config = {"max_concurrency": self.max_concurrency}
+
+        # Check if LLM supports async
+        if hasattr(self.llm, "abatch"):
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                responses = loop.run_until_complete(self.llm.abatch(prompts, config=run_config))
+            finally:
+                loop.close()
+        else:
+            # Use sync batch for non-async LLMs
+            responses = self.llm.batch(prompts, config=run_config)
+        return [resp.content for resp in responses]
+
+    def generate(self, chunk_contents: List[str], full_documents: List[str]) -> List[str]:
+        """Generate contexts for chunks
+
+        Args:
+            chunk_contents: contents of chunks
+            full_documents: documents of the chunks, one per chunk
+
+        Returns:
+            List[str]: context for every chunk
+        """
+        contexts = [None] * len(chunk_contents)
+
+        # group chunks by document
+        documents: Dict[str, str] = {}
+        groups: Dict[str, List[int]] = {}
+        for i, full_document in enumerate(full_documents):
+            doc_hash = _content_hash(full_document)
+            documents[doc_hash] = full_document
+            groups.setdefault(doc_hash, []).append(i)
+        chunk_hashes = [_content_hash(chunk_content) for chunk_content in chunk_contents]
+
+        # region lookup in cache
+        cached_records = {}
+        if self._cache is not None:
+            for doc_hash, indexes in groups.items():
+                record = self._cache.get(self._cache_key(doc_hash)) or {}
+                cached_records[doc_hash] = record
+                for i in indexes:
+                    if chunk_hashes[i] in record:
+                        contexts[i] = record[chunk_hashes[i]]
+        # endregion
+
+        # region prepare prompts for not cached chunks
+        single_requests = []  # (prompt, chunk index)
+        multi_requests = []  # (prompt, chunk indexes)
+        for doc_hash, indexes in groups.items():
+            missed = [i for i in indexes if contexts[i] is None]
+            for pos in range(0, len(missed), self.chunks_per_prompt):
+                group = missed[pos : pos + self.chunks_per_prompt]
+                if len(group) == 1:
+                    i = group[0]
+                    single_requests.append((self._prepare_prompt(chunk_contents[i], documents[doc_hash]), i))
+                else:
+                    prompt = self._prepare_multi_chunk_prompt([chunk_contents[i] for i in group], documents[doc_hash])
+                    multi_requests.append((prompt, group))
+        # endregion
+
+        if len(single_requests) + len(multi_requests) == 0:
+            logger.debug(f"All {len(contexts)} chunk contexts are taken from cache")
+            return contexts
+        logger.debug(
+            f"Generating contexts: {len(contexts)} chunks, {len(single_requests)} single-chunk prompts, "
+            f"{len(multi_requests)} multi-chunk prompts"
+        )
+
+        responses = self._call_llm([prompt for prompt, _ in multi_requests + single_requests])
+
+        for (_, group), response in zip(multi_requests, responses[: len(multi_requests)]):
+            group_contexts = self._parse_multi_chunk_response(response, len(group))
+            if group_contexts is None:
+                logger.debug("Can't parse response for multiple chunks, they will be processed one by one")
+                single_requests.extend((self._prepare_prompt(chunk_contents[i], full_documents[i]), i) for i in group)
+                continue
+            for i, context in zip(group, group_contexts):
+                contexts[i] = context
+
+        for (_, i), response in zip(single_requests, responses[len(multi_requests) :]):
+            contexts[i] = response
+
+        # chunks of failed multi-chunk prompts
+        retry_requests = [(prompt, i) for prompt, i in single_requests if contexts[i] is None]
+        for (_, i), response in zip(retry_requests, self._call_llm([prompt for prompt, _ in retry_requests])):
+            contexts[i] = response
+
+        # region save to cache
+        if self._cache is not None:
+            for doc_hash, indexes in groups.items():
+                record = cached_records.get(doc_hash, {})
+                size = len(record)
+                for i in indexes:
+                    record[chunk_hashes[i]] = contexts[i]
+                if len(record) != size:
+                    self._cache.set(self._cache_key(doc_hash), record)
+        # endregion
+
+        return contexts
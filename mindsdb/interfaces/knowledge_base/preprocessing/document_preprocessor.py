@@ -1,7 +1,4 @@
-import re
-import html
-import asyncio
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Tuple
 
 import pandas as pd
 from mindsdb.interfaces.knowledge_base.preprocessing.text_splitter import TextSplitter
@@ -11,12 +8,15 @@ from mindsdb.integrations.utilities.rag.splitters.file_splitter import (
     FileSplitterConfig,
 )
 from mindsdb.interfaces.agents.langchain_agent import create_chat_model
+from mindsdb.interfaces.knowledge_base.preprocessing.context_generator import ContextGenerator
 from mindsdb.interfaces.knowledge_base.preprocessing.models import (
     PreprocessingConfig,
     ProcessedChunk,
     PreprocessorType,
     ContextualConfig,
     Document,
+    RawDocument,
+    ChunkBatch,
     TextChunkingConfig,
 )
 from mindsdb.utilities import log
@@ -29,6 +29,9 @@ _DEFAULT_CONTENT_COLUMN_NAME = "content"
 class DocumentPreprocessor:
     """Base class for document preprocessing"""
 
+    # preprocessor can be re-created from its config in a worker process (see ParallelChunker)
+    supports_parallel_chunking: bool = False
+
     def __init__(self):
         """Initialize preprocessor"""
         self.splitter = None  # Will be set by child classes
@@ -42,6 +45,17 @@ class DocumentPreprocessor:
         """
         raise NotImplementedError("Subclasses must implement process_documents")
 
+    def chunk_documents(self, documents: List[RawDocument]) -> ChunkBatch:
+        """Split documents and return chunks in columnar form.
+        Default implementation goes through `process_documents`, subclasses may override it to avoid
+        creation of intermediate pydantic objects.
+
+        Args:
+            documents: List of raw documents to process
+        """
+        chunks = self.process_documents([doc.to_document() for doc in documents])
+        return ChunkBatch.from_chunks(chunks)
+
     def _split_document(self, doc: Document) -> List[Document]:
         """Split document into chunks while preserving metadata"""
         if self.splitter is None:
@@ -144,45 +158,18 @@ Please give a short succinct context to situate this chunk within the overall do
         )
         self.context_template = config.context_template or self.DEFAULT_CONTEXT_TEMPLATE
         self.summarize = self.config.summarize
-
-    def _prepare_prompts(self, chunk_contents: list[str], full_documents: list[str]) -> list[str]:
-        def tag_replacer(match):
-            tag = match.group(0)
-            if tag.lower() not in ["<document>", "</document>", "<chunk>", "</chunk>"]:
-                return tag
-            return html.escape(tag)
-
-        tag_pattern = r"</?document>|</?chunk>"
-        prompts = []
-        for chunk_content, full_document in zip(chunk_contents, full_documents):
-            chunk_content = re.sub(tag_pattern, tag_replacer, chunk_content, flags=re.IGNORECASE)
-            full_document = re.sub(tag_pattern, tag_replacer, full_document, flags=re.IGNORECASE)
-            prompts.append(
-                self.DEFAULT_CONTEXT_TEMPLATE.format(WHOLE_DOCUMENT=full_document, CHUNK_CONTENT=chunk_content)
-            )
-
-        return prompts
+        self.context_generator = ContextGenerator(
+            llm=self.llm,
+            template=self.DEFAULT_CONTEXT_TEMPLATE,
+            model_key=f"{self.config.llm_config.provider}:{self.config.llm_config.model_name}",
+            max_concurrency=self.config.max_concurrency,
+            chunks_per_prompt=self.config.chunks_per_prompt,
+            use_cache=self.config.cache,
+        )
 
     def _generate_context(self, chunk_contents: list[str], full_documents: list[str]) -> list[str]:
         """Generate contextual description for a chunk using LLM"""
-        prompts = self._prepare_prompts(chunk_contents, full_documents)
-
-        # Check if LLM supports async
-        if hasattr(self.llm, "abatch"):
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                response = loop.run_until_complete(self._async_generate(prompts))
-            finally:
-                loop.close()
-        else:
-            # Use sync batch for non-async LLMs
-            response = [resp.content for resp in self.llm.batch(prompts)]
-        return response
-
-    async def _async_generate(self, prompts: list[str]) -> list[str]:
-        """Helper for async LLM generation"""
-        return [resp.content for resp in await self.llm.abatch(prompts)]
+        return self.context_generator.generate(chunk_contents, full_documents)
 
     def _split_document(self, doc: Document) -> List[Document]:
         """Split document into chunks while preserving metadata"""
@@ -265,6 +252,8 @@ Please give a short succinct context to situate this chunk within the overall do
 class TextChunkingPreprocessor(DocumentPreprocessor):
     """Default text chunking preprocessor using TextSplitter"""
 
+    supports_parallel_chunking = True
+
     def __init__(self, config: Optional[TextChunkingConfig] = None):
         """Initialize with text chunking configuration"""
         super().__init__()
@@ -280,71 +269,87 @@ class TextChunkingPreprocessor(DocumentPreprocessor):
         # Use base class implementation
         return super()._split_document(doc)
 
-    def process_documents(self, documents: List[Document]) -> List[ProcessedChunk]:
-        processed_chunks = []
+    def _iter_document_chunks(
+        self, doc_id: Any, content: str, doc_metadata: Optional[Dict]
+    ) -> Iterator[Tuple[str, str, Dict]]:
+        """Split content of one document, yields (chunk_id, chunk_content, chunk_metadata)"""
+        # Document ID must be provided by this point
+        if doc_id is None:
+            raise ValueError("Document ID must be provided before preprocessing")
 
-        for doc in documents:
-            # Document ID must be provided by this point
-            if doc.id is None:
-                raise ValueError("Document ID must be provided before preprocessing")
+        # Skip empty or whitespace-only content
+        if not content or not content.strip():
+            return
 
-            # Skip empty or whitespace-only content
-            if not doc.content or not doc.content.strip():
+        # the same default as in Document model validator
+        doc_metadata = doc_metadata or {"source": "default"}
+
+        # Get content_column from metadata or use default
+        content_column = doc_metadata.get("_content_column")
+        if content_column is None:
+            # If content_column is not in metadata, use the default column name
+            content_column = _DEFAULT_CONTENT_COLUMN_NAME
+            logger.debug(f"No content_column found in metadata, using default: {_DEFAULT_CONTENT_COLUMN_NAME}")
+
+        if self.splitter is None:
+            raise ValueError("Splitter not configured")
+        chunk_contents = self.splitter.split_text(content)
+        total_chunks = len(chunk_contents)
+
+        # Track character positions
+        current_pos = 0
+        for i, chunk_content in enumerate(chunk_contents):
+            if not chunk_content or not chunk_content.strip():
                 continue
 
-            chunk_docs = self._split_document(doc)
-            total_chunks = len(chunk_docs)
+            # Calculate chunk positions
+            start_char = current_pos
+            end_char = start_char + len(chunk_content)
+            current_pos = end_char + 1  # +1 for separator
 
-            # Track character positions
-            current_pos = 0
-            for i, chunk_doc in enumerate(chunk_docs):
-                if not chunk_doc.content or not chunk_doc.content.strip():
-                    continue
+            # Initialize metadata
+            metadata = dict(doc_metadata)
 
-                # Calculate chunk positions
-                start_char = current_pos
-                end_char = start_char + len(chunk_doc.content)
-                current_pos = end_char + 1  # +1 for separator
-
-                # Initialize metadata
-                metadata = {}
-                if doc.metadata:
-                    metadata.update(doc.metadata)
-
-                # Add position metadata
-                metadata["_start_char"] = start_char
-                metadata["_end_char"] = end_char
-
-                # Get content_column from metadata or use default
-                content_column = None
-                if doc.metadata:
-                    content_column = doc.metadata.get("_content_column")
-
-                if content_column is None:
-                    # If content_column is not in metadata, use the default column name
-                    content_column = _DEFAULT_CONTENT_COLUMN_NAME
-                    logger.debug(f"No content_column found in metadata, using default: {_DEFAULT_CONTENT_COLUMN_NAME}")
-
-                chunk_id = self._generate_chunk_id(
-                    chunk_index=i,
-                    total_chunks=total_chunks,
-                    start_char=start_char,
-                    end_char=end_char,
-                    provided_id=doc.id,
-                    content_column=content_column,
-                )
+            # Add position metadata
+            metadata["_start_char"] = start_char
+            metadata["_end_char"] = end_char
 
+            chunk_id = self._generate_chunk_id(
+                chunk_index=i,
+                total_chunks=total_chunks,
+                start_char=start_char,
+                end_char=end_char,
+                provided_id=doc_id,
+                content_column=content_column,
+            )
+
+            yield chunk_id, chunk_content, self._prepare_chunk_metadata(doc_id, i, metadata)
+
+    def process_documents(self, documents: List[Document]) -> List[ProcessedChunk]:
+        processed_chunks = []
+
+        for doc in documents:
+            for chunk_id, chunk_content, metadata in self._iter_document_chunks(doc.id, doc.content, doc.metadata):
                 processed_chunks.append(
                     ProcessedChunk(
                         id=chunk_id,
-                        content=chunk_doc.content,
+                        content=chunk_content,
                         embeddings=doc.embeddings,
-                        metadata=self._prepare_chunk_metadata(doc.id, i, metadata),
+                        metadata=metadata,
                     )
                 )
 
         return processed_chunks
 
+    def chunk_documents(self, documents: List[RawDocument]) -> ChunkBatch:
+        ids, contents, metadata_list = [], [], []
+        for doc in documents:
+            for chunk_id, chunk_content, metadata in self._iter_document_chunks(doc.id, doc.content, doc.metadata):
+                ids.append(chunk_id)
+                contents.append(chunk_content)
+                metadata_list.append(metadata)
+        return ChunkBatch.from_lists(ids, contents, metadata_list)
+
 
 class PreprocessorFactory:
     """Factory for creating preprocessors based on configuration"""
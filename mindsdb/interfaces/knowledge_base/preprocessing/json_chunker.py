@@ -18,6 +18,8 @@ logger = log.getLogger(__name__)
 class JSONChunkingPreprocessor(DocumentPreprocessor):
     """JSON chunking preprocessor for handling JSON data structures"""
 
+    supports_parallel_chunking = True
+
     def __init__(self, config: Optional[JSONChunkingConfig] = None):
         """Initialize with JSON chunking configuration"""
         super().__init__()
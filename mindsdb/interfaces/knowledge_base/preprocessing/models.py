@@ -1,8 +1,9 @@
 from enum import Enum
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Union, Callable, NamedTuple
 
-from typing import List, Dict, Any, Optional, Union, Callable
-
-
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel, Field, model_validator
 
 
@@ -32,6 +33,15 @@ class ContextualConfig(BasePreprocessingConfig):
     )
     context_template: Optional[str] = Field(default=None, description="Custom template for context generation")
     summarize: Optional[bool] = Field(default=False, description="Whether to return chunks as summarizations")
+    max_concurrency: int = Field(default=8, description="Maximum number of concurrent requests to LLM", gt=0)
+    chunks_per_prompt: int = Field(
+        default=1,
+        description="Number of chunks of the same document to contextualize in one LLM request "
+        "(the document is sent once per group of chunks). Default 1 keeps one request per chunk with "
+        "the regular context template, set it > 1 to reduce LLM input tokens for long documents",
+        gt=0,
+    )
+    cache: bool = Field(default=True, description="Whether to cache generated contexts")
 
 
 class TextChunkingConfig(BasePreprocessingConfig):
@@ -127,3 +137,69 @@ class ProcessedChunk(Document):
     """Processed chunk that aligns with VectorStoreHandler schema"""
 
     pass
+
+
+class RawDocument(NamedTuple):
+    """Lightweight document representation used by columnar chunking.
+
+    Unlike `Document` it is not validated, so it is cheap to create and to send to worker processes.
+    """
+
+    id: Union[int, str]
+    content: str
+    metadata: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_document(cls, doc: Document) -> "RawDocument":
+        return cls(doc.id, doc.content, doc.metadata)
+
+    def to_document(self) -> Document:
+        return Document(id=self.id, content=self.content, metadata=self.metadata)
+
+
+@dataclass(slots=True)
+class ChunkBatch:
+    """Columnar batch of chunks: ids, contents and metadata are stored as numpy object arrays"""
+
+    ids: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    contents: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    metadata: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def _to_array(values: list) -> np.ndarray:
+        # np.array() would try to unpack dicts/lists into nested arrays, fill an empty array instead
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+        return arr
+
+    @classmethod
+    def from_lists(cls, ids: list, contents: list, metadata: list) -> "ChunkBatch":
+        return cls(ids=cls._to_array(ids), contents=cls._to_array(contents), metadata=cls._to_array(metadata))
+
+    @classmethod
+    def from_chunks(cls, chunks: List[Document]) -> "ChunkBatch":
+        return cls.from_lists(
+            [chunk.id for chunk in chunks],
+            [chunk.content for chunk in chunks],
+            [chunk.metadata for chunk in chunks],
+        )
+
+    @classmethod
+    def concat(cls, batches: List["ChunkBatch"]) -> "ChunkBatch":
+        batches = [batch for batch in batches if len(batch) > 0]
+        if len(batches) == 0:
+            return cls()
+        if len(batches) == 1:
+            return batches[0]
+        return cls(
+            ids=np.concatenate([batch.ids for batch in batches]),
+            contents=np.concatenate([batch.contents for batch in batches]),
+            metadata=np.concatenate([batch.metadata for batch in batches]),
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build dataframe column by column, without creating intermediate per-chunk objects"""
+        return pd.DataFrame({"id": self.ids, "content": self.contents, "metadata": self.metadata})
@@ -0,0 +1,123 @@
+import os
+import pickle
+import threading
+import multiprocessing as mp
+from typing import List, Iterator, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+from mindsdb.interfaces.knowledge_base.preprocessing.models import RawDocument, ChunkBatch
+from mindsdb.interfaces.knowledge_base.preprocessing.document_preprocessor import DocumentPreprocessor
+from mindsdb.utilities.config import config
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+# region worker side
+# preprocessors created in the worker process, keyed by pickled (class, config)
+_worker_preprocessors = {}
+
+
+def _chunk_documents_batch(preprocessor_key: bytes, documents: List[RawDocument]) -> ChunkBatch:
+    """Executed in a worker process: split batch of documents into chunks
+
+    Args:
+        preprocessor_key: pickled tuple (preprocessor class, preprocessor config)
+        documents: batch of documents
+
+    Returns:
+        ChunkBatch: chunks of the documents in columnar form
+    """
+    preprocessor = _worker_preprocessors.get(preprocessor_key)
+    if preprocessor is None:
+        preprocessor_class, preprocessor_config = pickle.loads(preprocessor_key)
+        preprocessor = preprocessor_class(preprocessor_config)
+        _worker_preprocessors[preprocessor_key] = preprocessor
+    return preprocessor.chunk_documents(documents)
+
+
+# endregion
+
+
+class ParallelChunker:
+    """Split documents using a pool of worker processes.
+
+    Documents are sent to workers in batches, each worker returns chunks as ChunkBatch, so no per-chunk
+    pydantic objects are created or pickled. The pool is shared between all knowledge bases and is created on
+    first use. Small inputs and preprocessors which can't be re-created in a worker are processed in the
+    current thread.
+
+    Settings are taken from config['knowledge_bases']['chunking']:
+        workers: number of worker processes, 0 - use the number of CPUs
+        batch_size: number of documents sent to a worker at once
+        min_documents: minimal number of documents to use the pool
+    """
+
+    _pool: Optional[ProcessPoolExecutor] = None
+    _pool_size: int = 0
+    _pool_lock = threading.Lock()
+
+    def __init__(self, preprocessor: DocumentPreprocessor):
+        self.preprocessor = preprocessor
+
+        chunking_config = config["knowledge_bases"]["chunking"]
+        self.workers = int(chunking_config["workers"]) or os.cpu_count() or 1
+        self.batch_size = max(int(chunking_config["batch_size"]), 1)
+        self.min_documents = int(chunking_config["min_documents"])
+
+    @classmethod
+    def _get_pool(cls, workers: int) -> ProcessPoolExecutor:
+        with cls._pool_lock:
+            if cls._pool is None or cls._pool_size != workers:
+                if cls._pool is not None:
+                    cls._pool.shutdown(wait=False)
+                cls._pool = ProcessPoolExecutor(workers, mp_context=mp.get_context("spawn"))
+                cls._pool_size = workers
+            return cls._pool
+
+    @classmethod
+    def shutdown(cls, wait: bool = True) -> None:
+        """Stop worker processes, if they were started"""
+        with cls._pool_lock:
+            if cls._pool is not None:
+                cls._pool.shutdown(wait=wait)
+                cls._pool = None
+                cls._pool_size = 0
+
+    def _use_pool(self, documents: List[RawDocument]) -> bool:
+        return (
+            self.preprocessor.supports_parallel_chunking
+            and self.workers > 1
+            and len(documents) >= max(self.min_documents, self.batch_size + 1)
+        )
+
+    def iter_batches(self, documents: List[RawDocument]) -> Iterator[ChunkBatch]:
+        """Split documents, yields chunk batches in the order of input documents
+
+        Args:
+            documents: documents to split
+
+        Yields:
+            ChunkBatch: chunks of a batch of documents
+        """
+        if not self._use_pool(documents):
+            yield self.preprocessor.chunk_documents(documents)
+            return
+
+        preprocessor_key = pickle.dumps((type(self.preprocessor), self.preprocessor.config))
+        batches = [documents[i : i + self.batch_size] for i in range(0, len(documents), self.batch_size)]
+        logger.debug(f"Chunking {len(documents)} documents in {len(batches)} batches using {self.workers} processes")
+
+        pool = self._get_pool(self.workers)
+        yield from pool.map(_chunk_documents_batch, [preprocessor_key] * len(batches), batches)
+
+    def chunk(self, documents: List[RawDocument]) -> ChunkBatch:
+        """Split documents into chunks
+
+        Args:
+            documents: documents to split
+
+        Returns:
+            ChunkBatch: all chunks of the documents
+        """
+        return ChunkBatch.concat(list(self.iter_batches(documents)))
@@ -0,0 +1,148 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional, Hashable
+
+import pandas as pd
+from prometheus_client import Counter, Gauge
+
+from mindsdb.utilities.config import config
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+KB_QUERY_CACHE_REQUESTS = Counter(
+    "mindsdb_kb_query_cache_requests",
+    "How many knowledge base selects were answered from the result cache (hit) or computed (miss)",
+    ("result",),
+)
+
+KB_QUERY_CACHE_SIZE = Gauge(
+    "mindsdb_kb_query_cache_size_bytes",
+    "Memory used by cached knowledge base query results",
+    multiprocess_mode="livesum",
+)
+
+
+class KnowledgeBaseQueryCache:
+    """In-memory cache of knowledge base select results.
+
+    Key of a record must contain the KB data version (see KnowledgeBaseTable.data_version), so any write to KB
+    makes previous records unreachable. Records of a KB are also dropped eagerly when it is modified in the
+    current process. Records are evicted in LRU order when total size of cached dataframes exceeds the limit,
+    and they expire after `ttl` seconds, because data in the vector database can be changed bypassing MindsDB.
+
+    Settings are taken from config['knowledge_bases']['query_cache']:
+        enabled: use the cache or not
+        ttl: lifetime of a record, seconds
+        max_size_mb: memory limit for all cached results
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_size: Optional[int] = None):
+        cache_config = config["knowledge_bases"]["query_cache"]
+        self.enabled = cache_config["enabled"]
+        self.ttl = ttl if ttl is not None else cache_config["ttl"]
+        self.max_size = max_size if max_size is not None else int(cache_config["max_size_mb"] * 1024 * 1024)
+
+        # key -> (kb_id, expires_at, size, df)
+        self._records = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _pop(self, key: Hashable) -> None:
+        _, _, size, _ = self._records.pop(key)
+        self._size -= size
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """Get copy of cached dataframe
+
+        Args:
+            key: key of the record, first element must be KB id
+
+        Returns:
+            Optional[pd.DataFrame]: cached result or None
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None and record[1] < time.monotonic():
+                self._pop(key)
+                record = None
+
+            if record is None:
+                self.misses += 1
+                KB_QUERY_CACHE_REQUESTS.labels("miss").inc()
+                return None
+
+            self._records.move_to_end(key)
+            self.hits += 1
+            KB_QUERY_CACHE_REQUESTS.labels("hit").inc()
+            df = record[3]
+        # result may be modified by caller
+        return df.copy()
+
+    def set(self, key: Hashable, kb_id: int, df: pd.DataFrame) -> None:
+        """Put result to the cache
+
+        Args:
+            key: key of the record
+            kb_id: id of the KB, used for invalidation
+            df: result of the query
+        """
+        if not self.enabled:
+            return
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_size:
+            return
+        df = df.copy()
+        with self._lock:
+            if key in self._records:
+                self._pop(key)
+            self._records[key] = (kb_id, time.monotonic() + self.ttl, size, df)
+            self._size += size
+            while self._size > self.max_size:
+                self._pop(next(iter(self._records)))
+            KB_QUERY_CACHE_SIZE.set(self._size)
+
+    def invalidate(self, kb_id: int) -> None:
+        """Remove all records of the KB
+
+        Args:
+            kb_id: id of the KB
+        """
+        with self._lock:
+            keys = [key for key, record in self._records.items() if record[0] == kb_id]
+            for key in keys:
+                self._pop(key)
+            KB_QUERY_CACHE_SIZE.set(self._size)
+        if keys:
+            logger.debug(f"Removed {len(keys)} cached results of knowledge base {kb_id}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._size = 0
+            KB_QUERY_CACHE_SIZE.set(0)
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_query_cache = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> KnowledgeBaseQueryCache:
+    """Returns process-wide instance of the cache"""
+    global _query_cache
+    if _query_cache is None:
+        with _query_cache_lock:
+            if _query_cache is None:
+                _query_cache = KnowledgeBaseQueryCache()
+    return _query_cache
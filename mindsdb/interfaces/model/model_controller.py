@@ -24,6 +24,7 @@ from mindsdb.utilities.functions import resolve_model_identifier
 import mindsdb.utilities.profiler as profiler
 from mindsdb.utilities.exception import EntityExistsError, EntityNotExistsError
 from mindsdb.utilities import log
+from mindsdb.api.executor.planner.plan_cache import invalidate_plan_cache
 
 logger = log.getLogger(__name__)
 
@@ -194,6 +195,7 @@ class ModelController():
             else:
                 db.session.delete(predictor_record)
         db.session.commit()
+        invalidate_plan_cache()
 
         # region delete storages
         if len(predictors_records) > 1:
@@ -213,6 +215,7 @@ class ModelController():
         for model_record in get_model_records(name=old_name):
             model_record.name = new_name
         db.session.commit()
+        invalidate_plan_cache()
 
     @staticmethod
     def _get_data_integration_ref(statement, database_controller):
@@ -304,6 +307,7 @@ class ModelController():
         if params['model_name'] in project_tables:
             raise EntityExistsError('Model already exists', f"{params['project_name']}.{params['model_name']}")
         predictor_record = ml_handler.learn(**params)
+        invalidate_plan_cache()
 
         return ModelController.get_model_info(predictor_record)
 
@@ -339,6 +343,7 @@ class ModelController():
         params['is_retrain'] = True
         params['set_active'] = set_active
         predictor_record = ml_handler.learn(**params)
+        invalidate_plan_cache()
 
         return ModelController.get_model_info(predictor_record)
 
@@ -390,6 +395,7 @@ class ModelController():
     def finetune_model(self, statement, ml_handler):
         params = self.prepare_finetune_statement(statement, ml_handler.database_controller)
         predictor_record = ml_handler.finetune(**params)
+        invalidate_plan_cache()
         return ModelController.get_model_info(predictor_record)
 
     def update_model(self, session, project_name: str, model_name: str, problem_definition, version=None):
@@ -0,0 +1,147 @@
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from mindsdb.utilities.config import config
+from mindsdb.utilities.loading_cache import LoadingCache, SharedInstance
+from mindsdb.utilities.context import context as ctx
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+@dataclass
+class TableSchema:
+    """Description of a table which is used by agents: columns and sample rows"""
+
+    fields: List[str]
+    dtypes: List[str]
+    sample_rows: str
+    # is shown instead of the description if columns of the table could not be loaded. Such records are not cached
+    error: Optional[str] = None
+
+
+# (company_id, integration, schema, table, sample rows count)
+TableKey = Tuple[Optional[int], str, Optional[str], str, int]
+
+
+def make_table_key(integration: str, schema: Optional[str], table: str, sample_rows: int) -> TableKey:
+    """Make key of the table for the current company
+
+    Args:
+        integration (str): name of the integration
+        schema (Optional[str]): name of the schema
+        table (str): name of the table
+        sample_rows (int): number of sample rows in the description
+
+    Returns:
+        TableKey: key of the record in the cache
+    """
+    return (
+        ctx.company_id,
+        integration.lower(),
+        schema.lower() if schema is not None else None,
+        table.lower(),
+        sample_rows,
+    )
+
+
+class TableSchemaCache(LoadingCache):
+    """Process-wide cache of table descriptions for agents, shared between all agents of a company.
+
+    - A missed record is loaded once, other threads which request the same table wait for the same load.
+    - An expired record is returned as is and refreshed in the background, so a conversation with an agent
+      doesn't wait for the remote database after the first load.
+    - Failed lookups (records with `error`) are not cached.
+    - Records of an integration (or a single table) are dropped when it is changed through MindsDB:
+      integration is altered or dropped, table is created or dropped, data catalog is reloaded.
+
+    Settings are taken from config['agents']['schema_cache']:
+        enabled: use the cache or not
+        ttl: seconds after which a record is refreshed
+        max_tables: max number of records, older are evicted
+        workers: number of threads which load tables
+    """
+
+    thread_name_prefix = "schema_cache"
+
+    def __init__(self, ttl: Optional[float] = None, max_tables: Optional[int] = None, workers: Optional[int] = None):
+        cache_config = config["agents"]["schema_cache"]
+        super().__init__(
+            enabled=cache_config["enabled"],
+            ttl=ttl if ttl is not None else cache_config["ttl"],
+            max_size=max_tables if max_tables is not None else cache_config["max_tables"],
+            workers=workers if workers is not None else cache_config["workers"],
+        )
+
+    def _is_cacheable(self, schema: TableSchema) -> bool:
+        # failed lookup is retried on the next request
+        return schema.error is None
+
+    def get(self, key: TableKey, loader: Callable[[], TableSchema]) -> TableSchema:
+        """Get description of the table
+
+        Args:
+            key (TableKey): key of the table, see make_table_key
+            loader (Callable): function which loads the table description
+
+        Returns:
+            TableSchema: description of the table
+        """
+        if not self.enabled:
+            return loader()
+
+        with self._lock:
+            record, future = self._get_or_submit(key, loader, time.monotonic())
+        if record is not None:
+            return record.value
+        return future.result()
+
+    def warm(self, tables: Iterable[Tuple[TableKey, Callable[[], TableSchema]]]) -> List[Future]:
+        """Load tables concurrently in the background, tables which are already cached and fresh are skipped
+
+        Args:
+            tables: pairs of (key, loader)
+
+        Returns:
+            List[Future]: loads which were started or already in progress
+        """
+        if not self.enabled:
+            return []
+        futures = []
+        now = time.monotonic()
+        with self._lock:
+            for key, loader in tables:
+                record = self._records.get(key)
+                if record is not None and self._is_fresh(record, now):
+                    continue
+                futures.append(self._submit(key, loader))
+        return futures
+
+    def invalidate(self, integration: str, table: Optional[str] = None, company_id: Optional[int] = None) -> None:
+        """Remove records of the integration or the table of the company
+
+        Args:
+            integration (str): name of the integration
+            table (Optional[str]): name of the table, if not set - all tables of the integration are removed
+            company_id (Optional[int]): id of the company, current company by default
+        """
+        if company_id is None:
+            company_id = ctx.company_id
+        integration = integration.lower()
+        if table is not None:
+            table = table.lower()
+        count = self._invalidate(
+            lambda key: key[0] == company_id and key[1] == integration and (table is None or key[3] == table)
+        )
+        if count:
+            logger.debug(f"Removed {count} cached table descriptions of {integration}")
+
+
+_schema_cache = SharedInstance(TableSchemaCache)
+
+
+def get_schema_cache() -> TableSchemaCache:
+    """Returns process-wide instance of the cache"""
+    return _schema_cache.get()
@@ -345,6 +345,8 @@ class SkillToolController:
             sample_rows_in_table_info=3,
             cache=get_cache("agent", max_size=_MAX_CACHE_SIZE),
         )
+        # descriptions of tables are loaded in the background while the agent is being prepared
+        sql_agent.warm_table_info()
         db = MindsDBSQL.custom_init(sql_agent=sql_agent)
         should_include_kb_tools = include_knowledge_bases is not None and len(include_knowledge_bases) > 0
         should_include_tables_tools = len(databases_struct) > 0 or len(tables_list) > 0
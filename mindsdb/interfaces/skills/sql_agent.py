@@ -6,6 +6,7 @@ from io import StringIO
 from typing import Iterable, List, Optional, Any, Tuple
 from collections import defaultdict
 import fnmatch
+from contextlib import contextmanager
 
 import pandas as pd
 from mindsdb_sql_parser import parse_sql
@@ -18,6 +19,8 @@ from mindsdb.integrations.libs.response import INF_SCHEMA_COLUMNS_NAMES
 from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import MYSQL_DATA_TYPE
 from mindsdb.utilities.config import config
 from mindsdb.interfaces.data_catalog.data_catalog_reader import DataCatalogReader
+from mindsdb.interfaces.skills.schema_cache import TableSchema, get_schema_cache, make_table_key
+from mindsdb.interfaces.storage import db
 
 logger = log.getLogger(__name__)
 
@@ -215,10 +218,15 @@ class SQLAgent:
         # Initialize the skill tool controller from MindsDB
         self.skill_tool = SkillToolController()
 
-    def _call_engine(self, query: str, database=None):
+    def _call_engine(self, query: str, database=None, command_executor=None):
+        if command_executor is None:
+            # one session for the permissions check and the query
+            with self._session_executor(self._command_executor.session.database) as command_executor:
+                return self._call_engine(query, database=database, command_executor=command_executor)
+
         # switch database
         ast_query = parse_sql(query.strip("`"))
-        self._check_permissions(ast_query)
+        self._check_permissions(ast_query, command_executor=command_executor)
 
         if database is None:
             # if we use tables with prefixes it should work for any database
@@ -227,15 +235,14 @@ class SQLAgent:
                 # for now, we will just use the first one
                 database = self._databases[0] if self._databases else "mindsdb"
 
-        ret = self._command_executor.execute_command(ast_query, database_name=database)
-        return ret
+        return command_executor.execute_command(ast_query, database_name=database)
 
-    def _check_permissions(self, ast_query):
+    def _check_permissions(self, ast_query, command_executor=None):
         # check type of query
         if not isinstance(ast_query, (Select, Show, Describe, Explain)):
             raise ValueError(f"Query is not allowed: {ast_query.to_string()}")
 
-        kb_names = self.get_all_knowledge_base_names()
+        kb_names = self.get_all_knowledge_base_names(command_executor=command_executor)
 
         # Check tables
         if self._tables_to_include:
@@ -318,14 +325,16 @@ class SQLAgent:
                 # get first column if not found
                 col_name = df.columns[0]
 
-            for _, row in df.iterrows():
-                if "table_schema" in row:
-                    parts = [db_name, row["table_schema"], row[col_name]]
-                else:
-                    parts = [db_name, row[col_name]]
-                if self._tables_to_include.match(Identifier(parts=parts)):
-                    if not self._tables_to_ignore.match(Identifier(parts=parts)):
-                        result_tables.append(parts)
+            names = df[col_name].astype(str).to_list()
+            if "table_schema" in df.columns:
+                tables = [[db_name, schema, name] for schema, name in zip(df["table_schema"].astype(str), names)]
+            else:
+                tables = [[db_name, name] for name in names]
+
+            for parts in tables:
+                table = Identifier(parts=parts)
+                if self._tables_to_include.match(table) and not self._tables_to_ignore.match(table):
+                    result_tables.append(parts)
 
         result_tables = [".".join(x) for x in result_tables]
         if self._cache:
@@ -353,9 +362,12 @@ class SQLAgent:
                 kb_names.append(kb_name)
         return kb_names
 
-    def get_all_knowledge_base_names(self) -> Iterable[str]:
+    def get_all_knowledge_base_names(self, command_executor=None) -> Iterable[str]:
         """Get a list of all knowledge bases
 
+        Args:
+            command_executor: executor of the current call, a separate session is used if it is not set
+
         Returns:
             Iterable[str]: list with knowledge base names
         """
@@ -371,7 +383,11 @@ class SQLAgent:
         try:
             # Query to get all knowledge bases
             ast_query = Show(category="Knowledge Bases")
-            result = self._command_executor.execute_command(ast_query, database_name=self.knowledge_base_database)
+            if command_executor is not None:
+                result = command_executor.execute_command(ast_query, database_name=self.knowledge_base_database)
+            else:
+                with self._session_executor(self.knowledge_base_database) as command_executor:
+                    result = command_executor.execute_command(ast_query, database_name=self.knowledge_base_database)
 
             # Filter knowledge bases based on ignore list
             kb_names = []
@@ -492,19 +508,28 @@ class SQLAgent:
             if table_names is not None:
                 all_tables = self._resolve_table_names(table_names, all_tables)
 
-            tables_info = []
-            for table in all_tables:
-                key = f"{ctx.company_id}_{table}_info"
-                table_info = self._cache.get(key) if self._cache else None
-                if True or table_info is None:
-                    table_info = self._get_single_table_info(table)
-                    if self._cache:
-                        self._cache.set(key, table_info)
-
-                tables_info.append(table_info)
-
+            tables_info = [self._get_single_table_info(table) for table in all_tables]
             return "\n\n".join(tables_info)
 
+    def warm_table_info(self) -> None:
+        """Start loading of descriptions of all usable tables into the shared schema cache.
+        Tables are loaded concurrently in the background, the method doesn't wait for them.
+        """
+        if config.get("data_catalog", {}).get("enabled", False):
+            # descriptions are read from the data catalog
+            return
+        try:
+            tables = []
+            for name in self.get_usable_table_names():
+                split = name.replace("`", "").split(".")
+                if len(split) < 2 or "*" in split[-1]:
+                    continue
+                table = Identifier(parts=[split[0], split[-1]])
+                tables.append((self._get_table_key(table), self._get_table_loader(table)))
+            get_schema_cache().warm(tables)
+        except Exception as e:
+            logger.warning(f"Can't warm up descriptions of tables: {e}")
+
     def get_kb_sample_rows(self, kb_name: str) -> str:
         """Get sample rows from a knowledge base.
 
@@ -532,7 +557,8 @@ class SQLAgent:
 
         return sample_rows_str
 
-    def _get_single_table_info(self, table: Identifier) -> str:
+    @staticmethod
+    def _split_table(table: Identifier) -> Tuple[str, Optional[str], str]:
         if len(table.parts) < 2:
             raise ValueError(f"Database is required for table: {table}")
         if len(table.parts) == 3:
@@ -540,54 +566,120 @@ class SQLAgent:
         else:
             schema_name = None
             integration, table_name = table.parts[-2:]
+        return integration, schema_name, table_name
 
-        table_str = str(table)
+    def _get_table_key(self, table: Identifier):
+        integration, schema_name, table_name = self._split_table(table)
+        return make_table_key(integration, schema_name, table_name, self._sample_rows_in_table_info)
 
-        dn = self._command_executor.session.datahub.get(integration)
+    def _get_table_loader(self, table: Identifier):
+        database = self._command_executor.session.database
+        return lambda: self._load_table_schema(table, database)
+
+    @contextmanager
+    def _session_executor(self, database: str):
+        """Command executor with a separate session for one call.
+        The session of the agent is not thread-safe: it is shared by the tools of all rows of an agent batch,
+        and loads of table descriptions are executed in the threads of the schema cache.
+        """
+        from mindsdb.api.executor.command_executor import ExecuteCommands
+        from mindsdb.api.executor.controllers import session_pool
+
+        with session_pool.session() as session:
+            session.database = database
+            yield ExecuteCommands(session)
+
+    def _get_catalog_columns(
+        self, command_executor, integration: str, schema_name: Optional[str], table_name: str
+    ) -> Optional[Tuple[List[str], List[str]]]:
+        """Get columns of the table from the data catalog, if the table was loaded to it
+
+        Returns:
+            Optional[Tuple[List[str], List[str]]]: names and types of columns, or None if table is not in the catalog
+        """
+        integration_record = command_executor.session.integration_controller.get(integration)
+        if integration_record is None:
+            return None
+        query = db.session.query(db.MetaTables).filter_by(integration_id=integration_record["id"], name=table_name)
+        if schema_name is not None:
+            query = query.filter_by(schema=schema_name)
+        meta_table = query.first()
+        if meta_table is None or not meta_table.meta_columns:
+            return None
+        fields = [column.name for column in meta_table.meta_columns]
+        dtypes = [column.data_type or "UNKNOWN" for column in meta_table.meta_columns]
+        return fields, dtypes
+
+    def _load_table_schema(self, table: Identifier, database: str) -> TableSchema:
+        with self._session_executor(database) as command_executor:
+            return self._read_table_schema(command_executor, table)
+
+    def _read_table_schema(self, command_executor, table: Identifier) -> TableSchema:
+        integration, schema_name, table_name = self._split_table(table)
+        table_str = str(table)
 
-        fields, dtypes = [], []
         try:
-            df = dn.get_table_columns_df(table_name, schema_name)
-            if not isinstance(df, pd.DataFrame) or df.empty:
-                logger.warning(f"Received empty or invalid DataFrame for table columns of {table_str}")
-                return f"Table named `{table_str}`:\n [No column information available]"
-
-            fields = df[INF_SCHEMA_COLUMNS_NAMES.COLUMN_NAME].to_list()
-            dtypes = [
-                mysql_data_type.value if isinstance(mysql_data_type, MYSQL_DATA_TYPE) else (data_type or "UNKNOWN")
-                for mysql_data_type, data_type in zip(
-                    df[INF_SCHEMA_COLUMNS_NAMES.MYSQL_DATA_TYPE], df[INF_SCHEMA_COLUMNS_NAMES.DATA_TYPE]
-                )
-            ]
+            catalog_columns = self._get_catalog_columns(command_executor, integration, schema_name, table_name)
         except Exception as e:
-            logger.error(f"Failed processing column info for {table_str}: {e}", exc_info=True)
-            raise ValueError(f"Failed to process column info for {table_str}") from e
+            logger.debug(f"Can't read columns of {table_str} from the data catalog: {e}")
+            catalog_columns = None
+
+        if catalog_columns is not None:
+            fields, dtypes = catalog_columns
+        else:
+            dn = command_executor.session.datahub.get(integration)
+
+            try:
+                df = dn.get_table_columns_df(table_name, schema_name)
+                if not isinstance(df, pd.DataFrame) or df.empty:
+                    logger.warning(f"Received empty or invalid DataFrame for table columns of {table_str}")
+                    return TableSchema(fields=[], dtypes=[], sample_rows="", error="[No column information available]")
+
+                fields = df[INF_SCHEMA_COLUMNS_NAMES.COLUMN_NAME].to_list()
+                dtypes = [
+                    mysql_data_type.value if isinstance(mysql_data_type, MYSQL_DATA_TYPE) else (data_type or "UNKNOWN")
+                    for mysql_data_type, data_type in zip(
+                        df[INF_SCHEMA_COLUMNS_NAMES.MYSQL_DATA_TYPE], df[INF_SCHEMA_COLUMNS_NAMES.DATA_TYPE]
+                    )
+                ]
+            except Exception as e:
+                logger.error(f"Failed processing column info for {table_str}: {e}", exc_info=True)
+                raise ValueError(f"Failed to process column info for {table_str}") from e
 
         if not fields:
             logger.error(f"Could not extract column fields for {table_str}.")
-            return f"Table named `{table_str}`:\n [Could not extract column information]"
+            return TableSchema(fields=[], dtypes=[], sample_rows="", error="[Could not extract column information]")
 
         try:
-            sample_rows_info = self._get_sample_rows(table_str, fields)
+            sample_rows_info = self._get_sample_rows(table_str, fields, command_executor)
         except Exception as e:
             logger.warning(f"Could not get sample rows for {table_str}: {e}")
             sample_rows_info = "\n\t [error] Couldn't retrieve sample rows!"
 
+        return TableSchema(fields=fields, dtypes=dtypes, sample_rows=sample_rows_info)
+
+    def _get_single_table_info(self, table: Identifier) -> str:
+        table_str = str(table)
+        schema = get_schema_cache().get(self._get_table_key(table), self._get_table_loader(table))
+
+        if schema.error is not None:
+            return f"Table named `{table_str}`:\n {schema.error}"
+
         info = f"Table named `{table_str}`:\n"
         info += f"\nSample with first {self._sample_rows_in_table_info} rows from table {table_str} in CSV format (dialect is 'excel'):\n"
-        info += sample_rows_info + "\n"
+        info += schema.sample_rows + "\n"
         info += (
             "\nColumn data types: "
-            + ",\t".join([f"\n`{field}` : `{dtype}`" for field, dtype in zip(fields, dtypes)])
+            + ",\t".join([f"\n`{field}` : `{dtype}`" for field, dtype in zip(schema.fields, schema.dtypes)])
             + "\n"
         )
         return info
 
-    def _get_sample_rows(self, table: str, fields: List[str]) -> str:
+    def _get_sample_rows(self, table: str, fields: List[str], command_executor=None) -> str:
         logger.info(f"_get_sample_rows: table={table} fields={fields}")
         command = f"select {', '.join(fields)} from {table} limit {self._sample_rows_in_table_info};"
         try:
-            ret = self._call_engine(command)
+            ret = self._call_engine(command, command_executor=command_executor)
             sample_rows = ret.data.to_lists()
 
             def truncate_value(val):
@@ -522,6 +522,7 @@ class KnowledgeBase(Base):
 
     embedding_model = relationship("Predictor", foreign_keys=[embedding_model_id], doc="embedding model")
     query_id = Column(Integer, nullable=True)
+    data_version = Column(Integer, nullable=True, default=0, doc="incremented on every change of KB data")
 
     created_at = Column(DateTime, default=datetime.datetime.now)
     updated_at = Column(DateTime, default=datetime.datetime.now, onupdate=datetime.datetime.now)
@@ -558,6 +559,15 @@ class KnowledgeBase(Base):
         }
 
 
+class PlanCacheVersion(Base):
+    __tablename__ = "plan_cache_version"
+    id: int = Column(Integer, primary_key=True)
+    company_id: int = Column(Integer, nullable=True)
+    version: int = Column(Integer, nullable=False, default=0, doc="incremented on every change of objects used by planner")
+
+    __table_args__ = (UniqueConstraint("company_id", name="unique_plan_cache_version_company_id"),)
+
+
 class QueryContext(Base):
     __tablename__ = "query_context"
     id: int = Column(Integer, primary_key=True)
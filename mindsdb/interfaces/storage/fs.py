@@ -1,21 +1,32 @@
 import os
 import io
+import sys
+import uuid
+import time
+import gzip
+import json
 import shutil
 import filecmp
 import tarfile
 import hashlib
+import tempfile
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Union, Optional
+from typing import Union, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
-import threading
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 
 if os.name == 'posix':
     import fcntl
 
 import psutil
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from mindsdb.utilities.config import Config
 
 if Config()['permanent_storage']['location'] == 's3':
@@ -45,7 +56,11 @@ RESOURCE_GROUP = RESOURCE_GROUP()
 
 DIR_LOCK_FILE_NAME = 'dir.lock'
 DIR_LAST_MODIFIED_FILE_NAME = 'last_modified.txt'
-SERVICE_FILES_NAMES = (DIR_LOCK_FILE_NAME, DIR_LAST_MODIFIED_FILE_NAME)
+DIR_MANIFEST_FILE_NAME = 'storage_manifest.json'
+SERVICE_FILES_NAMES = (DIR_LOCK_FILE_NAME, DIR_LAST_MODIFIED_FILE_NAME, DIR_MANIFEST_FILE_NAME)
+REMOTE_MANIFEST_FILE_NAME = 'manifest.json'
+# ioctl request to clone file on copy-on-write filesystems (btrfs, xfs)
+FICLONE = 0x40049409
 
 
 def compare_recursive(comparison: filecmp.dircmp) -> bool:
@@ -79,6 +94,167 @@ def compare_directories(dir1: str, dir2: str) -> bool:
     return compare_recursive(dcmp)
 
 
+def get_file_hash(path: Path) -> str:
+    """sha256 of the file content"""
+    file_hash = hashlib.sha256()
+    with open(path, 'rb') as fd:
+        for chunk in iter(lambda: fd.read(2**20), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def compress_file(src: Path, dst: Path) -> str:
+    """Compress file with zstd, or with gzip if 'zstandard' is not installed
+
+    Args:
+        src (Path): file to compress
+        dst (Path): path of compressed file
+
+    Returns:
+        str: name of used compression
+    """
+    with open(src, 'rb') as fd_in:
+        if zstandard is not None:
+            with open(dst, 'wb') as fd_out:
+                zstandard.ZstdCompressor(level=3).copy_stream(fd_in, fd_out)
+            return 'zstd'
+        with gzip.open(dst, 'wb', compresslevel=1) as fd_out:
+            shutil.copyfileobj(fd_in, fd_out, 2**20)
+        return 'gzip'
+
+
+def decompress_file(src: Path, dst: Path, compression: str):
+    """Decompress file compressed by `compress_file`
+
+    Args:
+        src (Path): compressed file
+        dst (Path): path of decompressed file
+        compression (str): name of compression
+    """
+    if compression == 'zstd':
+        if zstandard is None:
+            raise Exception("File is compressed with zstd, 'zstandard' package is required to read it")
+        with open(src, 'rb') as fd_in, open(dst, 'wb') as fd_out:
+            zstandard.ZstdDecompressor().copy_stream(fd_in, fd_out)
+    elif compression == 'gzip':
+        with gzip.open(src, 'rb') as fd_in, open(dst, 'wb') as fd_out:
+            shutil.copyfileobj(fd_in, fd_out, 2**20)
+    else:
+        raise Exception(f'Unknown compression: {compression}')
+
+
+def read_manifest(folder_path: Path) -> dict:
+    """Read manifest of the resource folder, empty dict if there is no manifest"""
+    try:
+        return json.loads((folder_path / DIR_MANIFEST_FILE_NAME).read_text())
+    except Exception:
+        return {}
+
+
+def write_manifest(folder_path: Path, manifest: dict):
+    (folder_path / DIR_MANIFEST_FILE_NAME).write_text(json.dumps(manifest))
+
+
+def in_sub_path(relative_path: str, sub_path: Optional[str]) -> bool:
+    """Check if file or dir of the resource is `sub_path` or is inside of it, any path is if `sub_path` is None"""
+    return sub_path is None or relative_path == sub_path or relative_path.startswith(f'{sub_path}/')
+
+
+def merge_sub_path(files: dict, dirs: list, sub_files: dict, sub_dirs: list, sub_path: Optional[str]) -> Tuple[dict, list]:
+    """Replace files and dirs inside of `sub_path` by `sub_files` and `sub_dirs`
+
+    Returns:
+        Tuple[dict, list]: files and dirs
+    """
+    files = {k: v for k, v in files.items() if not in_sub_path(k, sub_path)}
+    files.update(sub_files)
+    dirs = [relative_path for relative_path in dirs if not in_sub_path(relative_path, sub_path)]
+    return files, sorted(dirs + sub_dirs)
+
+
+def scan_folder(
+    folder_path: Path, known_files: dict, max_workers: int = 8, sub_path: Optional[str] = None
+) -> Tuple[dict, list]:
+    """Get files and dirs of the resource folder. Hash of a file is taken from `known_files` (manifest of the last
+    sync) if size and mtime of the file are not changed, other files are hashed.
+
+    Args:
+        folder_path (Path): folder of the resource
+        known_files (dict): relative path -> {hash, size, mtime}
+        max_workers (int): threads to hash files
+        sub_path (Optional[str]): relative path of file or folder, scan only it if is set
+
+    Returns:
+        Tuple[dict, list]: relative path -> {hash, size, mtime}; relative paths of dirs
+    """
+    files = {}
+    dirs = []
+    to_hash = []
+    root_path = folder_path if sub_path is None else folder_path / sub_path
+    if root_path.is_file():
+        paths = [root_path]
+    elif root_path.is_dir():
+        paths = root_path.rglob('*')
+        if sub_path is not None:
+            dirs.append(sub_path)
+    else:
+        return files, dirs
+    for path in paths:
+        relative_path = path.relative_to(folder_path).as_posix()
+        if path.is_dir():
+            dirs.append(relative_path)
+            continue
+        if relative_path in SERVICE_FILES_NAMES:
+            continue
+        stat = path.stat()
+        record = {'hash': None, 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+        known = known_files.get(relative_path)
+        if known is not None and known['size'] == record['size'] and known['mtime'] == record['mtime']:
+            record['hash'] = known['hash']
+        else:
+            to_hash.append(relative_path)
+        files[relative_path] = record
+
+    if len(to_hash) > 0:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashes = executor.map(lambda name: get_file_hash(folder_path / name), to_hash)
+            for relative_path, file_hash in zip(to_hash, hashes):
+                files[relative_path]['hash'] = file_hash
+    return files, sorted(dirs)
+
+
+def clone_file(src: Path, dst: Path, hardlink: bool = False):
+    """Copy file, dst is replaced atomically. The file is hardlinked if `hardlink` is True, or cloned (reflink) if
+    the filesystem supports it, otherwise it is copied.
+
+    Args:
+        src (Path): file to copy
+        dst (Path): destination path
+        hardlink (bool): make hardlink instead of copy
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dst.with_name(f'.{dst.name}.tmp')
+    tmp_path.unlink(missing_ok=True)
+    if hardlink:
+        try:
+            os.link(src, tmp_path)
+            os.replace(tmp_path, dst)
+            return
+        except OSError:
+            pass
+    if sys.platform == 'linux':
+        try:
+            with open(src, 'rb') as fd_src, open(tmp_path, 'wb') as fd_dst:
+                fcntl.ioctl(fd_dst.fileno(), FICLONE, fd_src.fileno())
+            shutil.copystat(src, tmp_path)
+            os.replace(tmp_path, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
 def copy(src, dst):
     if os.path.isdir(src):
         if os.path.exists(dst):
@@ -106,22 +282,24 @@ class BaseFSStore(ABC):
         self.storage = self.config['paths']['storage']
 
     @abstractmethod
-    def get(self, local_name, base_dir):
+    def get(self, local_name, base_dir, sub_path=None):
         """Copy file/folder from storage to {base_dir}
 
         Args:
             local_name (str): name of resource (file/folder)
             base_dir (str): path to copy the resource
+            sub_path (str): relative path of file/folder in the resource, copy only it if is set
         """
         pass
 
     @abstractmethod
-    def put(self, local_name, base_dir):
+    def put(self, local_name, base_dir, sub_path=None):
         """Copy file/folder from {base_dir} to storage
 
         Args:
             local_name (str): name of resource (file/folder)
             base_dir (str): path to folder with the resource
+            sub_path (str): relative path of file/folder in the resource, copy only it if is set
         """
         pass
 
@@ -161,24 +339,122 @@ class AbsentFSStore(BaseFSStore):
 
 class LocalFSStore(BaseFSStore):
     """Storage that stores files locally
+
+    Resource folder in the storage has a manifest with size, mtime and hash of every file, and a version which is
+    changed by every `put`. Manifest of the last sync is kept in the local folder too, so `get` of not changed
+    resource compares only versions, and only files with changed hash are copied. Files are cloned if the filesystem
+    supports it. With 'permanent_storage.hardlink' files are hardlinked instead: it is faster,
+    but then files must not be modified in place.
     """
 
     def __init__(self):
         super().__init__()
+        self.hardlink = self.config['permanent_storage'].get('hardlink', False)
 
-    def get(self, local_name, base_dir):
-        remote_name = local_name
-        src = os.path.join(self.storage, remote_name)
-        dest = os.path.join(base_dir, local_name)
-        if not os.path.exists(dest) or get_dir_size(src) != get_dir_size(dest):
-            copy(src, dest)
+    def _sync(
+        self, src: Path, dst: Path, src_files: dict, src_dirs: list, known_dst_files: dict, sub_path: str = None
+    ) -> dict:
+        """ Make content of dst folder the same as src
+
+            Args:
+                src (Path): source folder
+                dst (Path): destination folder
+                src_files (dict): files of src folder: relative path -> {hash, size, mtime}
+                src_dirs (list): dirs of src folder
+                known_dst_files (dict): files of dst folder from its manifest
+                sub_path (str): sync only this file/folder, src_files and src_dirs are inside of it
 
-    def put(self, local_name, base_dir, compression_level=9):
+            Returns:
+                dict: files of dst folder: relative path -> {hash, size, mtime}
+        """
+        dst.mkdir(parents=True, exist_ok=True)
+        dst_files, _ = scan_folder(dst, known_dst_files, sub_path=sub_path)
+        for relative_path in dst_files.keys() - src_files.keys():
+            (dst / relative_path).unlink()
+        for relative_path in src_dirs:
+            (dst / relative_path).mkdir(parents=True, exist_ok=True)
+
+        files = {}
+        for relative_path, record in src_files.items():
+            if dst_files.get(relative_path, {}).get('hash') != record['hash']:
+                clone_file(src / relative_path, dst / relative_path, hardlink=self.hardlink)
+                stat = (dst / relative_path).stat()
+                files[relative_path] = {'hash': record['hash'], 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+            else:
+                files[relative_path] = dst_files[relative_path]
+        return files
+
+    def get(self, local_name, base_dir, sub_path=None):
         remote_name = local_name
-        copy(
-            os.path.join(base_dir, local_name),
-            os.path.join(self.storage, remote_name)
+        src = Path(self.storage) / remote_name
+        dest = Path(base_dir) / local_name
+        if src.resolve() == dest.resolve():
+            return
+
+        remote_manifest = read_manifest(src)
+        if 'version' not in remote_manifest:
+            # resource was stored without manifest
+            if not os.path.exists(dest) or get_dir_size(src) != get_dir_size(dest):
+                copy(str(src), str(dest))
+            return
+
+        local_manifest = read_manifest(dest)
+        if local_manifest.get('version') == remote_manifest['version']:
+            return
+
+        local_files = local_manifest.get('files', {})
+        files = self._sync(
+            src, dest,
+            {k: v for k, v in remote_manifest['files'].items() if in_sub_path(k, sub_path)},
+            [k for k in remote_manifest.get('dirs', []) if in_sub_path(k, sub_path)],
+            local_files,
+            sub_path
         )
+        if sub_path is None:
+            write_manifest(dest, {'version': remote_manifest['version'], 'files': files})
+        else:
+            # other files are not synced, so version is not changed
+            files, _ = merge_sub_path(local_files, [], files, [], sub_path)
+            write_manifest(dest, {'version': local_manifest.get('version'), 'files': files})
+
+    def put(self, local_name, base_dir, compression_level=9, sub_path=None):
+        remote_name = local_name
+        src = Path(base_dir) / local_name
+        dest = Path(self.storage) / remote_name
+        if src.resolve() == dest.resolve():
+            return
+
+        if src.is_dir() is False:
+            raise FileNotFoundError(f'Resource folder does not exist: {src}')
+
+        remote_manifest = read_manifest(dest)
+        remote_files = remote_manifest.get('files', {})
+        remote_dirs = remote_manifest.get('dirs', [])
+        version = remote_manifest.get('version')
+        if version is None:
+            sub_path = None
+
+        local_manifest = read_manifest(src)
+        local_files = local_manifest.get('files', {})
+        files, dirs = scan_folder(src, local_files, sub_path=sub_path)
+
+        remote_sub_files = {k: v for k, v in remote_files.items() if in_sub_path(k, sub_path)}
+        if (
+            version is None
+            or [k for k in remote_dirs if in_sub_path(k, sub_path)] != dirs
+            or {k: v['hash'] for k, v in files.items()} != {k: v['hash'] for k, v in remote_sub_files.items()}
+        ):
+            remote_sub_files = self._sync(src, dest, files, dirs, remote_files, sub_path)
+            remote_files, remote_dirs = merge_sub_path(remote_files, remote_dirs, remote_sub_files, dirs, sub_path)
+            version = uuid.uuid4().hex
+            write_manifest(dest, {'version': version, 'files': remote_files, 'dirs': remote_dirs})
+
+        if sub_path is not None:
+            files, _ = merge_sub_path(local_files, [], files, [], sub_path)
+            if local_manifest.get('version') != remote_manifest['version']:
+                # other files of the local folder are not synced with the storage
+                version = local_manifest.get('version')
+        write_manifest(src, {'version': version, 'files': files})
 
     def delete(self, remote_name):
         path = Path(self.storage).joinpath(remote_name)
@@ -258,18 +534,133 @@ class FileLock:
 
 class S3FSStore(BaseFSStore):
     """Storage that stores files in amazon s3
+
+    Every file of the resource is stored as a separate compressed object, named by hash of its content:
+        {name}/manifest.json - files of the resource: path -> hash, size, compression
+        {name}/objects/{sha256} - content of the files
+    Manifest of the last sync is also kept in the resource folder, with size and mtime of the files. So only changed
+    files are hashed, and only files with new content are uploaded or downloaded. Files are transferred in parallel,
+    big files are transferred by multipart upload/download.
+    Files are compressed with zstd if 'zstandard' is installed, or gzip with fast level otherwise.
+    Objects are not deleted as soon as they are dropped from the manifest: another process can be reading the previous
+    manifest at that moment. The manifest keeps dropped hashes with the time they were dropped ('released'), and
+    objects are deleted only when no manifest has referenced them for 'permanent_storage.gc_grace_period' seconds.
+    Resources stored by previous versions as a single {name}.tar.gz archive are still readable.
     """
 
     dt_format = '%d.%m.%y %H:%M:%S.%f'
+    manifest_version = 1
+    get_attempts = 3
 
     def __init__(self):
         super().__init__()
+        from boto3.s3.transfer import TransferConfig
+
         if 's3_credentials' in self.config['permanent_storage']:
             self.s3 = boto3.client('s3', **self.config['permanent_storage']['s3_credentials'])
         else:
             self.s3 = boto3.client('s3')
         self.bucket = self.config['permanent_storage']['bucket']
-        self._thread_lock = threading.Lock()
+        self.max_workers = self.config['permanent_storage'].get('max_workers', 8)
+        self.gc_grace_period = self.config['permanent_storage'].get('gc_grace_period', 3600)
+        self.transfer_config = TransferConfig(max_concurrency=4)
+
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        if isinstance(error, FileNotFoundError):
+            return True
+        code = getattr(error, 'response', {}).get('Error', {}).get('Code')
+        return code in ('404', 'NoSuchKey', 'NotFound')
+
+    def _manifest_key(self, remote_name: str) -> str:
+        return f'{remote_name}/{REMOTE_MANIFEST_FILE_NAME}'
+
+    def _object_key(self, remote_name: str, file_hash: str) -> str:
+        return f'{remote_name}/objects/{file_hash}'
+
+    def _get_remote_manifest_etag(self, remote_name: str) -> Optional[str]:
+        try:
+            return self.s3.head_object(Bucket=self.bucket, Key=self._manifest_key(remote_name))['ETag']
+        except S3ClientError as e:
+            if self._is_not_found(e):
+                return None
+            raise
+
+    def _get_remote_manifest(self, remote_name: str) -> Tuple[Optional[dict], Optional[str]]:
+        """ get manifest of the resource and its etag
+
+            Args:
+                remote_name (str): name of the resource
+
+            Returns:
+                Tuple[Optional[dict], Optional[str]]: manifest and etag, (None, None) if there is no manifest
+        """
+        try:
+            response = self.s3.get_object(Bucket=self.bucket, Key=self._manifest_key(remote_name))
+        except S3ClientError as e:
+            if self._is_not_found(e):
+                return None, None
+            raise
+        return json.loads(response['Body'].read()), response['ETag']
+
+    def _upload_file(self, remote_name: str, path: Path, file_hash: str) -> str:
+        """ compress file and upload it
+
+            Returns:
+                str: used compression
+        """
+        with tempfile.TemporaryDirectory(prefix='mindsdb_s3_') as tmp_dir:
+            compressed_path = Path(tmp_dir) / file_hash
+            compression = compress_file(path, compressed_path)
+            self.s3.upload_file(
+                str(compressed_path),
+                self.bucket,
+                self._object_key(remote_name, file_hash),
+                Config=self.transfer_config
+            )
+        return compression
+
+    def _download_file(self, remote_name: str, path: Path, record: dict):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix='mindsdb_s3_') as tmp_dir:
+            compressed_path = Path(tmp_dir) / record['hash']
+            self.s3.download_file(
+                self.bucket,
+                self._object_key(remote_name, record['hash']),
+                str(compressed_path),
+                Config=self.transfer_config
+            )
+            tmp_path = path.with_name(f'.{path.name}.download')
+            decompress_file(compressed_path, tmp_path, record['compression'])
+            os.replace(tmp_path, path)
+
+    def _delete_keys(self, keys: list):
+        for i in range(0, len(keys), 1000):
+            self.s3.delete_objects(
+                Bucket=self.bucket,
+                Delete={'Objects': [{'Key': key} for key in keys[i:i + 1000]], 'Quiet': True}
+            )
+
+    def _collect_garbage(self, remote_name: str, keep_hashes: set):
+        """ delete objects of the resource which are not in `keep_hashes` and were not uploaded during the grace
+            period. Objects that are uploaded by a concurrent `put` but are not in the manifest yet are kept.
+
+            Args:
+                remote_name (str): name of the resource
+                keep_hashes (set): hashes of objects referenced by the manifest or released recently
+        """
+        prefix = self._object_key(remote_name, '')
+        expired_at = datetime.now(timezone.utc).timestamp() - self.gc_grace_period
+        keys = []
+        paginator = self.s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for item in page.get('Contents', []):
+                if item['Key'][len(prefix):] in keep_hashes:
+                    continue
+                if item['LastModified'].timestamp() >= expired_at:
+                    continue
+                keys.append(item['Key'])
+        self._delete_keys(keys)
 
     def _get_remote_last_modified(self, object_name: str) -> datetime:
         """ get time when object was created/modified
@@ -360,8 +751,8 @@ class S3FSStore(BaseFSStore):
             last_modified
         )
 
-    @profiler.profile()
-    def get(self, local_name, base_dir):
+    def _get_archive(self, local_name, base_dir):
+        """Download resource stored by previous versions as a single {name}.tar.gz"""
         remote_name = local_name
         remote_ziped_name = f'{remote_name}.tar.gz'
         local_ziped_name = f'{local_name}.tar.gz'
@@ -386,53 +777,176 @@ class S3FSStore(BaseFSStore):
             )
 
     @profiler.profile()
-    def put(self, local_name, base_dir, compression_level=9):
-        # NOTE: This `make_archive` function is implemente poorly and will create an empty archive file even if
-        # the file/dir to be archived doesn't exist or for some other reason can't be archived
+    def get(self, local_name, base_dir, sub_path=None):
         remote_name = local_name
-        remote_zipped_name = f'{remote_name}.tar.gz'
+        folder_path = Path(base_dir) / local_name
+        with FileLock(folder_path, mode='r'):
+            remote_etag = self._get_remote_manifest_etag(remote_name)
+            if remote_etag is not None and remote_etag == read_manifest(folder_path).get('etag'):
+                return
 
-        dir_path = Path(base_dir) / remote_name
-        dir_size = sum(f.stat().st_size for f in dir_path.glob('**/*') if f.is_file())
-        if (dir_size * 2) < psutil.virtual_memory().available:
-            old_cwd = os.getcwd()
-            fh = io.BytesIO()
-            with self._thread_lock:
-                os.chdir(base_dir)
-                with tarfile.open(fileobj=fh, mode='w:gz', compresslevel=compression_level) as tar:
-                    for path in dir_path.iterdir():
-                        if path.is_file() and path.name in SERVICE_FILES_NAMES:
-                            continue
-                        tar.add(path.relative_to(base_dir))
-                os.chdir(old_cwd)
-            fh.seek(0)
-
-            self.s3.upload_fileobj(
-                fh,
-                self.bucket,
-                remote_zipped_name
-            )
-        else:
-            shutil.make_archive(
-                os.path.join(base_dir, remote_name),
-                'gztar',
-                root_dir=base_dir,
-                base_dir=local_name
-            )
+        if remote_etag is None:
+            self._get_archive(local_name, base_dir)
+            return
 
-            self.s3.upload_file(
-                os.path.join(base_dir, remote_zipped_name),
-                self.bucket,
-                remote_zipped_name
+        # objects can be deleted if the manifest was changed after it was read: read it again and retry
+        for _ in range(self.get_attempts):
+            with FileLock(folder_path, mode='w'):
+                remote_manifest, remote_etag = self._get_remote_manifest(remote_name)
+                if remote_manifest is None:
+                    return
+                try:
+                    self._sync_from_remote(remote_name, folder_path, remote_manifest, remote_etag, sub_path)
+                    return
+                except S3ClientError as e:
+                    if self._is_not_found(e) is False:
+                        raise
+            logger.warning(f'Objects of resource {remote_name} were deleted during download, retry')
+        raise Exception(f'Can not get resource {remote_name}: objects of its manifest are missing in the storage')
+
+    def _sync_from_remote(
+        self, remote_name: str, folder_path: Path, remote_manifest: dict, remote_etag: str, sub_path: str = None
+    ):
+        """ make content of the local folder the same as in the manifest. Local manifest is written only if all
+            files are synced, so the next `get` repeats the sync after a failure
+
+            Args:
+                remote_name (str): name of the resource
+                folder_path (Path): local folder of the resource
+                remote_manifest (dict): manifest of the resource
+                remote_etag (str): etag of the manifest
+                sub_path (str): sync only this file/folder of the resource
+        """
+        local_manifest = read_manifest(folder_path)
+        local_files, _ = scan_folder(folder_path, local_manifest.get('files', {}), self.max_workers, sub_path)
+        remote_files = {k: v for k, v in remote_manifest['files'].items() if in_sub_path(k, sub_path)}
+
+        for relative_path in local_files.keys() - remote_files.keys():
+            (folder_path / relative_path).unlink()
+        for relative_path in remote_manifest.get('dirs', []):
+            if in_sub_path(relative_path, sub_path):
+                (folder_path / relative_path).mkdir(parents=True, exist_ok=True)
+
+        # hash -> files with this content
+        to_download = {}
+        for relative_path, record in remote_files.items():
+            if local_files.get(relative_path, {}).get('hash') != record['hash']:
+                to_download.setdefault(record['hash'], []).append((folder_path / relative_path, record))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda files: self._download_file(remote_name, *files[0]), to_download.values()))
+        for files in to_download.values():
+            for path, _ in files[1:]:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(files[0][0], path)
+
+        files = {}
+        for relative_path, record in remote_files.items():
+            stat = (folder_path / relative_path).stat()
+            files[relative_path] = {'hash': record['hash'], 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+        if sub_path is not None:
+            # other files are not synced, so etag is not changed
+            files, _ = merge_sub_path(local_manifest.get('files', {}), [], files, [], sub_path)
+            remote_etag = local_manifest.get('etag')
+        write_manifest(folder_path, {'etag': remote_etag, 'files': files})
+
+    @profiler.profile()
+    def put(self, local_name, base_dir, compression_level=9, sub_path=None):
+        """Upload changed files of the resource
+
+        Args:
+            local_name (str): name of resource
+            base_dir (str): path to folder with the resource
+            compression_level (int): not used, files are compressed with fast compression
+            sub_path (str): relative path of file/folder in the resource, upload only it if is set
+        """
+        remote_name = local_name
+        folder_path = Path(base_dir) / local_name
+        local_manifest = read_manifest(folder_path)
+        local_files = local_manifest.get('files', {})
+
+        remote_manifest, remote_etag = self._get_remote_manifest(remote_name)
+        remote_manifest_etag = remote_etag
+        if remote_manifest is None:
+            sub_path = None
+        remote_files = {} if remote_manifest is None else remote_manifest['files']
+        remote_dirs = [] if remote_manifest is None else remote_manifest.get('dirs', [])
+        remote_released = {} if remote_manifest is None else remote_manifest.get('released', {})
+        # hash -> compression of objects which are already in the bucket
+        stored = {record['hash']: record['compression'] for record in remote_files.values()}
+
+        files, dirs = scan_folder(folder_path, local_files, self.max_workers, sub_path)
+        to_upload = {}
+        for relative_path, record in files.items():
+            if record['hash'] not in stored:
+                to_upload.setdefault(record['hash'], folder_path / relative_path)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            compressions = executor.map(
+                lambda item: self._upload_file(remote_name, item[1], item[0]),
+                to_upload.items()
             )
-            os.remove(os.path.join(base_dir, remote_zipped_name))
+            for file_hash, compression in zip(to_upload.keys(), compressions):
+                stored[file_hash] = compression
+
+        manifest_files, manifest_dirs = merge_sub_path(
+            remote_files,
+            remote_dirs,
+            {
+                relative_path: {
+                    'hash': record['hash'],
+                    'size': record['size'],
+                    'compression': stored[record['hash']]
+                }
+                for relative_path, record in files.items()
+            },
+            dirs,
+            sub_path
+        )
 
-        last_modified = self._get_remote_last_modified(remote_zipped_name)
-        self._save_local_last_modified(base_dir, local_name, last_modified)
+        # objects which are not referenced anymore are kept during the grace period
+        now = time.time()
+        used_hashes = set(record['hash'] for record in manifest_files.values())
+        released = dict(remote_released)
+        for record in remote_files.values():
+            released.setdefault(record['hash'], now)
+        released = {
+            file_hash: released_at
+            for file_hash, released_at in released.items()
+            if file_hash not in used_hashes and now - released_at < self.gc_grace_period
+        }
+
+        manifest = {
+            'version': self.manifest_version,
+            'files': manifest_files,
+            'dirs': manifest_dirs,
+            'released': released
+        }
+        if manifest != remote_manifest:
+            remote_etag = self.s3.put_object(
+                Bucket=self.bucket,
+                Key=self._manifest_key(remote_name),
+                Body=json.dumps(manifest).encode()
+            )['ETag']
+
+            self._collect_garbage(remote_name, used_hashes | released.keys())
+            if remote_manifest is None:
+                # the resource could be stored by previous version as archive
+                self.s3.delete_object(Bucket=self.bucket, Key=f'{remote_name}.tar.gz')
+
+        if sub_path is not None:
+            files, _ = merge_sub_path(local_files, [], files, [], sub_path)
+            if local_manifest.get('etag') != remote_manifest_etag:
+                # other files of the local folder are not synced with the bucket
+                remote_etag = local_manifest.get('etag')
+        write_manifest(folder_path, {'etag': remote_etag, 'files': files})
 
     @profiler.profile()
     def delete(self, remote_name):
-        self.s3.delete_object(Bucket=self.bucket, Key=remote_name)
+        keys = []
+        paginator = self.s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=f'{remote_name}/'):
+            keys += [item['Key'] for item in page.get('Contents', [])]
+        keys.append(f'{remote_name}.tar.gz')
+        self._delete_keys(keys)
 
 
 def FsStore():
@@ -485,10 +999,32 @@ class FileStorage:
             compression_level=compression_level
         )
 
+    @staticmethod
+    def _sub_path(path: Union[str, Path]) -> Optional[str]:
+        """relative path of file/folder in the storage folder, None for the whole folder"""
+        path = Path(path)
+        if path.is_absolute():
+            raise TypeError('FSStorage got absolute path as argument')
+        path = path.as_posix()
+        if path == '.':
+            return None
+        return path
+
     @profiler.profile()
-    def push_path(self, path, compression_level: int = 9):
-        # TODO implement push per element
-        self.push(compression_level=compression_level)
+    def push_path(self, path: Union[str, Path], compression_level: int = 9):
+        """Upload only the file/folder of the storage folder
+
+        Args:
+            path (Union[str, Path]): path relative to the storage folder
+            compression_level (int)
+        """
+        with FileLock(self.folder_path, mode='r'):
+            self.fs_store.put(
+                str(self.folder_name),
+                str(self.resource_group_path),
+                compression_level=compression_level,
+                sub_path=self._sub_path(path)
+            )
 
     @profiler.profile()
     def pull(self):
@@ -501,9 +1037,20 @@ class FileStorage:
             pass
 
     @profiler.profile()
-    def pull_path(self, path):
-        # TODO implement pull per element
-        self.pull()
+    def pull_path(self, path: Union[str, Path]):
+        """Download only the file/folder of the storage folder
+
+        Args:
+            path (Union[str, Path]): path relative to the storage folder
+        """
+        try:
+            self.fs_store.get(
+                str(self.folder_name),
+                str(self.resource_group_path),
+                sub_path=self._sub_path(path)
+            )
+        except (FileNotFoundError, S3ClientError):
+            pass
 
     @profiler.profile()
     def file_set(self, name, content):
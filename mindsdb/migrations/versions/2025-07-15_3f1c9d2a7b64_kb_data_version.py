@@ -0,0 +1,28 @@
+"""kb_data_version
+
+Revision ID: 3f1c9d2a7b64
+Revises: 608e376c19a7
+Create Date: 2025-07-15 12:04:51.218335
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import mindsdb.interfaces.storage.db  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f1c9d2a7b64"
+down_revision = "608e376c19a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("knowledge_base", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("data_version", sa.Integer(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("knowledge_base", schema=None) as batch_op:
+        batch_op.drop_column("data_version")
@@ -0,0 +1,32 @@
+"""plan_cache_version
+
+Revision ID: c5a8e1f0d3b2
+Revises: 3f1c9d2a7b64
+Create Date: 2025-07-22 10:41:07.512943
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import mindsdb.interfaces.storage.db  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision = "c5a8e1f0d3b2"
+down_revision = "3f1c9d2a7b64"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "plan_cache_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("company_id", sa.Integer(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.UniqueConstraint("company_id", name="unique_plan_cache_version_company_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("plan_cache_version")
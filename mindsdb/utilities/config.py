@@ -179,8 +179,23 @@ class Config:
                     "restart_on_failure": True,
                     "max_restart_count": 1,
                     "max_restart_interval_seconds": 60,
+                    # 'threading' - thread per connection, 'asyncio' - event loop and pool of 'workers' threads
+                    "server": "threading",
+                    "workers": 16,
+                    # seconds to wait for every answer of the client during the handshake, 'asyncio' server only
+                    "handshake_timeout": 10,
                 },
-                "postgres": {"host": api_host, "port": "55432", "database": "mindsdb"},
+                "postgres": {
+                    "host": api_host,
+                    "port": "55432",
+                    "database": "mindsdb",
+                    # 'threading' - thread per connection, 'asyncio' - event loop and pool of 'workers' threads
+                    "server": "threading",
+                    "workers": 16,
+                    # seconds to wait for every answer of the client during the handshake, 'asyncio' server only
+                    "handshake_timeout": 10,
+                },
+                "flight": {"host": api_host, "port": "47336", "partition_rows": 1000000, "result_ttl": 600},
                 "litellm": {
                     "host": "0.0.0.0",  # API server binds to all interfaces by default
                     "port": "8000",
@@ -201,6 +216,70 @@ class Config:
             "data_catalog": {
                 "enabled": False,
             },
+            "information_schema": {
+                "metadata_cache": {
+                    "enabled": True,
+                    "ttl": 300,  # seconds, expired metadata is refreshed in the background
+                    "max_records": 100000,
+                    "workers": 8,  # threads which load metadata from integrations
+                    "timeout": 10,  # seconds to wait for one integration
+                    "persist": False,  # use data catalog (if enabled) as a persistent storage of columns
+                },
+            },
+            "query_execution": {
+                "parallel_steps": True,  # execute independent steps of the plan concurrently
+                "workers": 8,  # max number of steps executed at the same time by one query
+                "pool_size": 32,  # threads which execute steps, shared by all queries of the process
+                "max_per_integration": 2,  # max number of concurrent fetches from one integration by one query
+                "fuse_steps": True,  # execute chains of in-memory steps (join, union, select) as one DuckDB query
+            },
+            "query_stats": {
+                "enabled": True,  # collect statistics of executed steps, see information_schema.query_stats
+                "max_records": 10000,  # max number of stored steps, the oldest are dropped
+                "slow_query_ms": 10000,  # log queries which steps take longer, null to disable
+            },
+            "query_memory": {
+                "release_results": True,  # drop results of the steps as soon as no next step uses them
+                "max_query_mb": None,  # memory of the results held by one query, null to disable
+                "max_company_mb": None,  # memory of the results held by all queries of the company, null to disable
+                "on_exceed": "abort",  # 'abort' the query or 'spill' its largest results to disk
+            },
+            "admission_control": {
+                "enabled": True,
+                # queries which read only information_schema and log are executed in the light pool
+                "light": {"max_concurrent": 64, "max_per_company": None},
+                "heavy": {"max_concurrent": 32, "max_per_company": None},
+                "queue_timeout": 300,  # seconds, max time to wait for a free slot, null to wait forever
+                "company_weights": {},  # company_id -> share of slots when queries of companies wait, default 1
+            },
+            "plan_cache": {
+                "enabled": True,
+                "ttl": 60,  # seconds, plans are also dropped on changes of projects, integrations, models and views
+                "max_size": 1000,
+            },
+            "agents": {
+                "schema_cache": {
+                    "enabled": True,
+                    "ttl": 600,  # seconds, expired descriptions of tables are refreshed in the background
+                    "max_tables": 10000,
+                    "workers": 4,  # threads which load descriptions of tables
+                },
+            },
+            "knowledge_bases": {
+                "chunking": {
+                    "workers": 0,  # 0 - use number of CPUs
+                    "batch_size": 500,  # documents per worker task
+                    "min_documents": 2000,  # smaller inserts are chunked in the current thread
+                },
+                "contextual": {
+                    "cache_max_size": 10000,  # number of cached documents with contexts of their chunks
+                },
+                "query_cache": {
+                    "enabled": True,
+                    "ttl": 300,  # seconds
+                    "max_size_mb": 256,
+                },
+            },
         }
         # endregion
 
@@ -0,0 +1,138 @@
+"""Import time profiler of the startup, the same as `python -X importtime` but written to a report file.
+
+Enabled by the env variable MINDSDB_STARTUP_PROFILE=1, it is inherited by the spawned API processes, so every
+process writes its own report to `<paths.log>/startup/<process name>.txt`.
+"""
+
+import os
+import time
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+ENV_NAME = "MINDSDB_STARTUP_PROFILE"
+
+
+@dataclass
+class ImportRecord:
+    name: str
+    depth: int
+    # microseconds, as in the output of `-X importtime`
+    self_time: int
+    cumulative_time: int
+
+
+class ImportProfiler:
+    """Measures the time of every module import in the thread which started the profiler.
+
+    The function of importlib which is used by the `import` statement (`_find_and_load`) is wrapped, so the
+    measured time includes the search of the module, the import of its parent packages and its execution.
+    """
+
+    def __init__(self):
+        self.records: List[ImportRecord] = []
+        self.start_time: Optional[float] = None
+        self._thread_id = None
+        self._stack: List[int] = []
+        self._original = None
+
+    @property
+    def is_active(self) -> bool:
+        return self._original is not None
+
+    def start(self):
+        if self.is_active:
+            return
+        import importlib._bootstrap as bootstrap
+
+        self.start_time = time.perf_counter()
+        self._thread_id = threading.get_ident()
+        self._original = bootstrap._find_and_load
+        original = self._original
+
+        def find_and_load(name, import_):
+            if threading.get_ident() != self._thread_id:
+                return original(name, import_)
+
+            depth = len(self._stack)
+            self._stack.append(0)
+            start = time.perf_counter_ns()
+            try:
+                return original(name, import_)
+            finally:
+                cumulative = (time.perf_counter_ns() - start) // 1000
+                children = self._stack.pop()
+                if self._stack:
+                    self._stack[-1] += cumulative
+                self.records.append(ImportRecord(name, depth, cumulative - children, cumulative))
+
+        bootstrap._find_and_load = find_and_load
+
+    def stop(self):
+        if not self.is_active:
+            return
+        import importlib._bootstrap as bootstrap
+
+        bootstrap._find_and_load = self._original
+        self._original = None
+
+    def get_report(self, process_name: str, top: int = 30) -> str:
+        """Render the profile
+
+        Args:
+            process_name (str): name of the process for the header of the report
+            top (int): how many slowest modules to list in the summary
+
+        Returns:
+            str: the summary and the list of the imports in `-X importtime` format
+        """
+        total = sum(record.cumulative_time for record in self.records if record.depth == 0)
+        elapsed = time.perf_counter() - self.start_time if self.start_time is not None else 0
+        lines = [
+            f"process: {process_name}, pid: {os.getpid()}",
+            f"time since the start of profiling: {elapsed:.3f}s, imports: {total / 1e6:.3f}s,"
+            f" modules: {len(self.records)}",
+            "",
+            f"slowest {top} modules by self time:",
+        ]
+        for record in sorted(self.records, key=lambda x: x.self_time, reverse=True)[:top]:
+            lines.append(f"{record.self_time:>10} us  {record.name}")
+        lines += ["", "import time: self [us] | cumulative | imported package"]
+        for record in self.records:
+            lines.append(
+                f"import time: {record.self_time:>10} | {record.cumulative_time:>10} | {'  ' * record.depth}{record.name}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, process_name: str, directory: Path) -> Path:
+        """Save the report to `<directory>/<process_name>.txt`"""
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{process_name}.txt"
+        path.write_text(self.get_report(process_name))
+        return path
+
+
+profiler = ImportProfiler()
+
+
+def start_from_env():
+    """Start the profiler if it is enabled by the env variable"""
+    if os.environ.get(ENV_NAME, "").lower() in ("1", "true"):
+        profiler.start()
+
+
+def write_startup_report(process_name: str):
+    """Save the import profile of the process to the log directory and stop the profiler"""
+    if not profiler.is_active:
+        return
+    from mindsdb.utilities.config import config
+    from mindsdb.utilities import log
+
+    logger = log.getLogger(__name__)
+    profiler.stop()
+    try:
+        path = profiler.write_report(process_name, Path(config.paths["log"]) / "startup")
+        logger.info(f"Startup import profile of {process_name} is saved to {path}")
+    except Exception as e:
+        logger.warning(f"Can't save the startup import profile: {e}")
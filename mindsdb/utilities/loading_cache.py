@@ -0,0 +1,153 @@
+import time
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+class _Record:
+    __slots__ = ("value", "loaded_at")
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.loaded_at = time.monotonic()
+
+
+class LoadingCache:
+    """Base of process-wide caches of values which are loaded from slow sources (integrations) in background threads.
+
+    - A missed record is loaded once, other callers which request the same key wait for the same load.
+    - An expired record is returned as is and refreshed in the background.
+    - Older records are evicted when there are more than `max_size` of them.
+    - Loaders are executed in the threads of the cache, in the context (company, user) of the caller.
+      A loader must not use objects of the caller which are not thread-safe, like its session.
+    - Values for which `_is_cacheable` returns False (failed lookups) are returned but not stored.
+    - Invalidation also covers loads which are running: their results are returned to the callers which
+      are already waiting for them, but are not stored, and the next request starts a new load.
+    """
+
+    thread_name_prefix = "loading_cache"
+
+    def __init__(self, enabled: bool, ttl: float, max_size: int, workers: int):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_size = max_size
+        self.workers = workers
+
+        self._records: OrderedDict[Hashable, _Record] = OrderedDict()
+        self._pending: Dict[Hashable, Future] = {}
+        # token of the running load of the key, it is dropped when the key is invalidated
+        self._loads: Dict[Hashable, object] = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(self.workers, 1), thread_name_prefix=self.thread_name_prefix
+            )
+        return self._executor
+
+    def _is_cacheable(self, value: Any) -> bool:
+        return True
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], token: object) -> Any:
+        try:
+            value = loader()
+            if self.enabled and self._is_cacheable(value):
+                with self._lock:
+                    # the key could be invalidated while it was loading: the value can be stale
+                    if self._loads.get(key) is token:
+                        self._records[key] = _Record(value)
+                        self._records.move_to_end(key)
+                        while len(self._records) > self.max_size:
+                            self._records.popitem(last=False)
+            return value
+        finally:
+            with self._lock:
+                if self._loads.get(key) is token:
+                    del self._loads[key]
+                    self._pending.pop(key, None)
+            # the thread is reused by other loads: close its db session
+            if db.session is not None:
+                db.session.remove()
+
+    def _submit(self, key: Hashable, loader: Callable[[], Any]) -> Future:
+        """Start loading of the record if it is not loading yet. Must be called under the lock"""
+        future = self._pending.get(key)
+        if future is None:
+            token = object()
+            run_context = contextvars.copy_context()
+            self._loads[key] = token
+            future = self._get_executor().submit(run_context.run, self._load, key, loader, token)
+            self._pending[key] = future
+        return future
+
+    def _is_fresh(self, record: _Record, now: float) -> bool:
+        return now - record.loaded_at <= self.ttl
+
+    def _get_or_submit(
+        self, key: Hashable, loader: Callable[[], Any], now: float
+    ) -> Tuple[Optional[_Record], Optional[Future]]:
+        """Get the cached record or start loading of it. Stale record is returned and refreshed in the background.
+        Must be called under the lock
+
+        Returns:
+            Tuple[Optional[_Record], Optional[Future]]: (record, None) if the key is cached, (None, load) otherwise
+        """
+        record = self._records.get(key) if self.enabled else None
+        if record is None:
+            return None, self._submit(key, loader)
+        self._records.move_to_end(key)
+        if not self._is_fresh(record, now):
+            self._submit(key, loader)
+        return record, None
+
+    def _invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove records which keys match the predicate
+
+        Returns:
+            int: number of removed records
+        """
+        with self._lock:
+            keys = [key for key in self._records if predicate(key)]
+            for key in keys:
+                del self._records[key]
+            for key in [key for key in self._loads if predicate(key)]:
+                del self._loads[key]
+                del self._pending[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._loads.clear()
+            self._pending.clear()
+
+
+T = TypeVar("T")
+
+
+class SharedInstance(Generic[T]):
+    """Process-wide instance which is created on the first use"""
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+
+    def get_if_created(self) -> Optional[T]:
+        return self._instance
@@ -3,6 +3,8 @@ import pickle
 from walrus import Database
 from pandas import DataFrame
 
+import mindsdb.utilities.profiler as profiler
+from mindsdb.utilities import otel
 from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities.config import Config
 from mindsdb.utilities.ml_task_queue.utils import RedisKey, to_bytes
@@ -58,8 +60,13 @@ class MLTaskProducer(BaseRedisQueue):
             Returns:
                 Task: object representing the task
         '''
+        with profiler.Context('ml task queue: send', task_type=task_type.value.decode(), model_id=model_id):
+            return self._send(task_type, model_id, payload, dataframe)
+
+    def _send(self, task_type: ML_TASK_TYPE, model_id: int, payload: dict, dataframe: DataFrame = None) -> Task:
         try:
-            payload = pickle.dumps(payload, protocol=5)
+            # the consumer continues the trace of the sender, see ProcessCache.apply_async
+            payload = pickle.dumps({**payload, 'trace_context': otel.inject_trace_context()}, protocol=5)
             redis_key = RedisKey.new()
             message = {
                 "task_type": task_type.value,
@@ -1,22 +1,69 @@
 import os
+from contextlib import nullcontext
 
 # By default, we have Open Telemetry SDK enabled on all envs, except for local which is disabled by default.
-OTEL_SDK_DISABLED = (os.getenv("OTEL_SDK_DISABLED", "false").lower() == "true"
-                     or os.getenv("OTEL_SERVICE_ENVIRONMENT", "local").lower() == "local")
+OTEL_SDK_DISABLED = (
+    os.getenv("OTEL_SDK_DISABLED", "false").lower() == "true"
+    or os.getenv("OTEL_SERVICE_ENVIRONMENT", "local").lower() == "local"
+)
 
 # If you want to enable Open Telemetry on local for some reason please set OTEL_SDK_FORCE_RUN to true
 OTEL_SDK_FORCE_RUN = os.getenv("OTEL_SDK_FORCE_RUN", "false").lower() == "true"
 
 OTEL_ENABLED = not OTEL_SDK_DISABLED or OTEL_SDK_FORCE_RUN
 
+__all__ = [
+    "OTEL_ENABLED",
+    "TRACING_ENABLED",
+    "trace",
+    "increment_otel_query_request_counter",
+    "start_span",
+    "set_span_attributes",
+    "inject_trace_context",
+    "attach_trace_context",
+]
+
+
 def increment_otel_query_request_counter(metadata: dict) -> None:
     pass
 
+
+# region no-op tracing, it is replaced by mindsdb.utilities.otel.spans if tracing is enabled
+TRACING_ENABLED = False
+
+
+def start_span(name: str, attributes: dict = None):
+    return nullcontext()
+
+
+def set_span_attributes(attributes: dict) -> None:
+    pass
+
+
+def inject_trace_context() -> dict:
+    return {}
+
+
+def attach_trace_context(carrier: dict):
+    return nullcontext()
+
+
+# endregion
+
 trace = None
 if OTEL_ENABLED:
     try:
-        from mindsdb.utilities.otel.prepare import trace
+        from mindsdb.utilities.otel.prepare import trace, OTEL_TRACING_DISABLED
         from mindsdb.utilities.otel.metric_handlers import increment_otel_query_request_counter
+
+        if not OTEL_TRACING_DISABLED:
+            from mindsdb.utilities.otel.spans import (
+                start_span,
+                set_span_attributes,
+                inject_trace_context,
+                attach_trace_context,
+            )
+
+            TRACING_ENABLED = True
     except Exception:
         pass
-
@@ -0,0 +1,68 @@
+from contextlib import contextmanager
+from typing import Optional
+
+from opentelemetry import trace, context as otel_context
+from opentelemetry.propagate import inject, extract
+
+tracer = trace.get_tracer("mindsdb")
+
+_ATTRIBUTE_TYPES = (bool, str, bytes, int, float)
+
+
+def _clean_attributes(attributes: Optional[dict]) -> dict:
+    # span attributes can be only primitive types, None is not allowed
+    if not attributes:
+        return {}
+    return {
+        key: value if isinstance(value, _ATTRIBUTE_TYPES) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
+
+
+def start_span(name: str, attributes: Optional[dict] = None):
+    """Start new span as a child of the current one
+
+    Args:
+        name (str): name of the span
+        attributes (dict): attributes of the span
+
+    Returns:
+        context manager which makes the span current
+    """
+    return tracer.start_as_current_span(name, attributes=_clean_attributes(attributes))
+
+
+def set_span_attributes(attributes: dict) -> None:
+    """Add attributes to the current span"""
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attributes(_clean_attributes(attributes))
+
+
+def inject_trace_context() -> dict:
+    """Get the current trace context to send it to another process
+
+    Returns:
+        dict: W3C trace context headers
+    """
+    carrier = {}
+    inject(carrier)
+    return carrier
+
+
+@contextmanager
+def attach_trace_context(carrier: Optional[dict]):
+    """Make the trace context received from another process current
+
+    Args:
+        carrier (dict): result of inject_trace_context
+    """
+    if not carrier:
+        yield
+        return
+    token = otel_context.attach(extract(carrier))
+    try:
+        yield
+    finally:
+        otel_context.detach(token)
@@ -5,7 +5,9 @@ from mindsdb.utilities.profiler.profiler import (
     profile,
     enable,
     disable,
-    set_meta
+    set_meta,
+    set_attributes,
+    profiling_enabled
 )
 
 __all__ = [
@@ -15,5 +17,7 @@ __all__ = [
     'profile',
     'enable',
     'disable',
-    'set_meta'
+    'set_meta',
+    'set_attributes',
+    'profiling_enabled'
 ]
@@ -1,11 +1,16 @@
 import time
+import threading
 from datetime import datetime, timezone
 from functools import wraps
 
 import mindsdb.utilities.hooks as hooks
+from mindsdb.utilities import otel
 from mindsdb.utilities.config import Config
 from mindsdb.utilities.context import context as ctx
 
+# profiling data of the context is shared with threads which execute steps of the query in parallel
+_level_lock = threading.Lock()
+
 
 def _get_current_node(profiling: dict) -> dict:
     """ return the node that the pointer points to
@@ -69,6 +74,20 @@ def stop_current_node():
         profiling['pointer'] = None
 
 
+def set_attributes(**kwargs):
+    """ Add attributes (rows, integration, model, etc) to the current node of profiling and
+        to the current span of the trace. None values are skipped
+
+        Args:
+            **kwargs (dict): attributes to add
+    """
+    if profiling_enabled() is True and ctx.profiling['pointer'] is not None:
+        attributes = _get_current_node(ctx.profiling).setdefault('attributes', {})
+        attributes.update({key: value for key, value in kwargs.items() if value is not None})
+    if otel.TRACING_ENABLED:
+        otel.set_span_attributes(kwargs)
+
+
 def set_meta(**kwargs):
     """ Add any additional info to profiling data
 
@@ -106,7 +125,8 @@ def profiling_enabled():
 def start(tag):
     """ add new node to profiling data
     """
-    ctx.profiling['level'] += 1
+    with _level_lock:
+        ctx.profiling['level'] += 1
     if profiling_enabled() is True:
         start_node(tag)
 
@@ -114,19 +134,37 @@ def start(tag):
 def stop():
     """ finalize current node and move pointer up
     """
-    ctx.profiling['level'] -= 1
+    with _level_lock:
+        ctx.profiling['level'] -= 1
     if profiling_enabled() is True:
         stop_current_node()
 
 
 class Context:
-    def __init__(self, tag):
+    """ Node of profiling and span of the trace (if OpenTelemetry tracing is enabled)
+
+        Args:
+            tag (str): name of the node
+            **attributes (dict): attributes of the node, see set_attributes
+    """
+
+    def __init__(self, tag, **attributes):
         self.tag = tag
+        self.attributes = attributes
+        self.span = None
 
     def __enter__(self):
         start(self.tag)
+        if otel.TRACING_ENABLED:
+            self.span = otel.start_span(self.tag)
+            self.span.__enter__()
+        if len(self.attributes) > 0:
+            set_attributes(**self.attributes)
 
     def __exit__(self, exc_type, exc_value, traceback):
+        if self.span is not None:
+            self.span.__exit__(exc_type, exc_value, traceback)
+            self.span = None
         stop()
 
 
@@ -137,6 +175,9 @@ def profile(tag: str = None):
             if profiling_enabled() is True:
                 with Context(tag or f'{function.__name__}|{function.__module__}'):
                     result = function(*args, **kwargs)
+            elif otel.TRACING_ENABLED:
+                with otel.start_span(tag or f'{function.__name__}|{function.__module__}'):
+                    result = function(*args, **kwargs)
             else:
                 result = function(*args, **kwargs)
             return result
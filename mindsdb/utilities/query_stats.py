@@ -0,0 +1,142 @@
+import time
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass, astuple, fields
+from typing import List, Optional
+
+from mindsdb.utilities.config import config
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+@dataclass
+class StepStats:
+    """Statistics of one executed step of the plan"""
+
+    query_id: int
+    step_num: int
+    step: str
+    integration: Optional[str] = None
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    bytes_out: Optional[int] = None
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    cache_hit: bool = False
+    error: Optional[str] = None
+
+
+STEP_STATS_COLUMNS = [f.name for f in fields(StepStats)]
+
+
+def get_result_size(result) -> tuple:
+    """Get number of rows and size in memory of the step result without fetching it
+
+    Args:
+        result (ResultSet): result of the step
+
+    Returns:
+        tuple: (rows, bytes), items are None if the result is not fetched
+    """
+    if result is None or result.is_deferred:
+        return None, None
+    df = result.get_raw_df()
+    # shallow: deep memory usage of object columns costs as much as the copy of them
+    return len(df), int(df.memory_usage(index=False, deep=False).sum())
+
+
+class StepTimer:
+    """Measures wall and cpu time of the step. CPU time is the time of the current thread,
+    steps executed in parallel are measured independently
+    """
+
+    __slots__ = ("wall_start", "cpu_start")
+
+    def __init__(self):
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+
+    def stop(self, stats: StepStats):
+        stats.wall_time = time.perf_counter() - self.wall_start
+        stats.cpu_time = time.thread_time() - self.cpu_start
+
+
+class QueryStatsStorage:
+    """Ring buffer with statistics of the steps of recently executed queries.
+
+    Records of the query are added at once when the query is finished. If total time of the steps is longer than
+    `query_stats.slow_query_ms`, the query is written to the log with all its steps.
+    """
+
+    def __init__(self):
+        self._records = deque()
+        self._lock = threading.Lock()
+        self._query_ids = itertools.count(1)
+
+    def new_query_id(self) -> int:
+        return next(self._query_ids)
+
+    def add_query(
+        self,
+        sql: str,
+        database: Optional[str],
+        company_id,
+        steps: List[StepStats],
+        plan_cache_hit: bool,
+        wall_time: float,
+    ):
+        """Store statistics of the finished query
+
+        Args:
+            sql (str): text of the query
+            database (str): default database of the query
+            company_id: owner of the query
+            steps (List[StepStats]): executed steps
+            plan_cache_hit (bool): plan of the query was taken from the cache
+            wall_time (float): seconds, time of the execution of all steps
+        """
+        stats_config = config["query_stats"]
+        if not stats_config["enabled"] or len(steps) == 0:
+            return
+
+        finished_at = time.time()
+        with self._lock:
+            for step in steps:
+                self._records.append((company_id, finished_at, sql, database, plan_cache_hit) + astuple(step))
+            while len(self._records) > stats_config["max_records"]:
+                self._records.popleft()
+
+        slow_query_ms = stats_config["slow_query_ms"]
+        if slow_query_ms is not None and wall_time * 1000 >= slow_query_ms:
+            lines = [
+                f"  step {step.step_num} {step.step}"
+                f"{'' if step.integration is None else f' ({step.integration})'}:"
+                f" wall={step.wall_time * 1000:.1f}ms cpu={step.cpu_time * 1000:.1f}ms"
+                f" rows_in={step.rows_in} rows_out={step.rows_out} bytes={step.bytes_out}"
+                f"{' cache_hit' if step.cache_hit else ''}"
+                f"{'' if step.error is None else f' error={step.error}'}"
+                for step in steps
+            ]
+            logger.warning(
+                f"Slow query ({wall_time * 1000:.1f}ms, plan cache {'hit' if plan_cache_hit else 'miss'}): {sql}\n"
+                + "\n".join(lines)
+            )
+
+    def get_records(self, company_id) -> List[tuple]:
+        """Get stored records of the company
+
+        Returns:
+            List[tuple]: records, fields are: finished_at, sql, database, plan_cache_hit and fields of StepStats
+        """
+        with self._lock:
+            records = list(self._records)
+        return [record[1:] for record in records if record[0] == company_id]
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+
+query_stats = QueryStatsStorage()
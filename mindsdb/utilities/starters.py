@@ -1,3 +1,9 @@
+from mindsdb.utilities.import_profiler import start_from_env, write_startup_report
+
+# the module is the first one imported by a spawned API process
+start_from_env()
+
+
 def start_http(*args, **kwargs):
     from mindsdb.utilities.log import initialize_logging
 
@@ -5,6 +11,8 @@ def start_http(*args, **kwargs):
 
     from mindsdb.api.http.start import start
 
+    write_startup_report("http")
+
     start(*args, **kwargs)
 
 
@@ -15,6 +23,8 @@ def start_mysql(*args, **kwargs):
 
     from mindsdb.api.mysql.start import start
 
+    write_startup_report("mysql")
+
     start(*args, **kwargs)
 
 
@@ -25,6 +35,8 @@ def start_postgres(*args, **kwargs):
 
     from mindsdb.api.postgres.start import start
 
+    write_startup_report("postgres")
+
     start(*args, **kwargs)
 
 
@@ -35,6 +47,8 @@ def start_tasks(*args, **kwargs):
 
     from mindsdb.interfaces.tasks.task_monitor import start
 
+    write_startup_report("tasks")
+
     start(*args, **kwargs)
 
 
@@ -45,6 +59,8 @@ def start_ml_task_queue(*args, **kwargs):
 
     from mindsdb.utilities.ml_task_queue.consumer import start
 
+    write_startup_report("ml_task_queue")
+
     start(*args, **kwargs)
 
 
@@ -55,6 +71,8 @@ def start_scheduler(*args, **kwargs):
 
     from mindsdb.interfaces.jobs.scheduler import start
 
+    write_startup_report("scheduler")
+
     start(*args, **kwargs)
 
 
@@ -66,4 +84,18 @@ def start_litellm(*args, **kwargs):
 
     from mindsdb.api.litellm.start import start
 
+    write_startup_report("litellm")
+
+    start(*args, **kwargs)
+
+
+def start_flight(*args, **kwargs):
+    from mindsdb.utilities.log import initialize_logging
+
+    initialize_logging("flight")
+
+    from mindsdb.api.flight.start import start
+
+    write_startup_report("flight")
+
     start(*args, **kwargs)
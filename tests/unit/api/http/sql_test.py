@@ -0,0 +1,77 @@
+import json
+from http import HTTPStatus
+
+import pandas as pd
+import pyarrow as pa
+
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.http.result_stream import ARROW_STREAM_MIME, NDJSON_MIME, iter_arrow
+
+QUERY = "SELECT 1 AS x, 'a' AS y, 1.5 AS z UNION ALL SELECT 2, NULL, NULL"
+
+
+def test_query_json(client):
+    response = client.post("/api/sql/query", json={"query": QUERY})
+    assert response.status_code == HTTPStatus.OK
+    assert response.content_type == "application/json"
+    assert response.json["data"] == [[1, "a", 1.5], [2, None, None]]
+
+
+def test_query_ndjson(client):
+    response = client.post("/api/sql/query", json={"query": QUERY}, headers={"Accept": NDJSON_MIME})
+    assert response.status_code == HTTPStatus.OK
+    assert response.mimetype == NDJSON_MIME
+
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert lines[0]["type"] == "table"
+    assert lines[0]["column_names"] == ["x", "y", "z"]
+    assert "context" in lines[0]
+    assert lines[1:] == [[1, "a", 1.5], [2, None, None]]
+
+
+def test_query_arrow(client):
+    response = client.post("/api/sql/query", json={"query": QUERY}, headers={"Accept": ARROW_STREAM_MIME})
+    assert response.status_code == HTTPStatus.OK
+    assert response.mimetype == ARROW_STREAM_MIME
+
+    table = pa.ipc.open_stream(response.data).read_all()
+    assert table.column_names == ["x", "y", "z"]
+    assert table.to_pydict() == {"x": [1, 2], "y": ["a", None], "z": [1.5, None]}
+    assert "db" in json.loads(table.schema.metadata[b"context"])
+
+
+def test_iter_arrow_chunks():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 5],
+            # nulls in the first chunk, values later
+            "b": [None, None, 3, None, 5],
+            # mixed types in a later chunk
+            "c": ["x", "y", 1, "z", None],
+        },
+        dtype=object,
+    )
+    df["a"] = df["a"].astype("int64")
+    result_set = ResultSet.from_df(df)
+
+    parts = list(iter_arrow(result_set, {"db": "mindsdb"}, chunk_size=2))
+    reader = pa.ipc.open_stream(b"".join(parts))
+    batches = list(reader)
+    # batches are made from chunks of the table
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert reader.schema.field("b").type == pa.int64()
+    assert pa.Table.from_batches(batches).to_pydict() == {
+        "a": [1, 2, 3, 4, 5],
+        "b": [None, None, 3, None, 5],
+        "c": ["x", "y", "1", "z", None],
+    }
+
+
+def test_query_arrow_not_table(client):
+    # other responses are json
+    response = client.post(
+        "/api/sql/query", json={"query": "SET autocommit = 1"}, headers={"Accept": ARROW_STREAM_MIME}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.content_type == "application/json"
+    assert response.json["type"] == "ok"
@@ -0,0 +1,130 @@
+import time
+import threading
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from mindsdb.api.executor.exceptions import AdmissionTimeoutError
+from mindsdb.api.executor.sql_query.admission_control import AdmissionController, HEAVY_POOL, LIGHT_POOL
+from mindsdb.utilities.config import config
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+def admission_config(**kwargs):
+    return {
+        "enabled": True,
+        "light": {"max_concurrent": 10, "max_per_company": None},
+        "heavy": {"max_concurrent": 1, "max_per_company": None},
+        "queue_timeout": 5,
+        "company_weights": {},
+        **kwargs,
+    }
+
+
+class TestAdmissionControllerUnit:
+    def run_in_thread(self, controller, company_id, order, pool=HEAVY_POOL):
+        def run():
+            ticket = controller.acquire(company_id, pool)
+            order.append(company_id)
+            controller.release(ticket)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def wait_queued(self, controller, count, pool=HEAVY_POOL):
+        for _ in range(100):
+            if controller.get_stats()[pool]["queued"] == count:
+                return
+            time.sleep(0.01)
+        raise AssertionError("queries are not queued")
+
+    def test_fair_queue(self):
+        controller = AdmissionController()
+        with patch.dict(config["admission_control"], admission_config(company_weights={"2": 2})):
+            ticket = controller.acquire(1, HEAVY_POOL)
+            # the slot is taken, nested query of the same context doesn't take another one
+            assert controller.acquire(1, HEAVY_POOL) is None
+
+            order = []
+            threads = []
+            # company 1 queued 4 queries before company 2
+            for company_id in [1, 1, 1, 1, 2, 2, 2, 2]:
+                threads.append(self.run_in_thread(controller, company_id, order))
+                self.wait_queued(controller, len(threads))
+
+            # queries of other pool are not blocked
+            light_order = []
+            self.run_in_thread(controller, 1, light_order, pool=LIGHT_POOL).join()
+            assert light_order == [1]
+
+            controller.release(ticket)
+            for thread in threads:
+                thread.join()
+            # company 1 has already got a slot, company 2 has double weight
+            assert order == [2, 2, 1, 2, 2, 1, 1, 1]
+            assert controller.get_stats()[HEAVY_POOL] == {"active": 0, "queued": 0}
+
+    def test_limits(self):
+        controller = AdmissionController()
+        config_patch = admission_config(
+            heavy={"max_concurrent": 2, "max_per_company": 1},
+            queue_timeout=0.1,
+        )
+        with patch.dict(config["admission_control"], config_patch):
+            ticket = controller.acquire(1, HEAVY_POOL)
+            thread_errors = []
+
+            def run(company_id):
+                try:
+                    controller.release(controller.acquire(company_id, HEAVY_POOL))
+                except AdmissionTimeoutError as e:
+                    thread_errors.append(e)
+
+            # company 1 has used its slot
+            thread = threading.Thread(target=run, args=(1,))
+            thread.start()
+            thread.join()
+            assert len(thread_errors) == 1
+
+            # another company is admitted
+            thread = threading.Thread(target=run, args=(2,))
+            thread.start()
+            thread.join()
+            assert len(thread_errors) == 1
+
+            controller.release(ticket)
+            assert controller.get_stats()[HEAVY_POOL] == {"active": 0, "queued": 0}
+
+
+class TestAdmissionControl(BaseExecutorDummyML):
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_query_pools(self, data_handler):
+        from mindsdb.api.executor.sql_query import admission_control
+
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+
+        pools = []
+        acquire = admission_control.admission_controller.acquire
+
+        def acquire_spy(company_id, pool_name):
+            pools.append(pool_name)
+            return acquire(company_id, pool_name)
+
+        with patch.object(admission_control.admission_controller, "acquire", acquire_spy):
+            self.run_sql("select * from information_schema.tables")
+            self.run_sql("select * from pg.tbl1")
+        assert pools == [admission_control.LIGHT_POOL, admission_control.HEAVY_POOL]
+        assert admission_control.admission_controller.get_stats()[admission_control.HEAVY_POOL]["active"] == 0
+
+        # no free slots
+        from mindsdb.api.executor.exceptions import AdmissionTimeoutError
+        from mindsdb.utilities.config import config
+
+        config_patch = {"heavy": {"max_concurrent": 0, "max_per_company": None}, "queue_timeout": 0.1}
+        with patch.dict(config["admission_control"], config_patch):
+            with pytest.raises(AdmissionTimeoutError):
+                self.run_sql("select * from pg.tbl1")
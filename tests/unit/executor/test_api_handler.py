@@ -72,9 +72,17 @@ class TestApiHandler(BaseExecutorDummyML):
             [125, "feature", "open"],
         ]
 
+        class PaginatedList:
+            def __init__(self, items, per_page=2):
+                self.items = items
+                self.per_page = per_page
+
+            def get_page(self, page):
+                return self.items[page * self.per_page : (page + 1) * self.per_page]
+
         get_issues = Github().get_repo().get_issues
 
-        get_issues.return_value = [Issue(*row) for row in data]
+        get_issues.return_value = PaginatedList([Issue(*row) for row in data])
 
         ret = self.run_sql("""
             select max(number) number, title from gh.issues
@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow.flight as flight
+import pytest
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+class TestFlightServer(BaseExecutorDummyML):
+    def start_server(self, **kwargs):
+        from mindsdb.api.flight.flight_server import FlightSqlServer
+
+        server = FlightSqlServer("grpc://127.0.0.1:0", **kwargs)
+        client = flight.FlightClient(f"grpc://127.0.0.1:{server.port}")
+        return server, client
+
+    def get_call_options(self, client, username="mindsdb", password=""):
+        header = client.authenticate_basic_token(username, password)
+        return flight.FlightCallOptions(headers=[header])
+
+    def test_auth(self):
+        server, client = self.start_server()
+        try:
+            descriptor = flight.FlightDescriptor.for_command(b"select 1")
+            with pytest.raises(flight.FlightUnauthenticatedError):
+                client.get_flight_info(descriptor)
+            with pytest.raises(flight.FlightUnauthenticatedError):
+                self.get_call_options(client, password="wrong")
+
+            options = self.get_call_options(client)
+            info = client.get_flight_info(descriptor, options)
+            assert info.total_records == 1
+        finally:
+            client.close()
+            server.shutdown()
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_partitions(self, data_handler):
+        from mindsdb.api.flight.flight_server import (
+            COMMAND_STATEMENT_QUERY,
+            TICKET_STATEMENT_QUERY,
+            pack_any,
+            unpack_any,
+            encode_message,
+        )
+
+        df = pd.DataFrame({"a": range(25), "b": [f"x{i}" for i in range(25)]})
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+
+        server, client = self.start_server(partition_rows=10)
+        try:
+            options = self.get_call_options(client)
+
+            # Flight SQL command
+            command = pack_any(COMMAND_STATEMENT_QUERY, encode_message({1: "select a, b from pg.tbl1 order by a"}))
+            info = client.get_flight_info(flight.FlightDescriptor.for_command(command), options)
+            assert info.total_records == 25
+            assert info.schema.names == ["a", "b"]
+            assert len(info.endpoints) == 3
+
+            tables = [client.do_get(endpoint.ticket, options).read_all() for endpoint in info.endpoints]
+            assert [table.num_rows for table in tables] == [10, 10, 5]
+            assert unpack_any(info.endpoints[0].ticket.ticket)[0] == TICKET_STATEMENT_QUERY
+            result = pd.concat([table.to_pandas() for table in tables], ignore_index=True)
+            assert result["a"].tolist() == list(range(25))
+            assert result["b"].tolist() == df["b"].tolist()
+
+            # result is released after all partitions are fetched
+            with pytest.raises(flight.FlightServerError):
+                client.do_get(info.endpoints[0].ticket, options).read_all()
+
+            # plain text query
+            info = client.get_flight_info(flight.FlightDescriptor.for_command(b"select * from pg.tbl1"), options)
+            assert len(info.endpoints) == 3
+
+            with pytest.raises(flight.FlightServerError):
+                client.get_flight_info(flight.FlightDescriptor.for_command(b"select * from missing_db.tbl1"), options)
+        finally:
+            client.close()
+            server.shutdown()
+
+    def test_tickets(self):
+        from mindsdb.api.flight.flight_server import TICKET_STATEMENT_QUERY, pack_any
+
+        server, client = self.start_server()
+        try:
+            options = self.get_call_options(client)
+            info = client.get_flight_info(flight.FlightDescriptor.for_command(b"select 1"), options)
+            handle = info.endpoints[0].ticket.ticket.decode().partition(":")[0]
+
+            for ticket in (
+                b"",
+                b"\xff\xfe",
+                f"{handle}:x".encode(),
+                f"{handle}:5".encode(),
+                f"{handle}:-1".encode(),
+                pack_any(TICKET_STATEMENT_QUERY, b"\x0a\x05ab"),
+            ):
+                with pytest.raises(flight.FlightServerError):
+                    client.do_get(flight.Ticket(ticket), options).read_all()
+
+            # result belongs to the user who executed the query
+            class Context:
+                def __init__(self, username):
+                    self.username = username
+
+                def get_middleware(self, name):
+                    return self
+
+            with pytest.raises(flight.FlightServerError):
+                server.do_get(Context("other_user"), info.endpoints[0].ticket)
+
+            table = client.do_get(info.endpoints[0].ticket, options).read_all()
+            assert table.num_rows == 1
+        finally:
+            client.close()
+            server.shutdown()
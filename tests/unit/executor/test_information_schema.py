@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import pandas as pd
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+class TestInformationSchemaMetadata(BaseExecutorDummyML):
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_tables_and_columns_are_cached(self, data_handler):
+        # modules are reloaded by the test base class
+        from mindsdb.interfaces.database.metadata_cache import get_metadata_cache
+
+        get_metadata_cache().clear()
+
+        df = pd.DataFrame([{"a": 1, "b": "x"}])
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df, "tbl2": df})
+
+        for _ in range(2):
+            ret = self.run_sql("select * from information_schema.tables where table_schema = 'pg'")
+            assert sorted(ret["TABLE_NAME"]) == ["tbl1", "tbl2"]
+            columns = self.run_sql("select * from information_schema.columns where table_schema = 'pg'")
+            assert sorted(zip(columns["TABLE_NAME"], columns["COLUMN_NAME"])) == [
+                ("tbl1", "a"),
+                ("tbl1", "b"),
+                ("tbl2", "a"),
+                ("tbl2", "b"),
+            ]
+        assert data_handler().get_tables.call_count == 1
+        assert data_handler().get_columns.call_count == 2
+
+        # metadata is dropped on alter database
+        self.run_sql("alter database pg parameters = {'password': 'secret2'}")
+        self.run_sql("select * from information_schema.tables where table_schema = 'pg'")
+        assert data_handler().get_tables.call_count == 2
+
+
+class TestQueryStats(BaseExecutorDummyML):
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_query_stats(self, data_handler):
+        from mindsdb.utilities.query_stats import query_stats
+        from mindsdb.utilities.config import config
+
+        query_stats.clear()
+
+        df = pd.DataFrame({"a": range(10), "b": [f"x{i}" for i in range(10)]})
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+
+        with patch("mindsdb.utilities.query_stats.logger") as logger:
+            self.run_sql("select * from pg.tbl1 where a > 5")
+            logger.warning.assert_not_called()
+
+            with patch.dict(config["query_stats"], {"slow_query_ms": 0}):
+                self.run_sql("select a from pg.tbl1 limit 2")
+            logger.warning.assert_called_once()
+            message = logger.warning.call_args[0][0]
+            assert "Slow query" in message and "LIMIT 2" in message
+            assert "FetchDataframeStep (pg)" in message
+
+        ret = self.run_sql("select * from information_schema.query_stats")
+        # the query to query_stats itself is not finished yet
+        assert len(ret["QUERY_ID"].unique()) == 2
+
+        fetch = ret[ret["STEP"] == "FetchDataframeStep"]
+        assert fetch["INTEGRATION"].tolist() == ["pg", "pg"]
+        assert fetch["ROWS_OUT"].tolist() == [4, 2]
+        assert (fetch["BYTES_OUT"] > 0).all()
+        assert (fetch["WALL_TIME"] > 0).all()
+        assert "a > 5" in fetch["SQL"].tolist()[0]
+
+        # disabled
+        query_stats.clear()
+        with patch.dict(config["query_stats"], {"enabled": False}):
+            self.run_sql("select * from pg.tbl1")
+        assert query_stats.get_records(None) == []
@@ -290,6 +290,34 @@ class TestKB(BaseExecutorDummyML):
         assert len(ret) == 2
         assert set(ret["id"]) == {"9016", "9023"}
 
+    @patch("mindsdb.integrations.handlers.litellm_handler.litellm_handler.embedding")
+    def test_query_cache(self, mock_litellm_embedding):
+        self._create_kb("kb_cache")
+
+        set_litellm_embedding(mock_litellm_embedding)
+        self.run_sql("insert into kb_cache (id, content) values (1, 'white'), (2, 'black')")
+
+        def select():
+            return self.run_sql("select id from kb_cache where content = 'white'")
+
+        ret = select()
+        assert len(ret) == 2
+        calls = mock_litellm_embedding.call_count
+
+        # the same query: embeddings of content are not calculated again
+        ret = select()
+        assert len(ret) == 2
+        assert mock_litellm_embedding.call_count == calls
+
+        # insert invalidates cache
+        self.run_sql("insert into kb_cache (id, content) values (3, 'red')")
+        ret = select()
+        assert len(ret) == 3
+
+        self.run_sql("delete from kb_cache where id = 3")
+        ret = select()
+        assert len(ret) == 2
+
     @pytest.mark.slow
     @pytest.mark.skipif(sys.platform == "win32", reason="Causes hard crash on windows.")
     @patch("mindsdb.integrations.handlers.litellm_handler.litellm_handler.embedding")
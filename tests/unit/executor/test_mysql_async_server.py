@@ -0,0 +1,155 @@
+import time
+import socket
+import threading
+from functools import partial
+from unittest.mock import patch
+
+import pandas as pd
+import mysql.connector
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+class TestAsyncMysqlServer(BaseExecutorDummyML):
+    def start_server(self, workers, handshake_timeout=10):
+        from mindsdb.api.mysql.mysql_proxy.mysql_proxy import MysqlProxy
+        from mindsdb.api.mysql.mysql_proxy.async_server import AsyncMysqlServer
+        from mindsdb.api.common.middleware import check_auth
+        from mindsdb.utilities.config import config
+
+        server = AsyncMysqlServer("127.0.0.1", 0, MysqlProxy, workers=workers, handshake_timeout=handshake_timeout)
+        server.mindsdb_config = config
+        server.check_auth = partial(check_auth, config=config)
+        server.cert_path = None
+        server.hook_before_handle = lambda *args, **kwargs: None
+        server.bind()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server, thread
+
+    @staticmethod
+    def count_threads(prefix):
+        return len([thread for thread in threading.enumerate() if thread.name.startswith(prefix)])
+
+    @staticmethod
+    def wait_idle(server, timeout=5):
+        # the result is sent to the client before the slot of the worker is released in the event loop
+        deadline = time.monotonic() + timeout
+        while server.active > 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return server.active
+
+    def connect(self, server):
+        return mysql.connector.connect(
+            host="127.0.0.1",
+            port=server.port,
+            user="mindsdb",
+            password="",
+            use_pure=True,
+            ssl_disabled=True,
+        )
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_connections(self, data_handler):
+        from mindsdb.api.mysql.mysql_proxy.classes.server_capabilities import server_capabilities
+        from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import CAPABILITIES
+
+        df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+        server_capabilities.set(CAPABILITIES.CLIENT_SSL, False)
+
+        workers = 2
+        server, thread = self.start_server(workers=workers)
+        connections = []
+        try:
+            # idle connections don't take worker threads
+            connections = [self.connect(server) for _ in range(10)]
+            assert server.connections == 10
+            assert self.count_threads("mysql_worker") <= workers
+            assert self.count_threads("mysql_handshake") <= workers
+
+            # every connection keeps own session
+            cursor = connections[0].cursor()
+            cursor.execute("use pg")
+            cursor.close()
+            for connection, database in zip(connections[:3], ["pg", "", ""]):
+                cursor = connection.cursor()
+                cursor.execute("select database()")
+                assert cursor.fetchall() == [(database,)]
+                cursor.close()
+
+            # queries from many connections at the same time
+            errors = []
+            max_active = []
+
+            def run_query(connection):
+                try:
+                    cursor = connection.cursor()
+                    cursor.execute("select a, b from pg.tbl1 order by a")
+                    assert cursor.fetchall() == [(1, "x"), (2, "y"), (3, "z")]
+                    cursor.close()
+                    max_active.append(server.active)
+                except Exception as e:
+                    errors.append(e)
+
+            clients = [threading.Thread(target=run_query, args=(connection,)) for connection in connections]
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+            assert errors == []
+            assert max(max_active) <= workers
+        finally:
+            for connection in connections:
+                connection.close()
+            time.sleep(0.1)
+            server.shutdown()
+            thread.join(timeout=5)
+            server.server_close()
+        assert server.connections == 0
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_idle_handshakes(self, data_handler):
+        from mindsdb.api.mysql.mysql_proxy.classes.server_capabilities import server_capabilities
+        from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import CAPABILITIES
+
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+        server_capabilities.set(CAPABILITIES.CLIENT_SSL, False)
+
+        workers = 2
+        server, thread = self.start_server(workers=workers, handshake_timeout=1)
+        connection = None
+        idle = []
+        try:
+            connection = self.connect(server)
+            # clients which don't answer the handshake, more than workers
+            idle = [socket.create_connection(("127.0.0.1", server.port)) for _ in range(workers * 2)]
+            time.sleep(0.2)
+
+            # they don't block commands of other connections
+            cursor = connection.cursor()
+            cursor.execute("select a from pg.tbl1 order by a")
+            assert cursor.fetchall() == [(1,), (2,), (3,)]
+            cursor.close()
+            assert self.wait_idle(server) == 0
+
+            # clients are disconnected after the timeout of the handshake
+            for sock in idle:
+                sock.settimeout(5)
+                while len(sock.recv(1024)) > 0:
+                    pass
+            assert server.connections == 1
+
+            # new clients are accepted
+            new_connection = self.connect(server)
+            new_connection.close()
+        finally:
+            for sock in idle:
+                sock.close()
+            if connection is not None:
+                connection.close()
+            time.sleep(0.1)
+            server.shutdown()
+            thread.join(timeout=5)
+            server.server_close()
@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+import duckdb
+import numpy as np
+import pandas as pd
+from mindsdb_sql_parser import parse_sql
+
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import MYSQL_DATA_TYPE, DATA_C_TYPE_MAP
+from mindsdb.api.mysql.mysql_proxy.utilities.dump import dump_result_set_to_mysql
+from mindsdb.api.executor.utilities.sql import DeferredQuery, normalize_nulls, nulls_to_none, query_df
+from mindsdb.integrations.libs.response import RESPONSE_TYPE, HandlerResponse
+from mindsdb.utilities.render.sqlalchemy_render import SqlalchemyRender
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+def test_normalize_nulls():
+    df = pd.DataFrame(
+        {
+            "f": [1.5, np.nan, 3.0],
+            "i": pd.array([1, None, 3], dtype="Int32"),
+            "o": ["a", np.nan, pd.NA],
+            "n": [1, 2, 3],
+        }
+    )
+    normalize_nulls(df)
+    # typed columns are not changed
+    assert list(df.dtypes) == [np.dtype("float64"), pd.Int32Dtype(), np.dtype(object), np.dtype("int64")]
+    assert df["o"].tolist() == ["a", None, None]
+
+    result = nulls_to_none(df)
+    assert result.values.tolist() == [[1.5, 1, "a", 1], [None, None, None, 2], [3.0, 3, None, 3]]
+    # input is not changed, columns without nulls are shared
+    assert df["f"].dtype == np.dtype("float64")
+    assert np.shares_memory(result["n"].values, df["n"].values)
+
+
+def test_nullable_int_through_duckdb():
+    df = pd.DataFrame({"a": [1, 2, 3], "i": pd.array([10, None, 30], dtype="Int64")})
+
+    result = query_df(df, "select a, i from df where a < 3")
+    assert result["i"].dtype == pd.Int64Dtype()
+    assert result["i"].tolist() == [10, pd.NA]
+
+    deferred = DeferredQuery("SELECT t.a, t.i FROM t ORDER BY t.a", {"t": df})
+    result = deferred.execute()
+    assert result["i"].dtype == pd.Int64Dtype()
+    # ints with nulls in 'object' column are typed by duckdb
+    result = query_df(pd.DataFrame({"i": [10, None, 30]}, dtype=object), "select i from df")
+    assert pd.api.types.is_integer_dtype(result["i"].dtype)
+
+
+class TestNullHandling(BaseExecutorDummyML):
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_typed_nulls(self, data_handler):
+        df1 = pd.DataFrame({"a": [1, 2, 3], "f": [1.5, None, 3.5], "i": pd.array([10, None, 30], dtype="Int64")})
+        df2 = pd.DataFrame({"a": [1, 2, 4], "s": ["x", None, "z"]})
+        tables = {"tbl1": df1, "tbl2": df2}
+        # tables of different databases are joined by the executor
+        self.set_handler(data_handler, name="pg1", tables=tables)
+        self.set_handler(data_handler, name="pg2", tables=tables)
+
+        def query_f(query):
+            # set_handler builds the response from rows and turns nullable ints into floats, keep the dtypes
+            con = duckdb.connect(database=":memory:")
+            for table_name, df in tables.items():
+                con.register(table_name, df)
+            result_df = con.execute(SqlalchemyRender("postgres").get_string(query, with_failback=True)).fetchdf()
+            con.close()
+            return HandlerResponse(RESPONSE_TYPE.TABLE, result_df)
+
+        data_handler().query.side_effect = query_f
+
+        for sql in (
+            "select t1.a, t1.f, t1.i, t2.s from pg1.tbl1 t1 left join pg2.tbl2 t2 on t1.a = t2.a",
+            "select a, f, i, 'x' s from pg1.tbl1 union all select a, null, null, s from pg2.tbl2 where a = 4",
+        ):
+            result_set = self.command_executor.execute_command(parse_sql(sql)).data
+            df = result_set.get_raw_df()
+            # nulls of numeric columns don't turn them into objects
+            assert pd.api.types.is_float_dtype(df[1].dtype)
+            assert pd.api.types.is_integer_dtype(df[2].dtype)
+
+            rows = sorted(result_set.to_lists(), key=lambda row: row[0])
+            assert rows[1][1] is None and rows[1][2] is None
+            assert rows[2][1] == 3.5 and rows[2][2] == 30
+
+            json_rows = sorted(result_set.to_lists(json_types=True), key=lambda row: row[0])
+            assert json_rows[1][1] is None and json_rows[1][2] is None
+
+            mysql_df, columns = dump_result_set_to_mysql(result_set)
+            assert mysql_df.sort_values(0)[2].tolist()[:3] == ["10", None, "30"]
+            # numeric columns are not sent as text, nullable ints stay ints
+            assert columns[1]["type"] == DATA_C_TYPE_MAP[MYSQL_DATA_TYPE.FLOAT].code
+            assert columns[2]["type"] == DATA_C_TYPE_MAP[MYSQL_DATA_TYPE.INT].code
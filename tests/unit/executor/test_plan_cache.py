@@ -0,0 +1,184 @@
+from unittest.mock import patch
+
+import pandas as pd
+from mindsdb_sql_parser import parse_sql
+from mindsdb_sql_parser.ast import Constant
+
+from mindsdb.api.executor.planner.query_planner import QueryPlanner
+from mindsdb.api.executor.planner.plan_cache import LiftedConstant, PlanCache, bind_plan, lift_constants
+from mindsdb.api.executor.planner.steps import ApplyPredictorRowStep
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+def _plan(query):
+    return QueryPlanner(query, integrations=["int1"], default_namespace="mindsdb").from_query()
+
+
+class TestPlanCacheUnit:
+    def test_lift_constants(self):
+        query = parse_sql("select * from int1.t where a = 1 and b = 'x' limit 10")
+        key1, values1, lifted = lift_constants(query)
+        key2, values2, _ = lift_constants(parse_sql("select * from int1.t where a = 2 and b = 'y' limit 10"))
+        key3, _, _ = lift_constants(parse_sql("select * from int1.t where a = 'z' and b = 'y' limit 10"))
+        key4, _, _ = lift_constants(parse_sql("select * from int1.t where a = 2 and b = 'y' limit 20"))
+
+        assert key1 == key2
+        assert values1 == [1, "x"]
+        assert values2 == [2, "y"]
+        # type of the value and limit are parts of the key
+        assert key1 != key3
+        assert key1 != key4
+
+        # the query itself is not changed, constants are lifted in the copy
+        assert type(query.where.args[0].args[1]) is Constant
+        assert isinstance(lifted.where.args[0].args[1], LiftedConstant)
+
+    def test_verify_and_bind(self):
+        cache = PlanCache(ttl=60, max_size=10)
+
+        def get_plan(sql):
+            query = parse_sql(sql)
+            key, values, lifted = lift_constants(query)
+            key = cache.make_key(key, "mindsdb")
+            cached = cache.get(key, values)
+            if cached is not None:
+                plan, integrations = cached
+                assert integrations == ["int1"]
+                return plan
+            plan = _plan(query)
+            if cache.contains(key):
+                cache.set(key, values, plan, ["int1"])
+            else:
+                cache.set(key, values, _plan(lifted), ["int1"])
+            return plan
+
+        get_plan("select * from int1.t where a = 1")
+        # the same values: plan is reused
+        get_plan("select * from int1.t where a = 1")
+        assert cache.hits == 1
+        # other values: plan is not verified yet
+        get_plan("select * from int1.t where a = 2")
+        assert cache.hits == 1
+
+        # verified plan is reused with bound values
+        plan = get_plan("select * from int1.t where a = 3")
+        assert cache.hits == 2
+        assert repr(plan.steps) == repr(_plan(parse_sql("select * from int1.t where a = 3")).steps)
+        assert "a = 3" in plan.steps[0].query.to_string()
+
+        cache.invalidate()
+        assert get_plan("select * from int1.t where a = 4") is not None
+        assert cache.hits == 2
+
+    def test_plain_values_are_not_verified(self):
+        cache = PlanCache(ttl=60, max_size=10)
+        key, values, lifted = lift_constants(parse_sql("select * from int1.t where a = 1"))
+        key = cache.make_key(key, "mindsdb")
+
+        # the planner copied the value out of the ast node, bind_plan can't change it
+        plan = _plan(lifted)
+        plan.add_step(ApplyPredictorRowStep(namespace="mindsdb", predictor=None, row_dict={"a": values[0]}))
+        cache.set(key, values, plan)
+
+        # the plan with other value is equal to the cached one, but it is not trusted
+        cache.set(key, [2], bind_plan(plan, [2]))
+        assert cache.get(key, [3]) is None
+        assert cache.get(key, [1]) is not None
+
+    def test_version(self):
+        cache = PlanCache(ttl=60, max_size=10)
+        key, values, lifted = lift_constants(parse_sql("select * from int1.t where a = 1"))
+        key = cache.make_key(key, "mindsdb")
+        cache.set(key, values, _plan(lifted), version=1)
+        assert cache.contains(key, version=1)
+        assert cache.get(key, values, version=1) is not None
+
+        # objects were changed by another process
+        assert not cache.contains(key, version=2)
+        assert cache.get(key, values, version=2) is None
+        assert not cache.contains(key, version=1)
+
+
+class TestPlanCache(BaseExecutorDummyML):
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_select_with_cached_plan(self, data_handler):
+        # modules are reloaded by the test base class
+        from mindsdb.api.executor.planner.plan_cache import get_plan_cache
+
+        get_plan_cache().clear()
+        df = pd.DataFrame([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "z"}])
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+
+        cache = get_plan_cache()
+        hits = cache.hits
+        for value, expected in ((1, "x"), (2, "y"), (3, "z"), (1, "x")):
+            data_handler.reset_mock()
+            ret = self.run_sql(f"select * from pg.tbl1 where a = {value}")
+            assert ret["b"].tolist() == [expected]
+            sql = data_handler().query.call_args_list[0][0][0].to_string()
+            assert f"a = {value}" in sql
+        # first two queries were planned, others used the cache
+        assert cache.hits - hits == 2
+
+        # plans are dropped when a view is created
+        self.run_sql("create view v1 (select * from pg.tbl1)")
+        hits = cache.hits
+        ret = self.run_sql("select * from pg.tbl1 where a = 2")
+        assert ret["b"].tolist() == ["y"]
+        assert cache.hits == hits
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_invalidation_by_other_process(self, data_handler):
+        from mindsdb.api.executor.planner import plan_cache
+        from mindsdb.utilities.context import context as ctx
+
+        plan_cache.get_plan_cache().clear()
+        df = pd.DataFrame([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+
+        cache = plan_cache.get_plan_cache()
+        self.run_sql("select * from pg.tbl1 where a = 1")
+        hits = cache.hits
+        self.run_sql("select * from pg.tbl1 where a = 1")
+        assert cache.hits == hits + 1
+
+        # another process changed objects: only the version in the database is changed
+        version = cache.get_version()
+        plan_cache._increment_version(ctx.company_id)
+        assert cache.get_version() == version + 1
+
+        hits = cache.hits
+        ret = self.run_sql("select * from pg.tbl1 where a = 1")
+        assert ret["b"].tolist() == ["x"]
+        assert cache.hits == hits
+
+        # the plan is cached with the new version
+        self.run_sql("select * from pg.tbl1 where a = 1")
+        assert cache.hits == hits + 1
+
+    def test_model_select_with_constants(self):
+        from mindsdb.api.executor.planner.plan_cache import get_plan_cache
+
+        get_plan_cache().clear()
+        self.run_sql(
+            """
+                CREATE model mindsdb.m1
+                PREDICT answer
+                using
+                  column='question',
+                  output='a',
+                  engine='dummy_ml',
+                  join_learn_process=true
+            """
+        )
+
+        # constant targets and 'where 1=0' are planned from the original query
+        for _ in range(2):
+            ret = self.run_sql("select 1 as x, answer from mindsdb.m1 where question = 'q'")
+            assert ret["x"].tolist() == [1]
+            assert ret["answer"].tolist() == ["a"]
+
+            ret = self.run_sql("select * from mindsdb.m1 where 1 = 0")
+            assert len(ret) == 0
+            assert "answer" in ret.columns
@@ -0,0 +1,168 @@
+import io
+import time
+import socket
+import struct
+import threading
+from functools import partial
+from unittest.mock import patch
+
+import pandas as pd
+import psycopg
+
+from tests.unit.executor_test_base import BaseExecutorDummyML, BaseUnitTest
+
+
+class TestAsyncPostgresServer(BaseExecutorDummyML):
+    def start_server(self, workers, handshake_timeout=10):
+        from mindsdb.api.postgres.postgres_proxy.postgres_proxy import PostgresProxyHandler
+        from mindsdb.api.postgres.postgres_proxy.async_server import AsyncPostgresServer
+        from mindsdb.api.common.middleware import check_auth
+        from mindsdb.utilities.config import config
+
+        server = AsyncPostgresServer(
+            "127.0.0.1", 0, PostgresProxyHandler, workers=workers, handshake_timeout=handshake_timeout
+        )
+        server.mindsdb_config = config
+        server.check_auth = partial(check_auth, config=config)
+        server.bind()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server, thread
+
+    def connect(self, server):
+        return psycopg.connect(
+            host="127.0.0.1", port=server.port, user="mindsdb", password="", sslmode="disable", autocommit=True
+        )
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_pipeline(self, data_handler):
+        df = pd.DataFrame({"a": range(10000), "b": [f"x{i}" for i in range(10000)]})
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+
+        server, thread = self.start_server(workers=2)
+        try:
+            with self.connect(server) as connection:
+                # simple query, the result is sent by chunks
+                rows = connection.execute("select a, b from pg.tbl1", prepare=False).fetchall()
+                assert len(rows) == 10000
+                assert rows[0] == ("0", "x0")
+
+                # extended protocol queries sent without waiting for the results
+                with connection.pipeline():
+                    cursors = [
+                        connection.cursor().execute(f"select a, b from pg.tbl1 where b = 'x{i}'") for i in range(10)
+                    ]
+                for i, cursor in enumerate(cursors):
+                    assert cursor.fetchall() == [(str(i), f"x{i}")]
+
+                # error in the pipeline doesn't break the connection
+                with connection.pipeline() as pipeline:
+                    connection.execute("select * from missing_db.tbl1")
+                    try:
+                        pipeline.sync()
+                    except psycopg.Error:
+                        pass
+                rows = connection.execute("select a from pg.tbl1 where b = 'x5'").fetchall()
+                assert rows == [("5",)]
+        finally:
+            server.shutdown()
+            thread.join(timeout=5)
+            server.server_close()
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_prepared_statement_rebind(self, data_handler):
+        df = pd.DataFrame({"a": range(10), "b": [f"x{i}" for i in range(10)]})
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+
+        server, thread = self.start_server(workers=2)
+        try:
+            with self.connect(server) as connection:
+                query = "select a from pg.tbl1 where b = %s"
+                # named statement is bound again with other parameters
+                for i in range(3):
+                    rows = connection.execute(query, [f"x{i}"], prepare=True).fetchall()
+                    assert rows == [(str(i),)]
+
+                # and in the pipeline, where Describe of the portal is sent before Execute
+                with connection.pipeline():
+                    cursors = [connection.cursor().execute(query, [f"x{i}"], prepare=True) for i in range(3, 6)]
+                for i, cursor in enumerate(cursors, start=3):
+                    assert cursor.fetchall() == [(str(i),)]
+        finally:
+            server.shutdown()
+            thread.join(timeout=5)
+            server.server_close()
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_idle_handshakes(self, data_handler):
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        self.set_handler(data_handler, name="pg", tables={"tbl1": df})
+
+        workers = 2
+        server, thread = self.start_server(workers=workers, handshake_timeout=1)
+        idle = []
+        try:
+            with self.connect(server) as connection:
+                # clients which don't send the startup message, more than workers
+                idle = [socket.create_connection(("127.0.0.1", server.port)) for _ in range(workers * 2)]
+                # SSLRequest without the startup message after it
+                ssl_request = struct.pack("!ii", 8, 80877103)
+                idle[0].sendall(ssl_request)
+                time.sleep(0.2)
+
+                # they don't block queries of other connections
+                rows = connection.execute("select a from pg.tbl1 order by a").fetchall()
+                assert rows == [("1",), ("2",), ("3",)]
+                assert server.active == 0
+
+                # clients are disconnected after the timeout of the handshake
+                for sock in idle:
+                    sock.settimeout(5)
+                    while len(sock.recv(1024)) > 0:
+                        pass
+                assert server.connections == 1
+
+                # new clients are accepted
+                with self.connect(server) as new_connection:
+                    assert len(new_connection.execute("select 1").fetchall()) == 1
+        finally:
+            for sock in idle:
+                sock.close()
+            server.shutdown()
+            thread.join(timeout=5)
+            server.server_close()
+
+
+class TestPipelineErrors(BaseUnitTest):
+    def test_failed_pipeline_split_between_reads(self):
+        from mindsdb.api.postgres.postgres_proxy.postgres_proxy import PostgresProxyHandler
+        from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_formats import (
+            Bind,
+            Execute,
+            Parse,
+            Sync,
+        )
+
+        handler = PostgresProxyHandler(None, None, None, handle=False)
+        handler.wfile = io.BytesIO()
+        handled = []
+
+        def fail(message):
+            raise Exception("parse error")
+
+        def handle(message):
+            handled.append(type(message).__name__)
+            return True
+
+        handler.message_map = {Parse: fail, Bind: handle, Execute: handle, Sync: handle}
+
+        def message(cls):
+            return cls.__new__(cls)
+
+        assert handler.handle_messages([message(Parse), message(Bind)])
+        assert handled == []
+        assert handler.wfile.getvalue().startswith(b"E")
+
+        # the rest of the failed pipeline arrives with the next read, it is skipped until Sync
+        assert handler.handle_messages([message(Execute), message(Sync), message(Bind), message(Execute)])
+        assert handled == ["Sync", "Bind", "Execute"]
@@ -0,0 +1,149 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+class TestQueryMemory(BaseExecutorDummyML):
+    def set_tables(self, data_handler):
+        df1 = pd.DataFrame({"a": range(1000), "b": [f"text {i}" for i in range(1000)]})
+        df2 = pd.DataFrame({"a": range(1000), "c": [f"other {i}" for i in range(1000)]})
+        # tables of different databases are joined by the executor
+        self.set_handler(data_handler, name="pg1", tables={"tbl1": df1, "tbl2": df2})
+        self.set_handler(data_handler, name="pg2", tables={"tbl1": df1, "tbl2": df2})
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_release_results(self, data_handler):
+        from mindsdb.api.executor.sql_query.query_memory import QueryMemory
+
+        self.set_tables(data_handler)
+        released = []
+        release = QueryMemory.release
+
+        def release_spy(self, step_num):
+            released.append(step_num)
+            release(self, step_num)
+
+        sql = "select t1.a, t2.c from pg1.tbl1 t1 join pg2.tbl2 t2 on t1.a = t2.a where t1.a < 10"
+        with patch.object(QueryMemory, "release", release_spy):
+            ret = self.run_sql(sql)
+        assert len(ret) == 10
+        # fetched table is released after the join
+        assert 0 in released
+
+        from mindsdb.utilities.config import config
+
+        released.clear()
+        with patch.object(QueryMemory, "release", release_spy):
+            with patch.dict(config["query_memory"], {"release_results": False}):
+                self.run_sql(sql)
+        assert released == []
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_budget(self, data_handler):
+        from mindsdb.api.executor.exceptions import MemoryLimitError
+        from mindsdb.api.executor.sql_query.query_memory import memory_tracker
+        from mindsdb.api.executor.sql_query.result_set import ResultSet
+        from mindsdb.utilities.config import config
+        from mindsdb.utilities.context import context as ctx
+
+        self.set_tables(data_handler)
+        sql = "select t1.a, t1.b, t2.c from pg1.tbl1 t1 join pg2.tbl2 t2 on t1.a = t2.a order by t1.a"
+
+        # tables are bigger than 0.01 MB
+        with patch.dict(config["query_memory"], {"max_query_mb": 0.01, "on_exceed": "abort"}):
+            with pytest.raises(MemoryLimitError):
+                self.run_sql(sql)
+        assert memory_tracker.get_usage(ctx.company_id) == 0
+
+        # the company has no memory left
+        memory_tracker.change(ctx.company_id, 1 << 30)
+        try:
+            with patch.dict(config["query_memory"], {"max_company_mb": 1024, "on_exceed": "abort"}):
+                with pytest.raises(MemoryLimitError):
+                    self.run_sql(sql)
+        finally:
+            memory_tracker.change(ctx.company_id, -(1 << 30))
+
+        # the join needs both tables in memory, they are not spilled
+        spill = ResultSet.spill
+        spilled = []
+
+        def spill_spy(self, directory):
+            spilled.append(self)
+            spill(self, directory)
+
+        with patch.object(ResultSet, "spill", spill_spy):
+            with patch.dict(config["query_memory"], {"max_query_mb": 0.01, "on_exceed": "spill"}):
+                with pytest.raises(MemoryLimitError):
+                    self.run_sql(sql)
+        assert memory_tracker.get_usage(ctx.company_id) == 0
+
+    def test_spilled_results(self):
+        from mindsdb.api.executor.exceptions import MemoryLimitError
+        from mindsdb.api.executor.sql_query.query_memory import QueryMemory, memory_tracker, MB
+        from mindsdb.api.executor.sql_query.result_set import ResultSet
+        from mindsdb.utilities.config import config
+
+        def make_result(prefix):
+            return ResultSet.from_df(pd.DataFrame({"a": range(1000), "b": [f"{prefix} {i}" for i in range(1000)]}))
+
+        results = [make_result(prefix) for prefix in ("x", "y", "z")]
+        size = max(result.memory_size() for result in results)
+        # two results fit the budget
+        budget = {"max_query_mb": 2.5 * size / MB, "on_exceed": "spill"}
+
+        memory = QueryMemory("spill_company")
+        with patch.dict(config["query_memory"], budget):
+            memory.add(0, results[0])
+            memory.add(1, results[1])
+            # the result of the step 2 is used by the next step
+            memory.add(2, results[2], keep={2})
+            assert [result.is_spilled for result in results] == [True, False, False]
+
+            # the result is read back by a step: it is accounted and the results which are not used are spilled
+            assert results[0].get_column_values(1)[999] == "x 999"
+            assert [result.is_spilled for result in results] == [False, True, False]
+            assert memory.total == results[0].memory_size() + results[2].memory_size()
+            assert memory_tracker.get_usage("spill_company") == memory.total
+
+            # results which are used can't be spilled
+            with pytest.raises(MemoryLimitError):
+                memory.add(3, make_result("w"), keep={0, 2, 3})
+        memory.close()
+        assert memory_tracker.get_usage("spill_company") == 0
+
+        memory = QueryMemory("spill_company")
+        # one result fits the budget
+        with patch.dict(config["query_memory"], {"max_query_mb": 1.5 * size / MB, "on_exceed": "abort"}):
+            memory.add(0, results[0])
+            memory.add(1, results[1])
+            with pytest.raises(MemoryLimitError):
+                # spilled result is loaded back and exceeds the budget
+                results[1].get_column_values(0)
+        memory.close()
+        assert memory_tracker.get_usage("spill_company") == 0
+
+    def test_materialized_results(self):
+        from mindsdb.api.executor.sql_query.query_memory import QueryMemory, memory_tracker
+        from mindsdb.api.executor.sql_query.result_set import ResultSet, Column
+        from mindsdb.api.executor.utilities.sql import DeferredQuery
+        from mindsdb.utilities.config import config
+
+        df = pd.DataFrame({"a": range(1000), "b": [f"x {i}" for i in range(1000)]})
+        result = ResultSet.from_deferred(
+            DeferredQuery("SELECT * FROM tbl", {"tbl": df}), [Column(name="a"), Column(name="b")], ["a", "b"]
+        )
+
+        memory = QueryMemory("deferred_company")
+        with patch.dict(config["query_memory"], {"max_query_mb": 1024}):
+            memory.add(0, result)
+            # deferred result doesn't take memory until it is fetched
+            assert memory.total == 0
+            assert len(result.get_column_values(0)) == 1000
+            assert memory.total == result.memory_size() > 0
+            assert memory_tracker.get_usage("deferred_company") == memory.total
+        memory.close()
+        assert memory_tracker.get_usage("deferred_company") == 0
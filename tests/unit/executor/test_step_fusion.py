@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+import pandas as pd
+
+from mindsdb.api.executor.utilities.sql import DeferredQuery, query_df_with_type_infer_fallback
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+class TestDeferredQuery:
+    def test_chain(self):
+        df1 = pd.DataFrame([[1, "x"], [2, "y"]], columns=["a", "b"])
+        df2 = pd.DataFrame([[1, 10], [3, 30]], columns=["a", "c"])
+
+        join = DeferredQuery(
+            "SELECT * FROM table_a LEFT JOIN table_b ON table_a.a = table_b.a2",
+            {"table_a": df1, "table_b": df2.rename(columns={"a": "a2"})},
+        )
+        # source dataframe is renamed after the query is created
+        df1.columns = ["x", "y"]
+
+        renamed = join.rename(["a", "b", "c"], ["col_a", "col_b", "col_c"])
+        result, _ = query_df_with_type_infer_fallback("SELECT * FROM df ORDER BY col_a", {"df": renamed})
+        assert list(result.columns) == ["col_a", "col_b", "col_c"]
+        assert result["col_b"].tolist() == ["x", "y"]
+
+        result = join.execute()
+        assert list(result.columns) == ["a", "b", "a2", "c"]
+        assert len(result) == 2
+
+    def test_materialize_join_with_row_ids(self):
+        from mindsdb.api.executor.sql_query.result_set import ResultSet, Column
+
+        df1 = pd.DataFrame([[1, "x", 0], [2, "y", 1]], columns=["a", "b", "__mindsdb_row_id"])
+        df2 = pd.DataFrame([[0, 10], [1, 20]], columns=["__mindsdb_row_id", "c"])
+        query = DeferredQuery(
+            "SELECT * FROM table_a JOIN table_b ON table_a.row_a = table_b.row_b",
+            {
+                "table_a": df1.rename(columns={"__mindsdb_row_id": "row_a"}),
+                "table_b": df2.rename(columns={"__mindsdb_row_id": "row_b"}),
+            },
+        )
+        # row ids are not columns of the result, like in the join step
+        columns = [Column(name="a"), Column(name="b"), Column(name="c")]
+        result_set = ResultSet.from_deferred(query, columns, ["a", "b", "c"])
+
+        df, names = result_set.to_df_cols()
+        assert len(df.columns) == 3
+        assert result_set.get_column_values(2) == [10, 20]
+        assert result_set.to_lists() == [[1, "x", 10], [2, "y", 20]]
+
+
+class TestStepFusion(BaseExecutorDummyML):
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_join_chain(self, data_handler):
+        df1 = pd.DataFrame([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "z"}])
+        df2 = pd.DataFrame([{"a": 1, "c": 10}, {"a": 2, "c": 20}])
+        self.set_handler(data_handler, name="pg1", tables={"tbl1": df1, "tbl2": df2})
+        self.set_handler(data_handler, name="pg2", tables={"tbl1": df1, "tbl2": df2})
+
+        sql = """
+            select t1.a, t1.b, t2.c, t3.b b3 from pg1.tbl1 t1
+            left join pg2.tbl2 t2 on t1.a = t2.a
+            join pg1.tbl1 t3 on t3.a = t1.a
+            where t1.a < 3
+            order by t1.a
+        """
+
+        from mindsdb.api.executor.utilities import sql as sql_utils
+        from mindsdb.api.executor.sql_query.result_set import ResultSet
+        from mindsdb.utilities.config import config
+
+        calls = []
+        original = sql_utils.DeferredQuery.execute
+
+        def execute(self):
+            calls.append(self)
+            return original(self)
+
+        with patch.object(sql_utils.DeferredQuery, "execute", execute):
+            with patch.object(ResultSet, "from_deferred", wraps=ResultSet.from_deferred) as from_deferred:
+                ret = self.run_sql(sql)
+            with patch.dict(config["query_execution"], {"fuse_steps": False}):
+                expected = self.run_sql(sql)
+
+        assert ret.to_dict("records") == expected.to_dict("records")
+        assert ret["c"].tolist() == [10, 20]
+        assert ret["b3"].tolist() == ["x", "y"]
+        # both joins were executed as a part of the last query, without fetching
+        assert from_deferred.call_count == 2
+        assert len(calls) == 0
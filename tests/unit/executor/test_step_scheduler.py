@@ -0,0 +1,238 @@
+import time
+import threading
+import contextvars
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from mindsdb_sql_parser import parse_sql
+from mindsdb_sql_parser.ast import Identifier, Select, Star
+
+from mindsdb.api.executor.planner.steps import (
+    FetchDataframeStep,
+    JoinStep,
+    ProjectStep,
+    InsertToTable,
+    SubSelectStep,
+)
+from mindsdb.api.executor.exceptions import UnknownError
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.sql_query.steps.subselect_step import SubSelectStepCall
+from mindsdb.api.executor.sql_query.step_scheduler import (
+    execute_steps_parallel,
+    get_steps_dependencies,
+    has_independent_steps,
+)
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+def _fetch(step_num, integration):
+    return FetchDataframeStep(step_num=step_num, integration=integration, query=Select(targets=[Star()]))
+
+
+class ConcurrencyCounter:
+    def __init__(self, delay):
+        self.delay = delay
+        self.current = 0
+        self.max = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, fn):
+        def wrapper(*args, **kwargs):
+            with self.lock:
+                self.current += 1
+                self.max = max(self.max, self.current)
+            time.sleep(self.delay)
+            with self.lock:
+                self.current -= 1
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+
+class TestStepSchedulerUnit:
+    def test_dependencies(self):
+        steps = [
+            _fetch(0, "int1"),
+            _fetch(1, "int2"),
+            JoinStep(step_num=2, left=_fetch(0, "int1").result, right=_fetch(1, "int2").result, query=None),
+            InsertToTable(step_num=3, table=Identifier("int1.t"), dataframe=_fetch(2, "int1").result),
+            ProjectStep(step_num=4, columns=[Star()], dataframe=_fetch(0, "int1").result),
+        ]
+        dependencies = get_steps_dependencies(steps)
+        assert dependencies == {0: set(), 1: set(), 2: {0, 1}, 3: {0, 1, 2}, 4: {0, 3}}
+        assert has_independent_steps(steps, dependencies)
+        # chain of steps: nothing to parallelize
+        assert not has_independent_steps(steps[2:], get_steps_dependencies(steps[2:]))
+
+    def test_integration_limit(self):
+        steps = [_fetch(i, "int1") for i in range(4)] + [_fetch(i, "int2") for i in range(4, 6)]
+        counters = {"int1": ConcurrencyCounter(0.1), "int2": ConcurrencyCounter(0.1)}
+
+        def execute_step(step):
+            return counters[step.integration](lambda: step.step_num)()
+
+        steps_data = {}
+        execute_steps_parallel(
+            steps, execute_step, steps_data, get_steps_dependencies(steps), workers=8, max_per_integration=2
+        )
+        assert steps_data == {i: i for i in range(6)}
+        assert counters["int1"].max == 2
+        assert counters["int2"].max == 2
+
+    def test_shared_result(self):
+        # steps which read the same result are executed at the same time
+        steps = [
+            _fetch(0, "int1"),
+            ProjectStep(step_num=1, columns=[Star()], dataframe=_fetch(0, "int1").result),
+            ProjectStep(step_num=2, columns=[Star()], dataframe=_fetch(0, "int1").result),
+        ]
+        # both readers have to be inside execute_step to pass the barrier
+        barrier = threading.Barrier(2, timeout=10)
+
+        def execute_step(step):
+            if isinstance(step, ProjectStep):
+                barrier.wait()
+            return step.step_num
+
+        steps_data = {}
+        execute_steps_parallel(
+            steps, execute_step, steps_data, get_steps_dependencies(steps), workers=8, max_per_integration=2
+        )
+        assert steps_data == {i: i for i in range(3)}
+
+    def test_error(self):
+        steps = [_fetch(0, "int1"), _fetch(1, "int2"), _fetch(2, "int3")]
+
+        def execute_step(step):
+            if step.step_num == 1:
+                raise ValueError("fail")
+            time.sleep(0.1)
+            return step.step_num
+
+        steps_data = {}
+        try:
+            execute_steps_parallel(
+                steps, execute_step, steps_data, get_steps_dependencies(steps), workers=2, max_per_integration=2
+            )
+        except ValueError as e:
+            assert str(e) == "fail"
+        else:
+            raise AssertionError("error is not raised")
+        # the step which was running is completed, the next one is not started
+        assert steps_data == {0: 0}
+
+    def test_invalid_limits(self):
+        # limits less than 1 don't stop the execution
+        steps = [_fetch(0, "int1"), _fetch(1, "int1"), _fetch(2, "int2")]
+        steps_data = {}
+        execute_steps_parallel(
+            steps,
+            lambda step: step.step_num,
+            steps_data,
+            get_steps_dependencies(steps),
+            workers=0,
+            max_per_integration=0,
+        )
+        assert steps_data == {i: i for i in range(3)}
+
+    def test_unmet_dependencies(self):
+        steps = [_fetch(0, "int1"), _fetch(1, "int2")]
+        with pytest.raises(UnknownError):
+            execute_steps_parallel(
+                steps, lambda step: step.step_num, {}, {0: set(), 1: {5}}, workers=2, max_per_integration=2
+            )
+
+    def test_sub_select_keeps_input(self):
+        # input of the step can be read by other steps at the same time: absent columns are not added to it
+        result = ResultSet.from_df(pd.DataFrame({"a": [1, 2]}), table_name="tbl")
+        step = SubSelectStep(
+            step_num=1,
+            query=parse_sql("select * from tbl where b is null"),
+            dataframe=_fetch(0, "int1").result,
+            add_absent_cols=True,
+        )
+        sql_query = MagicMock(steps_data={0: result}, session=None)
+        ret = SubSelectStepCall(sql_query).call(step)
+        assert [col.name for col in result.columns] == ["a"]
+        assert list(result.to_df().columns) == ["a"]
+        assert ret.get_column_names() == ["a", "b"]
+
+    def test_shared_pool(self):
+        var = contextvars.ContextVar("var")
+        steps = [_fetch(0, "int1"), _fetch(1, "int2")]
+        threads = []
+
+        def execute_step(step):
+            threads.append(threading.current_thread())
+            return var.get()
+
+        # steps of all queries are executed by the threads of the process-wide pool,
+        # context of the query is passed to them
+        for value in range(5):
+            var.set(value)
+            threads.clear()
+            steps_data = {}
+            execute_steps_parallel(
+                steps, execute_step, steps_data, get_steps_dependencies(steps), workers=2, max_per_integration=2
+            )
+            assert steps_data == {0: value, 1: value}
+            assert all(thread.name.startswith("query_steps") for thread in threads)
+
+    def test_nested_query(self):
+        # steps of a query executed by a step are executed in the thread of that step
+        inner_steps = [_fetch(0, "int1"), _fetch(1, "int2")]
+        steps = [_fetch(0, "int1"), _fetch(1, "int2")]
+
+        def execute_inner_step(step):
+            return threading.get_ident()
+
+        def execute_step(step):
+            steps_data = {}
+            execute_steps_parallel(
+                inner_steps,
+                execute_inner_step,
+                steps_data,
+                get_steps_dependencies(inner_steps),
+                workers=2,
+                max_per_integration=2,
+            )
+            assert set(steps_data.values()) == {threading.get_ident()}
+            return step.step_num
+
+        steps_data = {}
+        execute_steps_parallel(
+            steps, execute_step, steps_data, get_steps_dependencies(steps), workers=2, max_per_integration=2
+        )
+        assert steps_data == {0: 0, 1: 1}
+
+
+class TestParallelSteps(BaseExecutorDummyML):
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_union_of_two_integrations(self, data_handler):
+        df1 = pd.DataFrame([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+        df2 = pd.DataFrame([{"a": 3, "c": "z"}])
+        self.set_handler(data_handler, name="pg1", tables={"tbl1": df1, "tbl2": df2})
+        self.set_handler(data_handler, name="pg2", tables={"tbl1": df1, "tbl2": df2})
+
+        counter = ConcurrencyCounter(0.3)
+        data_handler().query.side_effect = counter(data_handler().query.side_effect)
+
+        ret = self.run_sql("""
+            select a, b from pg1.tbl1
+            union all
+            select a, c from pg2.tbl2
+        """)
+        assert sorted(ret["a"].tolist()) == [1, 2, 3]
+        # both tables were fetched at the same time
+        assert counter.max == 2
+
+        # disabled in config
+        from mindsdb.utilities.config import config
+
+        counter.max = 0
+        with patch.dict(config["query_execution"], {"parallel_steps": False}):
+            ret = self.run_sql("select a, b from pg1.tbl1 union all select a, c from pg2.tbl2")
+        assert len(ret) == 3
+        assert counter.max == 1
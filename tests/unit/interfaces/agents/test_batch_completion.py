@@ -0,0 +1,94 @@
+import time
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+import pandas as pd
+
+from mindsdb.interfaces.agents.langchain_agent import LangchainAgent
+
+
+class SleepingAgentExecutor:
+    """Answers the question after a delay, delay is a part of the question: 'sleep:<seconds>:<answer>'.
+    If state has a barrier, the executor waits for other executors on it before answering.
+    """
+
+    def __init__(self, state):
+        self.state = state
+
+    def invoke(self, inputs, config=None):
+        with self.state["lock"]:
+            self.state["running"] += 1
+            self.state["max_running"] = max(self.state["max_running"], self.state["running"])
+        try:
+            _, delay, answer = inputs["input"].split(":")
+            if self.state.get("barrier") is not None:
+                self.state["barrier"].wait()
+            time.sleep(float(delay))
+            return {"output": answer}
+        finally:
+            with self.state["lock"]:
+                self.state["running"] -= 1
+
+
+class TestBatchCompletion(unittest.TestCase):
+    def setUp(self):
+        agent = SimpleNamespace(
+            params={"prompt_template": "{{question}}"}, model_name="gpt-4o", provider="openai", skills_relationships=[]
+        )
+        with patch("mindsdb.interfaces.agents.langchain_agent.LangfuseClientWrapper"):
+            self.agent = LangchainAgent(agent)
+
+        self.state = {"lock": threading.Lock(), "running": 0, "max_running": 0}
+        self.llm_created = 0
+
+        def create_chat_model(args):
+            self.llm_created += 1
+            return MagicMock()
+
+        patchers = [
+            patch("mindsdb.interfaces.agents.langchain_agent.create_chat_model", side_effect=create_chat_model),
+            patch("mindsdb.interfaces.agents.langchain_agent.DEFAULT_AGENT_SYSTEM_PROMPT", ""),
+            patch.object(LangchainAgent, "_langchain_tools_from_skills", return_value=[]),
+            patch.object(LangchainAgent, "_get_agent_callbacks", return_value=[]),
+            patch.object(LangchainAgent, "_create_memory", return_value=None),
+            patch.object(
+                LangchainAgent, "_create_agent_executor", side_effect=lambda *args: SleepingAgentExecutor(self.state)
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_rows_run_concurrently(self):
+        df = pd.DataFrame({"question": [f"sleep:0:answer {i}" for i in range(6)] + [None], "id": range(7)})
+        args = dict(self.agent.args, max_workers=3)
+        # rows pass the barrier only in groups of 3 running at the same time
+        self.state["barrier"] = threading.Barrier(3, timeout=10)
+
+        with patch("mindsdb.interfaces.agents.langchain_agent.logger") as logger:
+            result = self.agent.run_agent_batch(df, args)
+
+        assert result["answer"].tolist() == [f"answer {i}" for i in range(6)] + [None]
+        # input columns are kept
+        assert result["id"].tolist() == list(range(7))
+        assert self.state["max_running"] == 3
+        # llm is shared between rows
+        assert self.llm_created == 1
+        # missing conversation history is logged once per batch, not per row
+        warnings = [call.args[0] for call in logger.warning.call_args_list]
+        assert warnings.count("No conversation messages found - using simple prompt") == 1
+
+    def test_stream_and_row_timeout(self):
+        df = pd.DataFrame({"question": ["sleep:2:slow", "sleep:0.1:fast"]})
+        args = dict(self.agent.args, max_workers=2, timeout=0.5)
+
+        chunks = list(self.agent.stream_agent_batch(df, args))
+
+        assert chunks[0]["type"] == "start"
+        rows = [chunk for chunk in chunks if chunk["type"] == "row"]
+        # fast row is returned first
+        assert [row["index"] for row in rows] == [1, 0]
+        assert rows[0]["output"] == "fast"
+        assert "couldn't generate a response within the allotted time" in rows[1]["output"]
@@ -0,0 +1,92 @@
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from mindsdb_sql_parser.ast import Show
+
+from mindsdb.interfaces.skills.sql_agent import SQLAgent
+
+
+class FakeSessionPool:
+    def __init__(self):
+        self.sessions = []
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def session(self, api_type="http"):
+        session = SimpleNamespace(database=None)
+        with self.lock:
+            self.sessions.append(session)
+        yield session
+
+
+class RecordingExecutor:
+    """Executes the query when all callers are inside, records sessions which were used at the same time"""
+
+    def __init__(self, session, state):
+        self.session = session
+        self.state = state
+
+    def execute_command(self, query, database_name=None):
+        with self.state["lock"]:
+            self.state["active"].append(self.session)
+        self.state["barrier"].wait()
+        with self.state["lock"]:
+            self.state["concurrent"].append(list(self.state["active"]))
+        self.state["barrier"].wait()
+        with self.state["lock"]:
+            self.state["active"].remove(self.session)
+        if isinstance(query, Show):
+            # list of knowledge bases for the permissions check
+            return SimpleNamespace(data=SimpleNamespace(records=[{"NAME": "kb1"}]))
+        data = SimpleNamespace(columns=[SimpleNamespace(name="a")], to_lists=lambda: [[1]])
+        return SimpleNamespace(data=data)
+
+
+class TestSQLAgentSessions:
+    def test_concurrent_sql_tool_calls(self):
+        threads_count = 4
+        state = {
+            "lock": threading.Lock(),
+            "barrier": threading.Barrier(threads_count, timeout=10),
+            "active": [],
+            "concurrent": [],
+        }
+        command_executor = MagicMock()
+        command_executor.session.database = "mindsdb"
+        sql_agent = SQLAgent(command_executor=command_executor, databases=["mindsdb"], databases_struct={})
+
+        pool = FakeSessionPool()
+        results = []
+        errors = []
+
+        def call_tool():
+            try:
+                results.append(sql_agent.query("select 1 as a"))
+            except Exception as e:
+                errors.append(e)
+
+        with (
+            patch("mindsdb.api.executor.controllers.session_pool", pool),
+            patch(
+                "mindsdb.api.executor.command_executor.ExecuteCommands",
+                side_effect=lambda session: RecordingExecutor(session, state),
+            ),
+        ):
+            threads = [threading.Thread(target=call_tool) for _ in range(threads_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert errors == []
+        assert len(results) == threads_count
+        # the shared session of the agent is not used, every call has its own session
+        command_executor.execute_command.assert_not_called()
+        # the permissions check and the query use the same session
+        assert len(pool.sessions) == threads_count
+        assert all(session.database == "mindsdb" for session in pool.sessions)
+        for active in state["concurrent"]:
+            assert len(active) == threads_count
+            assert len({id(session) for session in active}) == threads_count
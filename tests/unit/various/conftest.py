@@ -0,0 +1,43 @@
+import time
+import threading
+
+import pytest
+
+
+class CountingLoader:
+    """Loader of a cache which counts its calls. The value is made from the number of the call, so reloads
+    are visible. With a barrier the loader waits for other loaders, to check that they run concurrently
+    """
+
+    def __init__(self, make_value=lambda calls: f"load {calls}", delay=0.0, barrier=None):
+        self.make_value = make_value
+        self.delay = delay
+        self.barrier = barrier
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            calls = self.calls
+        if self.barrier is not None:
+            self.barrier.wait()
+        time.sleep(self.delay)
+        return self.make_value(calls)
+
+
+@pytest.fixture
+def counting_loader():
+    return CountingLoader
+
+
+@pytest.fixture
+def make_cache():
+    """Factory of caches which are enabled regardless of the config"""
+
+    def _make_cache(cache_class, **kwargs):
+        cache = cache_class(**kwargs)
+        cache.enabled = True
+        return cache
+
+    return _make_cache
@@ -0,0 +1,152 @@
+import threading
+
+import pandas as pd
+from mindsdb_sql_parser import parse_sql
+
+from mindsdb.integrations.libs.api_handler import APIHandler, APIResource, prefetch_pages
+from mindsdb.integrations.utilities.sql_utils import FilterOperator
+
+
+class PagedTable(APIResource):
+    def __init__(self, *args, pages=3, page_size=10, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pages = pages
+        self.page_size = page_size
+        self.requested = []
+        self.closed = False
+
+    def list_pages(self, conditions=None, limit=None, sort=None, targets=None, **kwargs):
+        for condition in conditions:
+            if condition.column == "kind" and condition.op == FilterOperator.EQUAL:
+                condition.applied = True
+        if sort:
+            for col in sort:
+                if col.column == "id" and col.ascending:
+                    col.applied = True
+        try:
+            for page_num in range(self.pages):
+                self.requested.append(page_num)
+                start = page_num * self.page_size
+                ids = list(range(start, start + self.page_size))
+                yield pd.DataFrame({"id": ids, "kind": "a", "even": [i % 2 == 0 for i in ids]})
+        finally:
+            self.closed = True
+
+    def get_columns(self):
+        return ["id", "kind", "even"]
+
+
+class PagedHandler(APIHandler):
+    def __init__(self, table):
+        super().__init__("test")
+        self._register_table("items", table)
+
+
+def run_select(table, sql):
+    return table.select(parse_sql(sql))
+
+
+class TestAPIResourcePages:
+    def test_stop_on_limit(self):
+        table = PagedTable(None)
+        table.prefetch_pages = False
+        result = run_select(table, "select * from items where even = true limit 7")
+
+        assert result["id"].tolist() == [0, 2, 4, 6, 8, 10, 12]
+        # the third page is not requested
+        assert table.requested == [0, 1]
+        assert table.closed
+
+    def test_prefetch(self):
+        table = PagedTable(None)
+        result = run_select(table, "select * from items where kind = 'a' limit 5")
+
+        assert result["id"].tolist() == [0, 1, 2, 3, 4]
+        # the limit is reached on the first page: the next page is not requested in advance
+        assert table.requested == [0]
+        assert table.closed
+
+    def test_pages_without_close(self):
+        class IteratorTable(PagedTable):
+            def list_pages(self, **kwargs):
+                return iter(list(super().list_pages(**kwargs)))
+
+        for prefetch in (True, False):
+            table = IteratorTable(None)
+            table.prefetch_pages = prefetch
+            result = run_select(table, "select * from items limit 15")
+            assert result["id"].tolist() == list(range(15))
+
+    def test_sort_after_fetch(self):
+        table = PagedTable(None)
+        result = run_select(table, "select * from items order by id desc limit 3")
+        assert result["id"].tolist() == [29, 28, 27]
+        assert table.requested == [0, 1, 2]
+
+        # sorted by api
+        table = PagedTable(None)
+        result = run_select(table, "select * from items order by id limit 3")
+        assert result["id"].tolist() == [0, 1, 2]
+        assert len(table.requested) <= 2
+
+    def test_no_limit(self):
+        table = PagedTable(None)
+        result = run_select(table, "select * from items where even = false")
+        assert len(result) == 15
+        assert table.list(conditions=[])["id"].tolist() == list(range(30))
+
+    def test_query_stream(self):
+        table = PagedTable(None)
+        handler = PagedHandler(table)
+        parts = list(handler.query_stream(parse_sql("select * from items where even = true")))
+        assert [len(part) for part in parts] == [5, 5, 5]
+
+        response = handler.query(parse_sql("select id from items where id > 25"))
+        assert response.data_frame["id"].tolist() == [26, 27, 28, 29]
+
+    def test_prefetch_pages(self):
+        threads = set()
+
+        def pages():
+            for i in range(3):
+                threads.add(threading.get_ident())
+                yield i
+
+        assert list(prefetch_pages(pages())) == [0, 1, 2]
+        assert threading.get_ident() not in threads
+
+    def test_prefetch_pages_stop(self):
+        requesting = threading.Event()
+        release = threading.Event()
+        closed = threading.Event()
+
+        def pages():
+            try:
+                yield 0
+                # the consumer doesn't wait for the running request
+                requesting.set()
+                release.wait(10)
+                yield 1
+            finally:
+                closed.set()
+
+        stream = prefetch_pages(pages())
+        assert next(stream) == 0
+        assert requesting.wait(10)
+        stream.close()
+        assert not closed.is_set()
+
+        release.set()
+        # the source is closed when the request is finished
+        assert closed.wait(10)
+
+        # the next page is not requested after the last needed page
+        requested = []
+
+        def counted_pages():
+            for i in range(3):
+                requested.append(i)
+                yield i
+
+        assert list(prefetch_pages(counted_pages(), lambda page: (page, page == 1))) == [0, 1]
+        assert requested == [0, 1]
@@ -0,0 +1,102 @@
+import json
+from unittest.mock import Mock
+
+from mindsdb.interfaces.knowledge_base.preprocessing.context_generator import ContextGenerator, escape_tags
+
+TEMPLATE = "<document>{WHOLE_DOCUMENT}</document><chunk>{CHUNK_CONTENT}</chunk>"
+
+
+class MockResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value):
+        self.data[name] = value
+
+
+def _make_llm(answer):
+    llm = Mock(spec=["batch"])
+    llm.batch = Mock(side_effect=lambda prompts, config=None: [MockResponse(answer(prompt)) for prompt in prompts])
+    return llm
+
+
+def _make_generator(llm, chunks_per_prompt=1):
+    generator = ContextGenerator(
+        llm, TEMPLATE, model_key="test:model", max_concurrency=2, chunks_per_prompt=chunks_per_prompt, use_cache=False
+    )
+    generator._cache = DictCache()
+    return generator
+
+
+class TestContextGenerator:
+    def test_escape_tags(self):
+        assert escape_tags("a <chunk> b </DOCUMENT> <other>") == "a &lt;chunk&gt; b &lt;/DOCUMENT&gt; <other>"
+
+    def test_contexts_are_cached(self):
+        llm = _make_llm(lambda prompt: f"context {len(prompt)}")
+        generator = _make_generator(llm)
+
+        chunks = ["chunk 1", "chunk 22", "chunk 333"]
+        documents = ["doc A", "doc A", "doc B"]
+        contexts = generator.generate(chunks, documents)
+        assert len(contexts) == 3
+        assert llm.batch.call_count == 1
+        assert len(llm.batch.call_args.args[0]) == 3
+        assert llm.batch.call_args.kwargs["config"] == {"max_concurrency": 2}
+
+        # the same content: everything is taken from cache
+        assert generator.generate(chunks, documents) == contexts
+        assert llm.batch.call_count == 1
+
+        # only new chunk is sent to LLM
+        contexts2 = generator.generate(chunks + ["chunk 4"], documents + ["doc A"])
+        assert contexts2[:3] == contexts
+        assert llm.batch.call_count == 2
+        assert len(llm.batch.call_args.args[0]) == 1
+
+    def test_cache_depends_on_model(self):
+        llm = _make_llm(lambda prompt: "context")
+        generator = _make_generator(llm)
+        generator.generate(["chunk"], ["doc"])
+
+        other = ContextGenerator(llm, TEMPLATE, model_key="test:other", use_cache=False)
+        other._cache = generator._cache
+        other.generate(["chunk"], ["doc"])
+        assert llm.batch.call_count == 2
+
+    def test_multiple_chunks_per_prompt(self):
+        def answer(prompt):
+            count = prompt.count("<chunk number=")
+            return json.dumps([f"context {i}" for i in range(count)])
+
+        llm = _make_llm(answer)
+        generator = _make_generator(llm, chunks_per_prompt=2)
+
+        contexts = generator.generate(["c1", "c2", "c3", "c4"], ["doc A", "doc A", "doc A", "doc B"])
+        # doc A: 2 + 1 chunks, doc B: 1 chunk
+        prompts = llm.batch.call_args.args[0]
+        assert len(prompts) == 3
+        assert sum(prompt.count("doc A") for prompt in prompts) == 2
+        assert contexts[0] == "context 0"
+        assert contexts[1] == "context 1"
+
+    def test_multiple_chunks_fallback(self):
+        def answer(prompt):
+            if "<chunk number=" in prompt:
+                return "not a json"
+            return "single context"
+
+        llm = _make_llm(answer)
+        generator = _make_generator(llm, chunks_per_prompt=3)
+
+        contexts = generator.generate(["c1", "c2", "c3"], ["doc", "doc", "doc"])
+        assert contexts == ["single context"] * 3
+        assert llm.batch.call_count == 2
@@ -564,10 +564,10 @@ class TestContextualPreprocessor:
             chunks = preprocessor_sync.process_documents([doc])
             assert chunks[0].metadata["source"] == "ContextualPreprocessor"
 
-    def test_prepare_prompts(self, preprocessor_sync):
-        chunk_contents = [f"Chunk contents {i}" for i in range(10)]
-        full_documents = [f"Full document {i}" for i in range(10)]
-        _ = preprocessor_sync._prepare_prompts(chunk_contents, full_documents)
+    def test_prepare_prompt(self, preprocessor_sync):
+        prompt = preprocessor_sync.context_generator._prepare_prompt("Chunk <chunk>", "Full <document>")
+        assert "Chunk &lt;chunk&gt;" in prompt
+        assert "Full &lt;document&gt;" in prompt
 
     def test_process_documents(self, sample_document, preprocessor_sync):
         """Test document processing"""
@@ -2,6 +2,7 @@ from copy import deepcopy
 import datetime
 from decimal import Decimal
 
+import numpy as np
 import pytest
 from pandas import DataFrame, NA, Timestamp
 
@@ -69,6 +70,11 @@ dtype_tests = [
         'dtype': 'float64',
         'output': ['1.1', '2.2', '3.3', '4.4'],
         'mysql_type': MYSQL_DATA_TYPE.FLOAT
+    }, {
+        'input': [1.5, np.nan, None],
+        'dtype': 'float64',
+        'output': ['1.5', None, None],
+        'mysql_type': MYSQL_DATA_TYPE.FLOAT
     }, {
         'input': [1.1, NA, None, Decimal('4.4')],
         'dtype': 'Float64',
@@ -87,6 +93,11 @@ dtype_tests = [
         'dtype': 'Int64',
         'output': ['1', None, None],
         'mysql_type': MYSQL_DATA_TYPE.INT
+    }, {
+        'input': [1, NA, None],
+        'dtype': 'Int32',
+        'output': ['1', None, None],
+        'mysql_type': MYSQL_DATA_TYPE.INT
     },
 
     # STR types
@@ -0,0 +1,71 @@
+import time
+
+import pandas as pd
+
+from mindsdb.interfaces.knowledge_base.query_cache import KnowledgeBaseQueryCache
+
+
+class TestKnowledgeBaseQueryCache:
+    def test_get_set(self, make_cache):
+        cache = make_cache(KnowledgeBaseQueryCache, ttl=60, max_size=10**6)
+        df = pd.DataFrame({"id": [1, 2], "content": ["a", "b"]})
+
+        assert cache.get((1, 0, "q")) is None
+        cache.set((1, 0, "q"), 1, df)
+
+        cached = cache.get((1, 0, "q"))
+        assert cached.equals(df)
+        # a copy is returned
+        cached["id"] = 0
+        assert cache.get((1, 0, "q")).equals(df)
+
+        # other data version
+        assert cache.get((1, 1, "q")) is None
+        assert cache.hits == 2
+        assert cache.misses == 2
+        assert cache.hit_ratio == 0.5
+
+    def test_invalidate(self, make_cache):
+        cache = make_cache(KnowledgeBaseQueryCache, ttl=60, max_size=10**6)
+        df = pd.DataFrame({"id": [1]})
+        cache.set((1, 0, "q1"), 1, df)
+        cache.set((1, 0, "q2"), 1, df)
+        cache.set((2, 0, "q1"), 2, df)
+
+        cache.invalidate(1)
+        assert cache.get((1, 0, "q1")) is None
+        assert cache.get((1, 0, "q2")) is None
+        assert cache.get((2, 0, "q1")) is not None
+
+    def test_ttl(self, make_cache):
+        cache = make_cache(KnowledgeBaseQueryCache, ttl=0.01, max_size=10**6)
+        cache.set("key", 1, pd.DataFrame({"id": [1]}))
+        time.sleep(0.02)
+        assert cache.get("key") is None
+        assert cache._size == 0
+
+    def test_memory_limit(self, make_cache):
+        df = pd.DataFrame({"content": ["x" * 1000] * 10})
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        cache = make_cache(KnowledgeBaseQueryCache, ttl=60, max_size=size * 2)
+
+        cache.set("a", 1, df)
+        cache.set("b", 1, df)
+        # 'a' becomes most recently used
+        assert cache.get("a") is not None
+        cache.set("c", 1, df)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache._size <= size * 2
+
+        # too big to be cached
+        cache.set("d", 1, pd.concat([df] * 3))
+        assert cache.get("d") is None
+
+    def test_disabled(self, make_cache):
+        cache = make_cache(KnowledgeBaseQueryCache, ttl=60, max_size=10**6)
+        cache.enabled = False
+        cache.set("a", 1, pd.DataFrame({"id": [1]}))
+        assert cache.get("a") is None
@@ -0,0 +1,118 @@
+import time
+import threading
+from concurrent.futures import wait
+
+import pytest
+
+from mindsdb.utilities.loading_cache import LoadingCache
+
+
+class SimpleCache(LoadingCache):
+    def __init__(self, ttl=60, max_size=10, workers=1):
+        super().__init__(enabled=True, ttl=ttl, max_size=max_size, workers=workers)
+
+    def get(self, key, loader, timeout=5):
+        with self._lock:
+            record, future = self._get_or_submit(key, loader, time.monotonic())
+        if record is not None:
+            return record.value
+        return future.result(timeout)
+
+    def invalidate(self, prefix):
+        return self._invalidate(lambda key: key.startswith(prefix))
+
+
+class TestLoadingCache:
+    def test_concurrent_get_loads_once(self, counting_loader):
+        cache = SimpleCache(workers=4)
+        loader = counting_loader(delay=0.1)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("key", loader))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert loader.calls == 1
+        assert results == ["load 1"] * 5
+
+    def test_stale_record_refreshed_in_background(self, counting_loader):
+        cache = SimpleCache(ttl=0.05)
+        loader = counting_loader()
+
+        assert cache.get("key", loader) == "load 1"
+        time.sleep(0.1)
+        # stale record is returned immediately
+        assert cache.get("key", loader) == "load 1"
+        wait(list(cache._pending.values()))
+        assert cache.get("key", loader) == "load 2"
+        assert loader.calls == 2
+
+    def test_eviction(self, counting_loader):
+        cache = SimpleCache(max_size=2)
+        loader = counting_loader()
+        for key in ("k1", "k2", "k3"):
+            cache.get(key, loader)
+        cache.get("k1", loader)
+        assert loader.calls == 4
+
+    def test_failed_load_not_cached(self, counting_loader):
+        cache = SimpleCache()
+
+        def loader():
+            raise ConnectionError("unreachable")
+
+        with pytest.raises(ConnectionError):
+            cache.get("key", loader)
+        assert len(cache._records) == 0
+        assert len(cache._pending) == 0
+        assert cache.get("key", counting_loader()) == "load 1"
+
+    def test_disabled(self, counting_loader):
+        cache = SimpleCache()
+        cache.enabled = False
+        loader = counting_loader()
+        assert cache.get("key", loader) == "load 1"
+        assert cache.get("key", loader) == "load 2"
+        assert len(cache._records) == 0
+
+    def test_invalidate(self, counting_loader):
+        cache = SimpleCache()
+        loader = counting_loader()
+        cache.get("db.t1", loader)
+        cache.get("db.t2", loader)
+        cache.get("db2.t1", loader)
+
+        assert cache.invalidate("db.") == 2
+        cache.get("db.t1", loader)
+        cache.get("db2.t1", loader)
+        assert loader.calls == 4
+
+        cache.clear()
+        cache.get("db2.t1", loader)
+        assert loader.calls == 5
+
+    def test_invalidate_running_load(self, counting_loader):
+        cache = SimpleCache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_loader():
+            started.set()
+            release.wait(5)
+            return "stale"
+
+        with cache._lock:
+            future = cache._submit("key", slow_loader)
+        started.wait(5)
+        # the source is changed while it is loading
+        cache.invalidate("key")
+        release.set()
+        # callers which already wait get the value, but it is not stored
+        assert future.result(timeout=5) == "stale"
+        assert "key" not in cache._records
+
+        # the next request loads it again
+        assert cache.get("key", counting_loader(make_value=lambda calls: "fresh")) == "fresh"
+        assert cache.get("key", counting_loader(make_value=lambda calls: "other")) == "fresh"
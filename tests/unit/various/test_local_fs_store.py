@@ -0,0 +1,130 @@
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mindsdb.interfaces.storage import fs
+
+
+@pytest.fixture
+def dirs():
+    paths = [Path(tempfile.mkdtemp(prefix="mindsdb_fs_test_")) for _ in range(3)]
+    yield paths
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def make_store(storage: Path, hardlink: bool = False) -> fs.LocalFSStore:
+    store = fs.LocalFSStore()
+    store.storage = str(storage)
+    store.hardlink = hardlink
+    return store
+
+
+def test_sync_changed_files(dirs):
+    storage, local_1, local_2 = dirs
+    name = "predictor_1_1"
+    src = local_1 / name
+    (src / "sub").mkdir(parents=True)
+    (src / "empty").mkdir()
+    (src / "a.bin").write_bytes(b"a" * 1000)
+    (src / "sub" / "b.txt").write_text("b")
+
+    store = make_store(storage)
+    store.put(name, str(local_1))
+    store.get(name, str(local_2))
+    dst = local_2 / name
+    assert (dst / "a.bin").read_bytes() == b"a" * 1000
+    assert (dst / "sub" / "b.txt").read_text() == "b"
+    assert (dst / "empty").is_dir()
+
+    # not changed resource: only manifests are compared
+    with patch.object(fs, "scan_folder") as scan_folder:
+        store.get(name, str(local_2))
+        scan_folder.assert_not_called()
+
+    (src / "sub" / "b.txt").write_text("bb")
+    (src / "c.txt").write_text("c")
+    (src / "a.bin").unlink()
+    with patch.object(fs, "clone_file", wraps=fs.clone_file) as clone_file:
+        store.put(name, str(local_1))
+        assert sorted(call.args[0].name for call in clone_file.call_args_list) == ["b.txt", "c.txt"]
+
+        clone_file.reset_mock()
+        store.get(name, str(local_2))
+        assert sorted(call.args[0].name for call in clone_file.call_args_list) == ["b.txt", "c.txt"]
+
+        # nothing is changed
+        clone_file.reset_mock()
+        store.put(name, str(local_1))
+        clone_file.assert_not_called()
+
+    assert not (dst / "a.bin").exists()
+    assert (dst / "sub" / "b.txt").read_text() == "bb"
+    assert (dst / "c.txt").read_text() == "c"
+
+
+def test_storage_without_manifest(dirs):
+    storage, local_1, _ = dirs
+    name = "integration_1_2"
+    (storage / name).mkdir()
+    (storage / name / "file.txt").write_text("content")
+
+    store = make_store(storage)
+    store.get(name, str(local_1))
+    assert (local_1 / name / "file.txt").read_text() == "content"
+
+    (local_1 / name / "file.txt").write_text("new content")
+    store.put(name, str(local_1))
+    assert (storage / name / "file.txt").read_text() == "new content"
+    assert "version" in fs.read_manifest(storage / name)
+
+
+def test_hardlink(dirs):
+    storage, local_1, local_2 = dirs
+    name = "predictor_1_3"
+    (local_1 / name).mkdir()
+    (local_1 / name / "model.bin").write_bytes(b"model")
+
+    store = make_store(storage, hardlink=True)
+    store.put(name, str(local_1))
+    store.get(name, str(local_2))
+    assert (local_2 / name / "model.bin").stat().st_ino == (storage / name / "model.bin").stat().st_ino
+
+
+def test_sync_sub_path(dirs):
+    storage, local_1, local_2 = dirs
+    name = "integration_1_4"
+    src = local_1 / name
+    (src / "folder").mkdir(parents=True)
+    (src / "folder" / "a.txt").write_text("a")
+    (src / "b.txt").write_text("b")
+
+    store = make_store(storage)
+    store.put(name, str(local_1))
+    store.get(name, str(local_2))
+    dst = local_2 / name
+
+    (src / "folder" / "a.txt").write_text("aa")
+    (src / "folder" / "c.txt").write_text("c")
+    (src / "b.txt").write_text("bb")
+    store.put(name, str(local_1), sub_path="folder")
+    # only the sub path is pushed
+    assert (storage / name / "folder" / "a.txt").read_text() == "aa"
+    assert (storage / name / "folder" / "c.txt").read_text() == "c"
+    assert (storage / name / "b.txt").read_text() == "b"
+
+    store.get(name, str(local_2), sub_path="folder")
+    assert (dst / "folder" / "a.txt").read_text() == "aa"
+    assert (dst / "folder" / "c.txt").read_text() == "c"
+
+    # local folder is not marked as synced by the sub path: full sync is done
+    (dst / "b.txt").write_text("local")
+    store.get(name, str(local_2))
+    assert (dst / "b.txt").read_text() == "b"
+
+    store.put(name, str(local_1))
+    store.get(name, str(local_2))
+    assert (dst / "b.txt").read_text() == "bb"
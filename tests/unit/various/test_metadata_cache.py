@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import wait
+
+from mindsdb.interfaces.database.metadata_cache import MetadataCache, make_metadata_key
+from mindsdb.utilities.context import context as ctx
+
+
+def value(name):
+    return lambda calls: name
+
+
+class TestMetadataCache:
+    def test_sources_are_loaded_concurrently(self, make_cache, counting_loader):
+        cache = make_cache(MetadataCache, ttl=60, max_records=100, workers=4, timeout=5)
+        # loaders pass the barrier only if all 4 of them run at the same time
+        barrier = threading.Barrier(4, timeout=5)
+        loaders = [counting_loader(value(f"db{i}"), barrier=barrier) for i in range(4)]
+        items = [(make_metadata_key(f"db{i}"), loader) for i, loader in enumerate(loaders)]
+
+        assert cache.get_many(items) == (["db0", "db1", "db2", "db3"], [])
+
+        # cached
+        assert cache.get_many(items) == (["db0", "db1", "db2", "db3"], [])
+        assert all(loader.calls == 1 for loader in loaders)
+
+    def test_slow_source_is_skipped(self, make_cache, counting_loader):
+        cache = make_cache(MetadataCache, ttl=60, max_records=100, workers=2, timeout=5)
+        fast = counting_loader(value("fast"))
+        slow = counting_loader(value("slow"), delay=0.5)
+        items = [(make_metadata_key("fast"), fast), (make_metadata_key("slow"), slow)]
+
+        assert cache.get_many(items, timeout=0.1) == (["fast", None], [make_metadata_key("slow")])
+
+        # loading is continued in the background
+        wait(list(cache._pending.values()))
+        assert cache.get_many(items, timeout=0.1) == (["fast", "slow"], [])
+        assert slow.calls == 1
+
+    def test_failed_source(self, make_cache):
+        cache = make_cache(MetadataCache, ttl=60, max_records=100, workers=1, timeout=5)
+
+        def loader():
+            raise ConnectionError("unreachable")
+
+        # error of the source is not raised to the caller
+        assert cache.get(make_metadata_key("db"), loader) is None
+        assert len(cache._records) == 0
+
+    def test_invalidate_and_company_scope(self, make_cache, counting_loader):
+        cache = make_cache(MetadataCache, ttl=60, max_records=100, workers=1, timeout=5)
+        loader = counting_loader(value("tables"))
+
+        ctx.set_default()
+        ctx.company_id = 1
+        cache.get(make_metadata_key("db"), loader)
+        cache.get(make_metadata_key("DB", "t1"), loader)
+        ctx.company_id = 2
+        cache.get(make_metadata_key("db"), loader)
+        assert loader.calls == 3
+
+        ctx.company_id = 1
+        cache.invalidate("Db")
+        cache.get(make_metadata_key("db"), loader)
+        cache.get(make_metadata_key("db", "t1"), loader)
+        assert loader.calls == 5
+
+        # other company is not affected
+        ctx.company_id = 2
+        cache.get(make_metadata_key("db"), loader)
+        assert loader.calls == 5
+        ctx.set_default()
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import pytest
+
+# opentelemetry is an optional dependency
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from mindsdb.utilities import otel
+from mindsdb.utilities.otel import spans
+from mindsdb.utilities.context import context as ctx
+import mindsdb.utilities.profiler as profiler
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with (
+        patch.object(spans, "tracer", provider.get_tracer("test")),
+        patch.multiple(
+            otel,
+            TRACING_ENABLED=True,
+            start_span=spans.start_span,
+            set_span_attributes=spans.set_span_attributes,
+            inject_trace_context=spans.inject_trace_context,
+            attach_trace_context=spans.attach_trace_context,
+        ),
+    ):
+        ctx.set_default()
+        yield exporter
+
+
+def test_profiler_spans(exporter):
+    @profiler.profile("decorated")
+    def fetch():
+        profiler.set_attributes(rows=10, model=None)
+
+    with profiler.Context("root", integration="pg"):
+        fetch()
+        profiler.set_attributes(bytes=100)
+
+    decorated, root = exporter.get_finished_spans()
+    assert root.name == "root"
+    assert dict(root.attributes) == {"integration": "pg", "bytes": 100}
+    assert decorated.parent.span_id == root.context.span_id
+    assert dict(decorated.attributes) == {"rows": 10}
+
+    # attributes are added to profiling nodes too
+    profiler.enable()
+    with profiler.Context("root", integration="pg"):
+        fetch()
+    tree = ctx.profiling["tree"]
+    assert tree["attributes"] == {"integration": "pg"}
+    assert tree["children"][0]["attributes"] == {"rows": 10}
+    assert ctx.profiling["level"] == 0
+
+
+def test_trace_context_propagation(exporter):
+    from mindsdb.integrations.libs.process_cache import warm_function
+
+    def predict_process(value):
+        profiler.set_attributes(value=value)
+        return value
+
+    with profiler.Context("ml: predict"):
+        trace_context = otel.inject_trace_context()
+    # as it is executed in another process: the trace is continued only by trace_context
+    assert warm_function(predict_process, ctx.dump(), trace_context, 5) == 5
+
+    dispatch, process = exporter.get_finished_spans()
+    assert process.name == "ml process: predict_process"
+    assert process.context.trace_id == dispatch.context.trace_id
+    assert process.parent.span_id == dispatch.context.span_id
+    assert dict(process.attributes) == {"value": 5}
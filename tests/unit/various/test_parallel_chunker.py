@@ -0,0 +1,104 @@
+import json
+from unittest.mock import patch
+
+import pandas as pd
+
+from mindsdb.interfaces.knowledge_base.preprocessing.models import (
+    Document,
+    RawDocument,
+    ChunkBatch,
+    TextChunkingConfig,
+)
+from mindsdb.interfaces.knowledge_base.preprocessing.document_preprocessor import TextChunkingPreprocessor
+from mindsdb.interfaces.knowledge_base.preprocessing.json_chunker import JSONChunkingPreprocessor
+from mindsdb.interfaces.knowledge_base.preprocessing.parallel_chunker import ParallelChunker
+
+
+def _make_documents(count: int) -> list:
+    text = " ".join(f"Sentence number {i} of the document." for i in range(60))
+    return [
+        RawDocument(f"doc_{i}", f"{i} {text}", {"_content_column": "content", "_original_row_index": str(i)})
+        for i in range(count)
+    ]
+
+
+def _as_records(chunks: list) -> list:
+    return [(chunk.id, chunk.content, chunk.metadata) for chunk in chunks]
+
+
+def _batch_as_records(batch: ChunkBatch) -> list:
+    return list(zip(batch.ids, batch.contents, batch.metadata))
+
+
+class TestColumnarChunking:
+    def test_text_chunking_matches_process_documents(self):
+        preprocessor = TextChunkingPreprocessor(TextChunkingConfig(chunk_size=200, chunk_overlap=20))
+        documents = _make_documents(5)
+
+        batch = preprocessor.chunk_documents(documents)
+        chunks = preprocessor.process_documents([doc.to_document() for doc in documents])
+
+        assert len(batch) == len(chunks) > len(documents)
+        assert _batch_as_records(batch) == _as_records(chunks)
+
+    def test_empty_content_is_skipped(self):
+        preprocessor = TextChunkingPreprocessor()
+        batch = preprocessor.chunk_documents([RawDocument("1", "   "), RawDocument("2", "")])
+        assert len(batch) == 0
+        assert list(batch.to_dataframe().columns) == ["id", "content", "metadata"]
+
+    def test_json_chunking_uses_process_documents(self):
+        preprocessor = JSONChunkingPreprocessor()
+        documents = [RawDocument(f"doc_{i}", json.dumps({"id": i, "name": f"name {i}"}), {"a": i}) for i in range(3)]
+
+        batch = preprocessor.chunk_documents(documents)
+        chunks = preprocessor.process_documents([doc.to_document() for doc in documents])
+
+        assert _batch_as_records(batch) == _as_records(chunks)
+
+    def test_to_dataframe(self):
+        batch = ChunkBatch.from_lists(["a", "b"], ["content a", "content b"], [{"x": 1}, {"x": [1, 2]}])
+        df = batch.to_dataframe()
+
+        assert isinstance(df, pd.DataFrame)
+        assert df["id"].tolist() == ["a", "b"]
+        assert df["metadata"].tolist() == [{"x": 1}, {"x": [1, 2]}]
+
+    def test_concat(self):
+        batch1 = ChunkBatch.from_lists(["a"], ["1"], [{}])
+        batch2 = ChunkBatch.from_lists(["b", "c"], ["2", "3"], [{}, {}])
+        batch = ChunkBatch.concat([batch1, ChunkBatch(), batch2])
+        assert batch.ids.tolist() == ["a", "b", "c"]
+        assert len(ChunkBatch.concat([])) == 0
+
+
+class TestParallelChunker:
+    def test_small_input_is_processed_in_place(self):
+        preprocessor = TextChunkingPreprocessor(TextChunkingConfig(chunk_size=200, chunk_overlap=20))
+        chunker = ParallelChunker(preprocessor)
+        chunker.workers = 2
+        chunker.min_documents = 100
+
+        with patch.object(ParallelChunker, "_get_pool") as get_pool:
+            chunker.chunk(_make_documents(10))
+            get_pool.assert_not_called()
+
+    def test_parallel_result_matches_serial(self):
+        preprocessor = TextChunkingPreprocessor(TextChunkingConfig(chunk_size=200, chunk_overlap=20))
+        documents = _make_documents(20)
+
+        chunker = ParallelChunker(preprocessor)
+        chunker.workers = 2
+        chunker.batch_size = 3
+        chunker.min_documents = 0
+        try:
+            batch = chunker.chunk(documents)
+        finally:
+            ParallelChunker.shutdown()
+
+        expected = preprocessor.chunk_documents(documents)
+        assert _batch_as_records(batch) == _batch_as_records(expected)
+
+    def test_document_is_converted_back(self):
+        doc = Document(id="1", content="text", metadata={"a": 1})
+        assert RawDocument.from_document(doc).to_document() == doc
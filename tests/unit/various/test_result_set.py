@@ -0,0 +1,67 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+
+
+def make_result_set():
+    df = pd.DataFrame({"a": np.arange(10), "b": np.arange(10.0), "c": [f"text {i}" for i in range(10)]})
+    return ResultSet.from_df(df, table_name="tbl")
+
+
+def test_positional_columns():
+    result_set = make_result_set()
+    raw_df = result_set.get_raw_df()
+    assert isinstance(raw_df.columns, pd.RangeIndex)
+    assert [col.name for col in result_set.columns] == ["a", "b", "c"]
+
+    # named frames share the data and don't rename the frame of the result set
+    df = result_set.to_df()
+    assert list(df.columns) == ["a", "b", "c"]
+    assert np.shares_memory(df["a"].values, raw_df[0].values)
+
+    df, col_names = result_set.to_df_cols(prefix="A")
+    assert list(df.columns) == ["A_tbl_a", "A_tbl_b", "A_tbl_c"]
+    assert np.shares_memory(df["A_tbl_b"].values, raw_df[1].values)
+    assert list(result_set.get_raw_df().columns) == [0, 1, 2]
+
+    # restored result set uses the same column objects
+    result_set2 = ResultSet.from_df_cols(df, col_names)
+    assert all(col1 is col2 for col1, col2 in zip(result_set2.columns, result_set.columns))
+    assert list(df.columns) == [0, 1, 2]
+
+
+def test_slice():
+    result_set = make_result_set()
+    sliced = result_set[2:5]
+    assert sliced.to_lists() == [[2, 2.0, "text 2"], [3, 3.0, "text 3"], [4, 4.0, "text 4"]]
+    assert np.shares_memory(sliced.get_raw_df()[0].values, result_set.get_raw_df()[0].values)
+
+    # the list of columns is not shared
+    sliced.del_column(sliced.columns[2])
+    assert len(sliced.columns) == 2
+    assert len(result_set.columns) == 3
+    assert result_set.get_column_names() == ["a", "b", "c"]
+
+
+def test_concurrent_readers():
+    # steps executed in parallel read the same result set
+    result_set = make_result_set()
+    errors = []
+
+    def read(prefix):
+        try:
+            for _ in range(100):
+                df, _ = result_set.to_df_cols(prefix=prefix)
+                assert list(df.columns) == [f"{prefix}_tbl_a", f"{prefix}_tbl_b", f"{prefix}_tbl_c"]
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read, args=(prefix,)) for prefix in ("A", "B")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
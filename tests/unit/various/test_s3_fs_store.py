@@ -0,0 +1,287 @@
+import os
+import io
+import shutil
+import hashlib
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from mindsdb.interfaces.storage import fs
+from mindsdb.utilities.config import config
+
+
+class FakeS3:
+    """In-memory bucket with the subset of s3 client api used by S3FSStore"""
+
+    def __init__(self):
+        self.objects = {}
+        self.modified = {}
+        self.uploads = []
+        self.downloads = []
+
+    def _get(self, key):
+        if key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return self.objects[key]
+
+    def _etag(self, key):
+        return '"' + hashlib.md5(self.objects[key]).hexdigest() + '"'
+
+    def head_object(self, Bucket, Key):
+        self._get(Key)
+        return {"ETag": self._etag(Key)}
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self._get(Key)), "ETag": self._etag(Key)}
+
+    def get_object_attributes(self, Bucket, Key, ObjectAttributes):
+        return {"ObjectSize": len(self._get(Key)), "LastModified": datetime(2024, 1, 1)}
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body
+        self.modified[Key] = datetime.now(timezone.utc)
+        return {"ETag": self._etag(Key)}
+
+    def upload_file(self, Filename, Bucket, Key, Config=None):
+        self.uploads.append(Key)
+        self.objects[Key] = Path(Filename).read_bytes()
+        self.modified[Key] = datetime.now(timezone.utc)
+
+    def download_file(self, Bucket, Key, Filename, Config=None):
+        self.downloads.append(Key)
+        Path(Filename).write_bytes(self._get(Key))
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def delete_objects(self, Bucket, Delete):
+        for item in Delete["Objects"]:
+            self.objects.pop(item["Key"], None)
+
+    def get_paginator(self, name):
+        paginator = MagicMock()
+        paginator.paginate.side_effect = lambda Bucket, Prefix: [
+            {
+                "Contents": [
+                    {"Key": key, "LastModified": self.modified.get(key, datetime(2024, 1, 1, tzinfo=timezone.utc))}
+                    for key in self.objects
+                    if key.startswith(Prefix)
+                ]
+            }
+        ]
+        return paginator
+
+
+@pytest.fixture
+def s3():
+    client = FakeS3()
+    boto3 = MagicMock()
+    boto3.client.return_value = client
+    with (
+        patch.object(fs, "boto3", boto3, create=True),
+        patch.object(fs, "S3ClientError", ClientError),
+        patch.dict(config["permanent_storage"], {"bucket": "test"}),
+    ):
+        yield client
+
+
+@pytest.fixture
+def base_dirs():
+    root = Path(config.paths["root"]) / "content"
+    root.mkdir(parents=True, exist_ok=True)
+    dirs = [Path(tempfile.mkdtemp(dir=root)) for _ in range(2)]
+    yield dirs
+    for path in dirs:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def objects_count(s3, name):
+    return len([key for key in s3.objects if key.startswith(f"{name}/objects/")])
+
+
+def age_objects(s3, seconds):
+    for key in s3.modified:
+        s3.modified[key] -= timedelta(seconds=seconds)
+
+
+def test_incremental_sync(s3, base_dirs):
+    name = "predictor_1_1"
+    src = base_dirs[0] / name
+    (src / "sub").mkdir(parents=True)
+    (src / "empty").mkdir()
+    (src / "model.bin").write_bytes(os.urandom(100000))
+    (src / "sub" / "args.json").write_text('{"a": 1}')
+    (src / "sub" / "copy.json").write_text('{"a": 1}')
+
+    store = fs.S3FSStore()
+    store.put(name, str(base_dirs[0]))
+    # same content is stored once
+    assert len(s3.uploads) == 2
+    assert objects_count(s3, name) == 2
+
+    # nothing is changed: nothing is uploaded
+    store.put(name, str(base_dirs[0]))
+    assert len(s3.uploads) == 2
+
+    other = fs.S3FSStore()
+    other.get(name, str(base_dirs[1]))
+    dst = base_dirs[1] / name
+    assert (dst / "model.bin").read_bytes() == (src / "model.bin").read_bytes()
+    assert (dst / "sub" / "copy.json").read_text() == '{"a": 1}'
+    assert (dst / "empty").is_dir()
+    assert len(s3.downloads) == 2
+
+    # only changed file is transferred
+    (src / "sub" / "args.json").write_text('{"a": 2}')
+    (src / "sub" / "copy.json").unlink()
+    store.put(name, str(base_dirs[0]))
+    assert len(s3.uploads) == 3
+
+    other.get(name, str(base_dirs[1]))
+    assert len(s3.downloads) == 3
+    assert (dst / "sub" / "args.json").read_text() == '{"a": 2}'
+    assert not (dst / "sub" / "copy.json").exists()
+
+    # remote is not changed
+    other.get(name, str(base_dirs[1]))
+    assert len(s3.downloads) == 3
+
+    store.delete(name)
+    assert len(s3.objects) == 0
+
+
+def test_read_archive(s3, base_dirs):
+    # resource stored by previous version
+    name = "integration_1_2"
+    src = base_dirs[0] / name
+    src.mkdir()
+    (src / "file.txt").write_text("content")
+    archive = shutil.make_archive(str(base_dirs[0] / name), "gztar", root_dir=base_dirs[0], base_dir=name)
+    s3.objects[f"{name}.tar.gz"] = Path(archive).read_bytes()
+
+    store = fs.S3FSStore()
+    store.get(name, str(base_dirs[1]))
+    assert (base_dirs[1] / name / "file.txt").read_text() == "content"
+
+    # next put converts it to per-file storage
+    store.put(name, str(base_dirs[1]))
+    assert f"{name}.tar.gz" not in s3.objects
+    assert f"{name}/manifest.json" in s3.objects
+
+
+def make_interleaved_get(s3, base_dirs, name, grace_period):
+    """Put a resource, then get it with a `put` that drops a file running between reading
+    of the manifest and download of the objects"""
+    src = base_dirs[0] / name
+    src.mkdir()
+    (src / "a.txt").write_text("a")
+    (src / "b.txt").write_text("b")
+
+    writer = fs.S3FSStore()
+    writer.gc_grace_period = grace_period
+    writer.put(name, str(base_dirs[0]))
+    age_objects(s3, 10)
+
+    reader = fs.S3FSStore()
+    # files are downloaded one by one: the put runs before the download of the dropped file
+    reader.max_workers = 1
+    download_file = reader._download_file
+    interleaved = []
+
+    def download_after_put(*args):
+        if len(interleaved) == 0:
+            interleaved.append(True)
+            (src / "b.txt").unlink()
+            writer.put(name, str(base_dirs[0]))
+        return download_file(*args)
+
+    with patch.object(reader, "_download_file", side_effect=download_after_put):
+        reader.get(name, str(base_dirs[1]))
+    return writer, interleaved
+
+
+def test_get_interleaved_with_put(s3, base_dirs):
+    name = "predictor_1_3"
+    writer, interleaved = make_interleaved_get(s3, base_dirs, name, grace_period=3600)
+    assert interleaved
+    # object of the dropped file is kept for the reader of the previous manifest
+    dst = base_dirs[1] / name
+    assert (dst / "a.txt").read_text() == "a"
+    assert (dst / "b.txt").read_text() == "b"
+    assert objects_count(s3, name) == 2
+
+    # it is deleted after the grace period
+    age_objects(s3, 3600)
+    writer.gc_grace_period = 0
+    (base_dirs[0] / name / "c.txt").write_text("c")
+    writer.put(name, str(base_dirs[0]))
+    assert objects_count(s3, name) == 2
+
+
+def test_get_retry_missing_object(s3, base_dirs):
+    name = "predictor_1_4"
+    # object is deleted right after the manifest is changed: get reads the new manifest
+    make_interleaved_get(s3, base_dirs, name, grace_period=0)
+    dst = base_dirs[1] / name
+    assert (dst / "a.txt").read_text() == "a"
+    assert not (dst / "b.txt").exists()
+    assert objects_count(s3, name) == 1
+
+
+def test_get_missing_object_raises(s3, base_dirs):
+    name = "predictor_1_5"
+    src = base_dirs[0] / name
+    src.mkdir()
+    (src / "a.txt").write_text("a")
+    fs.S3FSStore().put(name, str(base_dirs[0]))
+    for key in [key for key in s3.objects if key.startswith(f"{name}/objects/")]:
+        del s3.objects[key]
+
+    with pytest.raises(Exception, match="missing in the storage"):
+        fs.S3FSStore().get(name, str(base_dirs[1]))
+
+
+def test_sync_sub_path(s3, base_dirs):
+    name = "integration_1_6"
+    src = base_dirs[0] / name
+    (src / "folder").mkdir(parents=True)
+    (src / "folder" / "a.txt").write_text("a")
+    (src / "b.txt").write_text("b")
+
+    store = fs.S3FSStore()
+    store.put(name, str(base_dirs[0]))
+    other = fs.S3FSStore()
+    other.get(name, str(base_dirs[1]))
+    dst = base_dirs[1] / name
+
+    (src / "folder" / "a.txt").write_text("aa")
+    (src / "b.txt").write_text("bb")
+    uploads = len(s3.uploads)
+    store.put(name, str(base_dirs[0]), sub_path="folder")
+    # only the sub path is uploaded
+    assert len(s3.uploads) == uploads + 1
+
+    downloads = len(s3.downloads)
+    other.get(name, str(base_dirs[1]), sub_path="folder")
+    assert len(s3.downloads) == downloads + 1
+    assert (dst / "folder" / "a.txt").read_text() == "aa"
+    assert (dst / "b.txt").read_text() == "b"
+
+    # local folders are not marked as synced by the sub path
+    store.put(name, str(base_dirs[0]))
+    other.get(name, str(base_dirs[1]))
+    assert (dst / "b.txt").read_text() == "bb"
+
+    # push of the sub path from the folder which is not synced
+    (dst / "folder" / "a.txt").write_text("aaa")
+    etag = fs.read_manifest(dst)["etag"]
+    (src / "c.txt").write_text("c")
+    store.put(name, str(base_dirs[0]))
+    other.put(name, str(base_dirs[1]), sub_path="folder")
+    assert fs.read_manifest(dst)["etag"] == etag
+    store.get(name, str(base_dirs[0]))
+    assert (src / "folder" / "a.txt").read_text() == "aaa"
@@ -0,0 +1,69 @@
+import threading
+from concurrent.futures import wait
+
+from mindsdb.interfaces.skills.schema_cache import TableSchema, TableSchemaCache, make_table_key
+from mindsdb.utilities.context import context as ctx
+
+
+def schema(calls):
+    return TableSchema(fields=["a"], dtypes=["INT"], sample_rows=f"load {calls}")
+
+
+class TestTableSchemaCache:
+    def test_warm(self, make_cache, counting_loader):
+        cache = make_cache(TableSchemaCache, ttl=60, max_tables=10, workers=4)
+        # tables are loaded concurrently: loaders pass the barrier only if all 4 of them run at the same time
+        barrier = threading.Barrier(4, timeout=5)
+        loaders = {name: counting_loader(schema, barrier=barrier) for name in ("t1", "t2", "t3", "t4")}
+        tables = [(make_table_key("db", None, name, 3), loader) for name, loader in loaders.items()]
+
+        futures = cache.warm(tables)
+        wait(futures)
+        assert all(future.exception() is None for future in futures)
+        assert all(loader.calls == 1 for loader in loaders.values())
+
+        # fresh tables are not loaded again
+        assert cache.warm(tables) == []
+        for key, loader in tables:
+            cache.get(key, loader)
+        assert all(loader.calls == 1 for loader in loaders.values())
+
+    def test_invalidate_and_company_scope(self, make_cache, counting_loader):
+        cache = make_cache(TableSchemaCache, ttl=60, max_tables=10, workers=1)
+        loader = counting_loader(schema)
+
+        ctx.set_default()
+        ctx.company_id = 1
+        cache.get(make_table_key("db", None, "t1", 3), loader)
+        # case of the name doesn't matter
+        assert cache.get(make_table_key("DB", None, "T1", 3), loader).sample_rows == "load 1"
+        cache.get(make_table_key("db", None, "t2", 3), loader)
+        cache.get(make_table_key("db2", None, "t1", 3), loader)
+        ctx.company_id = 2
+        cache.get(make_table_key("db", None, "t1", 3), loader)
+        assert loader.calls == 4
+
+        # other company is not affected
+        cache.invalidate("db", "t1")
+        ctx.company_id = 1
+        cache.get(make_table_key("db", None, "t1", 3), loader)
+        assert loader.calls == 4
+
+        cache.invalidate("DB")
+        cache.get(make_table_key("db", None, "t1", 3), loader)
+        cache.get(make_table_key("db", None, "t2", 3), loader)
+        cache.get(make_table_key("db2", None, "t1", 3), loader)
+        assert loader.calls == 6
+        ctx.set_default()
+
+    def test_failed_lookup_not_cached(self, make_cache, counting_loader):
+        cache = make_cache(TableSchemaCache, ttl=60, max_tables=10, workers=1)
+        loader = counting_loader(
+            lambda calls: TableSchema(fields=[], dtypes=[], sample_rows="", error="[No column information available]")
+        )
+
+        key = make_table_key("db", None, "t", 3)
+        assert cache.get(key, loader).error == "[No column information available]"
+        cache.get(key, loader)
+        assert loader.calls == 2
+        assert key not in cache._records
@@ -0,0 +1,45 @@
+from mindsdb.api.executor.controllers.session_controller import SessionPool
+from mindsdb.utilities.context import context as ctx
+
+
+class TestSessionPool:
+    def test_session_is_reused_and_reset(self):
+        pool = SessionPool(max_idle=1)
+        ctx.set_default()
+
+        with pool.session() as session:
+            # controllers are created on the first use
+            assert session._agents_controller is None
+            session.database = "proj"
+            session.show_secrets = True
+            session.register_stmt("select 1")
+            function_controller = session.function_controller
+
+        with pool.session() as session2:
+            assert session2 is session
+            assert session2.database is None
+            assert session2.show_secrets is False
+            assert session2.prepared_stmts == {}
+            # functions of the previous request are not kept
+            assert session2.function_controller is not function_controller
+
+            # concurrent request gets another session
+            with pool.session() as session3:
+                assert session3 is not session
+
+        # only max_idle sessions are kept
+        assert len(pool._idle[(ctx.company_id, "http")]) == 1
+
+    def test_company_scope(self):
+        pool = SessionPool()
+        ctx.set_default()
+        ctx.company_id = 1
+        with pool.session() as session:
+            pass
+        ctx.company_id = 2
+        with pool.session() as session2:
+            assert session2 is not session
+        ctx.company_id = 1
+        with pool.session() as session3:
+            assert session3 is session
+        ctx.set_default()
@@ -0,0 +1,100 @@
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+from mindsdb.utilities.import_profiler import ImportProfiler
+
+ROOT_DIR = Path(__file__).parents[3]
+
+# libraries which are not needed to start the APIs, they are imported on the first use
+HEAVY_MODULES = [
+    "torch",
+    "langchain",
+    "langchain_core",
+    "litellm",
+    "mindsdb.interfaces.agents.langchain_agent",
+    "mindsdb.interfaces.knowledge_base.controller",
+]
+
+CHECK_SCRIPT = """
+import sys, json, time
+start = time.perf_counter()
+import mindsdb.__main__
+main_time = time.perf_counter() - start
+main_modules = sorted(sys.modules)
+for module_name in {api_modules}:
+    __import__(module_name)
+print(json.dumps({{"main_time": main_time, "main_modules": main_modules, "modules": sorted(sys.modules)}}))
+"""
+
+
+def run_imports(api_modules):
+    env = {**os.environ, "PYTHONPATH": str(ROOT_DIR)}
+    env.pop("MINDSDB_STARTUP_PROFILE", None)
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_SCRIPT.format(api_modules=api_modules)],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_startup_imports():
+    result = run_imports(
+        [
+            "mindsdb.api.http.start",
+            "mindsdb.api.mysql.start",
+            "mindsdb.api.postgres.start",
+            "mindsdb.interfaces.jobs.scheduler",
+        ]
+    )
+
+    # the main process doesn't load the data libraries at import
+    for module_name in ("pandas", "sqlalchemy", *HEAVY_MODULES):
+        assert module_name not in result["main_modules"]
+    # it takes ~0.1s, the limit is for slow machines
+    assert result["main_time"] < 3
+
+    for module_name in HEAVY_MODULES:
+        assert module_name not in result["modules"]
+
+
+def test_import_profiler(tmp_path):
+    package_dir = tmp_path / "startup_test_package"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("from . import child\n")
+    (package_dir / "child.py").write_text("import time\ntime.sleep(0.01)\n")
+
+    profiler = ImportProfiler()
+    sys.path.insert(0, str(tmp_path))
+    try:
+        profiler.start()
+        import startup_test_package  # noqa: F401
+
+        profiler.stop()
+    finally:
+        sys.path.remove(str(tmp_path))
+        for module_name in ("startup_test_package", "startup_test_package.child"):
+            sys.modules.pop(module_name, None)
+
+    records = {record.name: record for record in profiler.records}
+    parent = records["startup_test_package"]
+    child = records["startup_test_package.child"]
+    assert parent.depth == 0 and child.depth == 1
+    assert child.cumulative_time >= 10_000
+    assert parent.cumulative_time >= child.cumulative_time
+    assert parent.self_time == parent.cumulative_time - child.cumulative_time
+
+    assert len(profiler.records) == 2
+
+    path = profiler.write_report("test", tmp_path / "startup")
+    report = path.read_text()
+    assert path.name == "test.txt"
+    assert "process: test" in report
+    assert "|   startup_test_package.child" in report